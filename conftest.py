@@ -4,3 +4,16 @@ import os
 # Allow running `pytest` directly from the project root without the Makefile.
 # The Makefile sets PYTHONPATH=src; this does the same for bare pytest invocations.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+
+import pytest  # noqa: E402 — imported after sys.path bootstrap
+
+
+@pytest.fixture(autouse=True)
+def _clear_warm_caches():
+    """The warm-container CONFIG and autocomplete caches deliberately outlive invocations;
+    don't let them outlive a test."""
+    import database.dynamodb_utils as dynamodb_utils
+    import utils.autocomplete_helper as autocomplete_helper
+    dynamodb_utils.server_config_cache.clear()
+    autocomplete_helper.clear_name_indexes()
@@ -1,10 +1,10 @@
 import json
 import logging
 import os
-import time
 
 import boto3
-import requests
+
+import discord_rate_limit
 
 DISCORD_BOT_TOKEN_SECRET_NAME = os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"]
 _DISCORD_API = "https://discord.com/api/v10"
@@ -43,11 +43,7 @@ def _role_ping(role_id) -> str:
 
 def _discord_request(method, url, **kwargs):
     headers = {"Authorization": f"Bot {_get_bot_token()}"}
-    while True:
-        r = requests.request(method, url, headers=headers, **kwargs)
-        if r.status_code != 429:
-            return r
-        time.sleep(r.json().get("retry_after", 1))
+    return discord_rate_limit.request(method, url, headers=headers, timeout=10, **kwargs)
 
 
 def _notify(notification_channel_id, message, organizer_role=None, ping_organizers=False):
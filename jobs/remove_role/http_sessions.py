@@ -0,0 +1,109 @@
+# MIRROR: src/http_sessions.py — keep in sync (independent Lambda packaging prevents imports)
+"""
+Keep-alive HTTP sessions shared by every outbound call (Discord, start.gg, OAuth token endpoints).
+
+Module-level requests.request/post open a new connection, and pay a TCP+TLS handshake, on
+every call. One requests.Session per scheme+host keeps those connections open across calls
+and across warm invocations of the Lambda container.
+
+Idempotent methods are retried on connection errors and 5xx responses through urllib3's
+Retry. 429s are not retried here because discord_rate_limit owns them, and POSTs are never
+retried, so a GraphQL mutation or a token exchange is sent at most once. Every call gets a
+timeout: callers pass their own and DEFAULT_TIMEOUT covers the rest.
+"""
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds for calls that do not pass their own timeout
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Connections kept per host; raise with configure_pool() when a Lambda makes calls from threads
+DEFAULT_POOL_MAXSIZE = 10
+
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+_host_pool_maxsize: dict[str, int] = {}
+
+
+def configure_pool(maxsize: int) -> None:
+    """Size connection pools for sessions created after this call, e.g. to a job's thread
+    count. Sessions already created keep their pools."""
+    global _pool_maxsize
+    _pool_maxsize = max(1, maxsize)
+
+
+def configure_host_pool(url: str, maxsize: int) -> None:
+    """Size the connection pool of url's scheme+host only, e.g. for a burst of concurrent
+    requests to one API. An existing session for that host is re-mounted with the new size."""
+    key = _host_key(url)
+    maxsize = max(1, maxsize)
+    with _sessions_lock:
+        if _host_pool_maxsize.get(key) == maxsize:
+            return
+        _host_pool_maxsize[key] = maxsize
+        session = _sessions.get(key)
+        if session is not None:
+            _mount(session, maxsize)
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _mount(session: requests.Session, maxsize: int) -> None:
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, max_retries=_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _new_session(key: str) -> requests.Session:
+    session = requests.Session()
+    _mount(session, _host_pool_maxsize.get(key, _pool_maxsize))
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the shared session for url's scheme+host, creating it on first use."""
+    key = _host_key(url)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _new_session(key)
+    return session
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Drop-in for requests.request that reuses the host's pooled connections."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session(url).request(method, url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Drop-in for requests.post that reuses the host's pooled connections."""
+    return request("POST", url, **kwargs)
+
+
+def close_all() -> None:
+    """Close and forget every session; the next call opens fresh connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -2,6 +2,9 @@
 # Plan-name normalization here is plan_name.strip().lower(), identical to
 # SchedulePlan.normalize_name in src — keep both in sync if either changes.
 import logging
+import threading
+import time
+from collections import Counter
 
 import boto3
 from boto3.dynamodb.conditions import Attr, Key
@@ -15,9 +18,128 @@ _PK_SERVER_PREFIX = "SERVER#"
 _SK_EVENT_PREFIX = "EVENT#"
 _SK_CONFIG = "CONFIG"
 _SK_PLAN_PREFIX = "SCHEDULE_PLAN#"
+# Per-server bookkeeping for the scheduled job. MIRROR: the POLL_STATE section of
+# src/database/dynamodb_utils.py, which lowers next_action_at on event writes.
+_SK_POLL_STATE = "POLL_STATE"
+_NEXT_ACTION_INDEX = "NextActionIndex"
+_POLL_PARTITION = "POLL_STATE"
 
 dynamodb = boto3.resource("dynamodb", region_name=constants.REGION)
 
+_thread_local = threading.local()
+
+
+def get_thread_table(table_name):
+    """Return this thread's own Table. boto3 resources aren't thread-safe, so worker threads
+    each build one from a private session instead of sharing the module-level resource."""
+    table = getattr(_thread_local, "table", None)
+    if table is None or table.name != table_name:
+        session = boto3.session.Session()
+        table = session.resource("dynamodb", region_name=constants.REGION).Table(table_name)
+        _thread_local.table = table
+    return table
+
+
+class MeteredTable:
+    """Wraps the DynamoDB table for one scheduled run and counts calls per operation, so the
+    run can log how many round trips it made. Everything else is forwarded to the table."""
+
+    _METERED_OPERATIONS = frozenset({"get_item", "query", "scan", "put_item", "update_item", "delete_item"})
+
+    def __init__(self, table, calls=None, lock=None):
+        self._table = table
+        self.calls = calls if calls is not None else Counter()
+        self._lock = lock or threading.Lock()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._table, name)
+        if name not in self._METERED_OPERATIONS:
+            return attribute
+
+        def metered(*args, **kwargs):
+            self.record(name)
+            return attribute(*args, **kwargs)
+        return metered
+
+    def record(self, operation, count=1):
+        with self._lock:
+            self.calls[operation] += count
+
+    def sharing_counts(self, table):
+        """Wrap another table (e.g. a worker thread's own) so its calls add to these totals."""
+        return MeteredTable(table, self.calls, self._lock)
+
+    def summary(self):
+        counts = " ".join(f"{operation}={count}" for operation, count in sorted(self.calls.items()))
+        return f"total={sum(self.calls.values())} {counts}".strip()
+
+
+def _record_call(table, operation, count=1):
+    # Batch calls go through table.meta.client, which MeteredTable can't see
+    if isinstance(table, MeteredTable):
+        table.record(operation, count)
+
+
+# BatchGetItem accepts at most 100 keys per call
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_ATTEMPTS = 5
+_BATCH_GET_BACKOFF_SECONDS = 0.1
+# batch_writer flushes every 25 requests
+_BATCH_WRITE_MAX_ITEMS = 25
+
+
+def batch_get_items(table, keys, projection=None):
+    """BatchGetItem `keys` (PK/SK dicts) 100 at a time, retrying UnprocessedKeys with backoff.
+    Returns {(PK, SK): item} for the items that exist."""
+    request = {}
+    if projection:
+        # PK/SK are always fetched so results can be matched back to their keys
+        attributes = list(dict.fromkeys(["PK", "SK", *projection]))
+        names = {f"#p{i}": attribute for i, attribute in enumerate(attributes)}
+        request = {"ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+
+    items = {}
+    for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+        pending = keys[start:start + BATCH_GET_MAX_KEYS]
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_BATCH_GET_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            response = table.meta.client.batch_get_item(RequestItems={table.name: {"Keys": pending, **request}})
+            _record_call(table, "batch_get_item")
+            for item in response.get("Responses", {}).get(table.name, []):
+                items[(item["PK"], item["SK"])] = item
+            pending = response.get("UnprocessedKeys", {}).get(table.name, {}).get("Keys", [])
+            if not pending:
+                break
+        else:
+            logger.error(f"BatchGetItem left {len(pending)} key(s) unprocessed after {BATCH_GET_MAX_ATTEMPTS} attempts")
+    return items
+
+
+def batch_get_server_configs(table, server_ids):
+    """Get the CONFIG record of every server in `server_ids`. Returns {server_id: item};
+    servers without a CONFIG record are left out."""
+    keys = [{"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": _SK_CONFIG} for server_id in server_ids]
+    items = batch_get_items(table, keys)
+    return {pk[len(_PK_SERVER_PREFIX):]: item for (pk, _), item in items.items()}
+
+
+def batch_get_event_records(table, server_events, view=None):
+    """Get the `view` attributes (default: EVENT_RUN_VIEW) of every event in `server_events`
+    ({server_id: [event_id]}). Returns {server_id: {event_id: item}} for records that exist.
+
+    Keys come from the EventNameIndex scan, so this reads exactly the EVENT items: a per-server
+    SK-prefix query would also page through items-layout participant items."""
+    keys = [
+        {"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": f"{_SK_EVENT_PREFIX}{event_id}"}
+        for server_id, event_ids in server_events.items()
+        for event_id in event_ids
+    ]
+    records = {}
+    for (pk, sk), item in batch_get_items(table, keys, projection=view or EVENT_RUN_VIEW).items():
+        records.setdefault(pk[len(_PK_SERVER_PREFIX):], {})[sk[len(_SK_EVENT_PREFIX):]] = item
+    return records
+
 
 def get_server_config(table, server_id):
     """Get the server CONFIG record. Returns item dict or None."""
@@ -63,22 +185,57 @@ def get_all_server_configs_with_oauth(table):
     return configs
 
 
-def get_full_events_for_server(table, server_id):
-    """Query all EVENT records for a server by PK + SK prefix. Returns list of item dicts."""
+def iter_query(table, projection=None, limit=None, **query_kwargs):
+    """Run a Query and lazily yield its items across every page, following LastEvaluatedKey.
+    `projection` lists attributes to fetch; `limit` caps the total items yielded."""
+    if projection:
+        names = dict(query_kwargs.get("ExpressionAttributeNames", {}))
+        placeholders = []
+        for i, attribute in enumerate(projection):
+            placeholder = f"#p{i}"
+            names[placeholder] = attribute
+            placeholders.append(placeholder)
+        query_kwargs["ProjectionExpression"] = ", ".join(placeholders)
+        query_kwargs["ExpressionAttributeNames"] = names
+    remaining = limit
+    while True:
+        if remaining is not None:
+            query_kwargs["Limit"] = remaining
+        response = table.query(**query_kwargs)
+        for item in response.get("Items", []):
+            yield item
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+        if "LastEvaluatedKey" not in response:
+            return
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def iter_server_items(table, server_id, sk_prefix, projection=None, limit=None):
+    """Lazily yield the items in a server's partition whose SK starts with `sk_prefix`."""
     pk = f"{_PK_SERVER_PREFIX}{server_id}"
-    response = table.query(
-        KeyConditionExpression=Key("PK").eq(pk) & Key("SK").begins_with(_SK_EVENT_PREFIX)
+    return iter_query(
+        table, projection=projection, limit=limit,
+        KeyConditionExpression=Key("PK").eq(pk) & Key("SK").begins_with(sk_prefix),
     )
-    return response.get("Items", [])
+
+
+def is_event_record_sk(sk):
+    """True for an EVENT#<id> record, False for participant items still stored beneath it
+    under the old EVENT#<id>#REG#/#CHK# keys."""
+    return sk.startswith(_SK_EVENT_PREFIX) and "#" not in sk[len(_SK_EVENT_PREFIX):]
+
+
+def get_full_events_for_server(table, server_id):
+    """Query all EVENT records for a server by PK + SK prefix. Returns list of item dicts."""
+    return [item for item in iter_server_items(table, server_id, _SK_EVENT_PREFIX) if is_event_record_sk(item["SK"])]
 
 
 def get_schedule_plans_for_server(table, server_id):
     """Query all SCHEDULE_PLAN records for a server. Returns list of item dicts."""
-    pk = f"{_PK_SERVER_PREFIX}{server_id}"
-    response = table.query(
-        KeyConditionExpression=Key("PK").eq(pk) & Key("SK").begins_with(_SK_PLAN_PREFIX)
-    )
-    return response.get("Items", [])
+    return list(iter_server_items(table, server_id, _SK_PLAN_PREFIX))
 
 
 def delete_schedule_plan(table, server_id, plan_name):
@@ -88,20 +245,84 @@ def delete_schedule_plan(table, server_id, plan_name):
     table.delete_item(Key={"PK": pk, "SK": sk})
 
 
-def get_event_record(table, server_id, event_id):
-    """Get the full event record from DynamoDB. Returns item dict or None."""
-    pk = f"{_PK_SERVER_PREFIX}{server_id}"
-    sk = f"{_SK_EVENT_PREFIX}{event_id}"
-    response = table.get_item(Key={"PK": pk, "SK": sk})
+# Projected views of an EVENT record: the scalar attributes each pass reads, leaving out the
+# registered/checked_in/queue maps (cleanup needs checked_in for role removals). SK is always
+# included so an existing record never projects to an empty item.
+EVENT_REMINDER_VIEW = (
+    "SK", "event_name", "start_time", "should_post_reminder", "did_post_reminder",
+    "reminder_channel_id", "reminder_role_id",
+)
+EVENT_RESCHEDULE_VIEW = ("SK", "event_name", "start_time", "startgg_url", "reschedule_alerted_start")
+EVENT_CLEANUP_VIEW = ("SK", "event_name", "participant_role", "checked_in", "participant_layout")
+# What poll_watermark reads to compute the server's next_action_at after a run
+EVENT_WATERMARK_VIEW = ("SK", "start_time", "end_time", "should_post_reminder", "did_post_reminder", "startgg_url")
+# Everything the cleanup, reminder and reschedule passes read, prefetched once per run
+EVENT_RUN_VIEW = tuple(dict.fromkeys(
+    EVENT_REMINDER_VIEW + EVENT_RESCHEDULE_VIEW + EVENT_CLEANUP_VIEW + EVENT_WATERMARK_VIEW
+))
+
+# MIRROR: src/database/dynamodb_utils.py participant storage — events with
+# participant_layout = "items" keep one item per participant at SK PART#<event_id>#REG#/#CHK#<key>.
+PARTICIPANT_LAYOUT_ITEMS = "items"
+_SK_PARTICIPANT_PREFIX = "PART#"
+_SK_CHECKED_IN_INFIX = "#CHK#"
+
+
+def get_event_view(table, server_id, event_id, view):
+    """Get only the `view` attributes of an event record. Returns item dict or None."""
+    names = {f"#p{i}": attribute for i, attribute in enumerate(view)}
+    response = table.get_item(
+        Key={"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": f"{_SK_EVENT_PREFIX}{event_id}"},
+        ProjectionExpression=", ".join(names),
+        ExpressionAttributeNames=names,
+    )
     return response.get("Item")
 
 
+def get_event_reminder_view(table, server_id, event_id):
+    return get_event_view(table, server_id, event_id, EVENT_REMINDER_VIEW)
+
+
+def get_event_reschedule_view(table, server_id, event_id):
+    return get_event_view(table, server_id, event_id, EVENT_RESCHEDULE_VIEW)
+
+
+def get_event_cleanup_view(table, server_id, event_id):
+    return get_event_view(table, server_id, event_id, EVENT_CLEANUP_VIEW)
+
+
+def get_checked_in(table, server_id, event_id, event_record):
+    """Return the event's checked_in map ({user_id: participant}) in either participant layout."""
+    if event_record.get("participant_layout") != PARTICIPANT_LAYOUT_ITEMS:
+        return event_record.get("checked_in") or {}
+    prefix = f"{_SK_PARTICIPANT_PREFIX}{event_id}{_SK_CHECKED_IN_INFIX}"
+    return {
+        item["SK"][len(prefix):]: {key: value for key, value in item.items() if key not in ("PK", "SK")}
+        for item in iter_server_items(table, server_id, prefix)
+    }
+
+
+def delete_event_participant_items(table, server_id, event_id):
+    """Delete every participant item stored under an event. Returns the number deleted."""
+    keys = [
+        {"PK": item["PK"], "SK": item["SK"]}
+        for item in iter_server_items(table, server_id, f"{_SK_PARTICIPANT_PREFIX}{event_id}#", projection=["PK", "SK"])
+    ]
+    if keys:
+        with table.batch_writer() as batch:
+            for key in keys:
+                batch.delete_item(Key=key)
+        _record_call(table, "batch_write_item", -(-len(keys) // _BATCH_WRITE_MAX_ITEMS))
+    return len(keys)
+
+
 def delete_event_record(table, server_id, event_id):
-    """Delete event record from DynamoDB. Returns True on success."""
+    """Delete event record (and any participant items) from DynamoDB. Returns True on success."""
     pk = f"{_PK_SERVER_PREFIX}{server_id}"
     sk = f"{_SK_EVENT_PREFIX}{event_id}"
     try:
         table.delete_item(Key={"PK": pk, "SK": sk})
+        delete_event_participant_items(table, server_id, event_id)
         logger.info(f"Deleted DynamoDB record for event {event_id} in server {server_id}")
         return True
     except Exception as e:
@@ -150,3 +371,99 @@ def clear_reschedule_alerted(table, server_id: str, event_id: str):
         Key={"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": f"{_SK_EVENT_PREFIX}{event_id}"},
         UpdateExpression="REMOVE reschedule_alerted_start",
     )
+
+
+def claim_server_run(table, server_id, run_slot):
+    """Claim `server_id` for the run identified by `run_slot`. Returns the server's POLL_STATE
+    item as claimed, or None when this slot or a later one already claimed it, so overlapping
+    coordinator runs and redelivered messages don't process the same server twice."""
+    try:
+        response = table.update_item(
+            Key={"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": _SK_POLL_STATE},
+            UpdateExpression="SET last_run_slot = :slot",
+            ConditionExpression="attribute_not_exists(last_run_slot) OR last_run_slot < :slot",
+            ExpressionAttributeValues={":slot": run_slot},
+            ReturnValues="ALL_NEW",
+        )
+        return response["Attributes"]
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        return None
+
+
+def release_server_run(table, server_id, run_slot):
+    """Undo claim_server_run after a failed or deferred attempt so the redelivered message can
+    claim the server again. A later slot's claim is left alone."""
+    try:
+        table.update_item(
+            Key={"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": _SK_POLL_STATE},
+            UpdateExpression="SET last_run_slot = :previous",
+            ConditionExpression="last_run_slot = :slot",
+            ExpressionAttributeValues={":slot": run_slot, ":previous": run_slot - 1},
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        pass
+
+
+def get_due_server_ids(table, now):
+    """Query the sparse NextActionIndex for servers whose next_action_at is at or before `now`."""
+    items = iter_query(
+        table, projection=["PK"], IndexName=_NEXT_ACTION_INDEX,
+        KeyConditionExpression=Key("poll_partition").eq(_POLL_PARTITION) & Key("next_action_at").lte(now),
+    )
+    return [item["PK"][len(_PK_SERVER_PREFIX):] for item in items]
+
+
+def get_event_ids_for_servers(table, server_ids):
+    """Query EventNameIndex for each server in `server_ids`. Returns {server_id: [event_id]},
+    with an empty list for servers that no longer have events."""
+    return {
+        server_id: [
+            item["event_id"]
+            for item in iter_query(
+                table, projection=["event_id"], IndexName=_EVENT_NAME_INDEX,
+                KeyConditionExpression=Key("server_id").eq(server_id),
+            )
+            if item.get("event_id")
+        ]
+        for server_id in server_ids
+    }
+
+
+def set_server_next_action_at(table, server_id, next_action_at, claim):
+    """Store the server's next_action_at after a run (None removes it, dropping the server from
+    NextActionIndex) and clear the pending_event_ids the run picked up from `claim`.
+
+    The bot bumps watermark_revision whenever it writes an event. If that happened since
+    `claim`, the run may not have seen the event, so its watermark can only lower the stored one."""
+    names = {"#at": "next_action_at", "#rev": "watermark_revision"}
+    values = {}
+    revision = claim.get("watermark_revision")
+    if revision is None:
+        unchanged = "attribute_not_exists(#rev)"
+    else:
+        unchanged = "#rev = :rev"
+        values[":rev"] = revision
+
+    if next_action_at is None:
+        update = "REMOVE #at, #partition"
+        condition = unchanged
+    else:
+        update = "SET #at = :at, #partition = :partition"
+        condition = f"{unchanged} OR attribute_not_exists(#at) OR #at > :at"
+        values.update({":at": next_action_at, ":partition": _POLL_PARTITION})
+    names["#partition"] = "poll_partition"
+    if claim.get("pending_event_ids"):
+        update += " DELETE #pending :seen"
+        names["#pending"] = "pending_event_ids"
+        values[":seen"] = set(claim["pending_event_ids"])
+
+    try:
+        table.update_item(
+            Key={"PK": f"{_PK_SERVER_PREFIX}{server_id}", "SK": _SK_POLL_STATE},
+            UpdateExpression=update,
+            ConditionExpression=condition,
+            ExpressionAttributeNames=names,
+            **({"ExpressionAttributeValues": values} if values else {}),
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        logger.info(f"Server {server_id} had an event written during the run, keeping its earlier next_action_at")
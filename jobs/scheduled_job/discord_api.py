@@ -1,8 +1,6 @@
 import logging
-import time
-
-import requests
 
+import discord_rate_limit
 import scheduled_job_constants as constants
 
 logger = logging.getLogger()
@@ -19,13 +17,9 @@ def _role_ping(role_id) -> str:
 
 
 def _request(method, url, json=None):
-    while True:
-        r = requests.request(method, url, headers={"Authorization": f"Bot {constants.get_discord_bot_token()}"}, json=json)
-        if r.status_code != 429:
-            return r
-        retry_after = r.json().get("retry_after", 1)
-        logger.warning(f"Rate limited on {method} {url}, retrying after {retry_after}s")
-        time.sleep(retry_after)
+    return discord_rate_limit.request(
+        method, url, headers={"Authorization": f"Bot {constants.get_discord_bot_token()}"}, json=json, timeout=10
+    )
 
 
 def get_guild_events(guild_id):
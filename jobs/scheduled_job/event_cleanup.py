@@ -1,6 +1,5 @@
 import json
 import logging
-import time
 
 import boto3
 
@@ -10,9 +9,6 @@ import discord_api
 
 logger = logging.getLogger()
 
-# Brief pause between Discord API calls to avoid rate limits
-_API_CALL_PAUSE_SECONDS = 0.5
-
 _sqs = boto3.client("sqs", region_name=constants.REGION)
 
 
@@ -42,18 +38,20 @@ def _queue_role_removals(guild_id, checked_in, participant_role, notification_ch
     return failures
 
 
-def cleanup_ended_event(table, server_id, event_id, server_config=None):
+def cleanup_ended_event(table, server_id, event_id, server_config=None, event_record=None):
     """Queue role removals, delete the Discord event, and hard-delete the DynamoDB record.
 
-    Returns the event name on success, or None if the record was already gone.
+    `event_record` is the run's prefetched snapshot of the event; it's read from DynamoDB
+    when not given. Returns the event name on success, or None if the record was already gone.
     """
-    event_record = db.get_event_record(table, server_id, event_id)
+    if event_record is None:
+        event_record = db.get_event_cleanup_view(table, server_id, event_id)
     if not event_record:
         logger.info(f"Event {event_id} in server {server_id} already cleaned up, skipping")
         return None
 
     participant_role = event_record.get("participant_role")
-    checked_in = event_record.get("checked_in") or {}
+    checked_in = db.get_checked_in(table, server_id, event_id, event_record)
     event_name = event_record.get("event_name") or event_id
 
     logger.info(
@@ -80,7 +78,6 @@ def cleanup_ended_event(table, server_id, event_id, server_config=None):
             )
 
     discord_api.delete_guild_event(server_id, event_id)
-    time.sleep(_API_CALL_PAUSE_SECONDS)
 
     db.delete_event_record(table, server_id, event_id)
     logger.info(f"Event {event_id} ({event_name!r}) fully cleaned up for server {server_id}")
@@ -6,10 +6,11 @@ import discord_api
 
 logger = logging.getLogger()
 
+# MIRROR: REMINDER_LEAD_SECONDS in poll_watermark.py
 _REMINDER_WINDOW_HOURS = 24
 
 
-def check_and_send_reminder(table, server_id, event_id, server_config):
+def check_and_send_reminder(table, server_id, event_id, server_config, event_record=None):
     """Check if an active event is due for a reminder and send it if so.
 
     Returns the server_config (loading it from the DB if it was passed in as None);
@@ -19,8 +20,10 @@ def check_and_send_reminder(table, server_id, event_id, server_config):
       - did_post_reminder is False on the event
       - the event start_time is within the next 24 hours
       - announcement_channel_id is configured on the server
+    `event_record` is the run's prefetched snapshot of the event; it's read from DynamoDB when not given.
     """
-    event_record = db.get_event_record(table, server_id, event_id)
+    if event_record is None:
+        event_record = db.get_event_reminder_view(table, server_id, event_id)
     if not event_record:
         logger.info(f"Event record not found for {event_id} in server {server_id} during reminder check, skipping")
         return server_config
@@ -65,6 +68,8 @@ def check_and_send_reminder(table, server_id, event_id, server_config):
     sent = discord_api.send_channel_message(announcement_channel_id, message)
     if sent:
         db.mark_event_reminder_sent(table, server_id, event_id)
+        # Keep the run's snapshot current; the worker computes next_action_at from it
+        event_record["did_post_reminder"] = True
         logger.info(f"Sent reminder for event {event_id} in server {server_id}")
     else:
         logger.error(f"Failed to send reminder for event {event_id} in server {server_id}")
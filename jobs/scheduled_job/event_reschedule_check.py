@@ -31,7 +31,7 @@ def _is_past_time(utc_iso):
         return False
 
 
-def check_for_reschedule(table, server_id, event_id, server_config):
+def check_for_reschedule(table, server_id, event_id, server_config, event_record=None):
     """Alert organizers when start.gg shows a different start time than the one stored on Discord.
 
     Alert-only: the bot does not auto-reschedule. Organizers run `/event-refresh-startgg` to apply,
@@ -40,8 +40,11 @@ def check_for_reschedule(table, server_id, event_id, server_config):
     De-duped via the event's `reschedule_alerted_start` field, which records the start.gg time we
     last alerted about. A standing drift therefore alerts only once; the alert re-arms automatically
     when start.gg moves to a *new* time, or clears once the event is refreshed to match start.gg.
+
+    `event_record` is the run's prefetched snapshot of the event; it's read from DynamoDB when not given.
     """
-    event_record = db.get_event_record(table, server_id, event_id)
+    if event_record is None:
+        event_record = db.get_event_reschedule_view(table, server_id, event_id)
     if not event_record:
         return
 
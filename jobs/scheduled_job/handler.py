@@ -1,103 +1,106 @@
+import json
 import logging
+import time
+
+import boto3
 
 import scheduled_job_constants as constants
 import db
-import discord_api
-import event_cleanup
-import event_reminders
-import event_reschedule_check
-import schedule_sync
 import startgg_token_check
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Discord guild scheduled event statuses
-# https://discord.com/developers/docs/resources/guild-scheduled-event#guild-scheduled-event-object-guild-scheduled-event-status
-_STATUS_COMPLETED = 3
-_STATUS_CANCELED = 4
+# SQS SendMessageBatch accepts at most 10 entries per call
+_SQS_BATCH_LIMIT = 10
+
+_sqs = boto3.client("sqs", region_name=constants.REGION)
 
 
 def handler(event, context):
-    """Scheduled Lambda entry point: checks start.gg token expiry, cleans up
-    ended/removed Discord events, and sends event reminders for every server."""
-    table = db.dynamodb.Table(constants.DYNAMODB_TABLE_NAME)
+    """Scheduled Lambda entry point (coordinator): checks start.gg token expiry, then enqueues
+    one message per due server for the worker Lambda (worker.py) to process."""
+    table = db.MeteredTable(db.dynamodb.Table(constants.DYNAMODB_TABLE_NAME))
+    try:
+        _run(table)
+    finally:
+        logger.info(f"DynamoDB calls this run: {table.summary()}")
 
+
+def _run(table):
     try:
         startgg_token_check.check_startgg_tokens(table)
     except Exception as e:
         logger.error(f"Unhandled error during start.gg token expiry check: {e}")
 
-    server_events = db.get_all_events_by_server(table)
+    now = time.time()
+    run_slot = current_run_slot(now)
+    server_events = find_due_servers(table, int(now), run_slot)
     if not server_events:
-        logger.info("No active events found in DynamoDB")
+        logger.info(f"No servers due in run slot {run_slot}")
         return
 
     total_events = sum(len(ids) for ids in server_events.values())
-    logger.info(f"Found {total_events} events across {len(server_events)} servers")
-
-    for server_id, db_event_ids in server_events.items():
-        server_config = db.get_server_config(table, server_id)
-
-        discord_events = discord_api.get_guild_events(server_id)
-        if discord_events is None:
-            logger.error(f"Skipping server {server_id} due to Discord API failure")
-            notification_channel_id = server_config.get("notification_channel_id") if server_config else None
-            if notification_channel_id:
-                discord_api.send_organizer_notification(
-                    notification_channel_id,
-                    "⚠️ Adomin failed to fetch Discord events for this server. Event reminders and cleanup may be delayed.",
-                    organizer_role=server_config.get("organizer_role"),
-                    ping_organizers=server_config.get("ping_organizers", False),
-                )
-            continue
+    logger.info(f"Found {total_events} events across {len(server_events)} due servers, run slot {run_slot}")
 
-        # Map discord event id -> status for events managed by this bot
-        db_event_id_set = set(db_event_ids)
-        discord_event_status = {
-            e["id"]: e["status"] for e in discord_events if e["id"] in db_event_id_set
-        }
+    failed = enqueue_servers(server_events, run_slot)
+    logger.info(f"Enqueued {len(server_events) - len(failed)}/{len(server_events)} servers")
+    if failed:
+        logger.error(f"Failed to enqueue {len(failed)} server(s): {', '.join(failed)}")
+
+
+def find_due_servers(table, now, run_slot):
+    """Servers with work due by `now`, as {server_id: [event_id]}.
+
+    Normally only the servers NextActionIndex lists as due, so a run's cost tracks due work
+    rather than fleet size; a due server whose events are all gone comes back with [] so the
+    worker clears its watermark. Once every FULL_SWEEP_INTERVAL_SECONDS the whole EventNameIndex
+    is swept as well, which catches servers without a watermark yet and anything changed
+    outside the bot (e.g. an event deleted in Discord)."""
+    server_events = db.get_event_ids_for_servers(table, db.get_due_server_ids(table, now))
+    if is_full_sweep_slot(run_slot):
+        logger.info(f"Run slot {run_slot} is a full sweep, including every server with events")
+        server_events.update(db.get_all_events_by_server(table))
+    return server_events
 
-        cleaned_up_event_names = []
-        for event_id in db_event_ids:
-            status = discord_event_status.get(event_id)
-            if status in (_STATUS_COMPLETED, _STATUS_CANCELED) or status is None:
-                if status is None:
-                    logger.info(
-                        f"Event {event_id} in server {server_id} not found in Discord, cleaning up"
-                    )
-                else:
-                    logger.info(
-                        f"Event {event_id} in server {server_id} ended (status={status}), cleaning up"
-                    )
-                event_name = event_cleanup.cleanup_ended_event(table, server_id, event_id, server_config)
-                if event_name:
-                    cleaned_up_event_names.append(event_name)
-                    if server_config:
-                        schedule_sync.strikethrough_schedule_event(server_config, event_name)
-            else:
-                logger.info(
-                    f"Event {event_id} in server {server_id} still active (status={status}), checking reminders"
-                )
-                event_reminders.check_and_send_reminder(table, server_id, event_id, server_config)
-                # Scout start.gg for a reschedule and alert organizers. Guarded: start.gg is an
-                # external dependency, and a failure here must not block cleanup/reminders elsewhere.
-                try:
-                    event_reschedule_check.check_for_reschedule(table, server_id, event_id, server_config)
-                except Exception as e:
-                    logger.error(f"Reschedule check failed for event {event_id} in server {server_id}: {e}")
-
-        if cleaned_up_event_names:
-            notification_channel_id = server_config.get("notification_channel_id") if server_config else None
-            if notification_channel_id:
-                event_list = "\n".join(f"• {name}" for name in cleaned_up_event_names)
-                count = len(cleaned_up_event_names)
-                message = f"🧹 Cleaned up {count} ended event(s):\n{event_list}"
-                result = discord_api.send_channel_message(notification_channel_id, message)
-                if result is None:
-                    logger.error(
-                        f"Adomin is missing permissions to send to notification channel "
-                        f"{notification_channel_id} in server {server_id}"
-                    )
-            else:
-                logger.info(f"No notification_channel_id configured for server {server_id}, skipping notification")
+
+def is_full_sweep_slot(run_slot):
+    slots_per_sweep = max(1, constants.FULL_SWEEP_INTERVAL_SECONDS // constants.RUN_INTERVAL_SECONDS)
+    return run_slot % slots_per_sweep == 0
+
+
+def current_run_slot(now=None):
+    """Index of the RUN_INTERVAL_SECONDS slot `now` (epoch seconds) falls in. Coordinator runs
+    that overlap or retry within a slot produce the same dedup keys."""
+    return int((now if now is not None else time.time()) // constants.RUN_INTERVAL_SECONDS)
+
+
+def enqueue_servers(server_events, run_slot):
+    """Send one message per server to the FIFO server queue. Returns the server ids that failed.
+
+    MessageGroupId keeps a server's messages serial, and MessageDeduplicationId drops a second
+    enqueue of the same server in the same slot within SQS's 5-minute dedup window. Beyond
+    that window the worker's claim on the server (db.claim_server_run) still catches it."""
+    entries = [
+        {
+            "Id": str(idx),
+            "MessageBody": json.dumps({"server_id": server_id, "event_ids": event_ids, "run_slot": run_slot}),
+            "MessageGroupId": server_id,
+            "MessageDeduplicationId": f"{server_id}-{run_slot}",
+        }
+        for idx, (server_id, event_ids) in enumerate(server_events.items())
+    ]
+    server_ids = list(server_events)
+    failed = []
+    for start in range(0, len(entries), _SQS_BATCH_LIMIT):
+        batch = entries[start:start + _SQS_BATCH_LIMIT]
+        try:
+            response = _sqs.send_message_batch(QueueUrl=constants.SERVER_WORK_QUEUE_URL, Entries=batch)
+        except Exception as e:
+            logger.error(f"SendMessageBatch failed: {e}")
+            failed.extend(server_ids[int(entry["Id"])] for entry in batch)
+            continue
+        for entry in response.get("Failed", []):
+            logger.error(f"Enqueue failed for entry {entry['Id']}: {entry.get('Message')}")
+            failed.append(server_ids[int(entry["Id"])])
+    return failed
@@ -9,6 +9,20 @@ REGION = os.environ["REGION"]
 DISCORD_BOT_TOKEN_SECRET_NAME = os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"]
 REMOVE_ROLE_QUEUE_URL = os.environ["REMOVE_ROLE_QUEUE_URL"]
 STARTGG_SECRET_NAME = os.environ["STARTGG_SECRET_NAME"]
+# FIFO queue the coordinator fans servers out on; the worker Lambda consumes it
+SERVER_WORK_QUEUE_URL = os.environ["SERVER_WORK_QUEUE_URL"]
+
+# Optional tuning knobs, with defaults.
+# Servers processed in parallel per run; each server's own passes still run in order.
+SERVER_CONCURRENCY = int(os.environ.get("SERVER_CONCURRENCY", "8"))
+# Stop starting new servers once less than this much Lambda time remains; the rest wait for the next run.
+RUN_TIME_RESERVE_MS = int(os.environ.get("RUN_TIME_RESERVE_MS", "10000"))
+# Length of one coordinator run slot; must match the EventBridge schedule. A server is processed
+# at most once per slot, whichever coordinator run enqueued it.
+RUN_INTERVAL_SECONDS = int(os.environ.get("RUN_INTERVAL_SECONDS", "900"))
+# How often the coordinator enqueues every server with events, not just those whose
+# next_action_at is due. Bounds how long a change made outside the bot can go unnoticed.
+FULL_SWEEP_INTERVAL_SECONDS = int(os.environ.get("FULL_SWEEP_INTERVAL_SECONDS", "86400"))
 
 _discord_bot_token = None
 _startgg_api_token = None
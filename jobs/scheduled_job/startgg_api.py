@@ -2,18 +2,20 @@
 # (independent Lambda packaging prevents importing from src/). This is a *minimal* mirror: it only
 # fetches an event's scheduled start time (startAt). The src copy additionally pages entrants and
 # parses participants; the scheduled job's reschedule scout does not need those, so they are
-# intentionally omitted here. The slug regex, API URL, and unix→ISO formatting must stay identical.
+# intentionally omitted here. The slug regex and unix→ISO formatting must stay identical; requests
+# go through startgg_client, itself a mirror of src/utils/startgg_client.py.
 import logging
 import re
+import threading
 from datetime import datetime, timezone
 
 import requests
 
 import scheduled_job_constants as constants
+import startgg_client
 
 logger = logging.getLogger()
 
-_STARTGG_API_URL = "https://api.start.gg/gql/alpha"
 _REQUEST_TIMEOUT_SECONDS = 10
 
 # MIRROR: _STARTGG_SLUG_PATTERN in src startgg_api.py
@@ -29,6 +31,15 @@ _EVENT_START_TIME_QUERY = """
     }
 """
 
+# start.gg rejects a request that would return more than 1000 objects. Each aliased event costs
+# one object; 100 per document keeps well under that and the query text small.
+START_TIME_BATCH_SIZE = 100
+
+# Start times already resolved this run, by slug (None when start.gg had no time or failed).
+# The worker clears it at the start of each invocation, so warm containers never reuse it.
+_start_times = {}
+_start_times_lock = threading.Lock()
+
 
 def extract_startgg_slug(startgg_url):
     """Extracts 'tournament/<t>/event/<e>' from a start.gg URL, or None if not found."""
@@ -36,46 +47,107 @@ def extract_startgg_slug(startgg_url):
     return match.group(0) if match else None
 
 
-def get_event_start_time_utc(startgg_url):
-    """Query start.gg for an event's scheduled start time.
+def clear_start_time_cache():
+    """Forget every start time resolved so far; call once at the start of a run."""
+    with _start_times_lock:
+        _start_times.clear()
 
-    Returns the start time as a UTC ISO 8601 string (e.g. '2026-03-19T19:30:00Z'), or None if the
-    URL is invalid, the event has no start time, or the request fails. Best-effort: all failures
-    are logged and swallowed so a start.gg outage never breaks the rest of the poller run.
-    """
-    slug = extract_startgg_slug(startgg_url)
-    if not slug:
-        logger.warning(f"Could not extract start.gg slug from URL '{startgg_url}'")
-        return None
 
+def _post_query(query, variables, description):
+    """POST a GraphQL document to start.gg through the shared client (rate limit, retries).
+    Returns the response's `data` dict, or None on any failure (logged). GraphQL errors alongside
+    data are logged and the data still returned."""
     try:
-        response = requests.post(
-            _STARTGG_API_URL,
-            json={"query": _EVENT_START_TIME_QUERY, "variables": {"slug": slug}},
-            headers={"Authorization": f"Bearer {constants.get_startgg_api_token()}"},
+        response = startgg_client.post(
+            query,
+            variables,
+            {"Authorization": f"Bearer {constants.get_startgg_api_token()}"},
             timeout=_REQUEST_TIMEOUT_SECONDS,
         )
     except requests.RequestException as e:
-        logger.error(f"start.gg request failed for slug '{slug}': {e}")
+        logger.error(f"start.gg request failed for {description}: {e}")
         return None
 
     if not response.ok:
-        logger.error(f"start.gg returned {response.status_code} for slug '{slug}'")
+        logger.error(f"start.gg returned {response.status_code} for {description}")
         return None
 
     try:
         data = response.json()
     except ValueError as e:
-        logger.error(f"start.gg returned non-JSON for slug '{slug}': {e}")
+        logger.error(f"start.gg returned non-JSON for {description}: {e}")
         return None
 
     if data.get("errors"):
-        logger.error(f"start.gg GraphQL errors for slug '{slug}': {data['errors']}")
+        logger.error(f"start.gg GraphQL errors for {description}: {data['errors']}")
+    return data.get("data") or {}
+
+
+def _build_start_times_query(count):
+    """An aliased document resolving `count` events at once: e0: event(slug: $s0) {...} ..."""
+    variables = ", ".join(f"$s{i}: String" for i in range(count))
+    fields = "\n".join(f"        e{i}: event(slug: $s{i}) {{ id startAt }}" for i in range(count))
+    return f"query EventStartTimes({variables}) {{\n{fields}\n    }}"
+
+
+def prefetch_event_start_times(startgg_urls):
+    """Resolve the start times of every event in `startgg_urls` with as few requests as possible:
+    slugs are deduplicated, skipped if already cached this run, and sent START_TIME_BATCH_SIZE
+    at a time as aliased queries. Results land in the run's cache for get_event_start_time_utc.
+    Returns the number of requests made."""
+    with _start_times_lock:
+        slugs = [
+            slug for slug in dict.fromkeys(filter(None, map(extract_startgg_slug, startgg_urls)))
+            if slug not in _start_times
+        ]
+    requests_made = 0
+    for start in range(0, len(slugs), START_TIME_BATCH_SIZE):
+        chunk = slugs[start:start + START_TIME_BATCH_SIZE]
+        data = _post_query(
+            _build_start_times_query(len(chunk)),
+            {f"s{i}": slug for i, slug in enumerate(chunk)},
+            f"{len(chunk)} event slug(s)",
+        )
+        requests_made += 1
+        # A failed chunk is cached as None too: those events skip the reschedule check this run
+        # rather than each retrying start.gg on its own
+        results = {
+            slug: _unix_to_utc_iso(((data or {}).get(f"e{i}") or {}).get("startAt"))
+            for i, slug in enumerate(chunk)
+        }
+        with _start_times_lock:
+            _start_times.update(results)
+    if slugs:
+        logger.info(
+            f"Resolved {len(slugs)} start.gg start time(s) in {requests_made} request(s) ({startgg_client.client.stats})"
+        )
+    return requests_made
+
+
+def get_event_start_time_utc(startgg_url):
+    """Query start.gg for an event's scheduled start time.
+
+    Returns the start time as a UTC ISO 8601 string (e.g. '2026-03-19T19:30:00Z'), or None if the
+    URL is invalid, the event has no start time, or the request fails. Best-effort: all failures
+    are logged and swallowed so a start.gg outage never breaks the rest of the poller run.
+    Answers from the run's cache when prefetch_event_start_times (or an earlier call) has the slug.
+    """
+    slug = extract_startgg_slug(startgg_url)
+    if not slug:
+        logger.warning(f"Could not extract start.gg slug from URL '{startgg_url}'")
+        return None
+
+    with _start_times_lock:
+        if slug in _start_times:
+            return _start_times[slug]
 
-    event = (data.get("data") or {}).get("event")
-    if not event:
+    data = _post_query(_EVENT_START_TIME_QUERY, {"slug": slug}, f"slug '{slug}'")
+    if data is None:
         return None
-    return _unix_to_utc_iso(event.get("startAt"))
+    start_time = _unix_to_utc_iso((data.get("event") or {}).get("startAt"))
+    with _start_times_lock:
+        _start_times[slug] = start_time
+    return start_time
 
 
 def _unix_to_utc_iso(unix_ts):
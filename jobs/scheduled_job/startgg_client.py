@@ -0,0 +1,198 @@
+# MIRROR: src/utils/startgg_client.py — keep in sync (independent Lambda packaging prevents imports)
+"""
+start.gg GraphQL client shared by the bot and the scheduled job.
+
+start.gg allows 80 requests per 60 seconds per API token and locks the token out when that is
+exceeded (https://developer.start.gg/docs/rate-limits). Every request takes a token from a
+process-wide TokenBucket refilled at that rate, so concurrent page fetches and bulk refreshes
+queue inside the container instead of tripping the limit.
+
+Requests are retried with jittered exponential backoff when start.gg answers 429 or 5xx, or
+returns a "rate limit exceeded" error. Mutations are only retried on rate limits, which reject
+a request before it runs, so a reported set is never sent twice. A "query complexity is too
+high" error on the first page of a paged query halves its `perPage` and retries; the caller's
+variables are updated in place so later pages use the size that worked. Later pages are not
+shrunk, since a smaller page N would start at a different entrant.
+
+`stats` counts requests, retries and seconds spent waiting, for this container.
+"""
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import requests
+
+import http_sessions
+
+logger = logging.getLogger()
+
+STARTGG_API_URL = "https://api.start.gg/gql/alpha"
+REQUEST_TIMEOUT_SECONDS = 10
+
+REQUESTS_PER_WINDOW = 80
+WINDOW_SECONDS = 60
+
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 20.0
+MIN_PER_PAGE = 5
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket: holds up to `capacity` tokens, refilled continuously at
+    `capacity / window_seconds` per second. acquire() blocks until a token is available."""
+
+    def __init__(self, capacity: int, window_seconds: float,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.capacity = capacity
+        self._rate = capacity / window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Take one token, waiting for it if necessary. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self._rate
+            self._sleep(wait)
+            waited += wait
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after start.gg reports the limit was hit anyway (the token is
+        shared with other containers), so every caller here slows to the refill rate."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = 0.0
+
+
+@dataclass(slots=True)
+class ClientStats:
+    requests: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0
+    per_page_shrinks: int = 0
+
+    def __str__(self) -> str:
+        return (f"requests={self.requests} retries={self.retries} "
+                f"throttled={self.throttled_seconds:.1f}s per_page_shrinks={self.per_page_shrinks}")
+
+
+def _error_messages(response: requests.Response) -> list[str]:
+    """Lower-cased error messages in a start.gg response: `errors[].message`, or the top-level
+    `message` start.gg sends with a 429. Bodies without either are not decoded."""
+    content = response.content or b""
+    if b'"errors"' not in content and b'"message"' not in content:
+        return []
+    try:
+        body = response.json()
+    except ValueError:
+        return []
+    if not isinstance(body, dict):
+        return []
+    messages = [error.get("message") or "" for error in body.get("errors") or [] if isinstance(error, dict)]
+    if body.get("message"):
+        messages.append(body["message"])
+    return [message.lower() for message in messages]
+
+
+class StartggClient:
+    """Rate-limited, retrying start.gg client; one instance is shared by all calls in a container."""
+
+    def __init__(self, bucket: TokenBucket, max_retries: int = MAX_RETRIES,
+                 sleep: Callable[[float], None] = time.sleep, jitter: Callable[[float, float], float] = random.uniform):
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.stats = ClientStats()
+        self._sleep = sleep
+        self._jitter = jitter
+        self._stats_lock = threading.Lock()
+
+    def _count(self, requests_sent: int = 0, retries: int = 0, throttled: float = 0.0, shrinks: int = 0) -> None:
+        with self._stats_lock:
+            self.stats.requests += requests_sent
+            self.stats.retries += retries
+            self.stats.throttled_seconds += throttled
+            self.stats.per_page_shrinks += shrinks
+
+    def _backoff(self, attempt: int, response: requests.Response | None) -> None:
+        delay = self._jitter(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers.get("Retry-After", 0)))
+            except ValueError:
+                pass
+        self._count(throttled=delay)
+        self._sleep(delay)
+
+    def post(self, query: str, variables: dict, headers: dict,
+             timeout: float = REQUEST_TIMEOUT_SECONDS) -> requests.Response:
+        """POST a GraphQL document and return the final response. Raises the last
+        requests.RequestException if every attempt failed to connect."""
+        is_mutation = query.lstrip().startswith("mutation")
+        response = None
+        for attempt in range(self.max_retries + 1):
+            self._count(requests_sent=1, throttled=self.bucket.acquire())
+            try:
+                response = http_sessions.post(
+                    STARTGG_API_URL, json={"query": query, "variables": variables}, headers=headers, timeout=timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if is_mutation or attempt == self.max_retries:
+                    raise
+                logger.warning(f"[startgg] request failed (attempt {attempt + 1}/{self.max_retries + 1}): {e}")
+                self._count(retries=1)
+                self._backoff(attempt, None)
+                continue
+
+            messages = _error_messages(response) if response.status_code in (200, 429) else []
+            rate_limited = response.status_code == 429 or any("rate limit" in message for message in messages)
+            if (
+                any("complexity" in message for message in messages)
+                and variables.get("page", 1) == 1
+                and variables.get("perPage", 0) > MIN_PER_PAGE
+                and attempt < self.max_retries
+            ):
+                variables["perPage"] = max(MIN_PER_PAGE, variables["perPage"] // 2)
+                logger.warning(f"[startgg] query complexity too high, retrying with perPage={variables['perPage']}")
+                self._count(retries=1, shrinks=1)
+                continue
+            retryable = rate_limited or (not is_mutation and response.status_code in _RETRYABLE_STATUSES)
+            if not retryable:
+                return response
+            if rate_limited:
+                self.bucket.drain()
+            if attempt == self.max_retries:
+                logger.error(f"[startgg] giving up after {self.max_retries} retries (status {response.status_code})")
+                return response
+            logger.warning(
+                f"[startgg] {'rate limited' if rate_limited else f'status {response.status_code}'} "
+                f"(attempt {attempt + 1}/{self.max_retries + 1}), backing off"
+            )
+            self._count(retries=1)
+            self._backoff(attempt, response)
+        return response
+
+
+client = StartggClient(TokenBucket(REQUESTS_PER_WINDOW, WINDOW_SECONDS))
+
+
+def post(query: str, variables: dict, headers: dict, timeout: float = REQUEST_TIMEOUT_SECONDS) -> requests.Response:
+    """client.post through the shared, process-wide client."""
+    return client.post(query, variables, headers, timeout=timeout)
@@ -0,0 +1,250 @@
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import scheduled_job_constants as constants
+import db
+import discord_api
+import event_cleanup
+import event_reminders
+import event_reschedule_check
+import http_sessions
+import poll_watermark
+import schedule_sync
+import startgg_api
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Each server worker can hold a Discord connection at the same time
+http_sessions.configure_pool(constants.SERVER_CONCURRENCY)
+
+# Discord guild scheduled event statuses
+# https://discord.com/developers/docs/resources/guild-scheduled-event#guild-scheduled-event-object-guild-scheduled-event-status
+_STATUS_COMPLETED = 3
+_STATUS_CANCELED = 4
+
+
+def handler(event, context):
+    """SQS-triggered Lambda: runs cleanup, reminders and reschedule checks for each server the
+    coordinator (handler.py) enqueued. Failed or deferred servers are reported back as batch
+    item failures so SQS redelivers just those messages."""
+    table = db.MeteredTable(db.dynamodb.Table(constants.DYNAMODB_TABLE_NAME))
+    try:
+        return _run(table, event["Records"], context)
+    finally:
+        logger.info(f"DynamoDB calls this batch: {table.summary()}")
+
+
+def _run(table, records, context):
+    # FIFO delivers a server's messages in order; if a batch holds several, the newest slot wins
+    jobs = {}
+    for record in records:
+        message = json.loads(record["body"])
+        jobs[message["server_id"]] = (record["messageId"], message["run_slot"], message["event_ids"])
+
+    server_events = {}
+    claims = {}
+    for server_id, (_, run_slot, event_ids) in jobs.items():
+        claim = db.claim_server_run(table, server_id, run_slot)
+        if claim is None:
+            logger.info(f"Server {server_id} already processed for run slot {run_slot}, skipping")
+            continue
+        claims[server_id] = claim
+        # Events the bot wrote since the coordinator listed them are recorded on the claim
+        server_events[server_id] = list(dict.fromkeys([*event_ids, *sorted(claim.get("pending_event_ids", ()))]))
+    if not server_events:
+        return {"batchItemFailures": []}
+
+    try:
+        # Prefetch every CONFIG and EVENT record up front in batches; the passes below read these
+        # snapshots instead of fetching the same items per server and per event.
+        server_configs = db.batch_get_server_configs(table, list(server_events))
+        event_records = db.batch_get_event_records(table, server_events)
+        _prefetch_startgg_start_times(event_records)
+
+        failures, deferred = _process_servers(table, context, server_events, server_configs, event_records, claims)
+    except Exception:
+        # The whole batch is redelivered; without releasing, every redelivery would see its
+        # server as already processed for this slot and skip it.
+        for server_id in claims:
+            db.release_server_run(table, server_id, jobs[server_id][1])
+        raise
+    logger.info(
+        f"Processed {len(server_events) - len(failures) - len(deferred)}/{len(server_events)} servers"
+        f" ({len(failures)} failed, {len(deferred)} deferred for redelivery)"
+    )
+    for server_id, error in failures.items():
+        logger.error(f"Server {server_id} failed: {error}")
+
+    retry = [*failures, *deferred]
+    for server_id in retry:
+        db.release_server_run(table, server_id, jobs[server_id][1])
+    return {"batchItemFailures": [{"itemIdentifier": jobs[server_id][0]} for server_id in retry]}
+
+
+def _prefetch_startgg_start_times(event_records):
+    """Resolve every start.gg-linked event's start time for this batch's reschedule checks in a
+    few aliased queries, instead of one request per event. Slugs shared across servers are
+    fetched once; anything not resolved here falls back to a per-event query."""
+    startgg_api.clear_start_time_cache()
+    startgg_urls = [
+        record["startgg_url"]
+        for server_records in event_records.values()
+        for record in server_records.values()
+        if record.get("startgg_url")
+    ]
+    if not startgg_urls:
+        return
+    try:
+        startgg_api.prefetch_event_start_times(startgg_urls)
+    except Exception as e:
+        logger.error(f"start.gg start time prefetch failed, falling back to per-event queries: {e}")
+
+
+def _time_left_ms(context):
+    """Milliseconds left in this invocation, or None when run without a Lambda context."""
+    return context.get_remaining_time_in_millis() if context is not None else None
+
+
+def _process_servers(table, context, server_events, server_configs, event_records, claims):
+    """Process every server on a bounded thread pool. Returns ({server_id: error}, [deferred server_id]).
+
+    Servers only start while more than RUN_TIME_RESERVE_MS of the invocation remains, so a
+    slow batch hands its remaining servers back to SQS instead of being cut off mid-server.
+    Each processed server's next_action_at is then moved to when it next has work."""
+    def run_server(server_id, db_event_ids):
+        """Returns False if the server was deferred for lack of time."""
+        time_left = _time_left_ms(context)
+        if time_left is not None and time_left < constants.RUN_TIME_RESERVE_MS:
+            return False
+        # Each worker thread uses its own Table; calls still count towards the run's totals
+        server_table = table.sharing_counts(db.get_thread_table(constants.DYNAMODB_TABLE_NAME))
+        server_event_records = event_records.get(server_id, {})
+        cleaned_up = _process_server(
+            server_table, server_id, db_event_ids, server_configs.get(server_id), server_event_records,
+        )
+        next_action_at = _next_action_at(db_event_ids, server_event_records, cleaned_up, int(time.time()))
+        try:
+            db.set_server_next_action_at(server_table, server_id, next_action_at, claims[server_id])
+        except Exception as e:
+            # The watermark stays due, so the server is simply polled again next run
+            logger.error(f"Failed to store next_action_at for server {server_id}: {e}")
+        return True
+
+    failures = {}
+    deferred = []
+    with ThreadPoolExecutor(max_workers=constants.SERVER_CONCURRENCY) as executor:
+        futures = {
+            executor.submit(run_server, server_id, db_event_ids): server_id
+            for server_id, db_event_ids in server_events.items()
+        }
+        for future in as_completed(futures):
+            server_id = futures[future]
+            try:
+                if not future.result():
+                    deferred.append(server_id)
+            except Exception as e:
+                failures[server_id] = e
+    if deferred:
+        logger.warning(f"Time budget reached, deferred {len(deferred)} server(s) for redelivery: {', '.join(deferred)}")
+    return failures, deferred
+
+
+def _next_action_at(db_event_ids, server_event_records, cleaned_up, now):
+    """The server's next_action_at after this run: None once it has no events, and `now` (due
+    next run) when Discord couldn't be read or an event's record wasn't in the snapshot."""
+    if cleaned_up is None:
+        return now
+    records = []
+    for event_id in db_event_ids:
+        if event_id in cleaned_up:
+            continue
+        record = server_event_records.get(event_id)
+        if record is None:
+            return now
+        records.append(record)
+    return poll_watermark.server_next_action_at(records, now)
+
+
+def _process_server(table, server_id, db_event_ids, server_config, server_event_records):
+    """Cleanup, reminders and reschedule checks for one server's events, in order.
+    Returns the ids of the events cleaned up, or None if Discord's events couldn't be fetched."""
+    if not db_event_ids:
+        return []
+    discord_events = discord_api.get_guild_events(server_id)
+    if discord_events is None:
+        logger.error(f"Skipping server {server_id} due to Discord API failure")
+        notification_channel_id = server_config.get("notification_channel_id") if server_config else None
+        if notification_channel_id:
+            discord_api.send_organizer_notification(
+                notification_channel_id,
+                "⚠️ Adomin failed to fetch Discord events for this server. Event reminders and cleanup may be delayed.",
+                organizer_role=server_config.get("organizer_role"),
+                ping_organizers=server_config.get("ping_organizers", False),
+            )
+        return None
+
+    # Map discord event id -> status for events managed by this bot
+    db_event_id_set = set(db_event_ids)
+    discord_event_status = {
+        e["id"]: e["status"] for e in discord_events if e["id"] in db_event_id_set
+    }
+
+    cleaned_up_event_ids = []
+    cleaned_up_event_names = []
+    for event_id in db_event_ids:
+        event_record = server_event_records.get(event_id)
+        if event_record is None:
+            logger.info(f"Event {event_id} in server {server_id} was deleted since the index scan, skipping")
+            continue
+        status = discord_event_status.get(event_id)
+        if status in (_STATUS_COMPLETED, _STATUS_CANCELED) or status is None:
+            if status is None:
+                logger.info(
+                    f"Event {event_id} in server {server_id} not found in Discord, cleaning up"
+                )
+            else:
+                logger.info(
+                    f"Event {event_id} in server {server_id} ended (status={status}), cleaning up"
+                )
+            event_name = event_cleanup.cleanup_ended_event(
+                table, server_id, event_id, server_config, event_record=event_record
+            )
+            if event_name:
+                cleaned_up_event_ids.append(event_id)
+                cleaned_up_event_names.append(event_name)
+                if server_config:
+                    schedule_sync.strikethrough_schedule_event(server_config, event_name)
+        else:
+            logger.info(
+                f"Event {event_id} in server {server_id} still active (status={status}), checking reminders"
+            )
+            event_reminders.check_and_send_reminder(
+                table, server_id, event_id, server_config, event_record=event_record
+            )
+            # Scout start.gg for a reschedule and alert organizers. Guarded: start.gg is an
+            # external dependency, and a failure here must not block cleanup/reminders elsewhere.
+            try:
+                event_reschedule_check.check_for_reschedule(
+                    table, server_id, event_id, server_config, event_record=event_record
+                )
+            except Exception as e:
+                logger.error(f"Reschedule check failed for event {event_id} in server {server_id}: {e}")
+
+    if cleaned_up_event_names:
+        notification_channel_id = server_config.get("notification_channel_id") if server_config else None
+        if notification_channel_id:
+            event_list = "\n".join(f"• {name}" for name in cleaned_up_event_names)
+            count = len(cleaned_up_event_names)
+            message = f"🧹 Cleaned up {count} ended event(s):\n{event_list}"
+            result = discord_api.send_channel_message(notification_channel_id, message)
+            if result is None:
+                logger.error(
+                    f"Adomin is missing permissions to send to notification channel "
+                    f"{notification_channel_id} in server {server_id}"
+                )
+        else:
+            logger.info(f"No notification_channel_id configured for server {server_id}, skipping notification")
+    return cleaned_up_event_ids
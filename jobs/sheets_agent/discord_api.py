@@ -1,12 +1,12 @@
 import json
 import logging
-import time
 
 import requests
 
 from enum import Enum
 
 import constants
+import discord_rate_limit
 
 logger = logging.getLogger()
 
@@ -31,14 +31,8 @@ def _bot_auth_headers() -> dict:
 
 
 def discord_request(method: str, url: str, **kwargs) -> requests.Response:
-    """Make a Discord API request with automatic 429 retry."""
-    headers = _bot_auth_headers()
-    response = requests.request(method, url, headers=headers, timeout=10, **kwargs)
-    if response.status_code == 429:
-        retry_after = response.json().get("retry_after", 1.0)
-        logger.warning(f"[discord] rate limited on {method} {url}, sleeping {retry_after}s")
-        time.sleep(retry_after)
-        response = requests.request(method, url, headers=headers, timeout=10, **kwargs)
+    """Make a Discord API request under the shared rate limiter (see discord_rate_limit)."""
+    response = discord_rate_limit.request(method, url, headers=_bot_auth_headers(), timeout=10, **kwargs)
     _log_response(method, url, response)
     return response
 
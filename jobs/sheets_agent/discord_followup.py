@@ -1,8 +1,7 @@
 import logging
 
-import requests
-
 import discord_api
+import discord_rate_limit
 
 logger = logging.getLogger()
 
@@ -15,7 +14,7 @@ def send_followup(application_id: str, interaction_token: str, content: str, *,
         payload["allowed_mentions"] = allowed_mentions
     if flags:
         payload["flags"] = flags
-    resp = requests.post(url, json=payload, timeout=10)
+    resp = discord_rate_limit.request("POST", url, json=payload, timeout=10)
     if resp.ok:
         logger.info(f"[sheets_agent] followup sent OK status={resp.status_code}")
     else:
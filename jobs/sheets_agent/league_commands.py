@@ -1,5 +1,4 @@
 import logging
-import time
 
 import constants
 import sheets_helper
@@ -12,8 +11,6 @@ logger = logging.getLogger()
 
 _SUPPRESS_NOTIFICATIONS = 1 << 12
 
-# Brief pause between Discord API calls to avoid rate limits
-_API_CALL_PAUSE_SECONDS = 0.5
 
 def _silent_reply(content: str) -> dict:
     """Returns a followup payload dict that silently pings without triggering a notification."""
@@ -213,7 +210,6 @@ def handle_league_sync_participants(event_body: dict, aws_services: AWSServices)
         else:
             api_unresolved.append(handle)
             logger.warning(f"[sync] could not resolve snowflake for handle={handle!r}")
-        time.sleep(_API_CALL_PAUSE_SECONDS)
 
     # Build enriched active_players: {handle -> {"discord_id": snowflake, "display_name": name}}
     new_active_players = {
@@ -247,7 +243,6 @@ def handle_league_sync_participants(event_body: dict, aws_services: AWSServices)
                     role_failed_handles.append(handle)
                 else:
                     role_failed_handles.append(handle)
-                time.sleep(_API_CALL_PAUSE_SECONDS)
             else:
                 logger.warning(f"[sync] skipping role assignment for handle={handle!r}: no snowflake")
 
@@ -2,7 +2,6 @@ import datetime
 import json
 import logging
 import re
-import time
 
 import boto3
 from google.oauth2 import service_account
@@ -16,9 +15,6 @@ import report_log
 
 logger = logging.getLogger()
 
-# Brief pause between Discord API calls to avoid rate limits
-_API_CALL_PAUSE_SECONDS = 0.5
-
 _SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 _SHEETS_ID_PATTERN = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
 
@@ -437,7 +433,6 @@ def get_active_participants(spreadsheet_url: str, guild_id: str) -> dict:
         # No Discord ID — attempt to resolve by display name
         logger.info(f"[sheets] get_active_participants: row {i} has no Discord ID, searching by display name={participant_name!r}")
         match = discord_api.search_member_by_display_name(guild_id, participant_name)
-        time.sleep(_API_CALL_PAUSE_SECONDS)
 
         if match:
             _, username_handle = match
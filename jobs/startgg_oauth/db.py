@@ -43,11 +43,14 @@ def update_server_oauth_token(table, server_id: str, access_token: str, refresh_
         UpdateExpression=(
             "SET oauth_token_startgg = :token, "
             "startgg_refresh_token = :refresh_token, "
-            "startgg_token_expires_at = :expires_at"
+            "startgg_token_expires_at = :expires_at "
+            # Invalidates the bot's warm-container CONFIG cache (see src/database/dynamodb_utils.py)
+            "ADD config_version :version_bump"
         ),
         ExpressionAttributeValues={
             ":token": access_token,
             ":refresh_token": refresh_token,
             ":expires_at": int(time.time()) + expires_in,
+            ":version_bump": 1,
         },
     )
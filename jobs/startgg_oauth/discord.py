@@ -1,7 +1,6 @@
 import logging
 
-import requests
-
+import discord_rate_limit
 import oauth_constants as constants
 
 logger = logging.getLogger()
@@ -30,7 +29,8 @@ def send_oauth_notification(server_config: dict, discord_user_id: str):
             message = f"{_role_ping(organizer_role)} {message}"
 
     logger.info(f"[oauth:discord] Sending notification to channel_id={notification_channel_id!r}")
-    response = requests.post(
+    response = discord_rate_limit.request(
+        "POST",
         f"{_DISCORD_API}/channels/{notification_channel_id}/messages",
         headers={"Authorization": f"Bot {constants.get_discord_bot_token()}", "Content-Type": "application/json"},
         json={"content": message},
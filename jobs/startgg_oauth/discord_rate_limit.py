@@ -0,0 +1,202 @@
+# MIRROR: src/utils/discord_rate_limit.py — keep in sync (independent Lambda packaging prevents imports)
+"""
+Discord rate-limit engine shared by every Discord client in the bot and its jobs.
+
+Discord reports limits per response through headers:
+    X-RateLimit-Bucket       opaque id of the bucket the route belongs to
+    X-RateLimit-Remaining    requests left in the bucket's current window
+    X-RateLimit-Reset-After  seconds until the window resets
+    X-RateLimit-Global       present on a 429 caused by the global limit
+https://discord.com/developers/docs/topics/rate-limits
+
+Routes are learned into buckets as responses come in. A bucket's limit applies per
+major parameter (channel, guild or webhook), so state is kept per (bucket, major id).
+Once a bucket is drained, callers sharing it wait for the reset before sending instead
+of firing and eating a 429. A 429 is retried after its retry_after, at most MAX_RETRIES
+times, and never when the wait would exceed MAX_WAIT_SECONDS.
+"""
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import requests
+
+import http_sessions
+
+logger = logging.getLogger()
+
+MAX_RETRIES = 3
+MAX_WAIT_SECONDS = 30.0
+
+# Reset-After values from one window drift by network latency between responses
+_SAME_WINDOW_TOLERANCE_SECONDS = 0.05
+
+# The API version prefix is not part of the route
+_API_PREFIX_PATTERN = re.compile(r"^/api(/v\d+)?")
+_MAJOR_PARAM_PATTERN = re.compile(r"^/(channels|guilds|webhooks)/(\d+)(/[^/?]+)?")
+_SNOWFLAKE_PATTERN = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass(slots=True)
+class _BucketState:
+    limit: int = 1
+    remaining: int = 1
+    reset_at: float = 0.0
+    # Longest Reset-After seen, used to estimate the next window before Discord reports it
+    window: float = 0.0
+    # Requests sent under this bucket whose response has not come back yet
+    in_flight: int = 0
+
+
+def route_key(method: str, url: str) -> tuple[str, str]:
+    """Split a request into (route, major): route is the method plus the templated path,
+    e.g. "PUT /guilds/{id}/members/{id}/roles/{id}", and major is the id the bucket's
+    limit is scoped to (channel, guild, or webhook id + token)."""
+    path = "/" + url.split("://", 1)[-1].split("/", 1)[-1].split("?", 1)[0]
+    path = _API_PREFIX_PATTERN.sub("", path)
+    major = ""
+    match = _MAJOR_PARAM_PATTERN.match(path)
+    if match:
+        resource, major, token = match.groups()
+        if resource == "webhooks" and token:
+            # Interaction tokens scope the limit but must not end up in logs
+            major = f"{major}{token}"
+            path = "/webhooks/{id}/{token}" + path[match.end():]
+    return f"{method.upper()} {_SNOWFLAKE_PATTERN.sub('/{id}', path)}", major
+
+
+class DiscordRateLimiter:
+    """Thread-safe bucket manager; one instance is shared by all calls in a warm container."""
+
+    def __init__(self, max_retries: int = MAX_RETRIES, max_wait_seconds: float = MAX_WAIT_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.max_retries = max_retries
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._route_buckets: dict[str, str] = {}
+        self._buckets: dict[tuple[str, str], _BucketState] = {}
+        self._global_reset_at = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._route_buckets.clear()
+            self._buckets.clear()
+            self._global_reset_at = 0.0
+
+    def execute(self, method: str, url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Run send() under the limits learned for method+url, retrying 429s up to max_retries."""
+        route, major = route_key(method, url)
+        response = None
+        for attempt in range(self.max_retries + 1):
+            allowed, reserved = self._wait_for_capacity(route, major)
+            # A wait longer than the cap is not worth the Lambda's time: hand back the last
+            # 429, or on the first attempt send anyway and let Discord decide
+            if not allowed and response is not None:
+                return response
+            try:
+                response = send()
+            finally:
+                self._release(reserved)
+            self._update(route, major, response)
+            if response.status_code != 429:
+                return response
+            retry_after = self._handle_too_many_requests(route, major, response)
+            logger.warning(
+                f"[discord] 429 on {route} (attempt {attempt + 1}/{self.max_retries + 1}), retry_after={retry_after}s"
+            )
+        logger.error(f"[discord] giving up on {route} after {self.max_retries} retries")
+        return response
+
+    def _wait_for_capacity(self, route: str, major: str) -> tuple[bool, _BucketState | None]:
+        """Block until the global limit and the route's bucket allow a request, then reserve a
+        slot in the bucket. Returns (False, None) when the wait would exceed max_wait_seconds."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = self._global_reset_at - now
+                bucket_id = self._route_buckets.get(route)
+                state = self._buckets.get((bucket_id, major)) if bucket_id else None
+                if state is not None:
+                    if state.reset_at <= now:
+                        # The window rolled over; assume a full one until Discord says otherwise
+                        state.remaining = state.limit
+                        state.reset_at = now + state.window
+                    if state.remaining - state.in_flight <= 0:
+                        delay = max(delay, state.reset_at - now)
+                if delay <= 0:
+                    if state is not None:
+                        state.in_flight += 1
+                    return True, state
+            if delay > self.max_wait_seconds:
+                logger.error(f"[discord] {route} is limited for {delay:.1f}s, not waiting")
+                return False, None
+            logger.warning(f"[discord] waiting {delay:.2f}s for rate limit on {route}")
+            self._sleep(delay)
+
+    def _release(self, state: _BucketState | None) -> None:
+        if state is not None:
+            with self._lock:
+                state.in_flight -= 1
+
+    def _update(self, route: str, major: str, response: requests.Response) -> None:
+        headers = response.headers
+        bucket_id = headers.get("X-RateLimit-Bucket")
+        if not bucket_id:
+            return
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+            limit = int(headers.get("X-RateLimit-Limit", remaining + 1))
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            self._route_buckets[route] = bucket_id
+            state = self._buckets.setdefault((bucket_id, major), _BucketState())
+            reset_at = self._clock() + reset_after
+            if reset_at > state.reset_at + _SAME_WINDOW_TOLERANCE_SECONDS:
+                # First response from a new window
+                state.remaining = remaining
+                state.reset_at = reset_at
+            else:
+                # Responses can arrive out of order; within a window the lowest count is current,
+                # and a response from an older window must not lift the limit early
+                state.remaining = min(state.remaining, remaining)
+                state.reset_at = max(state.reset_at, reset_at)
+            state.limit = limit
+            state.window = max(state.window, reset_after)
+
+    def _handle_too_many_requests(self, route: str, major: str, response: requests.Response) -> float:
+        """Record the wait a 429 asks for and return it in seconds."""
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        retry_after = body.get("retry_after")
+        if retry_after is None:
+            retry_after = response.headers.get("Retry-After", 1.0)
+        retry_after = float(retry_after)
+        is_global = body.get("global") or response.headers.get("X-RateLimit-Global", "").lower() == "true"
+        with self._lock:
+            reset_at = self._clock() + retry_after
+            if is_global:
+                self._global_reset_at = max(self._global_reset_at, reset_at)
+            else:
+                bucket_id = self._route_buckets.get(route) or f"route:{route}"
+                self._route_buckets[route] = bucket_id
+                state = self._buckets.setdefault((bucket_id, major), _BucketState())
+                state.remaining = 0
+                state.reset_at = max(state.reset_at, reset_at)
+        return retry_after
+
+
+limiter = DiscordRateLimiter()
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """http_sessions.request through the shared limiter; kwargs are passed straight through."""
+    return limiter.execute(method, url, lambda: http_sessions.request(method, url, **kwargs))
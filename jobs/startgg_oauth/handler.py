@@ -2,11 +2,11 @@ import json
 import logging
 
 import boto3
-import requests
 
 import oauth_constants as constants
 import db
 import discord
+import http_sessions
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -66,7 +66,7 @@ def handler(event, context):
 
     logger.info(f"[oauth:handler] Exchanging code for token — discord_user_id={discord_user_id!r}, server_id={server_id!r}")
     credentials = _get_oauth_credentials()
-    token_response = requests.post(
+    token_response = http_sessions.post(
         STARTGG_TOKEN_URL,
         json={
             "client_id": credentials["client_id"],
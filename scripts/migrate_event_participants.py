@@ -0,0 +1,81 @@
+"""
+Convert events from the embedded participant layout (registered/checked_in maps on the
+EVENT item) to one item per participant (SK=PART#<id>#REG#<uid> / PART#<id>#CHK#<uid>).
+Events already in the items layout whose participant items still use the old
+EVENT#<id>#REG#/#CHK# keys are re-keyed to PART#.
+
+Usage:
+    REGION=us-east-2 DYNAMODB_TABLE_NAME=adomi-discord-server-data-dev \\
+        python scripts/migrate_event_participants.py --server-id 123 [--event-id 456] [--dry-run]
+
+Without --event-id every event in the server is migrated. Already-migrated events are skipped,
+so the script is safe to re-run. Run it before deploying the PART# key change to a stage with
+items-layout events, so their participants stay readable.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import boto3
+
+# --- Add src/ to sys.path so we can reuse the bot's DynamoDB helpers ---
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT_DIR / "src"
+sys.path.append(str(SRC_DIR))
+
+import database.dynamodb_utils as db_helper  # noqa: E402 — imported after sys.path bootstrap
+from database.models.event_data import EventData  # noqa: E402
+
+TABLE_NAME = os.environ.get("DYNAMODB_TABLE_NAME")
+REGION = os.environ.get("REGION")
+
+
+def _event_ids_to_migrate(server_id: str, event_id: str, table) -> list:
+    if event_id:
+        return [event_id]
+    events = db_helper.iter_full_events_for_server(
+        server_id, table, projection=[EventData.Keys.PARTICIPANT_LAYOUT]
+    )
+    return [e.event_id for e in events]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server-id", required=True)
+    parser.add_argument("--event-id", help="Migrate a single event (default: every event in the server)")
+    parser.add_argument("--dry-run", action="store_true", help="List the events that would be migrated")
+    args = parser.parse_args()
+
+    if not TABLE_NAME:
+        raise RuntimeError("DYNAMODB_TABLE_NAME must be set as an environment variable")
+    table = boto3.resource("dynamodb", region_name=REGION).Table(TABLE_NAME)
+
+    event_ids = _event_ids_to_migrate(args.server_id, args.event_id, table)
+    print(f"{len(event_ids)} event(s) to check in server {args.server_id}")
+
+    failed = []
+    for event_id in event_ids:
+        if args.dry_run:
+            print(f"  would check event {event_id}")
+            continue
+        try:
+            moved = db_helper.move_legacy_participant_items(args.server_id, event_id, table)
+            written = db_helper.migrate_event_participants(args.server_id, event_id, table)
+        except Exception as e:
+            print(f"  ❌ event {event_id}: {e}")
+            failed.append(event_id)
+            continue
+        if written is None:
+            print(f"  ⚠️ event {event_id} not found")
+        elif moved:
+            print(f"  ✅ event {event_id}: {moved} participant item(s) re-keyed to PART#")
+        else:
+            print(f"  ✅ event {event_id}: {written} participant item(s)")
+
+    if failed:
+        sys.exit(f"Migration failed for {len(failed)} event(s): {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,5 +19,6 @@ def get_aws_services() -> AWSServices:
             dynamodb_table=_dynamodb.Table(constants.DYNAMODB_TABLE_NAME),
             remove_role_sqs_queue=_sqs.Queue(constants.SQS_REMOVE_ROLE_QUEUE_URL),
             sheets_agent_sqs_queue=_sqs.Queue(constants.SQS_SHEETS_AGENT_QUEUE_URL),
+            deferred_command_sqs_queue=_sqs.Queue(constants.SQS_DEFERRED_COMMAND_QUEUE_URL),
         )
     return _aws_services
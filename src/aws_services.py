@@ -1,15 +1,30 @@
 # MIRROR: jobs/sheets_agent/aws_services.py — keep in sync (independent Lambda packaging prevents imports)
-from mypy_boto3_dynamodb.service_resource import Table
-from mypy_boto3_sqs.service_resource import Queue
+import copy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Type stubs only; importing them at runtime pulls in all of botocore's docs machinery
+    from mypy_boto3_dynamodb.service_resource import Table
+    from mypy_boto3_sqs.service_resource import Queue
 
 class AWSServices:
     """Container bundling the AWS resource clients (DynamoDB table and SQS
     queues) the bot needs, so handlers receive one injectable dependency."""
-    dynamodb_table: Table
-    remove_role_sqs_queue: Queue
-    sheets_agent_sqs_queue: Queue
+    dynamodb_table: "Table"
+    remove_role_sqs_queue: "Queue"
+    sheets_agent_sqs_queue: "Queue"
+    deferred_command_sqs_queue: "Queue"
 
-    def __init__(self, dynamodb_table: Table, remove_role_sqs_queue: Queue, sheets_agent_sqs_queue: Queue):
+    def __init__(self, dynamodb_table: "Table", remove_role_sqs_queue: "Queue", sheets_agent_sqs_queue: "Queue",
+                 deferred_command_sqs_queue: "Queue"):
         self.dynamodb_table = dynamodb_table
         self.remove_role_sqs_queue = remove_role_sqs_queue
         self.sheets_agent_sqs_queue = sheets_agent_sqs_queue
+        self.deferred_command_sqs_queue = deferred_command_sqs_queue
+
+    def with_dynamodb_table(self, dynamodb_table: "Table") -> "AWSServices":
+        """Return a copy of these services using a different table handle, e.g. one wrapped
+        in a per-interaction read cache. The shared instance is left untouched."""
+        services = copy.copy(self)
+        services.dynamodb_table = dynamodb_table
+        return services
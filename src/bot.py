@@ -1,31 +1,31 @@
+import time
 import traceback
 from aws_services import AWSServices
 
+import constants
 import commands.command_map as command_map
+import utils.discord_api_helper as discord_helper
+import utils.queue_deferred_command as queue_deferred_command
+import database.dynamodb_utils as db_helper
+from commands.models.command_mapping import CommandEntry
 from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
+from enums import DiscordCallbackType
 
-def process_bot_command(event_body: dict, aws_services: AWSServices) -> dict:
-    """Dispatch a Discord slash command interaction to its registered handler.
-
-    :param event_body: Parsed Discord interaction payload.
-    :param aws_services: Shared AWS service clients.
-    :return: The interaction response as a dict.
-    """
-    if "data" not in event_body:
-        raise KeyError("No field 'data'. This is not a valid Discord Slash Command message.")
-
-    event = DiscordEvent(event_body)
-    command_name = event.get_command_name()
-
+def _get_command_or_fail(command_name: str) -> CommandEntry:
     command = command_map.command_map.get(command_name)
     if command is None:
         raise ValueError(f"No command registered for {command_name}")
+    return command
 
+def _run_command(command_name: str, command: CommandEntry, event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
+    """Invoke a command handler, converting raised errors into user-facing messages.
+    The handler gets a fresh read cache over the table, scoped to this interaction."""
     command_function = command["function"]
     print(f"[bot] command={command_name} server={event.get_server_id()} user={event.get_user_id()}")
+    read_cache = db_helper.RequestReadCache(aws_services.dynamodb_table)
     try:
-        message = command_function(event, aws_services)
+        message = command_function(event, aws_services.with_dynamodb_table(read_cache))
     except ValueError as e:
         print(f"[bot] ERROR ValueError | command={command_name} | {e}")
         print(f"[bot] {traceback.format_exc()}")
@@ -34,12 +34,77 @@ def process_bot_command(event_body: dict, aws_services: AWSServices) -> dict:
         print(f"[bot] ERROR {type(e).__name__} | command={command_name} | {e}")
         print(f"[bot] {traceback.format_exc()}")
         message = ResponseMessage.get_error_message()
+    print(f"[db] request cache {read_cache.stats()} command={command_name}")
     if message:
         print(f"[bot] command={command_name} -> ok")
-        return message.to_dict()
+        return message
 
     raise RuntimeError(f"Error processing command '{command_name}': did not return a message.")
 
+def process_bot_command(event_body: dict, aws_services: AWSServices) -> dict:
+    """Dispatch a Discord slash command interaction to its registered handler.
+
+    Commands mapped with `deferred` are enqueued for the deferred command worker instead,
+    and Discord is answered immediately with a deferred ("thinking...") response.
+
+    :param event_body: Parsed Discord interaction payload.
+    :param aws_services: Shared AWS service clients.
+    :return: The interaction response as a dict.
+    """
+    if "data" not in event_body:
+        raise KeyError("No field 'data'. This is not a valid Discord Slash Command message.")
+
+    event = DiscordEvent(event_body)
+    command_name = event.get_command_name()
+    command = _get_command_or_fail(command_name)
+
+    if command.get("deferred"):
+        print(f"[bot] command={command_name} server={event.get_server_id()} user={event.get_user_id()} -> deferred")
+        queue_deferred_command.enqueue_deferred_command(command_name, event_body, aws_services.deferred_command_sqs_queue)
+        return {"type": DiscordCallbackType.DEFERRED_MESSAGE_WITH_SOURCE}
+
+    return _run_command(command_name, command, event, aws_services).to_dict()
+
+def process_deferred_command(payload: dict, aws_services: AWSServices) -> None:
+    """Run a command enqueued by `process_bot_command` and post its result over the
+    interaction webhook, replacing the deferred response.
+
+    Results that ping are sent as a followup rather than an edit, since Discord never notifies
+    mentions added by editing a message.
+
+    Never raises once the command has run: a redelivered message would re-run a command that
+    may already have had side effects (e.g. created a Discord event).
+
+    :param payload: Queued message with command_name, event_body and enqueued_at.
+    :param aws_services: Shared AWS service clients.
+    """
+    command_name = payload["command_name"]
+    event_body = payload["event_body"]
+
+    enqueued_at = payload.get("enqueued_at")
+    queue_age = time.time() - enqueued_at if enqueued_at else 0
+    print(f"[bot] deferred command={command_name} queue_age={queue_age:.1f}s")
+    if queue_age > constants.INTERACTION_TOKEN_TTL_SECONDS:
+        print(f"[bot] ERROR deferred command={command_name} dropped — interaction token expired")
+        return
+
+    event = DiscordEvent(event_body)
+    try:
+        message = _run_command(command_name, _get_command_or_fail(command_name), event, aws_services)
+    except Exception as e:
+        print(f"[bot] ERROR {type(e).__name__} | deferred command={command_name} | {e}")
+        print(f"[bot] {traceback.format_exc()}")
+        message = ResponseMessage.get_error_message()
+
+    try:
+        deliver = (
+            discord_helper.send_interaction_followup if message.pings
+            else discord_helper.edit_original_interaction_response
+        )
+        deliver(event_body["application_id"], event_body["token"], message.to_dict()["data"])
+    except Exception as e:
+        print(f"[bot] ERROR {type(e).__name__} | delivering deferred command={command_name} | {e}")
+
 def process_input_autocomplete(event_body: dict, aws_services: AWSServices) -> dict:
     """Dispatch an autocomplete interaction to the focused option's handler.
 
@@ -56,9 +121,7 @@ def process_input_autocomplete(event_body: dict, aws_services: AWSServices) -> d
         raise KeyError("No focused option found in autocomplete interaction.")
 
     command_name = event_body["data"]["name"]
-    command = command_map.command_map.get(command_name)
-    if command is None:
-        raise ValueError(f"No command registered for {command_name}")
+    command = _get_command_or_fail(command_name)
 
     param = next((p for p in command["params"] if p.name == focused_option["name"]), None)
     if param is None or param.autocomplete_handler is None:
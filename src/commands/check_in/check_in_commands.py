@@ -1,5 +1,5 @@
 import commands.check_in.check_in_constants as check_in_constants
-import commands.event.event_commands as event_commands
+from commands.models.lazy_function import LazyModule
 import database.dynamodb_utils as db_helper
 import utils.discord_api_helper as discord_helper
 from utils.discord_api_helper import RoleAssignmentResult
@@ -9,46 +9,50 @@ import utils.queue_role_removal as queue_role_removal
 from aws_services import AWSServices
 from database.models.event_data import EventData
 from database.models.participant import Participant
+from enums import ParticipantWriteOutcome
 from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
 
+# Only needed to refresh start.gg events in check-in-list-absent; loaded on first use so
+# /check-in doesn't pay for the start.gg client on a cold start.
+event_commands = LazyModule("commands.event.event_commands")
+
 def check_in_user(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
     """
-    Adds the user who invoked the command to the 'checked_in' map for the event record in DynamoDB.
+    Adds the user who invoked the command to the event's checked-in participants in DynamoDB.
     Assigns the participant role if configured.
     Returns a ResponseMessage indicating success or failure.
     """
     server_id = event.get_server_id()
     event_id = event.get_command_input_value("event_name")
+    user_id = event.get_user_id()
+    checked_in_user = Participant(
+        display_name=event.get_username(),
+        user_id=user_id
+    )
 
-    event_data_result = db_helper.get_server_event_data_or_fail(server_id, event_id, aws_services.dynamodb_table)
-    if isinstance(event_data_result, ResponseMessage):
-        return event_data_result
+    # One conditional write: rejected if check-ins are closed or the user is already checked in,
+    # so concurrent check-ins can't race and we don't read the full event first
+    write_result = db_helper.add_event_participant_or_fail(
+        server_id, event_id, EventData.Keys.CHECKED_IN, user_id, checked_in_user.to_dict(),
+        aws_services.dynamodb_table, enabled_key=EventData.Keys.CHECK_IN_ENABLED
+    )
+    if isinstance(write_result, ResponseMessage):
+        return write_result
 
-    if not event_data_result.check_in_enabled:
+    event_data_result = write_result.event_data
+    if write_result.outcome == ParticipantWriteOutcome.CLOSED:
         return ResponseMessage(
             content=f"😵‍💫 Check-ins are not being accepted right now for **{event_data_result.event_name}**.\n"
                     "An Organizer must start check-ins before I can accept any new ones."
         )
 
-    user_id = event.get_user_id()
-    if user_id in event_data_result.checked_in:
-        existing_check_in = Participant.from_dynamodb(event_data_result.checked_in[user_id])
+    if write_result.outcome == ParticipantWriteOutcome.ALREADY_PRESENT:
+        existing_check_in = Participant.from_dynamodb(write_result.existing)
         return ResponseMessage(
             content=f"✅ You already checked in {existing_check_in.get_relative_time_added().lower()}."
         )
 
-    checked_in_user = Participant(
-        display_name=event.get_username(),
-        user_id=user_id
-    )
-
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"SET {EventData.Keys.CHECKED_IN}.#uid = :participant_info",
-        ExpressionAttributeNames={"#uid": user_id},
-        ExpressionAttributeValues={":participant_info": checked_in_user.to_dict()}
-    )
     if event_data_result.participant_role:
         print(f"[check_in] Assigning participant role {event_data_result.participant_role} to user {user_id}")
         role_result = discord_helper.add_role_to_user(
@@ -138,10 +142,9 @@ def clear_checked_in(event: DiscordEvent, aws_services: AWSServices) -> Response
         print("[check_in] No participant_role set. No role to unassign.")
         content += "!" # Distinctly end the content of message to return
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"SET {EventData.Keys.CHECKED_IN} = :empty_map",
-        ExpressionAttributeValues={":empty_map": {}}
+    db_helper.clear_event_participants(
+        server_id, event_data_result.event_id or event_id, event_data_result,
+        EventData.Keys.CHECKED_IN, aws_services.dynamodb_table
     )
 
     return ResponseMessage(content=content)
@@ -249,10 +252,9 @@ def remove_checked_in(event: DiscordEvent, aws_services: AWSServices) -> Respons
             content=f"⚠️ {message_helper.get_user_ping(user_id)} is not checked in for this event."
         ).with_silent_pings()
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"REMOVE {EventData.Keys.CHECKED_IN}.#uid",
-        ExpressionAttributeNames={"#uid": user_id}
+    db_helper.remove_event_participant(
+        server_id, event_data_result.event_id or event_id, event_data_result,
+        EventData.Keys.CHECKED_IN, user_id, aws_services.dynamodb_table
     )
 
     content = f"✅ {message_helper.get_user_ping(user_id)} has been removed from check-in"
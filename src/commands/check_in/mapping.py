@@ -1,10 +1,13 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 import commands.check_in.check_in_constants as check_in_constants
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam, ParamChoice
-import commands.check_in.check_in_commands as check_in_commands
-from commands.event.autocomplete_handlers import EVENT_NAME_PARAM
+from commands.event.event_params import EVENT_NAME_PARAM
+
+# Command modules are imported only when one of their commands is invoked
+check_in_commands = LazyModule("commands.check_in.check_in_commands")
 
 checkin_commands: CommandMapping = {
     "check-in": {
@@ -24,6 +27,7 @@ checkin_commands: CommandMapping = {
     },
     "check-in-list-absent": {
         "function": check_in_commands.show_not_checked_in,
+        "deferred": True,
         "description": "Show registered users who have not checked in, optionally ping them (Organizer only)",
         "params": [
             EVENT_NAME_PARAM,
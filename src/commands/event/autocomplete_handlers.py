@@ -1,36 +1,27 @@
-from discord import AppCommandOptionType
-
 from aws_services import AWSServices
 from commands.models.autocomplete_response import AutocompleteResponse
-from commands.models.command_param import CommandParam, ParamChoice
 from commands.models.discord_event import DiscordEvent
 from commands.event.timezone_helper import TIMEZONE_OPTIONS
 import database.dynamodb_utils as db_helper
+import utils.autocomplete_helper as autocomplete_helper
+
+# Static, so built once per container; the curated order is kept when nothing is typed
+_TIMEZONE_INDEX = autocomplete_helper.NameIndex(
+    [(tz.display_name, tz.zoneinfo_key) for tz in TIMEZONE_OPTIONS], preserve_order=True
+)
 
 
-def autocomplete_event_timezone(_event: DiscordEvent, _aws_services: AWSServices) -> AutocompleteResponse:
-    """Returns the static list of supported timezone choices."""
-    return AutocompleteResponse([tz.to_param_choice() for tz in TIMEZONE_OPTIONS])
+def autocomplete_event_timezone(event: DiscordEvent, _aws_services: AWSServices) -> AutocompleteResponse:
+    """Returns the supported timezone choices matching what the user has typed."""
+    return autocomplete_helper.build_response(_TIMEZONE_INDEX, event.get_focused_option_value())
 
 
 def autocomplete_event_name(event: DiscordEvent, aws_services: AWSServices) -> AutocompleteResponse:
-    """Returns the server's active events as choices (label: event name, value: event_id)."""
+    """Returns the server's active events matching what the user has typed
+    (label: event name, value: event_id for easy indexing)."""
     server_id = event.get_server_id()
-    events = db_helper.get_events_for_server(server_id, aws_services.dynamodb_table)
-    # name is the display label; value is the event_id for easy indexing
-    choices = [ParamChoice(name=name, value=event_id) for name, event_id in events]
-    # Discord rejects autocomplete payloads with more than 25 choices
-    return AutocompleteResponse(choices[:25])
-
-
-# Shared param used by any command that needs to target a specific event.
-# The autocomplete value is the event_id, not the display name.
-EVENT_NAME_PARAM = CommandParam(
-    name="event_name",
-    description="Name of the event",
-    param_type=AppCommandOptionType.string,
-    required=True,
-    choices=None,
-    autocomplete=True,
-    autocomplete_handler=autocomplete_event_name
-)
+    index = autocomplete_helper.get_name_index(
+        autocomplete_helper.EVENT_INDEX, server_id,
+        lambda: db_helper.get_events_for_server(server_id, aws_services.dynamodb_table),
+    )
+    return autocomplete_helper.build_response(index, event.get_focused_option_value())
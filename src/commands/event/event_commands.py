@@ -1,3 +1,5 @@
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Optional
 
@@ -11,9 +13,11 @@ import utils.permissions_helper as permissions_helper
 import utils.queue_role_removal as queue_role_removal
 from aws_services import AWSServices
 from commands.event.event_helper import EventRecord
+from commands.event.startgg.models.startgg_event import StartggEventStream
 from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
 from database.models.event_data import EventData
+from database.models.participant import Participant
 
 NO_PARTICIPANT_ROLE_WARNING = (
     "\n⚠️ No participant role is set for this event. "
@@ -28,6 +32,94 @@ INVALID_STARTGG_LINK_MESSAGE = (
 
 DEFAULT_EVENT_LOCATION = "Online"
 
+# Registrant changes written per batch while a start.gg import streams in
+_IMPORT_CHUNK_SIZE = 500
+# start.gg users without Discord named in a summary; the rest are only counted
+_NO_DISCORD_REPORT_LIMIT = 50
+
+
+@dataclass
+class _ImportSummary:
+    total_count: int = 0
+    no_discord_count: int = 0
+    no_discord_names: list = field(default_factory=list)
+    added: int = 0
+    removed: int = 0
+    renamed: int = 0
+    updated: int = 0
+    manual_kept: int = 0
+
+    def describe_changes(self) -> str:
+        changes = f"{self.added} added, {self.removed} removed, {self.renamed} renamed"
+        if self.updated:
+            changes += f", {self.updated} updated"
+        if self.manual_kept:
+            changes += f"; {self.manual_kept} manual registration(s) kept"
+        return changes
+
+
+def _sync_registrant(summary: _ImportSummary, stored: Optional[dict], participant: dict) -> Optional[dict]:
+    """Diff one start.gg registrant against the stored entry under the same key. Returns what
+    to write, or None if nothing changed. time_added is kept from the stored entry."""
+    if stored is None:
+        summary.added += 1
+        return participant
+    if stored.get("source") == db_helper.MANUAL_PARTICIPANT_SOURCE:
+        return None
+    time_added = Participant.Keys.TIME_ADDED
+    if {**participant, time_added: None} == {**stored, time_added: None}:
+        return None
+    if stored.get(Participant.Keys.DISPLAY_NAME) != participant[Participant.Keys.DISPLAY_NAME]:
+        summary.renamed += 1
+    else:
+        summary.updated += 1
+    return {**participant, time_added: stored.get(time_added, participant[time_added])}
+
+
+def _import_startgg_registrants(server_id: str, event_id: str, event_data: EventData, stream: StartggEventStream,
+                                table, event_attributes: Optional[dict] = None) -> _ImportSummary:
+    """Sync an event's registered list with a start.gg event's entrants, page by page.
+
+    Only the differences against the stored list are written — new and renamed entrants are
+    upserted and entrants no longer on start.gg removed, in _IMPORT_CHUNK_SIZE batches as pages
+    arrive. Manual (/register) registrations are never removed.
+    """
+    summary = _ImportSummary()
+    kind = EventData.Keys.REGISTERED
+    stored = db_helper.prepare_participant_sync(server_id, event_id, event_data, kind, stream.entrant_total, table)
+    seen = set()
+
+    upserts = {}
+    for registered, no_discord in stream.pages:
+        summary.total_count += len(registered) + len(no_discord)
+        page = [(participant.user_id, participant) for participant in registered]
+        for participant in no_discord:
+            page.append((participant.display_name, participant))
+            summary.no_discord_count += 1
+            if len(summary.no_discord_names) < _NO_DISCORD_REPORT_LIMIT:
+                summary.no_discord_names.append(participant.display_name)
+        for participant_key, participant in page:
+            seen.add(participant_key)
+            change = _sync_registrant(summary, stored.get(participant_key), participant.to_dict())
+            if change is not None:
+                upserts[participant_key] = change
+        if len(upserts) >= _IMPORT_CHUNK_SIZE:
+            db_helper.apply_participant_diff(server_id, event_id, event_data, kind, upserts, [], table)
+            upserts = {}
+
+    removals = []
+    for participant_key, participant in stored.items():
+        if participant_key in seen:
+            continue
+        if participant.get("source") == db_helper.MANUAL_PARTICIPANT_SOURCE:
+            summary.manual_kept += 1
+        else:
+            removals.append(participant_key)
+    summary.removed = len(removals)
+    db_helper.apply_participant_diff(server_id, event_id, event_data, kind, upserts, removals, table)
+    db_helper.set_event_attributes(server_id, event_id, event_attributes or {}, table)
+    return summary
+
 
 def _build_register_description(event_url: str) -> str:
     """Builds the standard event description pointing at a start.gg registration link."""
@@ -328,7 +420,8 @@ def create_event_startgg(event: DiscordEvent, aws_services: AWSServices) -> Resp
     if not startgg_api.is_valid_startgg_url(event_url):
         return ResponseMessage(content=INVALID_STARTGG_LINK_MESSAGE)
 
-    startgg_event = startgg_api.query_startgg_event(event_url)
+    stream = startgg_api.stream_startgg_event(event_url, table=aws_services.dynamodb_table)
+    startgg_event = stream.event
 
     if not startgg_event.start_time_utc:
         return ResponseMessage(
@@ -371,33 +464,19 @@ def create_event_startgg(event: DiscordEvent, aws_services: AWSServices) -> Resp
         table=aws_services.dynamodb_table
     )
 
-    total_count = len(startgg_event.participants) + len(startgg_event.no_discord_participants)
-    no_discord_names = [p.display_name for p in startgg_event.no_discord_participants]
-
-    all_participants_data = {p.user_id: p.to_dict() for p in startgg_event.participants}
-    for p in startgg_event.no_discord_participants:
-        all_participants_data[p.display_name] = p.to_dict()
-
-    update_expressions = []
-    expression_values = {":startgg_url": event_url}
-
-    if all_participants_data:
-        update_expressions.append(f"{EventData.Keys.REGISTERED} = :startgg_registered")
-        expression_values[":startgg_registered"] = all_participants_data
-
-    update_expressions.append(f"{EventData.Keys.STARTGG_URL} = :startgg_url")
-
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + event_id},
-        UpdateExpression="SET " + ", ".join(update_expressions),
-        ExpressionAttributeValues=expression_values
+    # The record was just created with the default embedded layout and empty maps
+    imported = _import_startgg_registrants(
+        server_id, event_id, EventData.from_dynamodb({EventData.Keys.REGISTERED: {}}), stream, aws_services.dynamodb_table,
+        event_attributes={EventData.Keys.STARTGG_URL: event_url},
     )
+    # start.gg-linked events get a reschedule check on every scheduled run until they start
+    db_helper.lower_server_next_action_at(server_id, int(time.time()), [event_id], aws_services.dynamodb_table)
 
-    no_discord_report = _build_no_discord_report(no_discord_names)
+    no_discord_report = _build_no_discord_report(imported)
 
     schedule_helper.sync_schedule(server_id, server_config, aws_services.dynamodb_table)
     return ResponseMessage(
-        content=f"✅ Event **{event_name}** created with {total_count} registered participants!{past_time_warning}{no_discord_report}{no_role_warning}"
+        content=f"✅ Event **{event_name}** created with {imported.total_count} registered participants!{past_time_warning}{no_discord_report}{no_role_warning}"
     )
 
 
@@ -420,7 +499,8 @@ def update_event_startgg(event: DiscordEvent, aws_services: AWSServices) -> Resp
     if not event_url or not startgg_api.is_valid_startgg_url(event_url):
         return ResponseMessage(content=INVALID_STARTGG_LINK_MESSAGE)
 
-    startgg_event = startgg_api.query_startgg_event(event_url)
+    stream = startgg_api.stream_startgg_event(event_url, table=aws_services.dynamodb_table)
+    startgg_event = stream.event
 
     if not startgg_event.start_time_utc:
         return ResponseMessage(
@@ -460,21 +540,16 @@ def update_event_startgg(event: DiscordEvent, aws_services: AWSServices) -> Resp
         table=aws_services.dynamodb_table
     )
 
-    total_count = len(startgg_event.participants) + len(startgg_event.no_discord_participants)
-    no_discord_names = [p.display_name for p in startgg_event.no_discord_participants]
-
-    all_participants_data = {p.user_id: p.to_dict() for p in startgg_event.participants}
-    for p in startgg_event.no_discord_participants:
-        all_participants_data[p.display_name] = p.to_dict()
-
-    # Always write both URL and full registrants list
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + resolved_event_id},
-        UpdateExpression=f"SET {EventData.Keys.STARTGG_URL} = :startgg_url, {EventData.Keys.REGISTERED} = :startgg_registered",
-        ExpressionAttributeValues={":startgg_url": event_url, ":startgg_registered": all_participants_data}
+    # Always write the URL and sync the registrants list
+    imported = _import_startgg_registrants(
+        server_id, resolved_event_id, event_data_result, stream, aws_services.dynamodb_table,
+        event_attributes={EventData.Keys.STARTGG_URL: event_url},
+    )
+    db_helper.lower_server_next_action_at(
+        server_id, int(time.time()), [resolved_event_id], aws_services.dynamodb_table
     )
 
-    no_discord_report = _build_no_discord_report(no_discord_names)
+    no_discord_report = _build_no_discord_report(imported)
 
     changes = []
     if start_time_in_past:
@@ -484,7 +559,9 @@ def update_event_startgg(event: DiscordEvent, aws_services: AWSServices) -> Resp
             changes.append(f"🕒 Start time updated to {_to_discord_ts(startgg_event.start_time_utc)}")
         else:
             changes.append(f"⚠️ Start time in start.gg ({_to_discord_ts(startgg_event.start_time_utc)}) differs but could not be updated — event is already active on Discord")
-    changes.append(f"👥 Registered list synced with {total_count} participant(s)")
+    changes.append(
+        f"👥 Registered list synced with {imported.total_count} participant(s) ({imported.describe_changes()})"
+    )
     change_summary = "\n".join(f"• {c}" for c in changes)
 
     return ResponseMessage(
@@ -511,20 +588,23 @@ def event_refresh_startgg(event: DiscordEvent, aws_services: AWSServices) -> Res
                     "Use `/event-update-startgg` to link a start.gg event first."
         )
 
-    summary = refresh_event_from_startgg(server_id, event_id, event_data_result, aws_services)
+    force_refresh = bool(event.get_command_input_value("force_refresh"))
+    summary = refresh_event_from_startgg(server_id, event_id, event_data_result, aws_services, force_refresh)
     return ResponseMessage(content=summary)
 
 
-def refresh_event_from_startgg(server_id, event_id, event_data_result, aws_services) -> str:
+def refresh_event_from_startgg(server_id, event_id, event_data_result, aws_services, force_refresh=False) -> str:
     """Sync an event's registrant list (and start time) from start.gg and persist the changes.
 
     Writes the latest registrants to DynamoDB and updates the Discord event start time if it
     changed. Returns a human-readable summary of what changed. The caller must ensure the event
-    has a start.gg link before calling.
+    has a start.gg link before calling. start.gg data may come from the short-lived response
+    cache unless `force_refresh` is set.
     """
-    startgg_event = startgg_api.query_startgg_event(event_data_result.startgg_url)
-    total_count = len(startgg_event.participants) + len(startgg_event.no_discord_participants)
-    no_discord_names = [p.display_name for p in startgg_event.no_discord_participants]
+    stream = startgg_api.stream_startgg_event(
+        event_data_result.startgg_url, table=aws_services.dynamodb_table, force_refresh=force_refresh
+    )
+    startgg_event = stream.event
 
     changes = []
 
@@ -562,19 +642,15 @@ def refresh_event_from_startgg(server_id, event_id, event_data_result, aws_servi
                 else:
                     changes.append(f"⚠️ Start time in start.gg ({_to_discord_ts(startgg_event.start_time_utc)}) differs but could not be updated — event is already active on Discord")
 
-    # Always write the current registrants list (even if empty)
-    all_participants_data = {p.user_id: p.to_dict() for p in startgg_event.participants}
-    for p in startgg_event.no_discord_participants:
-        all_participants_data[p.display_name] = p.to_dict()
-
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"SET {EventData.Keys.REGISTERED} = :startgg_registered",
-        ExpressionAttributeValues={":startgg_registered": all_participants_data}
+    # Always sync the registrants list (even if start.gg now has none)
+    imported = _import_startgg_registrants(
+        server_id, event_data_result.event_id or event_id, event_data_result, stream, aws_services.dynamodb_table
+    )
+    changes.append(
+        f"👥 Registered list updated with {imported.total_count} participant(s) ({imported.describe_changes()})"
     )
-    changes.append(f"👥 Registered list updated with {total_count} participant(s)")
 
-    no_discord_report = _build_no_discord_report(no_discord_names)
+    no_discord_report = _build_no_discord_report(imported)
     change_summary = "\n".join(f"• {c}" for c in changes)
 
     return f"👍 Event refreshed from start.gg:\n{change_summary}{no_discord_report}"
@@ -601,10 +677,13 @@ def events_list(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessa
     return ResponseMessage(content="\n".join(lines))
 
 
-def _build_no_discord_report(no_discord_names: list) -> str:
-    if not no_discord_names:
+def _build_no_discord_report(imported: _ImportSummary) -> str:
+    if not imported.no_discord_count:
         return ""
-    participant_list_markdown = "\n".join([f"* {name}" for name in no_discord_names])
+    participant_list_markdown = "\n".join([f"* {name}" for name in imported.no_discord_names])
+    unlisted = imported.no_discord_count - len(imported.no_discord_names)
+    if unlisted:
+        participant_list_markdown += f"\n* …and {unlisted} more (see `/startgg-notify-unlinked`)"
     return (
         "\n**I found these start.gg users do not have Discord linked**\n"
         "---\n"
@@ -1,13 +1,17 @@
+import time
 from dataclasses import dataclass
-from typing import Optional
-
-from mypy_boto3_dynamodb.service_resource import Table
+from typing import TYPE_CHECKING, Optional
 
 import database.dynamodb_utils as db_helper
+import utils.autocomplete_helper as autocomplete_helper
 import utils.discord_api_helper as discord_helper
+import utils.poll_watermark as poll_watermark
 from database.models.event_data import EventData
 from utils.discord_api_helper import ScheduledEventParams
 
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
 
 @dataclass
 class EventRecord:
@@ -20,7 +24,7 @@ class EventRecord:
     should_post_reminder: Optional[bool] = False
 
 
-def create_event_record(server_id: str, record: EventRecord, table: Table) -> str:
+def create_event_record(server_id: str, record: EventRecord, table: "Table") -> str:
     """
     Creates a Discord scheduled event and persists it to DynamoDB.
     Returns the created event ID.
@@ -38,7 +42,7 @@ def create_event_record(server_id: str, record: EventRecord, table: Table) -> st
         raise RuntimeError(f"Failed to create Discord scheduled event for server '{server_id}'")
 
     print(f"[event] Persisting event_id={event_id} to DynamoDB server={server_id}")
-    table.put_item(Item={
+    item = {
         "PK": db_helper.build_server_pk(server_id),
         "SK": EventData.Keys.SK_EVENT_PREFIX + event_id,
         EventData.Keys.SERVER_ID: server_id,
@@ -55,12 +59,15 @@ def create_event_record(server_id: str, record: EventRecord, table: Table) -> st
         EventData.Keys.REGISTER_ENABLED: False,
         EventData.Keys.SHOULD_POST_REMINDER: record.should_post_reminder or False,
         EventData.Keys.DID_POST_REMINDER: False,
-    })
+    }
+    table.put_item(Item=item)
+    _schedule_next_poll(server_id, event_id, item, table)
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.EVENT_INDEX, server_id)
     print(f"[event] Created event_id={event_id} name={record.name!r} server={server_id}")
     return event_id
 
 
-def update_event_record(server_id: str, event_id: str, record: EventRecord, table: Table) -> bool:
+def update_event_record(server_id: str, event_id: str, record: EventRecord, table: "Table") -> bool:
     """
     Updates the Discord scheduled event and persists the new metadata to DynamoDB.
     Returns True if the start time was updated on Discord, False if the event was already active
@@ -87,7 +94,7 @@ def update_event_record(server_id: str, event_id: str, record: EventRecord, tabl
         raise RuntimeError(f"Failed to update Discord scheduled event '{event_id}' for server '{server_id}'")
 
     print(f"[event] Persisting updated metadata to DynamoDB event_id={event_id} server={server_id}")
-    table.update_item(
+    response = table.update_item(
         Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + event_id},
         UpdateExpression=(
             f"SET {EventData.Keys.EVENT_NAME} = :name, "
@@ -102,13 +109,22 @@ def update_event_record(server_id: str, event_id: str, record: EventRecord, tabl
             ":start_time": record.start_time_utc,
             ":end_time": record.end_time_utc,
             ":participant_role": record.participant_role or "",
-        }
+        },
+        ReturnValues="ALL_NEW",
     )
+    _schedule_next_poll(server_id, event_id, response["Attributes"], table)
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.EVENT_INDEX, server_id)
     print(f"[event] Updated event_id={event_id} start_time_updated={start_time_updated}")
     return start_time_updated
 
 
-def delete_event_record(server_id: str, event_id: str, table: Table) -> None:
+def _schedule_next_poll(server_id: str, event_id: str, item: dict, table: "Table") -> None:
+    """Bring the server's scheduled-job watermark forward to when this event next needs a poll."""
+    next_action_at = poll_watermark.event_next_action_at(item, int(time.time()))
+    db_helper.lower_server_next_action_at(server_id, next_action_at, [event_id], table)
+
+
+def delete_event_record(server_id: str, event_id: str, table: "Table") -> None:
     """
     Deletes the Discord scheduled event and removes the DynamoDB record.
     Raises RuntimeError if the Discord API call fails.
@@ -123,4 +139,6 @@ def delete_event_record(server_id: str, event_id: str, table: Table) -> None:
         "PK": db_helper.build_server_pk(server_id),
         "SK": EventData.Keys.SK_EVENT_PREFIX + event_id,
     })
+    db_helper.delete_event_participant_items(server_id, event_id, table)
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.EVENT_INDEX, server_id)
     print(f"[event] Deleted event_id={event_id} server={server_id}")
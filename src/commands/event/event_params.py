@@ -0,0 +1,15 @@
+from enums import AppCommandOptionType
+from commands.models.command_param import CommandParam
+from commands.models.lazy_function import LazyFunction
+
+# Shared param used by any command that needs to target a specific event.
+# The autocomplete value is the event_id, not the display name.
+EVENT_NAME_PARAM = CommandParam(
+    name="event_name",
+    description="Name of the event",
+    param_type=AppCommandOptionType.string,
+    required=True,
+    choices=None,
+    autocomplete=True,
+    autocomplete_handler=LazyFunction("commands.event.autocomplete_handlers", "autocomplete_event_name")
+)
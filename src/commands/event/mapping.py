@@ -1,10 +1,13 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam
-import commands.event.event_commands as event_commands
-import commands.event.autocomplete_handlers as autocomplete_handlers
-from commands.event.autocomplete_handlers import EVENT_NAME_PARAM
+from commands.event.event_params import EVENT_NAME_PARAM
+
+# Command modules are imported only when one of their commands is invoked
+event_commands = LazyModule("commands.event.event_commands")
+autocomplete_handlers = LazyModule("commands.event.autocomplete_handlers")
 
 event_commands_mapping: CommandMapping = {
     "event-create": {
@@ -167,6 +170,7 @@ event_commands_mapping: CommandMapping = {
     },
     "event-create-startgg": {
         "function": event_commands.create_event_startgg,
+        "deferred": True,
         "description": "Create an event and import registered participants from a start.gg Tournament Event",
         "params": [
             CommandParam(
@@ -210,6 +214,7 @@ event_commands_mapping: CommandMapping = {
     },
     "event-update-startgg": {
         "function": event_commands.update_event_startgg,
+        "deferred": True,
         "description": "Link an existing event to a start.gg Tournament Event and refresh its data",
         "params": [
             EVENT_NAME_PARAM,
@@ -247,8 +252,18 @@ event_commands_mapping: CommandMapping = {
     },
     "event-refresh-startgg": {
         "function": event_commands.event_refresh_startgg,
+        "deferred": True,
         "description": "Refresh registered participants from the linked start.gg event (Organizer only)",
-        "params": [EVENT_NAME_PARAM]
+        "params": [
+            EVENT_NAME_PARAM,
+            CommandParam(
+                name="force_refresh",
+                description="Skip start.gg data fetched in the last couple of minutes and query start.gg again",
+                param_type=AppCommandOptionType.boolean,
+                required=False,
+                choices=None
+            )
+        ]
     },
     "event-list": {
         "function": event_commands.events_list,
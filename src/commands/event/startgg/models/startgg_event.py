@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 import commands.event.startgg.source_constants as source_constants
 from database.models.participant import Participant
@@ -46,14 +46,17 @@ class StartggEvent:
             no_discord_participants=no_discord_participants
         )
 
+    @classmethod
+    def _parse_participants(cls, event_data: Dict[str, Any]) -> tuple[List[RegisteredParticipant], List[Participant]]:
+        return cls.parse_entrants((event_data.get("entrants") or {}).get("nodes") or [])
+
     @staticmethod
-    def _parse_participants(event_data: Dict[str, Any]) -> tuple[List[RegisteredParticipant], List[Participant]]:
+    def parse_entrants(entrants: Iterable[Dict[str, Any]]) -> tuple[List[RegisteredParticipant], List[Participant]]:
+        """Split raw entrant nodes into Discord-linked registrants and start.gg-only participants."""
         registered_participants: List[RegisteredParticipant] = []
         no_discord_participants: List[Participant] = []
 
-        participants_list = event_data.get("entrants", {}).get("nodes", [])
-
-        for entrant in participants_list:
+        for entrant in entrants:
             participant_data: Optional[Dict[str, Any]] = entrant.get("participants", [None])[0]
 
             if participant_data is None:
@@ -78,3 +81,12 @@ class StartggEvent:
                 ))
 
         return registered_participants, no_discord_participants
+
+
+@dataclass
+class StartggEventStream:
+    """An event's details (with empty participant lists) and its entrants, parsed one page at a
+    time as pages arrive, so the raw entrant JSON of the whole event is never held at once."""
+    event: StartggEvent
+    entrant_total: int
+    pages: Iterator[tuple[List[RegisteredParticipant], List[Participant]]]
@@ -1,14 +1,28 @@
+import math
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
+
 import boto3
 import requests
 
 import constants
+import http_sessions
+import commands.event.startgg.startgg_cache as startgg_cache
 import commands.event.startgg.startgg_graphql as startgg_graphql
-from commands.event.startgg.models.startgg_event import StartggEvent
+import commands.event.startgg.startgg_set_index as startgg_set_index
+from utils import startgg_client
+from commands.event.startgg.models.startgg_event import StartggEvent, StartggEventStream
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
 
-STARTGG_API_URL = "https://api.start.gg/gql/alpha"
 
 _SET_STATE_COMPLETED = 3
+# Pages listed when building an event's open-set index; pairs beyond it use the live set search
+_MAX_OPEN_SET_PAGES = 20
+# reportBracketSet mutations aliased into one request by report_sets
+REPORT_SETS_BATCH_SIZE = 10
 
 
 class StartggAuthError(Exception):
@@ -46,79 +60,171 @@ def is_valid_startgg_url(startgg_link: str) -> bool:
     return extract_startgg_slug(startgg_link) is not None
 
 def _post_graphql(variables: dict, query: str, headers: dict) -> requests.Response:
-    """Executes a start.gg GraphQL request and returns the response."""
-    print(f"[startgg] POST {STARTGG_API_URL} | variables: {variables}")
-    response = requests.post(
-        url=STARTGG_API_URL,
-        json={"query": query, "variables": variables},
-        headers=headers,
-        timeout=10
-    )
-    print(f"[startgg] Response status: {response.status_code} | body length: {len(response.text)}")
+    """Executes a start.gg GraphQL request through the shared client (rate limit, retries) and
+    returns the response. The client may lower variables["perPage"] on page 1 (see startgg_client)."""
+    print(f"[startgg] POST {startgg_client.STARTGG_API_URL} | variables: {variables}")
+    response = startgg_client.post(query, variables, headers)
+    print(f"[startgg] Response status: {response.status_code} | body length: {len(response.text)} | {startgg_client.client.stats}")
     return response
 
-# Hard safety cap on entrant pagination: 20 pages * 75 perPage = 1500 entrants.
-_MAX_ENTRANT_PAGES = 20
+# Entrant pages in flight at once. Pages are fetched in waves of this size, so the raw JSON held
+# at any moment is bounded however large the event is; a 1500-entrant event's pages 2-20 are one wave.
+_ENTRANT_PAGE_WORKERS = 19
+
+# Larger events are not kept whole for the start.gg cache (startgg_cache): that would mean holding
+# every raw entrant node until the last page arrives
+_CACHEABLE_ENTRANT_LIMIT = 1500
+
+_EVENT_PARTICIPANTS_CACHE_NAME = "EventParticipants"
+
+def _post_event_page(slug: str, page: int, per_page: int, query: str, headers: dict) -> tuple[dict, int]:
+    """POSTs one page of an entrant query and returns the decoded body with the perPage actually
+    used, which the client lowers on page 1 if start.gg finds the query too complex. Safe to call
+    from threads."""
+    variables = {"slug": slug, "page": page, "perPage": per_page}
+    response = _post_graphql(variables, query, headers)
 
-def query_startgg_event(tourney_url: str) -> StartggEvent:
+    if not response.ok:
+        print(f"[startgg] Error querying event: status {response.status_code}, body: {response.text[:2000]}")
+    response.raise_for_status()
+
+    data = response.json()
+    if "errors" in data:
+        print(f"[startgg] GraphQL errors for slug '{slug}' page {page}: {data['errors']}")
+    return data, variables["perPage"]
+
+def _page_nodes(data: dict) -> list:
+    event = (data.get("data") or {}).get("event") or {}
+    return (event.get("entrants") or {}).get("nodes") or []
+
+def _iter_remaining_pages(slug: str, page_count: int, per_page: int, headers: dict) -> Iterator[tuple[list, bool]]:
+    """Yields (entrant nodes, had GraphQL errors) for pages 2..page_count in page order, fetching
+    them concurrently in waves of _ENTRANT_PAGE_WORKERS with the entrants-only query."""
+    remaining = range(2, page_count + 1)
+    if not remaining:
+        return
+    workers = min(_ENTRANT_PAGE_WORKERS, len(remaining))
+    http_sessions.configure_host_pool(startgg_client.STARTGG_API_URL, max(http_sessions.DEFAULT_POOL_MAXSIZE, workers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for wave_start in range(0, len(remaining), workers):
+            wave = remaining[wave_start:wave_start + workers]
+            for data, _ in executor.map(
+                lambda page: _post_event_page(slug, page, per_page, startgg_graphql.EVENT_ENTRANTS_PAGE_QUERY, headers),
+                wave,
+            ):
+                yield _page_nodes(data), "errors" in data
+
+def stream_startgg_event(tourney_url: str, table: "Table | None" = None,
+                         force_refresh: bool = False) -> StartggEventStream:
     """
-    Executes the start.gg GraphQL query and returns a populated StartggEvent object.
-    Pages through entrants (75 per page) until all entrants are fetched.
+    Fetches page 1 for the event details and pageInfo.total, and returns them with a generator
+    that yields each page's entrants parsed into (registered, no-Discord) participants as the
+    page arrives. Raw entrant JSON is dropped once parsed, so memory stays flat for any event
+    size; there is no page cap.
+    With `table`, events of up to _CACHEABLE_ENTRANT_LIMIT entrants are read through the
+    short-lived start.gg cache (startgg_cache), and written to it once every page has been
+    consumed without GraphQL errors. `force_refresh` skips the cache read.
     """
-    headers = {"Authorization": f"Bearer {_get_startgg_api_token()}"}
     slug = extract_startgg_slug(tourney_url)
 
-    event_data = None
-    all_nodes = []
-    page = 1
-
-    while True:
-        variables = {"slug": slug, "page": page}
+    if table is not None and not force_refresh:
+        cached = startgg_cache.get(slug, _EVENT_PARTICIPANTS_CACHE_NAME, table)
+        if cached is not None:
+            nodes = cached["entrants"].pop("nodes")
+            event = StartggEvent.from_dict(cached)
+            return StartggEventStream(event, len(nodes), iter([StartggEvent.parse_entrants(nodes)]))
 
-        response = _post_graphql(variables, startgg_graphql.EVENT_PARTICIPANTS_QUERY, headers)
+    headers = {"Authorization": f"Bearer {_get_startgg_api_token()}"}
+    data, per_page = _post_event_page(
+        slug, 1, startgg_graphql.ENTRANTS_PER_PAGE, startgg_graphql.EVENT_PARTICIPANTS_QUERY, headers
+    )
+    event_data = data["data"]["event"]
+    entrants = (event_data or {}).get("entrants") or {}
+    first_nodes = entrants.pop("nodes", None) or []
+    total = (entrants.get("pageInfo") or {}).get("total") or len(first_nodes)
+    page_count = math.ceil(total / per_page) if first_nodes else 1
+    event = StartggEvent.from_dict(event_data)
+
+    def pages():
+        kept = list(first_nodes) if table is not None and total <= _CACHEABLE_ENTRANT_LIMIT else None
+        has_errors = "errors" in data
+        yield StartggEvent.parse_entrants(first_nodes)
+        for nodes, page_has_errors in _iter_remaining_pages(slug, page_count, per_page, headers):
+            has_errors = has_errors or page_has_errors
+            if kept is not None:
+                kept.extend(nodes)
+            yield StartggEvent.parse_entrants(nodes)
+        if kept is not None and not has_errors:
+            startgg_cache.put(slug, _EVENT_PARTICIPANTS_CACHE_NAME, {**event_data, "entrants": {**entrants, "nodes": kept}}, table)
+
+    return StartggEventStream(event, total, pages())
+
+def query_startgg_event(tourney_url: str, table: "Table | None" = None, force_refresh: bool = False) -> StartggEvent:
+    """
+    Executes the start.gg GraphQL query and returns a populated StartggEvent object with every
+    entrant. Builds on stream_startgg_event (and its cache handling) but keeps all participants;
+    imports that write registrants should consume the stream instead.
+    """
+    stream = stream_startgg_event(tourney_url, table=table, force_refresh=force_refresh)
+    for registered, no_discord in stream.pages:
+        stream.event.participants.extend(registered)
+        stream.event.no_discord_participants.extend(no_discord)
+    return stream.event
+
+def list_open_sets(event_slug: str) -> dict[frozenset, str] | None:
+    """Lists an event's open sets as {frozenset of the two entrant IDs: set_id}, fresh from
+    start.gg. Returns None if start.gg returned an error."""
+    sets = _fetch_open_sets(event_slug)
+    if sets is None:
+        return None
+    return {frozenset(key.split(":")): set_id for key, set_id in sets.items()}
 
+def _fetch_open_sets(event_slug: str) -> dict[str, str] | None:
+    """Lists an event's open sets as {pair_key: set_id} for the set index, keeping the latest
+    set per entrant pair. Returns None if start.gg returned an error."""
+    headers = {"Authorization": f"Bearer {_get_startgg_api_token()}"}
+    latest = {}
+    page, total_pages = 1, 1
+    while page <= min(total_pages, _MAX_OPEN_SET_PAGES):
+        variables = {"eventSlug": event_slug, "page": page, "perPage": startgg_graphql.SETS_PER_PAGE}
+        response = _post_graphql(variables, startgg_graphql.OPEN_SETS_QUERY, headers)
         if not response.ok:
-            print(f"[startgg] Error querying event: status {response.status_code}, body: {response.text[:2000]}")
-        response.raise_for_status()
-
+            print(f"[startgg] Error listing open sets: status {response.status_code}, body: {response.text[:2000]}")
+            return None
         data = response.json()
         if "errors" in data:
-            print(f"[startgg] GraphQL errors for slug '{tourney_url}': {data['errors']}")
-
-        page_event = data["data"]["event"]
-        if event_data is None:
-            event_data = page_event
-
-        nodes = ((page_event or {}).get("entrants") or {}).get("nodes") or []
-        all_nodes.extend(nodes)
-
-        total = ((event_data or {}).get("entrants") or {}).get("pageInfo", {}).get("total") or 0
-
-        if len(all_nodes) >= total or not nodes:
-            break
-
-        if page >= _MAX_ENTRANT_PAGES:
-            print(
-                f"[startgg] WARNING: entrant pagination cap of {_MAX_ENTRANT_PAGES} pages reached for "
-                f"slug '{tourney_url}'; truncating at {len(all_nodes)} of {total} entrants"
-            )
-            break
-
+            print(f"[startgg] GraphQL errors listing open sets for slug '{event_slug}': {data['errors']}")
+            return None
+        sets = data["data"]["event"]["sets"]
+        total_pages = sets["pageInfo"]["totalPages"] or 0
+        for set_node in sets["nodes"]:
+            entrant_ids = [str(slot["entrant"]["id"]) for slot in set_node["slots"] if slot.get("entrant")]
+            if len(entrant_ids) != 2 or set_node.get("state") == _SET_STATE_COMPLETED:
+                continue
+            key = startgg_set_index.pair_key(entrant_ids)
+            if key not in latest or (set_node.get("createdAt") or 0) > (latest[key].get("createdAt") or 0):
+                latest[key] = set_node
         page += 1
-
-    if event_data is not None and event_data.get("entrants") is not None:
-        event_data["entrants"]["nodes"] = all_nodes
-
-    return StartggEvent.from_dict(event_data)
+    if total_pages > _MAX_OPEN_SET_PAGES:
+        print(f"[startgg] Open sets for slug '{event_slug}' span {total_pages} pages; indexed the first {_MAX_OPEN_SET_PAGES}")
+    return {key: str(set_node["id"]) for key, set_node in latest.items()}
 
 def find_set_between_players(
-    event_slug: str, player_ids: list[str]
+    event_slug: str, player_ids: list[str], table: "Table | None" = None
 ) -> tuple[str, dict[str, str], bool] | None:
     """
     Finds a set on start.gg between the given entrant IDs.
     Returns (set_id, {entrant_id: entrant_id}, is_completed), or None if no set found.
     is_completed is True when the set state is COMPLETED (3) — score already reported.
+    With a table, open sets are looked up in the event's set index first (see
+    startgg_set_index); pairs missing from it fall back to a live search.
     """
+    if table is not None:
+        index = startgg_set_index.get_index(event_slug, table, lambda: _fetch_open_sets(event_slug))
+        set_id = index.get(frozenset(str(player_id) for player_id in player_ids)) if index else None
+        if set_id is not None:
+            return set_id, {eid: eid for eid in player_ids}, False
+
     headers = {"Authorization": f"Bearer {_get_startgg_api_token()}"}
     variables = {"eventSlug": event_slug, "entrantIds": player_ids}
 
@@ -154,6 +260,10 @@ def find_set_between_players(
     is_completed = latest.get("state") == _SET_STATE_COMPLETED
     return str(latest["id"]), {eid: eid for eid in player_ids}, is_completed
 
+def forget_reported_set(event_slug: str, player_ids: list[str], table: "Table") -> None:
+    """Drops a just-reported set from the event's set index so it can't be reported twice."""
+    startgg_set_index.discard(event_slug, player_ids, table)
+
 def report_set(set_id: str, winner_entrant_id: str, game_data: list[dict], oauth_token: str, is_dq: bool = False) -> None:
     """
     Reports a set result on start.gg using the server's OAuth token.
@@ -178,3 +288,62 @@ def report_set(set_id: str, winner_entrant_id: str, game_data: list[dict], oauth
         if any("permission" in (e.get("message") or "").lower() for e in data["errors"]):
             raise StartggPermissionError()
         raise ValueError("start.gg returned an error while reporting the set. Please check that the set is still open or contact an organizer.")
+
+def _build_report_sets_mutation(count: int) -> str:
+    """An aliased document reporting `count` sets at once: r0: reportBracketSet(setId: $s0, ...) ..."""
+    variables = ", ".join(
+        f"$s{i}: ID!, $w{i}: ID!, $q{i}: Boolean, $g{i}: [BracketSetGameDataInput]" for i in range(count)
+    )
+    fields = "\n".join(
+        f"        r{i}: reportBracketSet(setId: $s{i}, winnerId: $w{i}, isDQ: $q{i}, gameData: $g{i}) {{ id state }}"
+        for i in range(count)
+    )
+    return f"mutation ReportBracketSets({variables}) {{\n{fields}\n    }}"
+
+def report_sets(reports: list[dict], oauth_token: str) -> list[str | None]:
+    """
+    Reports several set results using the server's OAuth token, REPORT_SETS_BATCH_SIZE aliased
+    reportBracketSet mutations per request (start.gg runs them in order).
+    reports: list of {"setId", "winnerId", "isDQ", "gameData"}, with gameData as for report_set.
+    Returns one entry per report: None if start.gg reported the set, else start.gg's error message.
+    Raises StartggAuthError if the token is invalid or expired; later batches are not sent.
+    """
+    headers = {"Authorization": f"Bearer {oauth_token}"}
+    outcomes = []
+    for start in range(0, len(reports), REPORT_SETS_BATCH_SIZE):
+        batch = reports[start:start + REPORT_SETS_BATCH_SIZE]
+        variables = {}
+        for i, report in enumerate(batch):
+            variables.update({
+                f"s{i}": report["setId"], f"w{i}": report["winnerId"],
+                f"q{i}": report["isDQ"], f"g{i}": report["gameData"],
+            })
+        response = _post_graphql(variables, _build_report_sets_mutation(len(batch)), headers)
+
+        if response.status_code == 401:
+            raise StartggAuthError("start.gg OAuth token is invalid or expired.")
+        if not response.ok:
+            print(f"[startgg] Error reporting sets: status {response.status_code}, body: {response.text[:2000]}")
+            outcomes.extend([f"start.gg returned status {response.status_code}"] * len(batch))
+            continue
+
+        data = response.json()
+        errors_by_alias = {}
+        unattributed_error = None
+        for error in data.get("errors") or []:
+            message = error.get("message") or "unknown error"
+            path = error.get("path") or []
+            if path:
+                errors_by_alias.setdefault(path[0], message)
+            else:
+                unattributed_error = unattributed_error or message
+        if errors_by_alias or unattributed_error:
+            print(f"[startgg] GraphQL errors reporting sets: {data['errors']}")
+        results = data.get("data") or {}
+        for i in range(len(batch)):
+            alias = f"r{i}"
+            if results.get(alias) is not None and alias not in errors_by_alias:
+                outcomes.append(None)
+            else:
+                outcomes.append(errors_by_alias.get(alias) or unattributed_error or "start.gg did not report the set")
+    return outcomes
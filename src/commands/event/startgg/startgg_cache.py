@@ -0,0 +1,84 @@
+"""
+Short-lived DynamoDB cache of start.gg GraphQL responses, shared by every Lambda container.
+
+Organizers often run several start.gg commands against the same event within a minute (link,
+refresh, absent list, unlinked list), and each one pages the full entrant list. The assembled
+result of a query is stored under PK `STARTGG_CACHE#<slug>`, SK `<query_name>`, as
+zlib-compressed JSON, so a repeat within STARTGG_CACHE_TTL_SECONDS costs one GetItem.
+
+Results are cached whole, never page by page: entrants shift between pages as people register
+or drop, so pages fetched at different times can duplicate or omit entrants when combined.
+
+Items carry the table's `expires_at` TTL attribute so DynamoDB deletes them eventually; reads
+also compare expires_at to now, because TTL deletion can lag by hours.
+"""
+import json
+import time
+import zlib
+from typing import TYPE_CHECKING, Optional
+
+import constants
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+PK_PREFIX = "STARTGG_CACHE#"
+PAYLOAD = "payload"
+EXPIRES_AT = "expires_at"
+
+# Stay clear of DynamoDB's 400 KB item limit; larger results are simply not cached
+_MAX_PAYLOAD_BYTES = 350_000
+
+_hits = 0
+_misses = 0
+
+
+def _build_key(slug: str, query_name: str) -> dict:
+    return {"PK": f"{PK_PREFIX}{slug}", "SK": query_name}
+
+
+def _stats() -> str:
+    lookups = _hits + _misses
+    rate = f"{_hits / lookups:.0%}" if lookups else "n/a"
+    return f"hits={_hits} misses={_misses} hit_rate={rate}"
+
+
+def get(slug: str, query_name: str, table: "Table") -> Optional[dict]:
+    """Return the cached result for this slug/query, or None if absent or expired."""
+    global _hits, _misses
+    if constants.STARTGG_CACHE_TTL_SECONDS <= 0:
+        return None
+    try:
+        item = table.get_item(Key=_build_key(slug, query_name)).get("Item")
+    except Exception as e:
+        print(f"[startgg_cache] WARN read failed slug={slug} query={query_name}: {e}")
+        return None
+    if item is None or int(item.get(EXPIRES_AT, 0)) <= time.time():
+        _misses += 1
+        print(f"[startgg_cache] MISS slug={slug} query={query_name} ({_stats()})")
+        return None
+    _hits += 1
+    print(f"[startgg_cache] HIT slug={slug} query={query_name} ({_stats()})")
+    # boto3 reads Binary attributes back as Binary; RequestReadCache hands back the bytes it wrote
+    payload = item[PAYLOAD]
+    return json.loads(zlib.decompress(bytes(getattr(payload, "value", payload))))
+
+
+def put(slug: str, query_name: str, result: dict, table: "Table") -> None:
+    """Store a complete query result for STARTGG_CACHE_TTL_SECONDS. A TTL of 0 disables the cache."""
+    ttl = constants.STARTGG_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return
+    payload = zlib.compress(json.dumps(result, separators=(",", ":")).encode())
+    if len(payload) > _MAX_PAYLOAD_BYTES:
+        print(f"[startgg_cache] SKIP slug={slug} query={query_name}: {len(payload)} bytes compressed")
+        return
+    try:
+        table.put_item(Item={
+            **_build_key(slug, query_name),
+            PAYLOAD: payload,
+            EXPIRES_AT: int(time.time()) + ttl,
+        })
+    except Exception as e:
+        # Best-effort: the caller already has the result, only later reuse is lost
+        print(f"[startgg_cache] WARN write failed slug={slug} query={query_name}: {e}")
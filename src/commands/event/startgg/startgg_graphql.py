@@ -23,6 +23,39 @@ FIND_SET_QUERY = """
     }
 """
 
+# Sets per page of an event's open-set index; each set node also returns two slots and entrants
+SETS_PER_PAGE = 80
+
+# Every set that can still be reported (any state but COMPLETED=3 and INVALID=5), for the set index
+OPEN_SETS_QUERY = """
+    query OpenSets($eventSlug: String, $page: Int!, $perPage: Int!) {
+        event(slug: $eventSlug) {
+            sets(
+                page: $page
+                perPage: $perPage
+                filters: {
+                    state: [1, 2, 4, 6, 7]
+                    hideEmpty: true
+                }
+            ) {
+                pageInfo {
+                    totalPages
+                }
+                nodes {
+                    id
+                    state
+                    createdAt
+                    slots {
+                        entrant {
+                            id
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
 REPORT_SET_MUTATION = """
     mutation ReportBracketSet($setId: ID!, $winnerId: ID!, $isDQ: Boolean, $gameData: [BracketSetGameDataInput]) {
         reportBracketSet(setId: $setId, winnerId: $winnerId, isDQ: $isDQ, gameData: $gameData) {
@@ -32,8 +65,29 @@ REPORT_SET_MUTATION = """
     }
 """
 
+# Entrants per page. start.gg counts every returned object towards a request's complexity
+# limit (1000), and each entrant node carries a participant and its authorizations.
+ENTRANTS_PER_PAGE = 75
+
+_ENTRANT_FIELDS_FRAGMENT = """
+    fragment EntrantFields on Entrant {
+        id
+        participants {
+            id
+            gamerTag
+            user {
+                authorizations(types: DISCORD) {
+                    externalId
+                    externalUsername
+                }
+            }
+        }
+    }
+"""
+
+# Page 1 of an import: the event's details plus pageInfo.total, which sizes the remaining pages
 EVENT_PARTICIPANTS_QUERY = """
-    query EventEntrants($slug: String, $page: Int!) {
+    query EventEntrants($slug: String, $page: Int!, $perPage: Int!) {
         event(slug: $slug) {
             id
             name
@@ -45,25 +99,31 @@ EVENT_PARTICIPANTS_QUERY = """
             }
             entrants(query: {
                 page: $page
-                perPage: 75
+                perPage: $perPage
             }) {
                 pageInfo {
                     total
                 }
                 nodes {
-                    id
-                    participants {
-                        id
-                        gamerTag
-                        user {
-                            authorizations(types: DISCORD) {
-                                externalId
-                                externalUsername
-                            }
-                        }
-                    }
+                    ...EntrantFields
                 }
             }
         }
     }
-"""
+""" + _ENTRANT_FIELDS_FRAGMENT
+
+# Pages 2+ of an import: entrant nodes only
+EVENT_ENTRANTS_PAGE_QUERY = """
+    query EventEntrantsPage($slug: String, $page: Int!, $perPage: Int!) {
+        event(slug: $slug) {
+            entrants(query: {
+                page: $page
+                perPage: $perPage
+            }) {
+                nodes {
+                    ...EntrantFields
+                }
+            }
+        }
+    }
+""" + _ENTRANT_FIELDS_FRAGMENT
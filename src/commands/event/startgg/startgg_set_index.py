@@ -0,0 +1,118 @@
+"""
+Short-lived index of an event's open start.gg sets, keyed by the pair of entrant IDs in each set.
+
+`/startgg-report-score` needs the set between two entrants, and during a busy bracket dozens of
+reports land on the same event each minute. Rather than one set search per report, the open
+sets are listed once (a few pages) and kept as `{frozenset(entrant IDs): set_id}`:
+
+- in the warm container for at most _LOCAL_TTL_SECONDS, and
+- in DynamoDB under PK `STARTGG_CACHE#<slug>`, SK `OpenSetIndex`, as a map of
+  `"<id>:<id>"` -> set ID, for STARTGG_CACHE_TTL_SECONDS (0 disables the index).
+
+A reported set is REMOVEd from the stored map (and the local copy) so it can't be found again;
+a pair missing from the index falls back to the live set search. Sets opened after the index
+was built are therefore still found, just without the shortcut.
+"""
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+import constants
+from commands.event.startgg.startgg_cache import EXPIRES_AT, PK_PREFIX
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+INDEX_SK = "OpenSetIndex"
+SETS = "sets"
+
+# Other containers may report sets from the stored index, so local copies are only trusted briefly
+_LOCAL_TTL_SECONDS = 15
+_LOCAL_MAX_EVENTS = 32
+
+# slug -> (trusted-until monotonic time, {frozenset of entrant IDs: set ID})
+_local: "OrderedDict[str, tuple[float, dict[frozenset, str]]]" = OrderedDict()
+
+
+def _build_key(slug: str) -> dict:
+    return {"PK": f"{PK_PREFIX}{slug}", "SK": INDEX_SK}
+
+
+def pair_key(entrant_ids: Iterable[str]) -> str:
+    """The DynamoDB map key for a set between these entrants (order-independent)."""
+    return ":".join(sorted(str(entrant_id) for entrant_id in entrant_ids))
+
+
+def _remember(slug: str, index: dict[frozenset, str]) -> None:
+    _local[slug] = (time.monotonic() + _LOCAL_TTL_SECONDS, index)
+    _local.move_to_end(slug)
+    while len(_local) > _LOCAL_MAX_EVENTS:
+        _local.popitem(last=False)
+
+
+def _load(slug: str, table: "Table") -> Optional[dict[frozenset, str]]:
+    try:
+        item = table.get_item(Key=_build_key(slug), ConsistentRead=True).get("Item")
+    except Exception as e:
+        print(f"[startgg_set_index] WARN read failed slug={slug}: {e}")
+        return None
+    if item is None or int(item.get(EXPIRES_AT, 0)) <= time.time():
+        return None
+    return {frozenset(key.split(":")): set_id for key, set_id in item.get(SETS, {}).items()}
+
+
+def _store(slug: str, sets: dict[str, str], table: "Table") -> None:
+    try:
+        table.put_item(Item={
+            **_build_key(slug),
+            SETS: sets,
+            EXPIRES_AT: int(time.time()) + constants.STARTGG_CACHE_TTL_SECONDS,
+        })
+    except Exception as e:
+        # Best-effort: this report still uses the index it just built
+        print(f"[startgg_set_index] WARN write failed slug={slug}: {e}")
+
+
+def get_index(slug: str, table: "Table", build: Callable[[], Optional[dict[str, str]]]) -> Optional[dict[frozenset, str]]:
+    """Return the event's open-set index, from the warm container, DynamoDB, or `build` (which
+    lists the open sets as {pair_key: set_id}, or returns None if it couldn't). None when the
+    index is disabled or couldn't be built."""
+    if constants.STARTGG_CACHE_TTL_SECONDS <= 0:
+        return None
+    cached = _local.get(slug)
+    if cached is not None and cached[0] > time.monotonic():
+        print(f"[startgg_set_index] HIT local slug={slug} sets={len(cached[1])}")
+        return cached[1]
+
+    index = _load(slug, table)
+    if index is not None:
+        print(f"[startgg_set_index] HIT dynamodb slug={slug} sets={len(index)}")
+    else:
+        sets = build()
+        if sets is None:
+            return None
+        _store(slug, sets, table)
+        index = {frozenset(key.split(":")): set_id for key, set_id in sets.items()}
+        print(f"[startgg_set_index] BUILT slug={slug} sets={len(index)}")
+    _remember(slug, index)
+    return index
+
+
+def discard(slug: str, entrant_ids: Iterable[str], table: "Table") -> None:
+    """Drop the set between these entrants once it has been reported."""
+    entrant_ids = [str(entrant_id) for entrant_id in entrant_ids]
+    cached = _local.get(slug)
+    if cached is not None:
+        cached[1].pop(frozenset(entrant_ids), None)
+    try:
+        table.update_item(
+            Key=_build_key(slug),
+            UpdateExpression="REMOVE #sets.#pair",
+            ConditionExpression="attribute_exists(#sets)",
+            ExpressionAttributeNames={"#sets": SETS, "#pair": pair_key(entrant_ids)},
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        pass
+    except Exception as e:
+        # The set is completed on start.gg either way; a stale entry only lives until the TTL
+        print(f"[startgg_set_index] WARN discard failed slug={slug}: {e}")
@@ -1,5 +1,8 @@
 from commands.models.command_mapping import CommandMapping
-import commands.help.adomi_help_commands as adomi_help_commands
+from commands.models.lazy_function import LazyModule
+
+# Command modules are imported only when one of their commands is invoked
+adomi_help_commands = LazyModule("commands.help.adomi_help_commands")
 
 help_commands: CommandMapping = {
     "help": {
@@ -1,30 +1,16 @@
-from discord import AppCommandOptionType
-
 from aws_services import AWSServices
 from commands.models.autocomplete_response import AutocompleteResponse
-from commands.models.command_param import CommandParam, ParamChoice
 from commands.models.discord_event import DiscordEvent
 import database.dynamodb_utils as db_helper
+import utils.autocomplete_helper as autocomplete_helper
 
 
 def autocomplete_league_name(event: DiscordEvent, aws_services: AWSServices) -> AutocompleteResponse:
-    """Returns the server's leagues as choices (label: league name, value: league_id)."""
+    """Returns the server's leagues matching what the user has typed
+    (label: league name, value: league_id for easy indexing)."""
     server_id = event.get_server_id()
-    leagues = db_helper.get_leagues_for_server(server_id, aws_services.dynamodb_table)
-    # name is the display label; value is the league_id for easy indexing
-    choices = [ParamChoice(name=name, value=league_id) for name, league_id in leagues]
-    # Discord rejects autocomplete payloads with more than 25 choices
-    return AutocompleteResponse(choices[:25])
-
-
-# Shared param used by any command that needs to target a specific league.
-# The autocomplete value is the league_id, not the display name.
-LEAGUE_NAME_PARAM = CommandParam(
-    name="league_name",
-    description="Name of the league",
-    param_type=AppCommandOptionType.string,
-    required=True,
-    choices=None,
-    autocomplete=True,
-    autocomplete_handler=autocomplete_league_name
-)
+    index = autocomplete_helper.get_name_index(
+        autocomplete_helper.LEAGUE_INDEX, server_id,
+        lambda: db_helper.get_leagues_for_server(server_id, aws_services.dynamodb_table),
+    )
+    return autocomplete_helper.build_response(index, event.get_focused_option_value())
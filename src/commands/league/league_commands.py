@@ -4,6 +4,7 @@ import time
 import commands.check_in.check_in_constants as check_in_constants
 import constants
 import database.dynamodb_utils as db_helper
+import utils.autocomplete_helper as autocomplete_helper
 import utils.message_helper as message_helper
 import utils.permissions_helper as permissions_helper
 from aws_services import AWSServices
@@ -66,6 +67,7 @@ def create_league(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
     if active_participant_role:
         item[LeagueData.Keys.ACTIVE_PARTICIPANT_ROLE] = active_participant_role
     aws_services.dynamodb_table.put_item(Item=item)
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.LEAGUE_INDEX, server_id)
 
     return ResponseMessage(
         content=(
@@ -283,6 +285,7 @@ def delete_league(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
     aws_services.dynamodb_table.delete_item(
         Key={"PK": db_helper.build_server_pk(server_id), "SK": LeagueData.Keys.SK_LEAGUE_PREFIX + league_data.league_id}
     )
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.LEAGUE_INDEX, server_id)
 
     return ResponseMessage(content=f"🗑️ League **{league_data.league_name}** (`{league_id}`) deleted.")
 
@@ -0,0 +1,15 @@
+from enums import AppCommandOptionType
+from commands.models.command_param import CommandParam
+from commands.models.lazy_function import LazyFunction
+
+# Shared param used by any command that needs to target a specific league.
+# The autocomplete value is the league_id, not the display name.
+LEAGUE_NAME_PARAM = CommandParam(
+    name="league_name",
+    description="Name of the league",
+    param_type=AppCommandOptionType.string,
+    required=True,
+    choices=None,
+    autocomplete=True,
+    autocomplete_handler=LazyFunction("commands.league.autocomplete_handlers", "autocomplete_league_name")
+)
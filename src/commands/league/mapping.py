@@ -1,10 +1,10 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 import commands.check_in.check_in_constants as check_in_constants
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam, ParamChoice
-import commands.league.league_commands as league_commands
-from commands.league.autocomplete_handlers import LEAGUE_NAME_PARAM
+from commands.league.league_params import LEAGUE_NAME_PARAM
 
 LEAGUE_ID_PARAM = CommandParam(
     name="league_id",
@@ -22,6 +22,9 @@ ACTIVE_PARTICIPANT_ROLE_PARAM = CommandParam(
     choices=None
 )
 
+# Command modules are imported only when one of their commands is invoked
+league_commands = LazyModule("commands.league.league_commands")
+
 league_commands_mapping: CommandMapping = {
     "league-create": {
         "function": league_commands.create_league,
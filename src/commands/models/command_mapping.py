@@ -1,4 +1,4 @@
-from typing import Callable, List, TypedDict
+from typing import Callable, List, NotRequired, TypedDict
 
 from aws_services import AWSServices
 from commands.models.command_param import CommandParam
@@ -9,5 +9,8 @@ class CommandEntry(TypedDict):
     function: Callable[[DiscordEvent, AWSServices], ResponseMessage]
     description: str
     params: List[CommandParam]
+    # True for commands that can outlast Discord's 3-second window: the bot acks with a
+    # deferred response and the deferred command worker posts the result via webhook.
+    deferred: NotRequired[bool]
 
 CommandMapping = dict[str, CommandEntry]
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional, List, Callable
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 if TYPE_CHECKING:
     from aws_services import AWSServices
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import List
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 @dataclass
 class DiscordInputParam:
@@ -45,6 +45,12 @@ class DiscordEvent:
         input = next((input for input in inputs if input.name == input_name), None)
         return input.value if input else None
 
+    def get_focused_option_value(self) -> str:
+        """The partial value typed into the option an autocomplete interaction is for ("" if none)."""
+        options = self._get_event_field("data").get("options", [])
+        focused = next((option for option in options if option.get("focused")), None)
+        return str(focused.get("value", "")) if focused else ""
+
     def get_server_id(self) -> str:
         return self._get_event_field("guild_id")
 
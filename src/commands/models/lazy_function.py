@@ -0,0 +1,43 @@
+import importlib
+from typing import Any, Callable
+
+
+class LazyFunction:
+    """Reference to a function by module path and name, imported on first call.
+
+    Lets the command registry describe every command (and autocomplete handler) without
+    importing every command module on a cold start: only the module for the invoked
+    command is loaded. The function is looked up on each call, so patches applied to the
+    target module are honoured.
+    """
+    module_path: str
+    function_name: str
+
+    def __init__(self, module_path: str, function_name: str):
+        self.module_path = module_path
+        self.function_name = function_name
+
+    def resolve(self) -> Callable:
+        """Import the target module and return the referenced function."""
+        module = importlib.import_module(self.module_path)
+        return getattr(module, self.function_name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyFunction({self.module_path}.{self.function_name})"
+
+
+class LazyModule:
+    """Stand-in for a command module in mapping files: attribute access yields a
+    LazyFunction, so `event_commands.create_event` reads the same as an eager import."""
+    module_path: str
+
+    def __init__(self, module_path: str):
+        self.module_path = module_path
+
+    def __getattr__(self, name: str) -> LazyFunction:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return LazyFunction(self.module_path, name)
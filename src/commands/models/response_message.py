@@ -1,17 +1,20 @@
-from typing import Dict, List, Optional
-from discord import Embed
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import utils.adomin_messages as adomin_messages
 from enums import DiscordCallbackType
 import commands.models.message_flags as message_flags
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing discord.py costs hundreds of ms on a cold start
+    from discord import Embed
+
 class ResponseMessage:
     content: str
-    embeds: Optional[List[Embed]]
+    embeds: Optional[List["Embed"]]
     allowed_mentions: Optional[Dict] = None
     flags: int = 0
 
-    def __init__(self, content: str, embeds: List[Embed] = None):
+    def __init__(self, content: str, embeds: List["Embed"] = None):
         self.content = content
         self.embeds = embeds or []
 
@@ -22,6 +25,11 @@ class ResponseMessage:
         self.flags |= message_flags.SUPPRESS_NOTIFICATIONS
         return self
 
+    @property
+    def pings(self) -> bool:
+        """Whether the content has mentions that will notify (i.e. the message was not silenced)."""
+        return self.allowed_mentions is None and "<@" in self.content
+
     def with_suppressed_embeds(self) -> "ResponseMessage":
         self.flags |= message_flags.SUPPRESS_EMBEDS
         return self
@@ -1,11 +1,14 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 import commands.register.register_constants as register_constants
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam, ParamChoice
-import commands.register.register_list_commands as register_list_commands
-import commands.register.register_commands as register_commands
-from commands.event.autocomplete_handlers import EVENT_NAME_PARAM
+from commands.event.event_params import EVENT_NAME_PARAM
+
+# Command modules are imported only when one of their commands is invoked
+register_list_commands = LazyModule("commands.register.register_list_commands")
+register_commands = LazyModule("commands.register.register_commands")
 
 register_commands_mapping: CommandMapping = {
     "register-list": {
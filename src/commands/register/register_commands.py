@@ -7,8 +7,9 @@ from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
 from database.models.event_data import EventData
 from database.models.registered_participant import RegisteredParticipant
+from enums import ParticipantWriteOutcome
 
-MANUAL_SOURCE = "manual"
+MANUAL_SOURCE = db_helper.MANUAL_PARTICIPANT_SOURCE
 
 
 def register_user(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
@@ -21,18 +22,6 @@ def register_user(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
         error_message = permissions_helper.verify_has_organizer_role(event, aws_services)
         if error_message:
             return error_message
-
-    event_data_result = db_helper.get_server_event_data_or_fail(server_id, event_id, aws_services.dynamodb_table)
-    if isinstance(event_data_result, ResponseMessage):
-        return event_data_result
-
-    if not target_user_id and not event_data_result.register_enabled:
-        return ResponseMessage(
-            content="😵‍💫 Registration is not open for this event.\n"
-                    "An Organizer must open registration before new registrations can be accepted."
-        )
-
-    if target_user_id:
         user_id = target_user_id
         resolved_users = event.event_body.get("data", {}).get("resolved", {}).get("users", {})
         resolved_user = resolved_users.get(user_id, {})
@@ -41,27 +30,34 @@ def register_user(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
         user_id = event.get_user_id()
         display_name = event.get_username()
 
-    if user_id in event_data_result.registered:
-        existing = RegisteredParticipant.from_dynamodb(event_data_result.registered[user_id])
-        already_msg = (
-            f"✅ {message_helper.get_user_ping(user_id)} is already registered ({existing.get_relative_time_added().lower()})."
-            if target_user_id
-            else f"✅ You are already registered ({existing.get_relative_time_added().lower()})."
-        )
-        return ResponseMessage(content=already_msg).with_silent_pings()
-
     participant = RegisteredParticipant(
         display_name=display_name,
         user_id=user_id,
         source=MANUAL_SOURCE
     )
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"SET {EventData.Keys.REGISTERED}.#uid = :participant_info",
-        ExpressionAttributeNames={"#uid": user_id},
-        ExpressionAttributeValues={":participant_info": participant.to_dict()}
+    # Organizers registering someone else bypass the open/closed check
+    write_result = db_helper.add_event_participant_or_fail(
+        server_id, event_id, EventData.Keys.REGISTERED, user_id, participant.to_dict(), aws_services.dynamodb_table,
+        enabled_key=None if target_user_id else EventData.Keys.REGISTER_ENABLED
     )
+    if isinstance(write_result, ResponseMessage):
+        return write_result
+
+    if write_result.outcome == ParticipantWriteOutcome.CLOSED:
+        return ResponseMessage(
+            content="😵‍💫 Registration is not open for this event.\n"
+                    "An Organizer must open registration before new registrations can be accepted."
+        )
+
+    if write_result.outcome == ParticipantWriteOutcome.ALREADY_PRESENT:
+        existing = RegisteredParticipant.from_dynamodb(write_result.existing)
+        already_msg = (
+            f"✅ {message_helper.get_user_ping(user_id)} is already registered ({existing.get_relative_time_added().lower()})."
+            if target_user_id
+            else f"✅ You are already registered ({existing.get_relative_time_added().lower()})."
+        )
+        return ResponseMessage(content=already_msg).with_silent_pings()
 
     if target_user_id:
         return ResponseMessage(
@@ -90,10 +86,9 @@ def register_remove(event: DiscordEvent, aws_services: AWSServices) -> ResponseM
             content=f"⚠️ {message_helper.get_user_ping(user_id)} is not registered for this event."
         ).with_silent_pings()
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"REMOVE {EventData.Keys.REGISTERED}.#uid",
-        ExpressionAttributeNames={"#uid": user_id}
+    db_helper.remove_event_participant(
+        server_id, event_data_result.event_id or event_id, event_data_result,
+        EventData.Keys.REGISTERED, user_id, aws_services.dynamodb_table
     )
 
     return ResponseMessage(
@@ -50,10 +50,9 @@ def clear_registered(event: DiscordEvent, aws_services: AWSServices) -> Response
             content="ℹ️ There are no registered users to clear."
         )
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": db_helper.build_server_pk(server_id), "SK": EventData.Keys.SK_EVENT_PREFIX + (event_data_result.event_id or event_id)},
-        UpdateExpression=f"SET {EventData.Keys.REGISTERED} = :empty_map",
-        ExpressionAttributeValues={":empty_map": {}}
+    db_helper.clear_event_participants(
+        server_id, event_data_result.event_id or event_id, event_data_result,
+        EventData.Keys.REGISTERED, aws_services.dynamodb_table
     )
 
     return ResponseMessage(
@@ -1,11 +1,13 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam, ParamChoice
-import commands.event.autocomplete_handlers as event_autocomplete_handlers
-import commands.schedule.autocomplete_handlers as autocomplete_handlers
-import commands.schedule.schedule_commands as schedule_commands
 
+# Command modules are imported only when one of their commands is invoked
+event_autocomplete_handlers = LazyModule("commands.event.autocomplete_handlers")
+autocomplete_handlers = LazyModule("commands.schedule.autocomplete_handlers")
+schedule_commands = LazyModule("commands.schedule.schedule_commands")
 
 schedule_commands_mapping: CommandMapping = {
     "schedule-post": {
@@ -27,7 +27,9 @@ def post_schedule(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
     create_new = event.get_command_input_value("create_new_post") or False
     title = event.get_command_input_value("title") or schedule_helper.DEFAULT_SCHEDULE_TITLE
 
-    real_events = db_helper.get_full_events_for_server(server_id, aws_services.dynamodb_table)
+    real_events = db_helper.get_full_events_for_server(
+        server_id, aws_services.dynamodb_table, projection=db_helper.EVENT_SCHEDULE_VIEW
+    )
     planned_events = db_helper.get_schedule_plans_for_server(server_id, aws_services.dynamodb_table)
     planned_events = schedule_helper.remove_matched_plans(server_id, real_events, planned_events, aws_services.dynamodb_table)
 
@@ -37,8 +39,6 @@ def post_schedule(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
     existing_channel_id = server_config.schedule_channel_id
     should_create = create_new or not existing_message_id
 
-    pk = db_helper.build_server_pk(server_id)
-
     if should_create:
         if not channel:
             return ResponseMessage(
@@ -48,14 +48,10 @@ def post_schedule(event: DiscordEvent, aws_services: AWSServices) -> ResponseMes
         if not message_id:
             return ResponseMessage(content="❌ Failed to send the schedule message to Discord.")
 
-        aws_services.dynamodb_table.update_item(
-            Key={"PK": pk, "SK": ServerConfig.Keys.SK_CONFIG},
-            UpdateExpression=(
-                f"SET {ServerConfig.Keys.SCHEDULE_CHANNEL_ID} = :ch, "
-                f"{ServerConfig.Keys.SCHEDULE_MESSAGE_ID} = :mid"
-            ),
-            ExpressionAttributeValues={":ch": channel, ":mid": message_id},
-        )
+        db_helper.update_server_config(server_id, {
+            ServerConfig.Keys.SCHEDULE_CHANNEL_ID: channel,
+            ServerConfig.Keys.SCHEDULE_MESSAGE_ID: message_id,
+        }, aws_services.dynamodb_table)
         return ResponseMessage(
             content=f"✅ Schedule posted in {message_helper.get_channel_mention(channel)}."
         )
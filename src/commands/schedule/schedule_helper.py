@@ -251,7 +251,7 @@ def sync_schedule(server_id: str, server_config: ServerConfig, table, title: Opt
             server_config.schedule_channel_id, server_config.schedule_message_id
         )
         title = extract_title(current_content) if current_content is not None else DEFAULT_SCHEDULE_TITLE
-    real_events = db_helper.get_full_events_for_server(server_id, table)
+    real_events = db_helper.get_full_events_for_server(server_id, table, projection=db_helper.EVENT_SCHEDULE_VIEW)
     planned_events = db_helper.get_schedule_plans_for_server(server_id, table)
     planned_events = remove_matched_plans(server_id, real_events, planned_events, table)
     planned_events = _delete_past_plans(server_id, planned_events, table)
@@ -1,12 +1,14 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam, ParamChoice
-import commands.setup.server_config_commands as server_config_commands
-import commands.setup.show_config_commands as show_config_commands
-from commands.event.autocomplete_handlers import EVENT_NAME_PARAM
+from commands.event.event_params import EVENT_NAME_PARAM
 
 
+# Command modules are imported only when one of their commands is invoked
+server_config_commands = LazyModule("commands.setup.server_config_commands")
+show_config_commands = LazyModule("commands.setup.show_config_commands")
 
 setup_commands: CommandMapping = {
     "setup-server": {
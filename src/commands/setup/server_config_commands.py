@@ -1,5 +1,5 @@
-from mypy_boto3_dynamodb.service_resource import Table
 
+from typing import TYPE_CHECKING
 import database.dynamodb_utils as db_helper
 import utils.discord_api_helper as discord_helper
 import utils.message_helper as message_helper
@@ -9,9 +9,12 @@ from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
 from database.models.server_config import ServerConfig
 
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
 def setup_server(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
     """Sets up a CONFIG record for a server in DynamoDB if it does not already exist."""
-    table: Table = aws_services.dynamodb_table
+    table: "Table" = aws_services.dynamodb_table
     error_message = permissions_helper.require_manage_server_permission(event)
     if isinstance(error_message, ResponseMessage):
         return error_message
@@ -29,22 +32,16 @@ def setup_server(event: DiscordEvent, aws_services: AWSServices) -> ResponseMess
     notification_channel = event.get_command_input_value("notification_channel")
     ping_organizers = event.get_command_input_value("ping_organizers") or False
 
-    pk = db_helper.build_server_pk(server_id)
-
     server_name = discord_helper.get_guild_name(server_id)
     print(f"[setup] Fetched server name: {server_name!r} for server_id={server_id!r}")
 
-    table.put_item(
-        Item={
-            "PK": pk,
-            "SK": ServerConfig.Keys.SK_CONFIG,
-            ServerConfig.Keys.SERVER_ID: server_id,
-            ServerConfig.Keys.SERVER_NAME: server_name,
-            ServerConfig.Keys.ORGANIZER_ROLE: organizer_role,
-            ServerConfig.Keys.NOTIFICATION_CHANNEL_ID: notification_channel,
-            ServerConfig.Keys.PING_ORGANIZERS: ping_organizers,
-        }
-    )
+    db_helper.create_server_config(server_id, {
+        ServerConfig.Keys.SERVER_ID: server_id,
+        ServerConfig.Keys.SERVER_NAME: server_name,
+        ServerConfig.Keys.ORGANIZER_ROLE: organizer_role,
+        ServerConfig.Keys.NOTIFICATION_CHANNEL_ID: notification_channel,
+        ServerConfig.Keys.PING_ORGANIZERS: ping_organizers,
+    }, table)
 
     return ResponseMessage(
         content=(
@@ -57,13 +54,12 @@ def setup_server(event: DiscordEvent, aws_services: AWSServices) -> ResponseMess
 
 def set_organizer_role(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
     """Sets the organizer_role property of the existing CONFIG record."""
-    table: Table = aws_services.dynamodb_table
+    table: "Table" = aws_services.dynamodb_table
     error_message = permissions_helper.require_manage_server_permission(event)
     if isinstance(error_message, ResponseMessage):
          return error_message
 
     server_id = event.get_server_id()
-    pk = db_helper.build_server_pk(server_id)
 
     result = db_helper.get_server_config_or_fail(server_id, aws_services.dynamodb_table)
     if isinstance(result, ResponseMessage):
@@ -71,11 +67,7 @@ def set_organizer_role(event: DiscordEvent, aws_services: AWSServices) -> Respon
 
     organizer_role = event.get_command_input_value("organizer_role")
 
-    table.update_item(
-        Key={"PK": pk, "SK": ServerConfig.Keys.SK_CONFIG},
-        UpdateExpression=f"SET {ServerConfig.Keys.ORGANIZER_ROLE} = :r",
-        ExpressionAttributeValues={":r": organizer_role}
-    )
+    db_helper.update_server_config(server_id, {ServerConfig.Keys.ORGANIZER_ROLE: organizer_role}, table)
 
     return ResponseMessage(
         content="👍 Organizer role updated successfully."
@@ -88,7 +80,6 @@ def setup_notifications(event: DiscordEvent, aws_services: AWSServices) -> Respo
         return error_message
 
     server_id = event.get_server_id()
-    pk = db_helper.build_server_pk(server_id)
 
     result = db_helper.get_server_config_or_fail(server_id, aws_services.dynamodb_table)
     if isinstance(result, ResponseMessage):
@@ -97,11 +88,10 @@ def setup_notifications(event: DiscordEvent, aws_services: AWSServices) -> Respo
     channel_id = event.get_command_input_value("channel")
     ping_organizers = event.get_command_input_value("ping_organizers") or False
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": pk, "SK": ServerConfig.Keys.SK_CONFIG},
-        UpdateExpression=f"SET {ServerConfig.Keys.NOTIFICATION_CHANNEL_ID} = :c, {ServerConfig.Keys.PING_ORGANIZERS} = :p",
-        ExpressionAttributeValues={":c": channel_id, ":p": ping_organizers}
-    )
+    db_helper.update_server_config(server_id, {
+        ServerConfig.Keys.NOTIFICATION_CHANNEL_ID: channel_id,
+        ServerConfig.Keys.PING_ORGANIZERS: ping_organizers,
+    }, aws_services.dynamodb_table)
 
     ping_note = " Organizers will be pinged with notifications." if ping_organizers else ""
     return ResponseMessage(
@@ -116,7 +106,6 @@ def setup_event_reminders(event: DiscordEvent, aws_services: AWSServices) -> Res
         return error_message
 
     server_id = event.get_server_id()
-    pk = db_helper.build_server_pk(server_id)
 
     result = db_helper.get_server_config_or_fail(server_id, aws_services.dynamodb_table)
     if isinstance(result, ResponseMessage):
@@ -126,22 +115,15 @@ def setup_event_reminders(event: DiscordEvent, aws_services: AWSServices) -> Res
     announcement_role = event.get_command_input_value("announcement_role")
     remind_by_default = event.get_command_input_value("remind_by_default")
 
-    update_expr = f"SET {ServerConfig.Keys.ANNOUNCEMENT_CHANNEL_ID} = :channel"
-    expression_values = {":channel": announcement_channel}
+    config_values = {ServerConfig.Keys.ANNOUNCEMENT_CHANNEL_ID: announcement_channel}
 
     if announcement_role is not None:
-        update_expr += f", {ServerConfig.Keys.ANNOUNCEMENT_ROLE_ID} = :role"
-        expression_values[":role"] = announcement_role
+        config_values[ServerConfig.Keys.ANNOUNCEMENT_ROLE_ID] = announcement_role
 
     if remind_by_default is not None:
-        update_expr += f", {ServerConfig.Keys.SHOULD_ALWAYS_REMIND} = :remind"
-        expression_values[":remind"] = remind_by_default
+        config_values[ServerConfig.Keys.SHOULD_ALWAYS_REMIND] = remind_by_default
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": pk, "SK": ServerConfig.Keys.SK_CONFIG},
-        UpdateExpression=update_expr,
-        ExpressionAttributeValues=expression_values
-    )
+    db_helper.update_server_config(server_id, config_values, aws_services.dynamodb_table)
 
     queued_count = 0
     if remind_by_default:
@@ -166,7 +148,6 @@ def set_default_participant_role(event: DiscordEvent, aws_services: AWSServices)
         return error_message
 
     server_id = event.get_server_id()
-    pk = db_helper.build_server_pk(server_id)
 
     result = db_helper.get_server_config_or_fail(server_id, aws_services.dynamodb_table)
     if isinstance(result, ResponseMessage):
@@ -174,10 +155,8 @@ def set_default_participant_role(event: DiscordEvent, aws_services: AWSServices)
 
     participant_role = event.get_command_input_value("participant_role")
 
-    aws_services.dynamodb_table.update_item(
-        Key={"PK": pk, "SK": ServerConfig.Keys.SK_CONFIG},
-        UpdateExpression=f"SET {ServerConfig.Keys.DEFAULT_PARTICIPANT_ROLE} = :r",
-        ExpressionAttributeValues={":r": participant_role}
+    db_helper.update_server_config(
+        server_id, {ServerConfig.Keys.DEFAULT_PARTICIPANT_ROLE: participant_role}, aws_services.dynamodb_table
     )
 
     return ResponseMessage(
@@ -1,9 +1,12 @@
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 from commands.models.command_mapping import CommandMapping
+from commands.models.lazy_function import LazyModule
 from commands.models.command_param import CommandParam
-from commands.event.autocomplete_handlers import EVENT_NAME_PARAM
-import commands.startgg.startgg_commands as startgg_commands
+from commands.event.event_params import EVENT_NAME_PARAM
+
+# Command modules are imported only when one of their commands is invoked
+startgg_commands = LazyModule("commands.startgg.startgg_commands")
 
 startgg_commands_mapping: CommandMapping = {
     "startgg-notify-unlinked": {
@@ -18,6 +21,7 @@ startgg_commands_mapping: CommandMapping = {
     },
     "startgg-report-score": {
         "function": startgg_commands.report_score,
+        "deferred": True,
         "description": "Report the result of a start.gg bracket set",
         "params": [
             EVENT_NAME_PARAM,
@@ -43,5 +47,20 @@ startgg_commands_mapping: CommandMapping = {
                 choices=None
             )
         ]
+    },
+    "startgg-report-scores": {
+        "function": startgg_commands.report_scores,
+        "deferred": True,
+        "description": "Report many start.gg bracket set results at once (Organizer only)",
+        "params": [
+            EVENT_NAME_PARAM,
+            CommandParam(
+                name="results",
+                description="'<winner> <loser> <score>' per set, separated by ';', e.g. '@Ann @Bo 2-1; @Cy @Di dq'",
+                param_type=AppCommandOptionType.string,
+                required=True,
+                choices=None
+            )
+        ]
     }
 }
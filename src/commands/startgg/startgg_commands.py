@@ -1,6 +1,7 @@
 import re
 import secrets
 import time
+from dataclasses import dataclass
 
 import constants
 from aws_services import AWSServices
@@ -15,6 +16,13 @@ import utils.permissions_helper as permissions_helper
 
 _SCORE_PATTERN = re.compile(r"^(\d+)-(\d+)$")
 
+# /startgg-report-scores: results are separated by ';' or newlines, each "<winner> <loser> <score>"
+_BULK_RESULT_SEPARATOR = re.compile(r"[;\n]")
+_MENTION_PATTERN = re.compile(r"^<@!?(\d+)>$")
+# Keeps the result table inside Discord's 2000-character message limit
+_BULK_MAX_RESULTS = 25
+_BULK_NAME_WIDTH = 16
+
 _STARTGG_OAUTH_BASE_URL = "https://start.gg/oauth/authorize"
 
 _AUTH_REQUIRED_MSG = (
@@ -123,7 +131,7 @@ def notify_unlinked(event: DiscordEvent, aws_services: AWSServices) -> ResponseM
         return ResponseMessage(content="❌ This event is not linked to a start.gg event.")
 
     try:
-        startgg_event = startgg_api.query_startgg_event(event_data.startgg_url)
+        startgg_event = startgg_api.query_startgg_event(event_data.startgg_url, table=aws_services.dynamodb_table)
     except Exception as e:
         print(f"[startgg] notify_unlinked: error querying event: {e}")
         return ResponseMessage(content="❌ Failed to fetch participant data from start.gg. Check the event link and try again.")
@@ -200,7 +208,7 @@ def report_score(event: DiscordEvent, aws_services: AWSServices) -> ResponseMess
     event_slug = startgg_api.extract_startgg_slug(event_data.startgg_url)
 
     result = startgg_api.find_set_between_players(
-        event_slug, [winner_entrant_id, loser_entrant_id]
+        event_slug, [winner_entrant_id, loser_entrant_id], table=aws_services.dynamodb_table
     )
     if result is None:
         return ResponseMessage(
@@ -233,9 +241,158 @@ def report_score(event: DiscordEvent, aws_services: AWSServices) -> ResponseMess
             )
         )
     except ValueError as e:
+        # Most likely the set was already reported elsewhere; the next attempt searches live
+        startgg_api.forget_reported_set(event_slug, [winner_entrant_id, loser_entrant_id], aws_services.dynamodb_table)
         return ResponseMessage(content=f"❌ {e}")
+    startgg_api.forget_reported_set(event_slug, [winner_entrant_id, loser_entrant_id], aws_services.dynamodb_table)
 
     result_str = f"{message_helper.get_user_ping(loser_id)} DQ" if is_dq else score_str
     return ResponseMessage(
         content=f"Score reported on start.gg: {message_helper.get_user_ping(winner_id)} def. {message_helper.get_user_ping(loser_id)} ({result_str})"
     ).with_silent_pings()
+
+
+@dataclass
+class _BulkResult:
+    line: str
+    status: str = ""
+    winner_name: str = ""
+    loser_name: str = ""
+    score: str = ""
+    winner_entrant_id: str | None = None
+    loser_entrant_id: str | None = None
+    report: dict | None = None
+    error: str | None = None
+
+
+def _resolve_bulk_player(token: str, registered, names: dict[str, list[str]]) -> tuple[dict | None, str]:
+    """Finds a registrant by mention, user ID or (case-insensitive) display name.
+    Returns (participant or None, name to show)."""
+    mention = _MENTION_PATTERN.match(token)
+    user_id = mention.group(1) if mention else token
+    participant = registered.get(user_id)
+    if participant is None:
+        matches = names.get(token.lower(), [])
+        participant = registered.get(matches[0]) if len(matches) == 1 else None
+    return participant, (participant or {}).get("display_name") or token
+
+
+def _parse_bulk_result(result: _BulkResult, registered, names: dict[str, list[str]]) -> None:
+    """Fills in a bulk line's players, score and report, or sets its error status."""
+    tokens = result.line.split()
+    if len(tokens) != 3:
+        result.status = "❌ expected <winner> <loser> <score>"
+        return
+    winner_token, loser_token, result.score = tokens
+    winner_info, result.winner_name = _resolve_bulk_player(winner_token, registered, names)
+    loser_info, result.loser_name = _resolve_bulk_player(loser_token, registered, names)
+
+    is_dq = result.score.lower() == "dq"
+    parsed_score = None if is_dq else _parse_score(result.score)
+    if not is_dq and parsed_score is None:
+        result.status = "❌ bad score"
+        return
+    for info in (winner_info, loser_info):
+        if not info:
+            result.status = "❌ not registered"
+            return
+        if not info.get("external_id"):
+            result.status = "❌ no start.gg ID"
+            return
+
+    result.winner_entrant_id = winner_info["external_id"]
+    result.loser_entrant_id = loser_info["external_id"]
+    if result.winner_entrant_id == result.loser_entrant_id:
+        result.status = "❌ same player"
+        return
+    game_data = [] if is_dq else build_set_game_data(*parsed_score, result.winner_entrant_id, result.loser_entrant_id)
+    result.report = {"winnerId": result.winner_entrant_id, "isDQ": is_dq, "gameData": game_data}
+
+
+def _build_bulk_table(results: list[_BulkResult]) -> str:
+    width = _BULK_NAME_WIDTH
+    rows = [f"{'#':>2} {'Winner':<{width}} {'Loser':<{width}} {'Score':<5} Status"]
+    for number, result in enumerate(results, 1):
+        rows.append(
+            f"{number:>2} {result.winner_name[:width]:<{width}} {result.loser_name[:width]:<{width}} "
+            f"{result.score[:5]:<5} {result.status}"
+        )
+    return "```\n" + "\n".join(rows) + "\n```"
+
+
+def report_scores(event: DiscordEvent, aws_services: AWSServices) -> ResponseMessage:
+    """Reports many start.gg set results at once (e.g. the end of pools). Organizer only.
+
+    Players are resolved against the event's registered map, every set is found with one
+    open-set listing, and the reports are sent as batched aliased mutations."""
+    server_id = event.get_server_id()
+    server_config = db_helper.get_server_config_or_fail(server_id, aws_services.dynamodb_table)
+    if isinstance(server_config, ResponseMessage):
+        return server_config
+    error_message = permissions_helper.require_organizer_role(server_config, event)
+    if error_message:
+        return error_message
+    if not server_config.startgg_oauth_token:
+        return ResponseMessage(content=_AUTH_REQUIRED_MSG)
+
+    lines = [line.strip() for line in _BULK_RESULT_SEPARATOR.split(event.get_command_input_value("results") or "")]
+    results = [_BulkResult(line=line) for line in lines if line]
+    if not results:
+        return ResponseMessage(content="No results given. Use `<winner> <loser> <score>` separated by `;`, e.g. `@Ann @Bo 2-1; @Cy @Di dq`.")
+    if len(results) > _BULK_MAX_RESULTS:
+        return ResponseMessage(content=f"Too many results: at most {_BULK_MAX_RESULTS} can be reported at once.")
+
+    event_id = event.get_command_input_value("event_name")
+    event_data = db_helper.get_server_event_data_or_fail(server_id, event_id, aws_services.dynamodb_table)
+    if isinstance(event_data, ResponseMessage):
+        return event_data
+    if not event_data.startgg_url:
+        return ResponseMessage(content="This event is not linked to a start.gg event.")
+
+    registered = event_data.registered or {}
+    names = {}
+    for user_id, participant in registered.items():
+        names.setdefault((participant.get("display_name") or "").lower(), []).append(user_id)
+    for result in results:
+        _parse_bulk_result(result, registered, names)
+
+    pending = [result for result in results if result.report is not None]
+    event_slug = startgg_api.extract_startgg_slug(event_data.startgg_url)
+    open_sets = startgg_api.list_open_sets(event_slug) if pending else {}
+    if open_sets is None:
+        return ResponseMessage(content="❌ Failed to list the event's sets on start.gg. Please try again.")
+
+    to_report = []
+    claimed_sets = set()
+    for result in pending:
+        set_id = open_sets.get(frozenset((result.winner_entrant_id, result.loser_entrant_id)))
+        if set_id is None:
+            result.status = "❌ no open set"
+        elif set_id in claimed_sets:
+            result.status = "❌ duplicate"
+        else:
+            claimed_sets.add(set_id)
+            result.report["setId"] = set_id
+            to_report.append(result)
+
+    try:
+        outcomes = startgg_api.report_sets([result.report for result in to_report], server_config.startgg_oauth_token)
+    except StartggAuthError:
+        return ResponseMessage(content=_AUTH_EXPIRED_MSG)
+
+    errors = []
+    for result, error in zip(to_report, outcomes):
+        if error is None:
+            result.status = "✅ reported"
+            startgg_api.forget_reported_set(
+                event_slug, [result.winner_entrant_id, result.loser_entrant_id], aws_services.dynamodb_table
+            )
+        else:
+            result.status = "❌ start.gg error"
+            errors.append(f"{results.index(result) + 1}. {error[:150]}")
+
+    reported = sum(result.status == "✅ reported" for result in results)
+    content = f"Reported {reported}/{len(results)} set(s) on start.gg:\n{_build_bulk_table(results)}"
+    if errors:
+        content += "\nstart.gg errors:\n" + "\n".join(errors)
+    return ResponseMessage(content=content)
@@ -1,21 +1,142 @@
 # MIRROR: jobs/scheduled_job/db.py — keep in sync (independent Lambda packaging prevents imports)
+import copy
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone as dt_timezone
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 from boto3.dynamodb.conditions import Key
-from mypy_boto3_dynamodb.service_resource import Table
 
 import utils.adomin_messages as adomin_messages
+import utils.autocomplete_helper as autocomplete_helper
 from commands.models.response_message import ResponseMessage
-from database.models.event_data import EventData
+from database.models.event_data import EventData, LazyParticipantMap
 from database.models.league_data import LeagueData
 from database.models.schedule_plan import SchedulePlan
 from database.models.server_config import ServerConfig
+from enums import ParticipantWriteOutcome
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
 
 PK_SERVER_PREFIX = "SERVER#"
 PK_ATTR = "PK"
 SK_ATTR = "SK"
 
+def _copy_value(value):
+    """Copy a DynamoDB item or response structurally. Only maps, lists and sets are copied; the
+    leaves boto3 returns (str, Decimal, bool, bytes, Binary) are immutable and shared. Several
+    times faster than copy.deepcopy on large participant maps, since there's no memo to keep."""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_value(nested) for key, nested in value.items()}
+    if value_type is list:
+        return [_copy_value(nested) for nested in value]
+    if value_type is set:
+        return set(value)
+    return value
+
+class RequestReadCache:
+    """Unit-of-work read cache for one interaction, wrapping the DynamoDB table.
+
+    Created per command in bot.py and handed to handlers as `aws_services.dynamodb_table`,
+    so repeated GetItem/Query calls within one invocation (e.g. the permission check and
+    the handler both reading CONFIG) hit DynamoDB once. Writes made through the wrapper
+    keep it coherent: put_item caches the written item, update_item/delete_item drop or
+    replace it, and any write discards cached query results. Everything else is
+    forwarded to the wrapped table.
+    """
+
+    def __init__(self, table: "Table"):
+        self._table = table
+        self._items: dict[tuple, Optional[dict]] = {}
+        self._queries: list[tuple[dict, dict]] = []
+        self.hits = 0
+        self.misses = 0
+        self.last_was_hit = False
+
+    def __getattr__(self, name):
+        return getattr(self._table, name)
+
+    @staticmethod
+    def _item_key(key: dict) -> tuple:
+        return key[PK_ATTR], key[SK_ATTR]
+
+    def _drop_projections(self, item_key: tuple) -> None:
+        for cache_key in [k for k in self._items if k[:2] == item_key and k != item_key]:
+            del self._items[cache_key]
+
+    def _record(self, hit: bool) -> None:
+        self.last_was_hit = hit
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_item(self, Key: dict, **kwargs) -> dict:
+        item_key = self._item_key(Key)
+        # Projected reads are cached separately, but a cached full item satisfies any projection
+        cache_key = item_key + (repr(sorted(kwargs.items())),) if kwargs else item_key
+        for candidate in (item_key, cache_key):
+            if candidate in self._items:
+                self._record(hit=True)
+                item = self._items[candidate]
+                return {"Item": _copy_value(item)} if item is not None else {}
+        response = self._table.get_item(Key=Key, **kwargs)
+        self._record(hit=False)
+        self._items[cache_key] = _copy_value(response.get("Item"))
+        return response
+
+    def query(self, **kwargs) -> dict:
+        # boto3 conditions compare by value, so equal queries match even if rebuilt
+        cached = next((response for query, response in self._queries if query == kwargs), None)
+        if cached is not None:
+            self._record(hit=True)
+            return _copy_value(cached)
+        response = self._table.query(**kwargs)
+        self._record(hit=False)
+        self._queries.append((kwargs, _copy_value(response)))
+        return response
+
+    def put_item(self, Item: dict, **kwargs) -> dict:
+        response = self._table.put_item(Item=Item, **kwargs)
+        self._drop_projections(self._item_key(Item))
+        self._items[self._item_key(Item)] = _copy_value(Item)
+        self._queries.clear()
+        return response
+
+    def update_item(self, Key: dict, **kwargs) -> dict:
+        response = self._table.update_item(Key=Key, **kwargs)
+        self._drop_projections(self._item_key(Key))
+        if kwargs.get("ReturnValues") == "ALL_NEW":
+            self._items[self._item_key(Key)] = _copy_value(response["Attributes"])
+        else:
+            self._items.pop(self._item_key(Key), None)
+        self._queries.clear()
+        return response
+
+    def delete_item(self, Key: dict, **kwargs) -> dict:
+        response = self._table.delete_item(Key=Key, **kwargs)
+        self._drop_projections(self._item_key(Key))
+        self._items[self._item_key(Key)] = None
+        self._queries.clear()
+        return response
+
+    def invalidate(self) -> None:
+        """Drop everything, for writes that bypass the wrapper (e.g. transact_write_items)."""
+        self._items.clear()
+        self._queries.clear()
+
+    def stats(self) -> str:
+        return f"hits={self.hits} misses={self.misses}"
+
+
+def _cache_note(table: "Table") -> str:
+    """Suffix for [db] log lines describing whether the last read came from the request cache."""
+    if not isinstance(table, RequestReadCache):
+        return ""
+    return f" (cache {'hit' if table.last_was_hit else 'miss'}, {table.stats()})"
+
 def build_server_pk(server_id: str) -> str:
     """Build the DynamoDB partition key value for a server's records."""
     return f"{PK_SERVER_PREFIX}{server_id}"
@@ -24,53 +145,201 @@ def build_event_key(server_id: str, event_id: str) -> dict:
     """Build the DynamoDB primary key dict for an EVENT record."""
     return {PK_ATTR: build_server_pk(server_id), SK_ATTR: EventData.Keys.SK_EVENT_PREFIX + event_id}
 
-def get_server_config_or_fail(server_id: str, table: Table) -> ServerConfig | ResponseMessage:
+def iter_query(table: "Table", projection: Optional[Sequence[str]] = None, limit: Optional[int] = None,
+               **query_kwargs) -> Iterator[dict]:
+    """Run a Query and lazily yield its items across every page, following LastEvaluatedKey.
+
+    `projection` lists the attributes to fetch (placeholders are generated, so reserved words
+    are safe); `limit` caps the total number of items yielded and is also sent as the
+    per-page Limit so no more than needed is read. Remaining kwargs go to table.query."""
+    if projection:
+        names = dict(query_kwargs.get("ExpressionAttributeNames", {}))
+        placeholders = []
+        for i, attribute in enumerate(projection):
+            placeholder = f"#p{i}"
+            names[placeholder] = attribute
+            placeholders.append(placeholder)
+        query_kwargs["ProjectionExpression"] = ", ".join(placeholders)
+        query_kwargs["ExpressionAttributeNames"] = names
+    remaining = limit
+    while True:
+        if remaining is not None:
+            query_kwargs["Limit"] = remaining
+        response = table.query(**query_kwargs)
+        for item in response.get("Items", []):
+            yield item
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+def iter_server_items(server_id: str, sk_prefix: str, table: "Table", projection: Optional[Sequence[str]] = None,
+                      limit: Optional[int] = None) -> Iterator[dict]:
+    """Lazily yield the items in a server's partition whose SK starts with `sk_prefix`."""
+    return iter_query(
+        table, projection=projection, limit=limit,
+        KeyConditionExpression=Key(PK_ATTR).eq(build_server_pk(server_id)) & Key(SK_ATTR).begins_with(sk_prefix),
+    )
+
+CONFIG_CACHE_MAX_ENTRIES = 512
+CONFIG_CACHE_TTL_SECONDS = 600
+
+class ServerConfigCache:
+    """Bounded LRU of ServerConfig objects that outlives a single invocation on a warm
+    container. Entries are only trusted after a projected read confirms their
+    config_version still matches DynamoDB; entries older than the TTL are refetched."""
+
+    def __init__(self, max_entries: int = CONFIG_CACHE_MAX_ENTRIES, ttl_seconds: int = CONFIG_CACHE_TTL_SECONDS):
+        self._entries: OrderedDict[str, Tuple[ServerConfig, float]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, server_id: str) -> Optional[ServerConfig]:
+        entry = self._entries.get(server_id)
+        if entry is None:
+            return None
+        config, cached_at = entry
+        if time.monotonic() - cached_at > self._ttl_seconds:
+            del self._entries[server_id]
+            return None
+        self._entries.move_to_end(server_id)
+        return copy.deepcopy(config)
+
+    def put(self, server_id: str, config: ServerConfig) -> None:
+        self._entries[server_id] = (copy.deepcopy(config), time.monotonic())
+        self._entries.move_to_end(server_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, server_id: str) -> None:
+        self._entries.pop(server_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+server_config_cache = ServerConfigCache()
+
+def _build_config_key(server_id: str) -> dict:
+    return {PK_ATTR: build_server_pk(server_id), SK_ATTR: ServerConfig.Keys.SK_CONFIG}
+
+def _get_config_version(server_id: str, table: "Table") -> Optional[int]:
+    """Projected read of just the CONFIG version. Returns None if the record is gone."""
+    response = table.get_item(
+        Key=_build_config_key(server_id),
+        ProjectionExpression="#sk, #version",
+        ExpressionAttributeNames={"#sk": SK_ATTR, "#version": ServerConfig.Keys.CONFIG_VERSION},
+    )
+    item = response.get("Item")
+    if not item:
+        return None
+    return int(item.get(ServerConfig.Keys.CONFIG_VERSION, 0))
+
+def get_server_config_or_fail(server_id: str, table: "Table") -> ServerConfig | ResponseMessage:
     """Fetch the server's CONFIG record. Returns a ServerConfig on success,
-    or a user-facing ResponseMessage if the server is not set up."""
-    pk = build_server_pk(server_id)
+    or a user-facing ResponseMessage if the server is not set up.
+
+    A warm-container cached copy is served when a projected read shows its
+    config_version is still current."""
+    cached_config = server_config_cache.get(server_id)
+    if cached_config is not None:
+        print(f"[db] CHECK CONFIG VERSION server={server_id}")
+        version = _get_config_version(server_id, table)
+        if version == cached_config.config_version:
+            print(f"[db] -> warm cache hit CONFIG server={server_id} version={version}{_cache_note(table)}")
+            return cached_config
+        print(f"[db] -> warm cache stale CONFIG server={server_id} cached={cached_config.config_version} current={version}")
+        server_config_cache.invalidate(server_id)
+
     print(f"[db] GET CONFIG server={server_id}")
-    response = table.get_item(Key={PK_ATTR: pk, SK_ATTR: ServerConfig.Keys.SK_CONFIG})
+    response = table.get_item(Key=_build_config_key(server_id))
     config_record = response.get("Item")
     if not config_record:
-        print(f"[db] -> not found CONFIG server={server_id}")
+        print(f"[db] -> not found CONFIG server={server_id}{_cache_note(table)}")
         return ResponseMessage(content=adomin_messages.SERVER_CONFIG_MISSING)
-    print(f"[db] -> found CONFIG server={server_id}")
-    return ServerConfig.from_dynamodb(config_record)
+    print(f"[db] -> found CONFIG server={server_id}{_cache_note(table)}")
+    config = ServerConfig.from_dynamodb(config_record)
+    server_config_cache.put(server_id, config)
+    return config
+
+def update_server_config(server_id: str, values: dict, table: "Table", version_bump: int = 1) -> None:
+    """SET the given CONFIG attributes (db key -> value), bumping config_version so other
+    warm containers' cached copies fail revalidation, and drop this container's copy."""
+    names = {f"#a{i}": attribute for i, attribute in enumerate(values)}
+    expression_values = {f":v{i}": value for i, value in enumerate(values.values())}
+    expression_values[":version_bump"] = version_bump
+    set_clause = ", ".join(f"#a{i} = :v{i}" for i in range(len(values)))
+    print(f"[db] UPDATE CONFIG server={server_id} attributes={list(values)}")
+    table.update_item(
+        Key=_build_config_key(server_id),
+        UpdateExpression=f"SET {set_clause} ADD {ServerConfig.Keys.CONFIG_VERSION} :version_bump",
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=expression_values,
+    )
+    server_config_cache.invalidate(server_id)
+    print("[db] -> ok")
+
+def create_server_config(server_id: str, values: dict, table: "Table") -> None:
+    """Write a new CONFIG record. The version is bumped by the current time in milliseconds
+    rather than reset to 1, so a CONFIG deleted and set up again never reuses a version that a
+    warm container may still hold for the old record."""
+    update_server_config(server_id, values, table, version_bump=int(time.time() * 1000))
 
 EVENT_NAME_INDEX = "EventNameIndex"
 LEAGUE_NAME_INDEX = "LeagueNameIndex"
 
-def _query_name_index(server_id: str, index_name: str, name_key: str, id_key: str, table: Table) -> List[Tuple[str, str]]:
+def _query_name_index(server_id: str, index_name: str, name_key: str, id_key: str, table: "Table") -> List[Tuple[str, str]]:
     """Query a server-scoped name GSI and return (name, id) tuples.
     Both name indexes are partitioned by the server_id attribute."""
-    response = table.query(
-        IndexName=index_name,
-        KeyConditionExpression=Key("server_id").eq(server_id)
+    items = iter_query(
+        table, projection=[name_key, id_key],
+        IndexName=index_name, KeyConditionExpression=Key("server_id").eq(server_id),
     )
-    return [
-        (item[name_key], item[id_key])
-        for item in response.get("Items", [])
-    ]
+    return [(item[name_key], item[id_key]) for item in items]
 
-def get_events_for_server(server_id: str, table: Table) -> List[Tuple[str, str]]:
+def get_events_for_server(server_id: str, table: "Table") -> List[Tuple[str, str]]:
     """Query EventNameIndex and return list of (event_name, event_id) tuples for active (not ended) events."""
     print(f"[db] QUERY EVENTS server={server_id}")
     events = _query_name_index(server_id, EVENT_NAME_INDEX, EventData.Keys.EVENT_NAME, EventData.Keys.EVENT_ID, table)
-    print(f"[db] -> {len(events)} active event(s) found for server={server_id}")
+    print(f"[db] -> {len(events)} active event(s) found for server={server_id}{_cache_note(table)}")
     return events
 
-def _resolve_event_id(server_id: str, event_id: str, table: Table) -> str:
+# Duplicate display names are rare, so one small page almost always holds every match
+NAME_LOOKUP_PAGE_SIZE = 10
+
+def _resolve_id_by_name(server_id: str, name: str, index_name: str, name_key: str, id_key: str,
+                        table: "Table") -> Optional[str]:
+    """Look up a record ID by exact display name using the name GSI's RANGE key, so the read
+    size depends on how many records share the name, not on how many the server has.
+    Duplicate names resolve to the oldest record (smallest ID) so repeated lookups agree."""
+    # Limit is the page size here, not a cap: every match is read so the choice among duplicates is stable
+    items = iter_query(
+        table, projection=[id_key], Limit=NAME_LOOKUP_PAGE_SIZE,
+        IndexName=index_name, KeyConditionExpression=Key("server_id").eq(server_id) & Key(name_key).eq(name),
+    )
+    candidate_ids = [item[id_key] for item in items]
+    if not candidate_ids:
+        return None
+    if len(candidate_ids) > 1:
+        print(f"[db] WARN {len(candidate_ids)} records share name {name!r} in {index_name} server={server_id} — using oldest")
+    return min(candidate_ids, key=lambda candidate_id: (len(candidate_id), candidate_id))
+
+def _resolve_event_id(server_id: str, event_id: str, table: "Table") -> str:
     # Discord may repopulate autocomplete fields with the display name instead of the snowflake ID.
     # Resolve by name first if the input isn't numeric.
     if not event_id.isdigit():
-        events = get_events_for_server(server_id, table)
-        resolved_id = next((candidate_event_id for name, candidate_event_id in events if name == event_id), None)
+        resolved_id = _resolve_id_by_name(
+            server_id, event_id, EVENT_NAME_INDEX, EventData.Keys.EVENT_NAME, EventData.Keys.EVENT_ID, table
+        )
         if resolved_id:
             print(f"[db] -> resolved event by name {event_id!r} -> {resolved_id}")
             return resolved_id
     return event_id
 
-def _get_server_record_or_fail(server_id: str, record_id: str, table: Table, resolve_record_id, sk_prefix: str,
+def _get_server_record_or_fail(server_id: str, record_id: str, table: "Table", resolve_record_id, sk_prefix: str,
                                record_label: str, id_label: str, not_found_message: str, model_class):
     """Resolve the record ID, fetch the record by PK/SK, and return it as a model
     instance — or a user-facing ResponseMessage if it doesn't exist."""
@@ -80,15 +349,50 @@ def _get_server_record_or_fail(server_id: str, record_id: str, table: Table, res
     response = table.get_item(Key={PK_ATTR: pk, SK_ATTR: sk_prefix + record_id})
     record = response.get("Item")
     if not record:
-        print(f"[db] -> not found {record_label} server={server_id} {id_label}={record_id}")
+        print(f"[db] -> not found {record_label} server={server_id} {id_label}={record_id}{_cache_note(table)}")
         return ResponseMessage(content=not_found_message)
-    print(f"[db] -> found {record_label} server={server_id} {id_label}={record_id}")
+    print(f"[db] -> found {record_label} server={server_id} {id_label}={record_id}{_cache_note(table)}")
     return model_class.from_dynamodb(record)
 
-def get_server_event_data_or_fail(server_id: str, event_id: str, table: Table) -> EventData | ResponseMessage:
+# MIRROR: jobs/scheduled_job/db.py EVENT_*_VIEW — keep in sync.
+# Projected views of an EVENT record: the scalar attributes each caller reads, leaving out
+# the registered/checked_in/queue maps. SK is included so event_id is always populated.
+EVENT_SCHEDULE_VIEW = (
+    SK_ATTR, EventData.Keys.EVENT_NAME, EventData.Keys.START_TIME, EventData.Keys.STARTGG_URL,
+)
+EVENT_REMINDER_VIEW = (
+    SK_ATTR, EventData.Keys.EVENT_NAME, EventData.Keys.START_TIME, EventData.Keys.SHOULD_POST_REMINDER,
+    EventData.Keys.DID_POST_REMINDER, EventData.Keys.REMINDER_CHANNEL_ID, EventData.Keys.REMINDER_ROLE_ID,
+)
+EVENT_RESCHEDULE_VIEW = (
+    SK_ATTR, EventData.Keys.EVENT_NAME, EventData.Keys.START_TIME, EventData.Keys.STARTGG_URL,
+    EventData.Keys.RESCHEDULE_ALERTED_START,
+)
+EVENT_CLEANUP_VIEW = (
+    SK_ATTR, EventData.Keys.EVENT_NAME, EventData.Keys.PARTICIPANT_ROLE, EventData.Keys.CHECKED_IN,
+    EventData.Keys.PARTICIPANT_LAYOUT,
+)
+
+def get_event_view(server_id: str, event_id: str, view: Sequence[str], table: "Table") -> Optional[EventData]:
+    """Fetch only the `view` attributes of an EVENT record (one of the EVENT_*_VIEW tuples).
+    Fields outside the view come back as their EventData defaults. Returns None if missing."""
+    names = {f"#p{i}": attribute for i, attribute in enumerate(view)}
+    print(f"[db] GET EVENT view server={server_id} event_id={event_id} attributes={len(view)}")
+    response = table.get_item(
+        Key=build_event_key(server_id, event_id),
+        ProjectionExpression=", ".join(names),
+        ExpressionAttributeNames=names,
+    )
+    item = response.get("Item")
+    print(f"[db] -> {'found' if item else 'not found'} EVENT event_id={event_id}{_cache_note(table)}")
+    return EventData.from_dynamodb(item) if item else None
+
+
+def get_server_event_data_or_fail(server_id: str, event_id: str, table: "Table") -> EventData | ResponseMessage:
     """Fetch an EVENT record, resolving a display name back to its ID if needed.
-    Returns an EventData on success, or a user-facing ResponseMessage if not found."""
-    return _get_server_record_or_fail(
+    Returns an EventData on success, or a user-facing ResponseMessage if not found.
+    registered/checked_in are populated whichever participant layout the event uses."""
+    event_data = _get_server_record_or_fail(
         server_id, event_id, table,
         resolve_record_id=_resolve_event_id,
         sk_prefix=EventData.Keys.SK_EVENT_PREFIX,
@@ -97,29 +401,437 @@ def get_server_event_data_or_fail(server_id: str, event_id: str, table: Table) -
         not_found_message=adomin_messages.SERVER_EVENT_DATA_MISSING,
         model_class=EventData,
     )
+    if isinstance(event_data, ResponseMessage):
+        return event_data
+    return load_event_participants(server_id, event_data, table)
+
+
+# ---- Event participant storage ----
+# Events store registered/checked_in participants in one of two layouts, recorded on the
+# EVENT item as participant_layout:
+#   embedded (default) — maps on the EVENT item; simple, but the item is capped at 400 KB
+#   items — one item per participant at SK=PART#<id>#REG#<key> / PART#<id>#CHK#<key>,
+#           so a check-in is a single small write and list reads page through the partition.
+#           They sit outside the EVENT# prefix so event listings never page through them.
+# Handlers write through the functions below and read EventData.registered/checked_in as
+# before; get_server_event_data_or_fail fills those maps from participant items on first read.
+# The queue map stays embedded in both layouts.
+PARTICIPANT_LAYOUT_EMBEDDED = "embedded"
+PARTICIPANT_LAYOUT_ITEMS = "items"
+_PARTICIPANT_SK_INFIXES = {EventData.Keys.REGISTERED: "#REG#", EventData.Keys.CHECKED_IN: "#CHK#"}
+
+# Start.gg imports larger than this move the event to the items layout before writing
+EMBEDDED_PARTICIPANT_LIMIT = 500
+# SET/REMOVE actions per UpdateItem when a sync patches an embedded participant map
+PARTICIPANT_SYNC_ACTIONS_PER_UPDATE = 100
+# Registrations made with /register; a start.gg sync never removes these
+MANUAL_PARTICIPANT_SOURCE = "manual"
+MIGRATION_MAX_ATTEMPTS = 3
+
+def _participant_sk_prefix(event_id: str, kind: Optional[str] = None) -> str:
+    """SK prefix for an event's participant items of one kind, or of every kind if None."""
+    prefix = EventData.Keys.SK_PARTICIPANT_PREFIX + event_id
+    return prefix + _PARTICIPANT_SK_INFIXES[kind] if kind else prefix + "#"
+
+def build_participant_key(server_id: str, event_id: str, kind: str, participant_key: str) -> dict:
+    """Primary key of one participant item; `kind` is EventData.Keys.REGISTERED or CHECKED_IN."""
+    return {PK_ATTR: build_server_pk(server_id), SK_ATTR: _participant_sk_prefix(event_id, kind) + participant_key}
+
+def is_event_record_sk(sk: str) -> bool:
+    """True for an EVENT#<id> record, False for participant items still stored beneath it
+    under the old EVENT#<id>#REG#/#CHK# keys (see move_legacy_participant_items)."""
+    return sk.startswith(EventData.Keys.SK_EVENT_PREFIX) and "#" not in sk[len(EventData.Keys.SK_EVENT_PREFIX):]
+
+def uses_participant_items(event_data: EventData) -> bool:
+    return event_data.participant_layout == PARTICIPANT_LAYOUT_ITEMS
+
+def _forget_request_reads(table: "Table") -> None:
+    # Batch and transactional writes bypass RequestReadCache, so drop what it has cached
+    if isinstance(table, RequestReadCache):
+        table.invalidate()
+
+def iter_event_participants(server_id: str, event_id: str, kind: str, table: "Table") -> Iterator[Tuple[str, dict]]:
+    """Lazily yield (participant_key, participant dict) for an items-layout event, page by page."""
+    prefix = _participant_sk_prefix(event_id, kind)
+    for item in iter_server_items(server_id, prefix, table):
+        participant = {key: value for key, value in item.items() if key not in (PK_ATTR, SK_ATTR)}
+        yield item[SK_ATTR][len(prefix):], participant
+
+def _read_event_participants(server_id: str, event_id: str, kind: str, table: "Table") -> dict:
+    participants = dict(iter_event_participants(server_id, event_id, kind, table))
+    print(f"[db] -> loaded {len(participants)} {kind} participant item(s) event_id={event_id}{_cache_note(table)}")
+    return participants
+
+def load_event_participants(server_id: str, event_data: EventData, table: "Table") -> EventData:
+    """Attach registered/checked_in for an items-layout event as LazyParticipantMaps, which
+    only query the participant items if the command actually reads them."""
+    if uses_participant_items(event_data):
+        event_id = event_data.event_id
+        event_data.registered = LazyParticipantMap(
+            lambda: _read_event_participants(server_id, event_id, EventData.Keys.REGISTERED, table)
+        )
+        event_data.checked_in = LazyParticipantMap(
+            lambda: _read_event_participants(server_id, event_id, EventData.Keys.CHECKED_IN, table)
+        )
+    return event_data
+
+def put_event_participant(server_id: str, event_id: str, event_data: EventData, kind: str,
+                          participant_key: str, participant: dict, table: "Table") -> None:
+    """Add or overwrite one participant in whichever layout the event uses."""
+    if uses_participant_items(event_data):
+        table.put_item(Item={**build_participant_key(server_id, event_id, kind, participant_key), **participant})
+        return
+    table.update_item(
+        Key=build_event_key(server_id, event_id),
+        UpdateExpression=f"SET {kind}.#uid = :participant_info",
+        ExpressionAttributeNames={"#uid": participant_key},
+        ExpressionAttributeValues={":participant_info": participant},
+    )
 
+def remove_event_participant(server_id: str, event_id: str, event_data: EventData, kind: str,
+                             participant_key: str, table: "Table") -> None:
+    """Remove one participant in whichever layout the event uses."""
+    if uses_participant_items(event_data):
+        table.delete_item(Key=build_participant_key(server_id, event_id, kind, participant_key))
+        return
+    table.update_item(
+        Key=build_event_key(server_id, event_id),
+        UpdateExpression=f"REMOVE {kind}.#uid",
+        ExpressionAttributeNames={"#uid": participant_key},
+    )
 
-def get_full_events_for_server(server_id: str, table: Table) -> List[EventData]:
-    """Query all EVENT records for a server by PK + SK prefix and return as EventData objects."""
-    pk = build_server_pk(server_id)
-    print(f"[db] QUERY ALL EVENTS server={server_id}")
-    response = table.query(
-        KeyConditionExpression=Key(PK_ATTR).eq(pk) & Key(SK_ATTR).begins_with(EventData.Keys.SK_EVENT_PREFIX)
+class AddParticipantResult(NamedTuple):
+    outcome: ParticipantWriteOutcome
+    # The EVENT fields callers act on (name, participant role, flags, layout); participant maps are not loaded
+    event_data: EventData
+    # The stored participant when outcome is ALREADY_PRESENT
+    existing: Optional[dict] = None
+
+def _get_participant_write_state(server_id: str, event_id: str, kind: str, participant_key: str,
+                                 table: "Table", enabled_key: Optional[str]) -> Optional[dict]:
+    """Projected, consistent read of what decides a rejected participant write: the EVENT's name,
+    role, layout and enabled flag, plus the one participant entry. None if the event is gone."""
+    names = {
+        "#sk": SK_ATTR, "#name": EventData.Keys.EVENT_NAME, "#role": EventData.Keys.PARTICIPANT_ROLE,
+        "#layout": EventData.Keys.PARTICIPANT_LAYOUT, "#kind": kind, "#uid": participant_key,
+    }
+    projection = "#sk, #name, #role, #layout, #kind.#uid"
+    if enabled_key:
+        names["#enabled"] = enabled_key
+        projection += ", #enabled"
+    return table.get_item(
+        Key=build_event_key(server_id, event_id),
+        ProjectionExpression=projection,
+        ExpressionAttributeNames=names,
+        ConsistentRead=True,
+    ).get("Item")
+
+def add_event_participant_or_fail(server_id: str, event_id: str, kind: str, participant_key: str, participant: dict,
+                                  table: "Table", enabled_key: Optional[str] = None) -> AddParticipantResult | ResponseMessage:
+    """Add one participant unless they're already present, in a single conditional write.
+
+    With `enabled_key` (e.g. EventData.Keys.CHECK_IN_ENABLED) the write is also refused while
+    that flag is off. Only the written entry and the participant role come back from the write,
+    never the participant maps; a rejected write is explained by a small projected read.
+    Items-layout events fail the first write on the layout condition and are retried as a
+    transaction against the EVENT item.
+    Returns a ResponseMessage if the event doesn't exist."""
+    event_id = _resolve_event_id(server_id, event_id, table)
+    names = {
+        "#layout": EventData.Keys.PARTICIPANT_LAYOUT, "#kind": kind, "#uid": participant_key,
+        "#role": EventData.Keys.PARTICIPANT_ROLE,
+    }
+    values = {":items": PARTICIPANT_LAYOUT_ITEMS, ":participant": participant, ":none": None}
+    conditions = [f"attribute_exists({SK_ATTR})", "(attribute_not_exists(#layout) OR #layout <> :items)"]
+    if enabled_key:
+        names["#enabled"] = enabled_key
+        values[":true"] = True
+        conditions.append("#enabled = :true")
+    conditions.append("attribute_not_exists(#kind.#uid)")
+
+    print(f"[db] ADD {kind} participant server={server_id} event_id={event_id} key={participant_key}")
+    try:
+        response = table.update_item(
+            Key=build_event_key(server_id, event_id),
+            # The no-op role SET makes UPDATED_NEW return participant_role alongside the new entry
+            UpdateExpression="SET #kind.#uid = :participant, #role = if_not_exists(#role, :none)",
+            ConditionExpression=" AND ".join(conditions),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="UPDATED_NEW",
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        old_item = _get_participant_write_state(server_id, event_id, kind, participant_key, table, enabled_key)
+        if not old_item:
+            print(f"[db] -> not found EVENT server={server_id} event_id={event_id}")
+            return ResponseMessage(content=adomin_messages.SERVER_EVENT_DATA_MISSING)
+        event_data = EventData.from_dynamodb(old_item)
+        if enabled_key and not old_item.get(enabled_key):
+            print(f"[db] -> rejected, {enabled_key} is off event_id={event_id}")
+            return AddParticipantResult(ParticipantWriteOutcome.CLOSED, event_data)
+        if uses_participant_items(event_data):
+            return _add_participant_item(server_id, event_id, event_data, kind, participant_key, participant,
+                                         table, enabled_key)
+        print(f"[db] -> rejected, already present event_id={event_id} key={participant_key}")
+        return AddParticipantResult(
+            ParticipantWriteOutcome.ALREADY_PRESENT, event_data, (old_item.get(kind) or {}).get(participant_key)
+        )
+
+    attributes = response["Attributes"]
+    return AddParticipantResult(ParticipantWriteOutcome.ADDED, EventData.from_dynamodb({
+        EventData.Keys.PARTICIPANT_ROLE: attributes.get(EventData.Keys.PARTICIPANT_ROLE),
+    }))
+
+def _add_participant_item(server_id: str, event_id: str, event_data: EventData, kind: str, participant_key: str,
+                          participant: dict, table: "Table", enabled_key: Optional[str]) -> AddParticipantResult:
+    """Items-layout half of add_event_participant_or_fail: put the participant item only if it
+    doesn't exist, checking the EVENT item's enabled flag in the same transaction."""
+    table_name = table.name
+    participant_put = {
+        "Put": {
+            "TableName": table_name,
+            "Item": {**build_participant_key(server_id, event_id, kind, participant_key), **participant},
+            "ConditionExpression": f"attribute_not_exists({SK_ATTR})",
+        }
+    }
+    transact_items = [participant_put]
+    if enabled_key:
+        transact_items.insert(0, {
+            "ConditionCheck": {
+                "TableName": table_name,
+                "Key": build_event_key(server_id, event_id),
+                "ConditionExpression": "#enabled = :true",
+                "ExpressionAttributeNames": {"#enabled": enabled_key},
+                "ExpressionAttributeValues": {":true": True},
+            }
+        })
+    try:
+        table.meta.client.transact_write_items(TransactItems=transact_items)
+    except table.meta.client.exceptions.TransactionCanceledException as e:
+        reasons = [reason.get("Code") for reason in e.response.get("CancellationReasons", [])]
+        if enabled_key and reasons and reasons[0] == "ConditionalCheckFailed":
+            print(f"[db] -> rejected, {enabled_key} is off event_id={event_id}")
+            return AddParticipantResult(ParticipantWriteOutcome.CLOSED, event_data)
+        if reasons and reasons[-1] == "ConditionalCheckFailed":
+            existing = table.get_item(Key=build_participant_key(server_id, event_id, kind, participant_key)).get("Item", {})
+            print(f"[db] -> rejected, already present event_id={event_id} key={participant_key}")
+            return AddParticipantResult(
+                ParticipantWriteOutcome.ALREADY_PRESENT, event_data,
+                {key: value for key, value in existing.items() if key not in (PK_ATTR, SK_ATTR)},
+            )
+        raise
+    _forget_request_reads(table)
+    return AddParticipantResult(ParticipantWriteOutcome.ADDED, event_data)
+
+def delete_event_participant_items(server_id: str, event_id: str, table: "Table", kind: Optional[str] = None) -> int:
+    """Delete an event's participant items (of one kind, or all). Returns the number deleted."""
+    keys = [
+        {PK_ATTR: item[PK_ATTR], SK_ATTR: item[SK_ATTR]}
+        for item in iter_server_items(server_id, _participant_sk_prefix(event_id, kind), table, projection=[PK_ATTR, SK_ATTR])
+    ]
+    if keys:
+        with table.batch_writer() as batch:
+            for key in keys:
+                batch.delete_item(Key=key)
+        _forget_request_reads(table)
+        print(f"[db] -> deleted {len(keys)} participant item(s) event_id={event_id}")
+    return len(keys)
+
+def clear_event_participants(server_id: str, event_id: str, event_data: EventData, kind: str, table: "Table") -> None:
+    """Remove every participant of one kind in whichever layout the event uses."""
+    if uses_participant_items(event_data):
+        delete_event_participant_items(server_id, event_id, table, kind=kind)
+        return
+    table.update_item(
+        Key=build_event_key(server_id, event_id),
+        UpdateExpression=f"SET {kind} = :empty_map",
+        ExpressionAttributeValues={":empty_map": {}},
+    )
+
+def prepare_participant_sync(server_id: str, event_id: str, event_data: EventData, kind: str,
+                             incoming_count: int, table: "Table") -> Mapping[str, dict]:
+    """Return the stored participants of one kind that a sync (e.g. a start.gg import of
+    `incoming_count` entrants) should be diffed against.
+
+    Manual registrations survive a sync, so an embedded event moves to the items layout first
+    when `incoming_count` plus its manual registrations would exceed EMBEDDED_PARTICIPANT_LIMIT.
+    An embedded EVENT item without the map gets an empty one so per-key SETs have a parent."""
+    stored = event_data[kind]
+    if uses_participant_items(event_data):
+        return stored if stored is not None else dict(iter_event_participants(server_id, event_id, kind, table))
+
+    if stored is None:
+        table.update_item(
+            Key=build_event_key(server_id, event_id),
+            UpdateExpression="SET #m = if_not_exists(#m, :empty_map)",
+            ExpressionAttributeNames={"#m": kind},
+            ExpressionAttributeValues={":empty_map": {}},
+        )
+        return {}
+
+    manual_count = sum(1 for participant in stored.values() if participant.get("source") == MANUAL_PARTICIPANT_SOURCE)
+    if incoming_count + manual_count > EMBEDDED_PARTICIPANT_LIMIT:
+        migrate_event_participants(server_id, event_id, table)
+        event_data.participant_layout = PARTICIPANT_LAYOUT_ITEMS
+    return stored
+
+def apply_participant_diff(server_id: str, event_id: str, event_data: EventData, kind: str,
+                           upserts: dict, removals: Sequence[str], table: "Table") -> None:
+    """Write one chunk of a participant sync: put each of `upserts` and delete each key in
+    `removals`, leaving every other participant untouched.
+
+    Embedded events get per-key `SET <map>.#k` / `REMOVE <map>.#k` updates of at most
+    PARTICIPANT_SYNC_ACTIONS_PER_UPDATE actions each, keeping every expression well inside
+    DynamoDB's 4 KB expression limit."""
+    if not upserts and not removals:
+        return
+    if uses_participant_items(event_data):
+        with table.batch_writer() as batch:
+            for participant_key, participant in upserts.items():
+                batch.put_item(Item={**build_participant_key(server_id, event_id, kind, participant_key), **participant})
+            for participant_key in removals:
+                batch.delete_item(Key=build_participant_key(server_id, event_id, kind, participant_key))
+        _forget_request_reads(table)
+    else:
+        actions = [*upserts.items(), *((participant_key, None) for participant_key in removals)]
+        for start in range(0, len(actions), PARTICIPANT_SYNC_ACTIONS_PER_UPDATE):
+            names = {"#m": kind}
+            values = {}
+            sets, removes = [], []
+            for i, (participant_key, participant) in enumerate(actions[start:start + PARTICIPANT_SYNC_ACTIONS_PER_UPDATE]):
+                names[f"#k{i}"] = participant_key
+                if participant is None:
+                    removes.append(f"#m.#k{i}")
+                else:
+                    values[f":v{i}"] = participant
+                    sets.append(f"#m.#k{i} = :v{i}")
+            clauses = [f"SET {', '.join(sets)}"] if sets else []
+            if removes:
+                clauses.append(f"REMOVE {', '.join(removes)}")
+            kwargs = {"ExpressionAttributeValues": values} if values else {}
+            table.update_item(
+                Key=build_event_key(server_id, event_id),
+                UpdateExpression=" ".join(clauses),
+                ExpressionAttributeNames=names,
+                **kwargs,
+            )
+    print(f"[db] -> synced {kind} event_id={event_id} upserted={len(upserts)} removed={len(removals)}")
+
+def set_event_attributes(server_id: str, event_id: str, event_attributes: dict, table: "Table") -> None:
+    """SET top-level attributes on an EVENT item; a no-op when there are none."""
+    if not event_attributes:
+        return
+    names = {f"#a{i}": attribute for i, attribute in enumerate(event_attributes)}
+    values = {f":a{i}": value for i, value in enumerate(event_attributes.values())}
+    table.update_item(
+        Key=build_event_key(server_id, event_id),
+        UpdateExpression="SET " + ", ".join(f"#a{i} = :a{i}" for i in range(len(names))),
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values,
     )
-    items = response.get("Items", [])
-    print(f"[db] -> {len(items)} event(s) found for server={server_id}")
-    return [EventData.from_dynamodb(item) for item in items]
 
+def move_legacy_participant_items(server_id: str, event_id: str, table: "Table") -> int:
+    """Re-key an items-layout event's participant items from the old EVENT#<id>#REG#/#CHK#
+    SKs to PART#<id>#..., for events migrated before the PART# prefix. Returns the number moved."""
+    legacy_prefix = EventData.Keys.SK_EVENT_PREFIX + event_id + "#"
+    items = list(iter_server_items(server_id, legacy_prefix, table))
+    if not items:
+        return 0
+    with table.batch_writer() as batch:
+        for item in items:
+            moved_sk = EventData.Keys.SK_PARTICIPANT_PREFIX + item[SK_ATTR][len(EventData.Keys.SK_EVENT_PREFIX):]
+            batch.put_item(Item={**item, SK_ATTR: moved_sk})
+        for item in items:
+            batch.delete_item(Key={PK_ATTR: item[PK_ATTR], SK_ATTR: item[SK_ATTR]})
+    _forget_request_reads(table)
+    print(f"[db] -> moved {len(items)} participant item(s) to {EventData.Keys.SK_PARTICIPANT_PREFIX} event_id={event_id}")
+    return len(items)
+
+def migrate_event_participants(server_id: str, event_id: str, table: "Table") -> Optional[int]:
+    """Convert an embedded-layout event to the items layout. Returns the number of participant
+    items written (0 if already migrated), or None if the event doesn't exist.
+
+    The final EVENT update is conditioned on the maps' sizes being unchanged, so a check-in or
+    registration that lands mid-migration makes the attempt retry instead of being dropped."""
+    key = build_event_key(server_id, event_id)
+    maps = (EventData.Keys.REGISTERED, EventData.Keys.CHECKED_IN)
+    for attempt in range(1, MIGRATION_MAX_ATTEMPTS + 1):
+        item = table.get_item(Key=key, ConsistentRead=True).get("Item")
+        if not item:
+            return None
+        if item.get(EventData.Keys.PARTICIPANT_LAYOUT) == PARTICIPANT_LAYOUT_ITEMS:
+            return 0
+
+        # Start from a clean slate so a previous failed attempt can't leave stale participants
+        delete_event_participant_items(server_id, event_id, table)
+        written = 0
+        with table.batch_writer() as batch:
+            for kind in maps:
+                for participant_key, participant in (item.get(kind) or {}).items():
+                    batch.put_item(Item={**build_participant_key(server_id, event_id, kind, participant_key), **participant})
+                    written += 1
+        _forget_request_reads(table)
+
+        names = {"#layout": EventData.Keys.PARTICIPANT_LAYOUT}
+        values = {":items": PARTICIPANT_LAYOUT_ITEMS, ":empty_map": {}}
+        conditions = []
+        for i, kind in enumerate(maps):
+            names[f"#m{i}"] = kind
+            if kind in item:
+                values[f":n{i}"] = len(item[kind])
+                conditions.append(f"size(#m{i}) = :n{i}")
+            else:
+                conditions.append(f"attribute_not_exists(#m{i})")
+        try:
+            table.update_item(
+                Key=key,
+                # The maps are emptied rather than removed so SET <map>.#uid paths stay valid
+                UpdateExpression="SET #layout = :items, #m0 = :empty_map, #m1 = :empty_map",
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            print(f"[db] WARN participants changed during migration event_id={event_id} attempt={attempt} — retrying")
+            continue
+        print(f"[db] MIGRATED EVENT participants server={server_id} event_id={event_id} items={written}")
+        return written
+    raise RuntimeError(f"Participants for event '{event_id}' kept changing; migration gave up after {MIGRATION_MAX_ATTEMPTS} attempts")
+
+
+def iter_full_events_for_server(server_id: str, table: "Table", projection: Optional[Sequence[str]] = None,
+                                limit: Optional[int] = None) -> Iterator[EventData]:
+    """Lazily yield a server's EVENT records as EventData, page by page. With a projection,
+    attributes left out come back as their EventData defaults (SK is always fetched for event_id)."""
+    if projection and SK_ATTR not in projection:
+        projection = [SK_ATTR, *projection]
+    for item in iter_server_items(server_id, EventData.Keys.SK_EVENT_PREFIX, table, projection=projection, limit=limit):
+        if is_event_record_sk(item[SK_ATTR]):
+            yield EventData.from_dynamodb(item)
+
+
+def get_full_events_for_server(server_id: str, table: "Table",
+                               projection: Optional[Sequence[str]] = None) -> List[EventData]:
+    """Query all EVENT records for a server by PK + SK prefix and return as EventData objects.
+    Pass one of the EVENT_*_VIEW projections when only a few scalar fields are needed."""
+    print(f"[db] QUERY ALL EVENTS server={server_id}")
+    events = list(iter_full_events_for_server(server_id, table, projection=projection))
+    print(f"[db] -> {len(events)} event(s) found for server={server_id}{_cache_note(table)}")
+    return events
+
+
+# TransactWriteItems accepts at most 100 actions per call
+TRANSACT_WRITE_MAX_ITEMS = 100
 
-def enable_reminders_for_server_events(server_id: str, table: Table) -> int:
+def enable_reminders_for_server_events(server_id: str, table: "Table") -> int:
     """Enable reminders on all events that don't already have them. Returns count updated."""
-    pk = build_server_pk(server_id)
     print(f"[db] ENABLE REMINDERS server={server_id}")
-    response = table.query(
-        KeyConditionExpression=Key(PK_ATTR).eq(pk) & Key(SK_ATTR).begins_with(EventData.Keys.SK_EVENT_PREFIX)
+    items = iter_server_items(
+        server_id, EventData.Keys.SK_EVENT_PREFIX, table,
+        projection=[EventData.Keys.EVENT_ID, EventData.Keys.SHOULD_POST_REMINDER],
     )
     transact_items = []
-    for item in response.get("Items", []):
+    for item in items:
         if item.get(EventData.Keys.SHOULD_POST_REMINDER):
             continue
         event_id = item.get(EventData.Keys.EVENT_ID)
@@ -133,11 +845,56 @@ def enable_reminders_for_server_events(server_id: str, table: Table) -> int:
                 "ExpressionAttributeValues": {":should_post_reminder": True, ":did_post_reminder": False},
             }
         })
+    for start in range(0, len(transact_items), TRANSACT_WRITE_MAX_ITEMS):
+        table.meta.client.transact_write_items(TransactItems=transact_items[start:start + TRANSACT_WRITE_MAX_ITEMS])
     if transact_items:
-        table.meta.client.transact_write_items(TransactItems=transact_items)
+        if isinstance(table, RequestReadCache):
+            table.invalidate()
+        # A newly pending reminder may already be inside its window; the next poll recomputes
+        updated_ids = [transact["Update"]["Key"][SK_ATTR][len(EventData.Keys.SK_EVENT_PREFIX):]
+                       for transact in transact_items]
+        lower_server_next_action_at(server_id, int(time.time()), updated_ids, table)
     print(f"[db] -> enabled reminders on {len(transact_items)} event(s) for server={server_id}")
     return len(transact_items)
 
+# Scheduled job bookkeeping lives on one POLL_STATE item per server. NextActionIndex is sparse:
+# only items carrying next_action_at are in it, and the job's coordinator queries it for the
+# servers whose next_action_at has passed (see utils/poll_watermark.py).
+SK_POLL_STATE = "POLL_STATE"
+NEXT_ACTION_INDEX = "NextActionIndex"
+POLL_PARTITION_ATTR = "poll_partition"
+POLL_PARTITION = "POLL_STATE"
+NEXT_ACTION_AT_ATTR = "next_action_at"
+WATERMARK_REVISION_ATTR = "watermark_revision"
+PENDING_EVENT_IDS_ATTR = "pending_event_ids"
+
+def lower_server_next_action_at(server_id: str, next_action_at: int, event_ids: Sequence[str],
+                                table: "Table") -> None:
+    """Make the scheduled job poll the server no later than `next_action_at` (epoch seconds),
+    after `event_ids` were written. An earlier watermark is kept.
+
+    Every call bumps watermark_revision and adds `event_ids` to pending_event_ids, so a job run
+    already underway only lowers the watermark rather than raising it past events it never saw."""
+    print(f"[db] LOWER next_action_at={next_action_at} server={server_id} events={list(event_ids)}")
+    key = {PK_ATTR: build_server_pk(server_id), SK_ATTR: SK_POLL_STATE}
+    names = {"#rev": WATERMARK_REVISION_ATTR, "#pending": PENDING_EVENT_IDS_ATTR}
+    values = {":one": 1, ":ids": set(event_ids)}
+    record_write = "ADD #rev :one, #pending :ids"
+    try:
+        table.update_item(
+            Key=key,
+            UpdateExpression=f"SET #at = :at, #partition = :partition {record_write}",
+            ConditionExpression="attribute_not_exists(#at) OR #at > :at",
+            ExpressionAttributeNames={**names, "#at": NEXT_ACTION_AT_ATTR, "#partition": POLL_PARTITION_ATTR},
+            ExpressionAttributeValues={**values, ":at": next_action_at, ":partition": POLL_PARTITION},
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        print(f"[db] -> already due sooner server={server_id}")
+        table.update_item(
+            Key=key, UpdateExpression=record_write,
+            ExpressionAttributeNames=names, ExpressionAttributeValues=values,
+        )
+
 
 def _parse_start_epoch(item: dict) -> Optional[int]:
     """Return the item's start_time as an epoch timestamp, or None if missing/unparseable."""
@@ -151,42 +908,53 @@ def _parse_start_epoch(item: dict) -> Optional[int]:
         return None
 
 
-def delete_past_real_events(server_id: str, table: Table) -> List[str]:
+def delete_past_real_events(server_id: str, table: "Table") -> List[str]:
     """Delete all past EVENT records from DynamoDB. Returns list of deleted event names."""
-    pk = build_server_pk(server_id)
     print(f"[db] DELETE PAST EVENTS server={server_id}")
-    response = table.query(
-        KeyConditionExpression=Key(PK_ATTR).eq(pk) & Key(SK_ATTR).begins_with(EventData.Keys.SK_EVENT_PREFIX)
-    )
+    # Materialized before deleting so the paginator isn't reading a partition it is mutating
+    items = [
+        item for item in iter_server_items(
+            server_id, EventData.Keys.SK_EVENT_PREFIX, table,
+            projection=[SK_ATTR, EventData.Keys.EVENT_ID, EventData.Keys.EVENT_NAME, EventData.Keys.START_TIME,
+                        EventData.Keys.PARTICIPANT_LAYOUT],
+        )
+        if is_event_record_sk(item[SK_ATTR])
+    ]
     now_epoch = int(datetime.now(dt_timezone.utc).timestamp())
     deleted_names = []
-    for item in response.get("Items", []):
+    for item in items:
         epoch = _parse_start_epoch(item)
         if epoch is None:
             continue
         if epoch < now_epoch:
             event_id = item.get(EventData.Keys.EVENT_ID)
             table.delete_item(Key=build_event_key(server_id, event_id))
+            if item.get(EventData.Keys.PARTICIPANT_LAYOUT) == PARTICIPANT_LAYOUT_ITEMS:
+                delete_event_participant_items(server_id, event_id, table)
             name = item.get(EventData.Keys.EVENT_NAME) or event_id
             print(f"[db] -> deleted past EVENT event_id={event_id} name={name!r}")
             deleted_names.append(name)
+    if deleted_names:
+        autocomplete_helper.invalidate_name_index(autocomplete_helper.EVENT_INDEX, server_id)
     print(f"[db] -> deleted {len(deleted_names)} past event(s) for server={server_id}")
     return deleted_names
 
 
-def get_schedule_plans_for_server(server_id: str, table: Table) -> List[SchedulePlan]:
+def get_schedule_plans_for_server(server_id: str, table: "Table") -> List[SchedulePlan]:
     """Return all SCHEDULE_PLAN records for a server."""
-    pk = build_server_pk(server_id)
     print(f"[db] QUERY SCHEDULE_PLANS server={server_id}")
-    response = table.query(
-        KeyConditionExpression=Key(PK_ATTR).eq(pk) & Key(SK_ATTR).begins_with(SchedulePlan.Keys.SK_PLAN_PREFIX)
-    )
-    items = response.get("Items", [])
-    print(f"[db] -> {len(items)} plan(s) found for server={server_id}")
-    return [SchedulePlan.from_dynamodb(item) for item in items]
+    plans = list(iter_schedule_plans_for_server(server_id, table))
+    print(f"[db] -> {len(plans)} plan(s) found for server={server_id}{_cache_note(table)}")
+    return plans
+
+
+def iter_schedule_plans_for_server(server_id: str, table: "Table") -> Iterator[SchedulePlan]:
+    """Lazily yield a server's SCHEDULE_PLAN records as SchedulePlan, page by page."""
+    for item in iter_server_items(server_id, SchedulePlan.Keys.SK_PLAN_PREFIX, table):
+        yield SchedulePlan.from_dynamodb(item)
 
 
-def put_schedule_plan(server_id: str, plan: SchedulePlan, table: Table) -> None:
+def put_schedule_plan(server_id: str, plan: SchedulePlan, table: "Table") -> None:
     """Upsert a SCHEDULE_PLAN record, keyed by normalized plan name."""
     pk = build_server_pk(server_id)
     sk = SchedulePlan.Keys.SK_PLAN_PREFIX + SchedulePlan.normalize_name(plan.plan_name)
@@ -200,39 +968,42 @@ def put_schedule_plan(server_id: str, plan: SchedulePlan, table: Table) -> None:
         item[SchedulePlan.Keys.EVENT_LINK] = plan.event_link
     print(f"[db] PUT SCHEDULE_PLAN server={server_id} plan={plan.plan_name!r}")
     table.put_item(Item=item)
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.PLAN_INDEX, server_id)
     print("[db] -> ok")
 
 
-def delete_schedule_plan(server_id: str, plan_name: str, table: Table) -> None:
+def delete_schedule_plan(server_id: str, plan_name: str, table: "Table") -> None:
     """Delete a SCHEDULE_PLAN record by plan name (normalized for the key)."""
     pk = build_server_pk(server_id)
     sk = SchedulePlan.Keys.SK_PLAN_PREFIX + SchedulePlan.normalize_name(plan_name)
     print(f"[db] DELETE SCHEDULE_PLAN server={server_id} plan={plan_name!r}")
     table.delete_item(Key={PK_ATTR: pk, SK_ATTR: sk})
+    autocomplete_helper.invalidate_name_index(autocomplete_helper.PLAN_INDEX, server_id)
     print("[db] -> ok")
 
 
-def get_leagues_for_server(server_id: str, table: Table) -> List[Tuple[str, str]]:
+def get_leagues_for_server(server_id: str, table: "Table") -> List[Tuple[str, str]]:
     """Query LeagueNameIndex and return list of (league_name, league_id) tuples."""
     print(f"[db] QUERY LEAGUES server={server_id}")
     leagues = _query_name_index(server_id, LEAGUE_NAME_INDEX, LeagueData.Keys.LEAGUE_NAME, LeagueData.Keys.LEAGUE_ID, table)
-    print(f"[db] -> {len(leagues)} league(s) found for server={server_id}")
+    print(f"[db] -> {len(leagues)} league(s) found for server={server_id}{_cache_note(table)}")
     return leagues
 
 
-def _resolve_league_id(server_id: str, league_id: str, table: Table) -> str:
+def _resolve_league_id(server_id: str, league_id: str, table: "Table") -> str:
     # Discord may repopulate autocomplete fields with the display name instead of the short ID.
     # Resolve by name first if the input is longer than a valid league ID.
     if len(league_id) > LeagueData.LEAGUE_ID_MAX_LENGTH:
-        leagues = get_leagues_for_server(server_id, table)
-        resolved_id = next((candidate_league_id for name, candidate_league_id in leagues if name == league_id), None)
+        resolved_id = _resolve_id_by_name(
+            server_id, league_id, LEAGUE_NAME_INDEX, LeagueData.Keys.LEAGUE_NAME, LeagueData.Keys.LEAGUE_ID, table
+        )
         if resolved_id:
             print(f"[db] -> resolved league by name {league_id!r} -> {resolved_id}")
             return resolved_id
     return league_id
 
 
-def get_server_league_data_or_fail(server_id: str, league_id: str, table: Table) -> LeagueData | ResponseMessage:
+def get_server_league_data_or_fail(server_id: str, league_id: str, table: "Table") -> LeagueData | ResponseMessage:
     """Fetch a LEAGUE record, resolving a display name back to its ID if needed.
     Returns a LeagueData on success, or a user-facing ResponseMessage if not found."""
     return _get_server_record_or_fail(
@@ -1,12 +1,43 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 
 from database.models.subscriptable_mixin import SubscriptableMixin
 
-@dataclass
+
+class LazyParticipantMap(Mapping):
+    """Read-only participant map filled by `load` on first access. Used for items-layout
+    events so commands that never look at participants don't page through them."""
+    __slots__ = ("_load", "_participants")
+
+    def __init__(self, load: Callable[[], Dict[str, dict]]):
+        self._load = load
+        self._participants: Optional[Dict[str, dict]] = None
+
+    def _materialize(self) -> Dict[str, dict]:
+        if self._participants is None:
+            self._participants = self._load()
+            self._load = None
+        return self._participants
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        return f"LazyParticipantMap({self._participants!r})" if self._participants is not None else "LazyParticipantMap(<not loaded>)"
+
+
+@dataclass(slots=True)
 class EventData(SubscriptableMixin):
     class Keys:
         SK_EVENT_PREFIX = "EVENT#"
+        SK_PARTICIPANT_PREFIX = "PART#"
         SERVER_ID = "server_id"
         EVENT_ID = "event_id"
 
@@ -30,10 +61,13 @@ class EventData(SubscriptableMixin):
         DID_POST_REMINDER = "did_post_reminder"
         REMINDER_ROLE_ID = "reminder_role_id"
         REMINDER_CHANNEL_ID = "reminder_channel_id"
+        RESCHEDULE_ALERTED_START = "reschedule_alerted_start"
+        PARTICIPANT_LAYOUT = "participant_layout"
 
 
-    checked_in: dict = field(metadata={'db_key': Keys.CHECKED_IN})
-    registered: dict = field(metadata={'db_key': Keys.REGISTERED})
+    # dicts, or LazyParticipantMap for items-layout events loaded by dynamodb_utils
+    checked_in: Mapping = field(metadata={'db_key': Keys.CHECKED_IN})
+    registered: Mapping = field(metadata={'db_key': Keys.REGISTERED})
     queue: dict = field(metadata={'db_key': Keys.QUEUE})
     participant_role: str = field(metadata={'db_key': Keys.PARTICIPANT_ROLE})
     check_in_enabled: bool = field(metadata={'db_key': Keys.CHECK_IN_ENABLED})
@@ -49,25 +83,32 @@ class EventData(SubscriptableMixin):
     should_post_reminder: Optional[bool] = field(default=False, metadata={'db_key': Keys.SHOULD_POST_REMINDER})
     did_post_reminder: Optional[bool] = field(default=False, metadata={'db_key': Keys.DID_POST_REMINDER})
     reminder_role_id: Optional[str] = field(default=None, metadata={'db_key': Keys.REMINDER_ROLE_ID})
+    # None/"embedded": registered and checked_in are maps on the EVENT item.
+    # "items": one item per participant (see dynamodb_utils participant storage).
+    participant_layout: Optional[str] = field(default=None, metadata={'db_key': Keys.PARTICIPANT_LAYOUT})
 
     @classmethod
     def from_dynamodb(cls, record: Dict[str, Any]) -> 'EventData':
+        # Called once per EVENT in full-partition scans; participant maps are passed through as-is
+        get = record.get
+        keys = cls.Keys
         return cls(
-            checked_in=record.get(cls.Keys.CHECKED_IN),
-            registered=record.get(cls.Keys.REGISTERED),
-            queue=record.get(cls.Keys.QUEUE),
-            participant_role=record.get(cls.Keys.PARTICIPANT_ROLE),
-            check_in_enabled=record.get(cls.Keys.CHECK_IN_ENABLED),
-            register_enabled=record.get(cls.Keys.REGISTER_ENABLED),
-            start_message=record.get(cls.Keys.START_MESSAGE),
-            end_message=record.get(cls.Keys.END_MESSAGE),
-            start_time=record.get(cls.Keys.START_TIME),
-            end_time=record.get(cls.Keys.END_TIME),
-            event_location=record.get(cls.Keys.EVENT_LOCATION),
-            event_name=record.get(cls.Keys.EVENT_NAME),
-            event_id=record.get("SK", "").removeprefix(cls.Keys.SK_EVENT_PREFIX) or None,
-            startgg_url=record.get(cls.Keys.STARTGG_URL),
-            should_post_reminder=record.get(cls.Keys.SHOULD_POST_REMINDER, False),
-            did_post_reminder=record.get(cls.Keys.DID_POST_REMINDER, False),
-            reminder_role_id=record.get(cls.Keys.REMINDER_ROLE_ID),
+            checked_in=get(keys.CHECKED_IN),
+            registered=get(keys.REGISTERED),
+            queue=get(keys.QUEUE),
+            participant_role=get(keys.PARTICIPANT_ROLE),
+            check_in_enabled=get(keys.CHECK_IN_ENABLED),
+            register_enabled=get(keys.REGISTER_ENABLED),
+            start_message=get(keys.START_MESSAGE),
+            end_message=get(keys.END_MESSAGE),
+            start_time=get(keys.START_TIME),
+            end_time=get(keys.END_TIME),
+            event_location=get(keys.EVENT_LOCATION),
+            event_name=get(keys.EVENT_NAME),
+            event_id=get("SK", "").removeprefix(keys.SK_EVENT_PREFIX) or None,
+            startgg_url=get(keys.STARTGG_URL),
+            should_post_reminder=get(keys.SHOULD_POST_REMINDER, False),
+            did_post_reminder=get(keys.DID_POST_REMINDER, False),
+            reminder_role_id=get(keys.REMINDER_ROLE_ID),
+            participant_layout=get(keys.PARTICIPANT_LAYOUT),
         )
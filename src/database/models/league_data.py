@@ -3,7 +3,7 @@ from typing import Dict, Any
 
 from database.models.subscriptable_mixin import SubscriptableMixin
 
-@dataclass
+@dataclass(slots=True)
 class LeagueData(SubscriptableMixin):
     LEAGUE_ID_MAX_LENGTH = 4  # validation limit for league_id
 
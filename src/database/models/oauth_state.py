@@ -4,7 +4,7 @@ from typing import Dict, Any
 from database.models.subscriptable_mixin import SubscriptableMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class OAuthState(SubscriptableMixin):
     class Keys:
         PK_PREFIX = "OAUTH_STATE#"
@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional
 
 from database.models.participant import Participant
 
-@dataclass
+@dataclass(slots=True)
 class RegisteredParticipant(Participant):
     class Keys(Participant.Keys):
         SOURCE = "source"
@@ -13,7 +13,8 @@ class RegisteredParticipant(Participant):
     external_id: Optional[str] = None
 
     def __init__(self, display_name: str, user_id: str, source: str, external_id: Optional[str] = None, time_added: Optional[str] = None):
-        super().__init__(display_name, user_id, time_added)
+        # Explicit base calls: zero-argument super() doesn't work in slots=True dataclasses
+        Participant.__init__(self, display_name, user_id, time_added)
 
         self.source = source
         self.external_id = external_id
@@ -29,7 +30,7 @@ class RegisteredParticipant(Participant):
         )
 
     def to_dict(self) -> dict:
-        base_dict = super().to_dict()
+        base_dict = Participant.to_dict(self)
 
         base_dict["source"] = self.source
         if self.external_id is not None:
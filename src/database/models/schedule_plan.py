@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulePlan:
     class Keys:
         SK_PLAN_PREFIX = "SCHEDULE_PLAN#"
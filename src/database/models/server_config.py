@@ -3,7 +3,7 @@ from typing import Dict, Any, Optional
 
 from database.models.subscriptable_mixin import SubscriptableMixin
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig(SubscriptableMixin):
     class Keys:
         SK_CONFIG = "CONFIG"
@@ -23,6 +23,9 @@ class ServerConfig(SubscriptableMixin):
         SCHEDULE_CHANNEL_ID = "schedule_channel_id"
         SCHEDULE_MESSAGE_ID = "schedule_message_id"
 
+        # Incremented on every CONFIG write so warm caches can revalidate with a projected read
+        CONFIG_VERSION = "config_version"
+
     server_id: str = field(metadata={'db_key': Keys.SERVER_ID})
     server_name: str = field(metadata={'db_key': Keys.SERVER_NAME})
     organizer_role: str = field(metadata={'db_key': Keys.ORGANIZER_ROLE})
@@ -35,6 +38,7 @@ class ServerConfig(SubscriptableMixin):
     should_always_remind: Optional[bool] = field(default=False, metadata={'db_key': Keys.SHOULD_ALWAYS_REMIND})
     schedule_channel_id: Optional[str] = field(default=None, metadata={'db_key': Keys.SCHEDULE_CHANNEL_ID})
     schedule_message_id: Optional[str] = field(default=None, metadata={'db_key': Keys.SCHEDULE_MESSAGE_ID})
+    config_version: int = field(default=0, metadata={'db_key': Keys.CONFIG_VERSION})
 
     @classmethod
     def from_dynamodb(cls, record: Dict[str, Any]) -> 'ServerConfig':
@@ -51,4 +55,5 @@ class ServerConfig(SubscriptableMixin):
             should_always_remind=record.get(cls.Keys.SHOULD_ALWAYS_REMIND, False),
             schedule_channel_id=record.get(cls.Keys.SCHEDULE_CHANNEL_ID),
             schedule_message_id=record.get(cls.Keys.SCHEDULE_MESSAGE_ID),
+            config_version=int(record.get(cls.Keys.CONFIG_VERSION, 0)),
         )
@@ -1,16 +1,16 @@
-from dataclasses import asdict
-
 class SubscriptableMixin:
     """
     A mixin class that adds dictionary-style access (subscriptability)
-    to any Python class, particularly useful for dataclasses.
+    to dataclass models. Declares no slots of its own so slotted subclasses
+    stay free of a per-instance __dict__.
     """
+    __slots__ = ()
+
     def __getitem__(self, key):
         """
-        Allows access via object[key]. Internally, it treats the object
-        as a dictionary using dataclasses.asdict().
+        Allows access via object[key]. Reads the field directly instead of
+        converting the whole model (participant maps included) with asdict().
         """
-        try:
-            return asdict(self)[key]
-        except KeyError as e:
-            raise KeyError(f"Key '{key}' not found in model.") from e
+        if key not in self.__dataclass_fields__:
+            raise KeyError(f"Key '{key}' not found in model.")
+        return getattr(self, key)
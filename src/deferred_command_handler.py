@@ -0,0 +1,17 @@
+import json
+
+import bot
+import aws_client
+
+
+def handler(event, context):
+    """SQS-triggered entry point for deferred slash commands. Runs from the same package
+    as lambda_handler, so commands execute exactly as they would inline; each result is
+    posted to Discord through the interaction webhook.
+
+    A message is acknowledged once its command has run, even if delivering the result failed;
+    only failures before the command starts raise and let SQS redeliver (up to the queue's
+    maxReceiveCount, then to its dead-letter queue)."""
+    for record in event["Records"]:
+        payload = json.loads(record["body"])
+        bot.process_deferred_command(payload, aws_client.get_aws_services())
@@ -19,3 +19,25 @@ class DiscordCallbackType(IntEnum):
     UPDATE_MESSAGE = 7
     APPLICATION_COMMAND_AUTOCOMPLETE_RESULT = 8
     MODAL = 9
+
+class AppCommandOptionType(IntEnum):
+    """Discord application command option types. Same names and values as
+    discord.AppCommandOptionType, defined here so the command registry and request
+    models don't import discord.py on every cold start."""
+    subcommand = 1
+    subcommand_group = 2
+    string = 3
+    integer = 4
+    boolean = 5
+    user = 6
+    channel = 7
+    role = 8
+    mentionable = 9
+    number = 10
+    attachment = 11
+
+class ParticipantWriteOutcome(str, Enum):
+    """Result of a conditional check-in/registration write (db_helper.add_event_participant_or_fail)."""
+    ADDED = "added"
+    CLOSED = "closed"                   # check-ins/registration aren't open
+    ALREADY_PRESENT = "already_present"
@@ -0,0 +1,105 @@
+import bisect
+import time
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from commands.models.autocomplete_response import AutocompleteResponse
+from commands.models.command_param import ParamChoice
+
+# Discord rejects autocomplete payloads with more than 25 choices
+MAX_CHOICES = 25
+
+# Autocomplete fires on every keystroke, so a few seconds of staleness buys a lot of reads.
+# Writes in this container invalidate immediately; other containers catch up within the TTL.
+NAME_INDEX_TTL_SECONDS = 30
+NAME_INDEX_MAX_ENTRIES = 512
+
+# Ranking tiers, best first
+_EXACT, _PREFIX, _WORD_PREFIX, _SUBSTRING = range(4)
+
+
+# Index kinds, one cached index per kind per server
+EVENT_INDEX = "event"
+LEAGUE_INDEX = "league"
+PLAN_INDEX = "plan"
+
+
+class NameIndex:
+    """Case-insensitively sorted (name, value) pairs for ranking autocomplete choices.
+
+    With `preserve_order`, an empty query lists entries in the order given (e.g. a curated
+    list) instead of alphabetically."""
+
+    def __init__(self, entries: List[Tuple[str, str]], preserve_order: bool = False):
+        self._entries = sorted(
+            ((name.casefold(), name, value) for name, value in entries),
+            key=lambda entry: (entry[0], entry[2]),
+        )
+        self._folded_names = [folded for folded, _, _ in self._entries]
+        self._listing = list(entries) if preserve_order else [(name, value) for _, name, value in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> List[ParamChoice]:
+        """Return up to `limit` choices matching `query`: exact match first, then names
+        starting with it, then names with a word starting with it, then any substring
+        match. Ties are broken alphabetically. An empty query lists names in order."""
+        query = (query or "").strip().casefold()
+        if not query:
+            return [ParamChoice(name=name, value=value) for name, value in self._listing[:limit]]
+
+        # Prefix matches are a contiguous run of the sorted list, found by binary search
+        start = bisect.bisect_left(self._folded_names, query)
+        end = start
+        while end < len(self._folded_names) and self._folded_names[end].startswith(query):
+            end += 1
+        ranked = [(_EXACT if self._folded_names[i] == query else _PREFIX, i) for i in range(start, end)]
+
+        # Only scan for weaker matches when prefix matches don't already fill the list
+        if len(ranked) < limit:
+            for i, folded in enumerate(self._folded_names):
+                if start <= i < end:
+                    continue
+                if any(word.startswith(query) for word in folded.split()):
+                    ranked.append((_WORD_PREFIX, i))
+                elif query in folded:
+                    ranked.append((_SUBSTRING, i))
+
+        ranked.sort()
+        return [ParamChoice(name=self._entries[i][1], value=self._entries[i][2]) for _, i in ranked[:limit]]
+
+
+_index_cache: "OrderedDict[Tuple[str, str], Tuple[NameIndex, float]]" = OrderedDict()
+
+
+def get_name_index(kind: str, server_id: str, load_entries: Callable[[], List[Tuple[str, str]]]) -> NameIndex:
+    """Return the warm-container NameIndex for one kind of record ("event", "league",
+    "plan") in a server, rebuilding it from `load_entries` once older than the TTL."""
+    cache_key = (kind, server_id)
+    cached = _index_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] <= NAME_INDEX_TTL_SECONDS:
+        _index_cache.move_to_end(cache_key)
+        print(f"[autocomplete] index hit kind={kind} server={server_id} size={len(cached[0])}")
+        return cached[0]
+
+    index = NameIndex(load_entries())
+    _index_cache[cache_key] = (index, time.monotonic())
+    _index_cache.move_to_end(cache_key)
+    while len(_index_cache) > NAME_INDEX_MAX_ENTRIES:
+        _index_cache.popitem(last=False)
+    print(f"[autocomplete] index built kind={kind} server={server_id} size={len(index)}")
+    return index
+
+
+def invalidate_name_index(kind: str, server_id: str) -> None:
+    """Drop a cached index after creating, renaming or deleting one of its records."""
+    _index_cache.pop((kind, server_id), None)
+
+
+def clear_name_indexes() -> None:
+    _index_cache.clear()
+
+
+def build_response(index: NameIndex, query: str) -> AutocompleteResponse:
+    return AutocompleteResponse(index.search(query))
@@ -6,6 +6,7 @@ from enum import Enum
 import boto3
 import requests
 import constants
+from utils import discord_rate_limit
 
 
 class RoleAssignmentResult(Enum):
@@ -43,7 +44,7 @@ def _bot_auth_headers() -> dict:
 def _request(method: str, path: str, json: dict | None = None, log_suffix: str = "") -> requests.Response:
     """Execute a Discord API request against DISCORD_API_BASE_URL and return the raw Response."""
     print(f"[discord] {method} {path}{log_suffix}")
-    return requests.request(method, f"{DISCORD_API_BASE_URL}{path}", headers=_bot_auth_headers(), json=json, timeout=8)
+    return discord_rate_limit.request(method, f"{DISCORD_API_BASE_URL}{path}", headers=_bot_auth_headers(), json=json, timeout=8)
 
 
 def _extract_discord_error(response: requests.Response) -> str:
@@ -167,6 +168,64 @@ def update_scheduled_event(guild_id: str, event_id: str, params: ScheduledEventP
     return False
 
 
+# Flags each interaction webhook accepts; Discord rejects the request if any other flag is set.
+# https://discord.com/developers/docs/interactions/receiving-and-responding#edit-original-interaction-response
+_EPHEMERAL = 1 << 6
+_SUPPRESS_NOTIFICATIONS = 1 << 12
+_EDIT_ALLOWED_FLAGS = SUPPRESS_EMBEDS
+_FOLLOWUP_ALLOWED_FLAGS = SUPPRESS_EMBEDS | _EPHEMERAL | _SUPPRESS_NOTIFICATIONS
+
+
+def _send_interaction_webhook(method: str, application_id: str, interaction_token: str, suffix: str,
+                              message_data: dict, allowed_flags: int) -> bool:
+    """Send message_data to the interaction webhook, dropping flags the endpoint does not accept.
+
+    Interaction webhooks are authorized by the token in the path, so no bot auth header is sent.
+    The path is not logged since the token stays valid for 15 minutes.
+    """
+    message_data = dict(message_data)
+    if "flags" in message_data:
+        message_data["flags"] &= allowed_flags
+    print(f"[discord] {method} /webhooks/{application_id}/<token>{suffix}")
+    try:
+        response = discord_rate_limit.request(
+            method,
+            f"{DISCORD_API_BASE_URL}/webhooks/{application_id}/{interaction_token}{suffix}",
+            json=message_data,
+            timeout=8,
+        )
+    except requests.RequestException as e:
+        print(f"[discord] ERROR -> {type(e).__name__} | {e}")
+        return False
+    if response.status_code in (200, 204):
+        print(f"[discord] -> {response.status_code}")
+        return True
+    print(f"[discord] ERROR -> {response.status_code} | {_extract_discord_error(response)}")
+    return False
+
+
+def edit_original_interaction_response(application_id: str, interaction_token: str, message_data: dict) -> bool:
+    """Replace the original (deferred) interaction response with the final message.
+
+    Discord never notifies mentions added by an edit; use send_interaction_followup for
+    messages meant to ping.
+    :return: True on success, False on any error. Never raises.
+    """
+    return _send_interaction_webhook(
+        "PATCH", application_id, interaction_token, "/messages/@original", message_data, _EDIT_ALLOWED_FLAGS
+    )
+
+
+def send_interaction_followup(application_id: str, interaction_token: str, message_data: dict) -> bool:
+    """Post message_data as a followup to the interaction. After a deferred response the first
+    followup takes the place of the loading message, and its mentions notify like a new message.
+    :return: True on success, False on any error. Never raises.
+    """
+    return _send_interaction_webhook(
+        "POST", application_id, interaction_token, "", message_data, _FOLLOWUP_ALLOWED_FLAGS
+    )
+
+
 def get_channel_message(channel_id: str, message_id: str) -> Optional[str]:
     """Fetch a message's text content. Returns the content string on success, None on any error."""
     response = _request("GET", f"/channels/{channel_id}/messages/{message_id}")
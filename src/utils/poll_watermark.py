@@ -0,0 +1,49 @@
+# MIRROR: jobs/scheduled_job/poll_watermark.py — keep in sync (independent Lambda packaging prevents imports)
+"""
+The `next_action_at` watermark: when the scheduled job next has work for a server.
+
+Every pass the job runs on an event becomes due at a time derived from the event record, so a
+server only needs polling once the earliest of these arrives:
+  - the reminder window opening (start - REMINDER_LEAD_SECONDS), while a reminder is pending
+  - the start time, while the event is upcoming
+  - the expected end (end_time), after which Discord completes the event and it is cleaned up
+  - every run, while a start.gg-linked event is upcoming (reschedule check)
+Moments already past collapse to `now`, so an event still waiting on cleanup keeps its server due.
+Times are epoch seconds.
+"""
+from datetime import datetime
+from typing import Iterable, Mapping, Optional
+
+# MIRROR: _REMINDER_WINDOW_HOURS in jobs/scheduled_job/event_reminders.py
+REMINDER_LEAD_SECONDS = 24 * 60 * 60
+
+
+def _epoch(utc_iso) -> Optional[int]:
+    try:
+        return int(datetime.fromisoformat(utc_iso.replace("Z", "+00:00")).timestamp())
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+
+def event_next_action_at(record: Mapping, now: int) -> int:
+    """Earliest time the scheduled job has work for the event in `record` (a DynamoDB item)."""
+    start = _epoch(record.get("start_time"))
+    end = _epoch(record.get("end_time"))
+    candidates = []
+    if start is not None and start > now:
+        candidates.append(start)
+        if record.get("should_post_reminder") and not record.get("did_post_reminder"):
+            candidates.append(max(start - REMINDER_LEAD_SECONDS, now))
+        if record.get("startgg_url"):
+            candidates.append(now)
+    if end is not None:
+        candidates.append(max(end, now))
+    elif start is None or start <= now:
+        # No expected end to wait for: keep polling until Discord reports it over
+        candidates.append(now)
+    return min(candidates)
+
+
+def server_next_action_at(records: Iterable[Mapping], now: int) -> Optional[int]:
+    """Earliest event_next_action_at across a server's event records, or None with no events."""
+    return min((event_next_action_at(record, now) for record in records), default=None)
@@ -0,0 +1,14 @@
+import json
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mypy_boto3_sqs.service_resource import Queue
+
+
+def enqueue_deferred_command(command_name: str, event_body: dict, sqs_queue: "Queue") -> None:
+    """Enqueue a slash command for the deferred command worker to run after the
+    interaction has been acknowledged. Same payload shape as the sheets agent dispatch."""
+    payload = json.dumps({"command_name": command_name, "event_body": event_body, "enqueued_at": time.time()})
+    sqs_queue.send_message(MessageBody=payload)
+    print(f"[deferred] enqueued command={command_name!r}")
@@ -1,9 +1,11 @@
 # MIRROR: jobs/sheets_agent/discord_api.enqueue_remove_roles — keep in sync (independent Lambda packaging prevents imports)
 import json
-from mypy_boto3_sqs.service_resource import Queue
-from typing import List
+from typing import TYPE_CHECKING, List
 
-def enqueue_remove_role_jobs(server_id: str, user_ids: List[str], role_id: str, sqs_queue: Queue):
+if TYPE_CHECKING:
+    from mypy_boto3_sqs.service_resource import Queue
+
+def enqueue_remove_role_jobs(server_id: str, user_ids: List[str], role_id: str, sqs_queue: "Queue"):
     """Enqueue one role-removal SQS message per user, sending in batches of 10
     (the SQS send_messages batch limit)."""
     batch = []
@@ -0,0 +1,52 @@
+resource "aws_sqs_queue" "deferred_command" {
+  name = "${var.app_name}-deferred-${var.deployment_env}"
+
+  # Must exceed the deferred command Lambda timeout (300s below) so a message is not
+  # redelivered while a consumer invocation is still running.
+  visibility_timeout_seconds = 360
+  # Interaction tokens expire after 15 minutes; older messages can no longer be answered.
+  message_retention_seconds = 900
+
+  # The handler only fails a message before its command runs; stop retrying after a few
+  # attempts instead of redelivering until retention expires.
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.deferred_command_dlq.arn
+    maxReceiveCount     = 3
+  })
+}
+
+# Deferred commands that failed every delivery attempt, kept for inspection
+resource "aws_sqs_queue" "deferred_command_dlq" {
+  name                      = "${var.app_name}-deferred-dlq-${var.deployment_env}"
+  message_retention_seconds = 1209600
+}
+
+# Runs deferred slash commands from the same package and layer as the interaction Lambda,
+# then posts each result to Discord via the interaction webhook.
+resource "aws_lambda_function" "deferred_command" {
+  function_name = "${var.app_name}-deferred-${var.deployment_env}"
+  s3_bucket     = data.aws_s3_bucket.lambda_bucket.id
+  s3_key        = data.aws_s3_object.lambda_zip_latest.key
+  handler       = "deferred_command_handler.handler"
+  runtime       = "python${var.python_runtime}"
+  architectures = [var.architecture]
+  memory_size   = 256
+  role          = aws_iam_role.lambda_exec_role.arn
+  # start.gg allows 80 requests a minute, so importing an event past ~6,000 entrants
+  # (75 per page) spans more than a minute
+  timeout       = 300
+  layers = [
+    aws_lambda_layer_version.app_layer.arn
+  ]
+  environment {
+    variables = local.bot_lambda_env
+  }
+
+  source_code_hash = data.aws_s3_object.lambda_zip_latest.etag
+}
+
+resource "aws_lambda_event_source_mapping" "deferred_command_trigger" {
+  event_source_arn = aws_sqs_queue.deferred_command.arn
+  function_name    = aws_lambda_function.deferred_command.arn
+  batch_size       = 1
+}
@@ -35,6 +35,16 @@ resource "aws_dynamodb_table" "adomi_discord_server_table" {
     type = "S"
   }
 
+  attribute {
+    name = "poll_partition"
+    type = "S"
+  }
+
+  attribute {
+    name = "next_action_at"
+    type = "N"
+  }
+
   # Expire OAuth state records automatically. Only OAUTH_STATE# items carry an
   # expires_at attribute — items without it (configs, events, etc.) are unaffected.
   ttl {
@@ -69,4 +79,19 @@ resource "aws_dynamodb_table" "adomi_discord_server_table" {
     projection_type    = "INCLUDE"
     non_key_attributes = ["event_id", "start_time", "end_time", "description"]
   }
+
+  # Sparse: only POLL_STATE items carrying next_action_at are indexed. The scheduled job's
+  # coordinator queries poll_partition = "POLL_STATE" AND next_action_at <= now for due servers.
+  global_secondary_index {
+    name = "NextActionIndex"
+    key_schema {
+      attribute_name = "poll_partition"
+      key_type       = "HASH"
+    }
+    key_schema {
+      attribute_name = "next_action_at"
+      key_type       = "RANGE"
+    }
+    projection_type = "KEYS_ONLY"
+  }
 }
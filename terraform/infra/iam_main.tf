@@ -53,8 +53,20 @@ resource "aws_iam_role_policy" "lambda_dynamodb_policy" {
         Action   = ["sqs:SendMessage", "sqs:SendMessageBatch"]
         Resource = [
           aws_sqs_queue.remove_role.arn,
-          aws_sqs_queue.sheets_agent.arn
+          aws_sqs_queue.sheets_agent.arn,
+          aws_sqs_queue.deferred_command.arn
         ]
+      },
+      {
+        Sid    = "SQSConsumeDeferredCommands"
+        Effect = "Allow"
+        Action = [
+          "sqs:ReceiveMessage",
+          "sqs:DeleteMessage",
+          "sqs:GetQueueAttributes",
+          "sqs:ChangeMessageVisibility"
+        ]
+        Resource = aws_sqs_queue.deferred_command.arn
       }
     ]
   })
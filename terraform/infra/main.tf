@@ -28,6 +28,25 @@ resource "aws_lambda_layer_version" "app_layer" {
   source_code_hash         = trimspace(data.aws_s3_object.app_layer_hash.body)
 }
 
+# Shared by the interaction Lambda and the deferred command worker, which run the same package
+locals {
+  bot_lambda_env = {
+    REGION                        = var.aws_region
+    PUBLIC_KEY                    = var.discord_public_key
+    DISCORD_BOT_TOKEN_SECRET_NAME = aws_secretsmanager_secret.discord_bot_token.name
+    DYNAMODB_TABLE_NAME           = aws_dynamodb_table.adomi_discord_server_table.name
+    REMOVE_ROLE_QUEUE_URL         = aws_sqs_queue.remove_role.url
+    STARTGG_SECRET_NAME           = aws_secretsmanager_secret.startgg_api_token.name
+    GOOGLE_SHEETS_SECRET_NAME     = data.aws_secretsmanager_secret.sheets_credentials.name
+    GOOGLE_SERVICE_ACCOUNT_EMAIL  = var.google_service_account_email
+
+    STARTGG_OAUTH_CLIENT_ID    = var.startgg_oauth_client_id
+    STARTGG_OAUTH_REDIRECT_URI = "${aws_apigatewayv2_stage.env_stage.invoke_url}/startgg/callback"
+    SHEETS_AGENT_QUEUE_URL     = aws_sqs_queue.sheets_agent.url
+    DEFERRED_COMMAND_QUEUE_URL = aws_sqs_queue.deferred_command.url
+  }
+}
+
 resource "aws_lambda_function" "bot_lambda" {
   function_name = "${var.app_name}-${var.deployment_env}"
   s3_bucket     = data.aws_s3_bucket.lambda_bucket.id
@@ -42,20 +61,7 @@ resource "aws_lambda_function" "bot_lambda" {
     aws_lambda_layer_version.app_layer.arn
   ]
   environment {
-    variables = {
-      REGION                    = var.aws_region
-      PUBLIC_KEY                = var.discord_public_key
-      DISCORD_BOT_TOKEN_SECRET_NAME = aws_secretsmanager_secret.discord_bot_token.name
-      DYNAMODB_TABLE_NAME       = aws_dynamodb_table.adomi_discord_server_table.name
-      REMOVE_ROLE_QUEUE_URL     = aws_sqs_queue.remove_role.url
-      STARTGG_SECRET_NAME       = aws_secretsmanager_secret.startgg_api_token.name
-      GOOGLE_SHEETS_SECRET_NAME    = data.aws_secretsmanager_secret.sheets_credentials.name
-      GOOGLE_SERVICE_ACCOUNT_EMAIL = var.google_service_account_email
-
-      STARTGG_OAUTH_CLIENT_ID    = var.startgg_oauth_client_id
-      STARTGG_OAUTH_REDIRECT_URI = "${aws_apigatewayv2_stage.env_stage.invoke_url}/startgg/callback"
-      SHEETS_AGENT_QUEUE_URL     = aws_sqs_queue.sheets_agent.url
-    }
+    variables = local.bot_lambda_env
   }
 
   # Ensures Lambda updates only if the zip file changes
@@ -32,7 +32,10 @@ resource "aws_iam_role_policy" "scheduled_job_policy" {
         Effect = "Allow"
         Action = [
           "dynamodb:Scan",
+          "dynamodb:Query",
           "dynamodb:GetItem",
+          "dynamodb:BatchGetItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:DeleteItem",
           "dynamodb:UpdateItem",
           "dynamodb:DescribeTable"
@@ -46,7 +49,13 @@ resource "aws_iam_role_policy" "scheduled_job_policy" {
         Sid    = "SQSSendMessage"
         Effect = "Allow"
         Action = ["sqs:SendMessage", "sqs:SendMessageBatch"]
-        Resource = data.aws_sqs_queue.remove_role.arn
+        Resource = [data.aws_sqs_queue.remove_role.arn, aws_sqs_queue.server_work.arn]
+      },
+      {
+        Sid      = "SQSConsumeServerWork"
+        Effect   = "Allow"
+        Action   = ["sqs:ReceiveMessage", "sqs:DeleteMessage", "sqs:GetQueueAttributes"]
+        Resource = aws_sqs_queue.server_work.arn
       },
       {
         Sid      = "GetDiscordBotToken"
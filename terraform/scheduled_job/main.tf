@@ -45,6 +45,20 @@ resource "aws_lambda_layer_version" "scheduled_job_layer" {
   source_code_hash         = trimspace(data.aws_s3_object.scheduled_job_layer_hash.body)
 }
 
+# Shared by the coordinator and the per-server worker, which run the same package
+locals {
+  scheduled_job_env = {
+    REGION                        = var.aws_region
+    DISCORD_BOT_TOKEN_SECRET_NAME = data.aws_secretsmanager_secret.discord_bot_token.name
+    DYNAMODB_TABLE_NAME           = data.aws_dynamodb_table.adomi_table.name
+    REMOVE_ROLE_QUEUE_URL         = data.aws_sqs_queue.remove_role.url
+    STARTGG_SECRET_NAME           = data.aws_secretsmanager_secret.startgg_api_token.name
+    SERVER_WORK_QUEUE_URL         = aws_sqs_queue.server_work.url
+    # One run slot per schedule tick; a server is processed at most once per slot
+    RUN_INTERVAL_SECONDS          = "900"
+  }
+}
+
 module "scheduled_job" {
   source = "github.com/enpicie/tf-module-eventbridge-scheduled-lambda?ref=v1.3.0"
 
@@ -64,11 +78,6 @@ module "scheduled_job" {
   architecture = var.architecture
   layers       = [aws_lambda_layer_version.scheduled_job_layer.arn]
 
-  environment_variables = {
-    REGION                        = var.aws_region
-    DISCORD_BOT_TOKEN_SECRET_NAME = data.aws_secretsmanager_secret.discord_bot_token.name
-    DYNAMODB_TABLE_NAME           = data.aws_dynamodb_table.adomi_table.name
-    REMOVE_ROLE_QUEUE_URL         = data.aws_sqs_queue.remove_role.url
-    STARTGG_SECRET_NAME           = data.aws_secretsmanager_secret.startgg_api_token.name
-  }
+  # Coordinator: scans EventNameIndex and enqueues one message per server (worker.tf)
+  environment_variables = local.scheduled_job_env
 }
@@ -2,3 +2,8 @@ output "scheduled_job_function_name" {
   description = "Name of the scheduled job Lambda function"
   value       = module.scheduled_job.lambda_function_name
 }
+
+output "scheduled_job_worker_function_name" {
+  description = "Name of the per-server scheduled job worker Lambda function"
+  value       = aws_lambda_function.scheduled_job_worker.function_name
+}
@@ -0,0 +1,55 @@
+# Per-server fan-out: the coordinator (handler.handler) enqueues one message per server on this
+# FIFO queue, and the worker (worker.handler) runs cleanup, reminders and reschedule checks for
+# the servers in each batch. FIFO groups by server, so a server is never processed twice at once.
+resource "aws_sqs_queue" "server_work_dlq" {
+  name                      = "${var.scheduled_job_name}-servers-dlq-${var.deployment_env}.fifo"
+  fifo_queue                = true
+  message_retention_seconds = 86400
+}
+
+resource "aws_sqs_queue" "server_work" {
+  name       = "${var.scheduled_job_name}-servers-${var.deployment_env}.fifo"
+  fifo_queue = true
+
+  # AWS recommends 6x the consuming Lambda's timeout
+  visibility_timeout_seconds = 720
+  # Older than one run slot is stale: the next coordinator run re-enqueues the server
+  message_retention_seconds = 900
+
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.server_work_dlq.arn
+    maxReceiveCount     = 3
+  })
+}
+
+resource "aws_lambda_function" "scheduled_job_worker" {
+  function_name = "${var.scheduled_job_name}-worker-${var.deployment_env}"
+  s3_bucket     = var.bucket_name
+  s3_key        = data.aws_s3_object.scheduled_job_zip_latest.key
+  handler       = "worker.handler"
+  runtime       = "python${var.python_runtime}"
+  architectures = [var.architecture]
+  role          = aws_iam_role.scheduled_job_role.arn
+  timeout       = 120
+
+  layers = [aws_lambda_layer_version.scheduled_job_layer.arn]
+
+  environment {
+    variables = merge(local.scheduled_job_env, {
+      # Servers in one batch processed in parallel; new servers stop starting with less than
+      # RUN_TIME_RESERVE_MS left and go back to the queue
+      SERVER_CONCURRENCY  = "8"
+      RUN_TIME_RESERVE_MS = "10000"
+    })
+  }
+
+  # Ensures Lambda updates only if the zip file changes
+  source_code_hash = data.aws_s3_object.scheduled_job_zip_latest.etag
+}
+
+resource "aws_lambda_event_source_mapping" "scheduled_job_worker_trigger" {
+  event_source_arn        = aws_sqs_queue.server_work.arn
+  function_name           = aws_lambda_function.scheduled_job_worker.arn
+  batch_size              = 10
+  function_response_types = ["ReportBatchItemFailures"]
+}
@@ -1,9 +1,12 @@
 import unittest
 from unittest.mock import Mock, patch
 
-from commands.check_in.check_in_commands import remove_checked_in, show_not_checked_in
+from commands.check_in.check_in_commands import check_in_user, remove_checked_in, show_not_checked_in
 from commands.models.response_message import ResponseMessage
+from database.dynamodb_utils import AddParticipantResult
 from database.models.event_data import EventData
+from enums import ParticipantWriteOutcome
+from utils.discord_api_helper import RoleAssignmentResult
 
 
 def _make_event_data(checked_in=None, participant_role=None, registered=None, startgg_url=None):
@@ -24,6 +27,7 @@ def _make_event(**kwargs):
     event = Mock()
     event.get_server_id.return_value = kwargs.get("server_id", "server123")
     event.get_user_id.return_value = kwargs.get("user_id", "user_abc")
+    event.get_username.return_value = kwargs.get("username", "TestUser")
     inputs = kwargs.get("inputs", {})
     event.get_command_input_value.side_effect = lambda key: inputs.get(key)
     return event
@@ -36,6 +40,60 @@ def _make_aws():
     return aws
 
 
+class TestCheckInUser(unittest.TestCase):
+    @patch("commands.check_in.check_in_commands.discord_helper")
+    @patch("commands.check_in.check_in_commands.db_helper")
+    def test_check_in_writes_conditionally_and_assigns_role(self, mock_db, mock_discord):
+        mock_db.add_event_participant_or_fail.return_value = AddParticipantResult(
+            ParticipantWriteOutcome.ADDED, _make_event_data(participant_role="role_1")
+        )
+        mock_discord.add_role_to_user.return_value = RoleAssignmentResult.OK
+        event = _make_event(inputs={"event_name": "event_111"}, user_id="user_abc", username="TestUser")
+
+        result = check_in_user(event, _make_aws())
+
+        self.assertIn("Checked in", result.content)
+        call = mock_db.add_event_participant_or_fail.call_args
+        _, event_id, kind, participant_key, participant_info, _ = call.args
+        self.assertEqual((event_id, kind, participant_key), ("event_111", "checked_in", "user_abc"))
+        self.assertEqual(participant_info["display_name"], "TestUser")
+        self.assertEqual(call.kwargs["enabled_key"], EventData.Keys.CHECK_IN_ENABLED)
+        mock_discord.add_role_to_user.assert_called_once_with(guild_id="server123", user_id="user_abc", role_id="role_1")
+
+    @patch("commands.check_in.check_in_commands.discord_helper")
+    @patch("commands.check_in.check_in_commands.db_helper")
+    def test_closed_check_in_is_rejected_without_role_assignment(self, mock_db, mock_discord):
+        event_data = _make_event_data(participant_role="role_1")
+        event_data.event_name = "Weekly"
+        mock_db.add_event_participant_or_fail.return_value = AddParticipantResult(ParticipantWriteOutcome.CLOSED, event_data)
+
+        result = check_in_user(_make_event(inputs={"event_name": "event_111"}), _make_aws())
+
+        self.assertIn("Check-ins are not being accepted right now for **Weekly**", result.content)
+        mock_discord.add_role_to_user.assert_not_called()
+
+    @patch("commands.check_in.check_in_commands.discord_helper")
+    @patch("commands.check_in.check_in_commands.db_helper")
+    def test_repeat_check_in_reports_existing_time(self, mock_db, mock_discord):
+        existing = {"display_name": "TestUser", "user_id": "user_abc", "time_added": "2025-01-01T00:00:00Z"}
+        mock_db.add_event_participant_or_fail.return_value = AddParticipantResult(
+            ParticipantWriteOutcome.ALREADY_PRESENT, _make_event_data(participant_role="role_1"), existing
+        )
+
+        result = check_in_user(_make_event(inputs={"event_name": "event_111"}), _make_aws())
+
+        self.assertIn("You already checked in", result.content)
+        mock_discord.add_role_to_user.assert_not_called()
+
+    @patch("commands.check_in.check_in_commands.db_helper")
+    def test_missing_event_message_is_propagated(self, mock_db):
+        mock_db.add_event_participant_or_fail.return_value = ResponseMessage(content="event not found")
+
+        result = check_in_user(_make_event(inputs={"event_name": "event_111"}), _make_aws())
+
+        self.assertEqual(result.content, "event not found")
+
+
 class TestRemoveCheckedIn(unittest.TestCase):
     @patch("commands.check_in.check_in_commands.permissions_helper")
     def test_missing_organizer_role_returns_error(self, mock_perms):
@@ -57,7 +115,7 @@ class TestRemoveCheckedIn(unittest.TestCase):
 
         self.assertIsInstance(result, ResponseMessage)
         self.assertIn("not checked in", result.content)
-        aws.dynamodb_table.update_item.assert_not_called()
+        mock_db.remove_event_participant.assert_not_called()
 
     @patch("commands.check_in.check_in_commands.permissions_helper")
     @patch("commands.check_in.check_in_commands.db_helper")
@@ -75,11 +133,12 @@ class TestRemoveCheckedIn(unittest.TestCase):
         # Outcome: the user was removed (single write targeting this event's record) and
         # the response confirms the removal — not the raw UpdateExpression/placeholder names.
         self.assertIsInstance(result, ResponseMessage)
-        aws.dynamodb_table.update_item.assert_called_once()
-        targeted_key = aws.dynamodb_table.update_item.call_args.kwargs["Key"]
-        self.assertEqual(targeted_key["PK"], "SERVER#server123")
-        # event_data has no resolved event_id, so the SK falls back to the input event name.
-        self.assertEqual(targeted_key["SK"], "EVENT#event1")
+        mock_db.remove_event_participant.assert_called_once()
+        server_id, targeted_event_id, _, kind, user_id, _ = mock_db.remove_event_participant.call_args.args
+        self.assertEqual(server_id, "server123")
+        # event_data has no resolved event_id, so the write falls back to the input event name.
+        self.assertEqual(targeted_event_id, "event1")
+        self.assertEqual((kind, user_id), ("checked_in", "user_xyz"))
         self.assertIn("removed from check-in", result.content)
 
     @patch("commands.check_in.check_in_commands.permissions_helper")
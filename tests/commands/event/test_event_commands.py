@@ -2,7 +2,10 @@ import unittest
 from unittest.mock import Mock, patch
 
 import commands.event.event_commands as event_commands
+from commands.event.startgg.models.startgg_event import StartggEventStream
 from database.models.event_data import EventData
+from database.models.participant import Participant
+from database.models.registered_participant import RegisteredParticipant
 
 
 def _make_event_data(participant_role=None, checked_in=None, event_id="event_111", event_name="Weekly Bracket"):
@@ -147,9 +150,12 @@ def _make_startgg_event(event_name="Start.gg Bracket"):
     startgg_event.event_name = event_name
     startgg_event.start_time_utc = "2099-01-01T12:00:00Z"  # far future, never "past"
     startgg_event.location = "Online"
-    startgg_event.participants = []
-    startgg_event.no_discord_participants = []
-    return startgg_event
+    return StartggEventStream(startgg_event, 0, iter([]))
+
+
+def _use_stored_registrants(mock_db, stored=None):
+    mock_db.prepare_participant_sync.return_value = stored or {}
+    mock_db.MANUAL_PARTICIPANT_SOURCE = "manual"
 
 
 class TestCreateEventStartgg(unittest.TestCase):
@@ -165,7 +171,8 @@ class TestCreateEventStartgg(unittest.TestCase):
         mock_perms.require_organizer_role.return_value = None
         mock_db.get_server_config_or_fail.return_value = _make_server_config()
         mock_api.is_valid_startgg_url.return_value = True
-        mock_api.query_startgg_event.return_value = _make_startgg_event(event_name="Start.gg Name")
+        mock_api.stream_startgg_event.return_value = _make_startgg_event(event_name="Start.gg Name")
+        _use_stored_registrants(mock_db)
         mock_tz.to_utc_iso.return_value = "2099-01-01T14:00:00Z"
         mock_event_helper.create_event_record.return_value = "new_event_id"
         aws = _make_aws()
@@ -194,7 +201,8 @@ class TestCreateEventStartgg(unittest.TestCase):
         mock_perms.require_organizer_role.return_value = None
         mock_db.get_server_config_or_fail.return_value = _make_server_config()
         mock_api.is_valid_startgg_url.return_value = True
-        mock_api.query_startgg_event.return_value = _make_startgg_event(event_name="Start.gg Name")
+        mock_api.stream_startgg_event.return_value = _make_startgg_event(event_name="Start.gg Name")
+        _use_stored_registrants(mock_db)
         mock_tz.to_utc_iso.return_value = "2099-01-01T14:00:00Z"
         mock_event_helper.create_event_record.return_value = "new_event_id"
         aws = _make_aws()
@@ -238,9 +246,7 @@ class TestRefreshEventFromStartgg(unittest.TestCase):
     def _make_startgg_event(self, start_time_utc):
         sg = Mock()
         sg.start_time_utc = start_time_utc
-        sg.participants = []
-        sg.no_discord_participants = []
-        return sg
+        return StartggEventStream(sg, 0, iter([]))
 
     @patch("commands.event.event_commands.message_helper")
     @patch("commands.event.event_commands.schedule_helper")
@@ -251,7 +257,8 @@ class TestRefreshEventFromStartgg(unittest.TestCase):
         self, mock_startgg, mock_event_helper, mock_db, mock_schedule, mock_msg
     ):
         mock_msg.get_discord_timestamp.return_value = "<t:123:F>"
-        mock_startgg.query_startgg_event.return_value = self._make_startgg_event("2099-01-01T21:00:00Z")
+        mock_startgg.stream_startgg_event.side_effect = lambda *a, **k: self._make_startgg_event("2099-01-01T21:00:00Z")
+        _use_stored_registrants(mock_db)
         mock_event_helper.update_event_record.return_value = True
         mock_db.get_server_config_or_fail.return_value = _make_server_config()
         event_data = _make_linked_event_data(start="2099-01-01T18:00:00Z", end="2099-01-01T20:00:00Z")
@@ -278,7 +285,8 @@ class TestRefreshEventFromStartgg(unittest.TestCase):
     ):
         mock_msg.get_discord_timestamp.return_value = "<t:123:F>"
         # start.gg reports the same start time already stored — nothing to reschedule.
-        mock_startgg.query_startgg_event.return_value = self._make_startgg_event("2099-01-01T18:00:00Z")
+        mock_startgg.stream_startgg_event.side_effect = lambda *a, **k: self._make_startgg_event("2099-01-01T18:00:00Z")
+        _use_stored_registrants(mock_db)
         event_data = _make_linked_event_data(start="2099-01-01T18:00:00Z", end="2099-01-01T20:00:00Z")
         aws = _make_aws()
 
@@ -287,9 +295,109 @@ class TestRefreshEventFromStartgg(unittest.TestCase):
         mock_event_helper.update_event_record.assert_not_called()
         mock_schedule.update_schedule_event.assert_not_called()
         # Registrants are still synced even when the time is unchanged.
-        aws.dynamodb_table.update_item.assert_called_once()
+        mock_db.apply_participant_diff.assert_called_once()
         self.assertIn("Registered list updated", summary)
 
+    @patch("commands.event.event_commands.message_helper")
+    @patch("commands.event.event_commands.schedule_helper")
+    @patch("commands.event.event_commands.db_helper")
+    @patch("commands.event.event_commands.event_helper")
+    @patch("commands.event.event_commands.startgg_api")
+    def test_reads_through_the_startgg_cache_unless_forced(
+        self, mock_startgg, mock_event_helper, mock_db, mock_schedule, mock_msg
+    ):
+        mock_startgg.stream_startgg_event.side_effect = lambda *a, **k: self._make_startgg_event("2099-01-01T18:00:00Z")
+        _use_stored_registrants(mock_db)
+        event_data = _make_linked_event_data(start="2099-01-01T18:00:00Z", end="2099-01-01T20:00:00Z")
+        aws = _make_aws()
+
+        event_commands.refresh_event_from_startgg("server123", "event_111", event_data, aws)
+        event_commands.refresh_event_from_startgg("server123", "event_111", event_data, aws, force_refresh=True)
+
+        self.assertEqual(
+            [call.kwargs for call in mock_startgg.stream_startgg_event.call_args_list],
+            [
+                {"table": aws.dynamodb_table, "force_refresh": False},
+                {"table": aws.dynamodb_table, "force_refresh": True},
+            ],
+        )
+
+
+class TestImportStartggRegistrants(unittest.TestCase):
+    def _stream(self, pages, total):
+        return StartggEventStream(Mock(), total, iter(pages))
+
+    def _page(self, first, count, no_discord=0):
+        registered = [
+            RegisteredParticipant(display_name=f"P{i}", user_id=f"U{i}", source="startgg") for i in range(first, first + count)
+        ]
+        return registered, [Participant(display_name=f"N{first}-{i}", user_id="no_id") for i in range(no_discord)]
+
+    def _registrant(self, i, name=None, source="startgg"):
+        return {"display_name": name or f"P{i}", "user_id": f"U{i}", "time_added": "2026-01-01T00:00:00Z", "source": source}
+
+    @patch("commands.event.event_commands.db_helper")
+    def test_large_event_is_written_in_bounded_chunks_as_pages_arrive(self, mock_db):
+        _use_stored_registrants(mock_db)
+        written = []
+        mock_db.apply_participant_diff.side_effect = lambda s, e, d, kind, upserts, removals, table: written.append(len(upserts))
+        pages = [self._page(i * 75, 75, no_discord=1) for i in range(16)]
+
+        summary = event_commands._import_startgg_registrants(
+            "server123", "event_111", _make_event_data(), self._stream(pages, 1216), Mock(),
+            event_attributes={"startgg_url": "https://start.gg/x"},
+        )
+
+        self.assertEqual(mock_db.prepare_participant_sync.call_args.args[4], 1216)
+        self.assertEqual(sum(written), 1216)
+        self.assertLessEqual(max(written), event_commands._IMPORT_CHUNK_SIZE + 76)
+        self.assertEqual(mock_db.set_event_attributes.call_args.args[2], {"startgg_url": "https://start.gg/x"})
+        self.assertEqual((summary.total_count, summary.no_discord_count, summary.added), (1216, 16, 1216))
+
+    @patch("commands.event.event_commands.db_helper")
+    def test_only_the_diff_is_written_and_manual_registrations_are_kept(self, mock_db):
+        _use_stored_registrants(mock_db, {
+            "U0": self._registrant(0),
+            "U1": self._registrant(1, name="Old name"),
+            "U2": self._registrant(2),
+            "U7": self._registrant(7),
+            "M1": self._registrant(100, name="Walk-in", source="manual"),
+        })
+
+        summary = event_commands._import_startgg_registrants(
+            "server123", "event_111", _make_event_data(), self._stream([self._page(0, 2), self._page(3, 1)], 3), Mock()
+        )
+
+        mock_db.apply_participant_diff.assert_called_once()
+        upserts, removals = mock_db.apply_participant_diff.call_args.args[4:6]
+        self.assertEqual(set(upserts), {"U1", "U3"})
+        self.assertEqual(upserts["U1"]["time_added"], "2026-01-01T00:00:00Z")
+        self.assertEqual(sorted(removals), ["U2", "U7"])
+        self.assertEqual(
+            (summary.added, summary.removed, summary.renamed, summary.updated, summary.manual_kept), (1, 2, 1, 0, 1)
+        )
+        self.assertEqual(summary.describe_changes(), "1 added, 2 removed, 1 renamed; 1 manual registration(s) kept")
+
+    @patch("commands.event.event_commands.db_helper")
+    def test_startgg_entrant_does_not_overwrite_a_manual_registration(self, mock_db):
+        _use_stored_registrants(mock_db, {"U0": self._registrant(0, name="Manual", source="manual")})
+
+        summary = event_commands._import_startgg_registrants(
+            "server123", "event_111", _make_event_data(), self._stream([self._page(0, 1)], 1), Mock()
+        )
+
+        self.assertEqual(mock_db.apply_participant_diff.call_args.args[4:6], ({}, []))
+        self.assertEqual(summary.describe_changes(), "0 added, 0 removed, 0 renamed")
+
+    def test_no_discord_report_lists_a_bounded_number_of_names(self):
+        summary = event_commands._ImportSummary(
+            total_count=200, no_discord_count=120, no_discord_names=[f"N{i}" for i in range(event_commands._NO_DISCORD_REPORT_LIMIT)]
+        )
+
+        report = event_commands._build_no_discord_report(summary)
+
+        self.assertIn("and 70 more", report)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,166 @@
+import os
+import unittest
+from unittest import mock
+
+# Fake AWS credentials/region so moto never touches a real account.
+os.environ["AWS_ACCESS_KEY_ID"] = "test-access-key"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "test-secret-key"
+os.environ["AWS_SECURITY_TOKEN"] = "test-token"
+os.environ["AWS_SESSION_TOKEN"] = "test-token"
+os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+
+import boto3
+from moto import mock_aws
+
+import commands.event.startgg.startgg_api as startgg_api
+import commands.event.startgg.startgg_cache as startgg_cache
+from database.dynamodb_utils import RequestReadCache
+
+_URL = "https://www.start.gg/tournament/test/event/main"
+_SLUG = "tournament/test/event/main"
+
+
+def _page_payload(first, count, total):
+    nodes = [
+        {"id": i, "participants": [{"gamerTag": f"Player{i}", "user": {"authorizations": [{"externalId": f"U{i}"}]}}]}
+        for i in range(first, first + count)
+    ]
+    return {"data": {"event": {
+        "id": 1, "name": "Main Bracket", "startAt": 1735689600,
+        "tournament": {"name": "Midweek Melting", "venueName": None, "venueAddress": None},
+        "entrants": {"pageInfo": {"total": total}, "nodes": nodes},
+    }}}
+
+
+def _response(payload):
+    response = mock.Mock(ok=True, status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+class StartggCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        mock_dynamo = mock_aws()
+        mock_dynamo.start()
+        self.addCleanup(mock_dynamo.stop)
+        self.table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName="test-table",
+            BillingMode="PAY_PER_REQUEST",
+            KeySchema=[{"AttributeName": "PK", "KeyType": "HASH"}, {"AttributeName": "SK", "KeyType": "RANGE"}],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+        )
+        for patcher in (
+            mock.patch.object(startgg_api, "_get_startgg_api_token", return_value="fake-token"),
+            mock.patch.object(startgg_cache.constants, "STARTGG_CACHE_TTL_SECONDS", 120),
+            mock.patch.object(startgg_cache, "_hits", 0),
+            mock.patch.object(startgg_cache, "_misses", 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestStartggCache(StartggCacheTestCase):
+    def test_round_trip_stores_compressed_payload_with_ttl(self):
+        payload = _page_payload(0, 75, 75)
+
+        with mock.patch("commands.event.startgg.startgg_cache.time.time", return_value=1_000):
+            startgg_cache.put(_SLUG, "EventParticipants", payload, self.table)
+            cached = startgg_cache.get(_SLUG, "EventParticipants", self.table)
+
+        self.assertEqual(cached, payload)
+        item = self.table.get_item(Key={"PK": f"STARTGG_CACHE#{_SLUG}", "SK": "EventParticipants"})["Item"]
+        self.assertEqual(item["expires_at"], 1_120)
+        self.assertLess(len(item["payload"].value), len(str(payload)) / 4)
+
+    def test_expired_item_is_a_miss_even_before_ttl_deletion(self):
+        with mock.patch("commands.event.startgg.startgg_cache.time.time", return_value=1_000):
+            startgg_cache.put(_SLUG, "EventParticipants", {"data": {}}, self.table)
+        with mock.patch("commands.event.startgg.startgg_cache.time.time", return_value=1_121):
+            self.assertIsNone(startgg_cache.get(_SLUG, "EventParticipants", self.table))
+
+    def test_zero_ttl_disables_reads_and_writes(self):
+        table = mock.Mock()
+        with mock.patch.object(startgg_cache.constants, "STARTGG_CACHE_TTL_SECONDS", 0):
+            startgg_cache.put(_SLUG, "EventParticipants", {"data": {}}, table)
+            self.assertIsNone(startgg_cache.get(_SLUG, "EventParticipants", table))
+        table.put_item.assert_not_called()
+        table.get_item.assert_not_called()
+
+    def test_read_through_request_cache_returns_written_payload(self):
+        table = RequestReadCache(self.table)
+        startgg_cache.put(_SLUG, "EventParticipants", {"data": {"page": 2}}, table)
+
+        self.assertEqual(startgg_cache.get(_SLUG, "EventParticipants", table), {"data": {"page": 2}})
+
+    def test_storage_errors_are_swallowed(self):
+        table = mock.Mock()
+        table.get_item.side_effect = RuntimeError("throttled")
+        table.put_item.side_effect = RuntimeError("throttled")
+
+        startgg_cache.put(_SLUG, "EventParticipants", {"data": {}}, table)
+        self.assertIsNone(startgg_cache.get(_SLUG, "EventParticipants", table))
+
+    def test_hit_rate_is_logged(self):
+        startgg_cache.put(_SLUG, "EventParticipants", {"data": {}}, self.table)
+        with mock.patch("builtins.print") as mock_print:
+            startgg_cache.get(_SLUG, "EventParticipants", self.table)
+            startgg_cache.get(_SLUG, "EventAbsent", self.table)
+
+        self.assertIn("hits=1 misses=1 hit_rate=50%", mock_print.call_args.args[0])
+
+
+class TestQueryStartggEventCaching(StartggCacheTestCase):
+    def _query(self, responses, **kwargs):
+        with mock.patch.object(startgg_api, "_post_graphql", side_effect=responses) as mock_post:
+            event = startgg_api.query_startgg_event(_URL, table=self.table, **kwargs)
+        return event, mock_post
+
+    def test_repeat_query_is_served_from_the_cache(self):
+        pages = [_page_payload(0, 75, 85), _page_payload(75, 10, 85)]
+        first, first_post = self._query([_response(page) for page in pages])
+
+        second, second_post = self._query([])
+
+        self.assertEqual(first_post.call_count, 2)
+        second_post.assert_not_called()
+        # One item for the assembled event: pages fetched apart are never recombined
+        self.assertEqual(self.table.scan()["Count"], 1)
+        self.assertEqual(len(second.participants), 85)
+        self.assertEqual(
+            sorted(p.display_name for p in second.participants), sorted(p.display_name for p in first.participants)
+        )
+
+    def test_force_refresh_queries_start_gg_and_replaces_the_cache(self):
+        self._query([_response(_page_payload(0, 5, 5))])
+
+        refreshed, mock_post = self._query([_response(_page_payload(0, 7, 7))], force_refresh=True)
+        cached, cached_post = self._query([])
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(len(refreshed.participants), 7)
+        cached_post.assert_not_called()
+        self.assertEqual(len(cached.participants), 7)
+
+    def test_response_with_graphql_errors_is_not_cached(self):
+        payload = _page_payload(0, 5, 5)
+        payload["errors"] = [{"message": "partial"}]
+        self._query([_response(payload)])
+
+        _, mock_post = self._query([_response(_page_payload(0, 5, 5))])
+
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_without_a_table_nothing_is_cached(self):
+        with mock.patch.object(startgg_api, "_post_graphql", return_value=_response(_page_payload(0, 5, 5))) as mock_post:
+            startgg_api.query_startgg_event(_URL)
+            startgg_api.query_startgg_event(_URL)
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(self.table.scan()["Count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
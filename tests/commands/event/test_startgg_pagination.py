@@ -1,7 +1,15 @@
+import json
+import threading
+import time
+import tracemalloc
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
+import commands.event.event_commands as event_commands
 import commands.event.startgg.startgg_api as startgg_api
+from database.models.event_data import EventData
+from utils import startgg_client
 
 
 def _make_entrant(entrant_id, gamer_tag, discord_id=None):
@@ -101,6 +109,184 @@ class TestQueryStartggEventPagination(unittest.TestCase):
         self.assertEqual(mock_post.call_args.args[0]["page"], 1)
         self.assertEqual(len(event.participants), total)
 
+    def test_remaining_pages_use_the_entrants_only_query(self):
+        total = 160
+        responses = [
+            _make_response(_make_page_payload([_make_entrant(i, f"Player{i}", f"U{i}") for i in range(75)], total)),
+            _make_response({"data": {"event": {"entrants": {"nodes": [
+                _make_entrant(i, f"Player{i}", f"U{i}") for i in range(75, 150)
+            ]}}}}),
+            _make_response({"data": {"event": {"entrants": {"nodes": [
+                _make_entrant(i, f"Player{i}", f"U{i}") for i in range(150, total)
+            ]}}}}),
+        ]
+
+        with mock.patch.object(startgg_api, "_post_graphql", side_effect=responses) as mock_post:
+            startgg_api.query_startgg_event("https://www.start.gg/tournament/test/event/main")
+
+        queries = [call.args[1] for call in mock_post.call_args_list]
+        self.assertIn("tournament", queries[0])
+        self.assertTrue(all("tournament" not in query for query in queries[1:]))
+        self.assertEqual(sorted(call.args[0]["page"] for call in mock_post.call_args_list), [1, 2, 3])
+
+    def test_events_past_the_old_1500_cap_are_fetched_in_full(self):
+        total = 5000
+
+        def post(variables, query, headers):
+            first = (variables["page"] - 1) * variables["perPage"]
+            nodes = [_make_entrant(i, f"Player{i}", f"U{i}") for i in range(first, min(first + variables["perPage"], total))]
+            return _make_response(_make_page_payload(nodes, total))
+
+        with mock.patch.object(startgg_api, "_post_graphql", side_effect=post) as mock_post:
+            event = startgg_api.query_startgg_event("https://www.start.gg/tournament/test/event/main")
+
+        self.assertEqual(mock_post.call_count, 67)
+        self.assertEqual([p.display_name for p in event.participants], [f"Player{i}" for i in range(total)])
+
+    def test_a_per_page_lowered_on_page_one_is_used_for_the_remaining_pages(self):
+        total = 100
+
+        def post(variables, query, headers):
+            if variables["page"] == 1:
+                # What the shared client does after a complexity error on page 1
+                variables["perPage"] = 37
+            first = (variables["page"] - 1) * variables["perPage"]
+            nodes = [_make_entrant(i, f"Player{i}", f"U{i}") for i in range(first, min(first + variables["perPage"], total))]
+            return _make_response(_make_page_payload(nodes, total))
+
+        with mock.patch.object(startgg_api, "_post_graphql", side_effect=post) as mock_post:
+            event = startgg_api.query_startgg_event("https://www.start.gg/tournament/test/event/main")
+
+        self.assertEqual(sorted(call.args[0]["page"] for call in mock_post.call_args_list), [1, 2, 3])
+        self.assertEqual([p.display_name for p in event.participants], [f"Player{i}" for i in range(total)])
+
+
+_LATENCY_SECONDS = 0.3
+
+
+class _FakeStartggHandler(BaseHTTPRequestHandler):
+    """Answers entrant queries for an event of `total` entrants after a fixed delay, and records
+    the most requests it had in flight at once."""
+    total = 0
+    latency = _LATENCY_SECONDS
+    in_flight = 0
+    peak_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            self._answer()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _answer(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        variables = body["variables"]
+        first = (variables["page"] - 1) * variables["perPage"]
+        nodes = [
+            _make_entrant(i, f"Player{i}", discord_id=f"U{i}")
+            for i in range(first, min(first + variables["perPage"], self.total))
+        ]
+        if "tournament" in body["query"]:
+            payload = _make_page_payload(nodes, self.total)
+        else:
+            payload = {"data": {"event": {"entrants": {"nodes": nodes}}}}
+        time.sleep(self.latency)
+        encoded = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeStartggServer(ThreadingHTTPServer):
+    # A wave of pages opens every pooled connection at once; the default backlog of 5 resets some
+    request_queue_size = 64
+
+
+class _FakeServerTestCase(unittest.TestCase):
+    def setUp(self):
+        _FakeStartggHandler.total = 1500
+        _FakeStartggHandler.in_flight = 0
+        _FakeStartggHandler.peak_in_flight = 0
+        server = _FakeStartggServer(("127.0.0.1", 0), _FakeStartggHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        for patcher in (
+            mock.patch.object(startgg_api, "_get_startgg_api_token", return_value="fake-token"),
+            mock.patch.object(startgg_client, "STARTGG_API_URL", f"http://127.0.0.1:{server.server_port}/gql"),
+            # 134 pages in the memory test would otherwise wait out start.gg's per-minute budget
+            mock.patch.object(startgg_client, "client", startgg_client.StartggClient(startgg_client.TokenBucket(1000, 60))),
+            mock.patch("builtins.print", lambda *args, **kwargs: None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestQueryStartggEventAgainstFakeServer(_FakeServerTestCase):
+    def test_1500_entrants_fetch_the_remaining_pages_in_one_wave(self):
+        self.addCleanup(startgg_api.http_sessions.close_all)
+        self.addCleanup(startgg_api.http_sessions._host_pool_maxsize.clear)
+
+        event = startgg_api.query_startgg_event("https://www.start.gg/tournament/test/event/main")
+
+        # Page 1 alone, then the other 19 pages all in flight together: two round trips, not 20
+        self.assertEqual(_FakeStartggHandler.peak_in_flight, 19)
+        self.assertEqual(
+            [p.display_name for p in event.participants], [f"Player{i}" for i in range(1500)]
+        )
+
+
+class TestStreamingImportMemory(_FakeServerTestCase):
+    ENTRANTS = 10_000
+    # Holding every raw entrant node (the old all_nodes) for 10,000 entrants takes ~10 MiB on its own;
+    # streaming peaks around 5 MiB, set by one wave of in-flight pages rather than the event size
+    PEAK_CEILING_BYTES = 8 * 1024 * 1024
+
+    def setUp(self):
+        super().setUp()
+        _FakeStartggHandler.total = self.ENTRANTS
+        patcher = mock.patch.object(_FakeStartggHandler, "latency", 0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_10000_entrant_import_stays_under_a_fixed_memory_ceiling(self):
+        self.addCleanup(startgg_api.http_sessions.close_all)
+        self.addCleanup(startgg_api.http_sessions._host_pool_maxsize.clear)
+        written = []
+
+        def apply_diff(server_id, event_id, event_data, kind, upserts, removals, table):
+            written.append(len(upserts))
+
+        with mock.patch.object(event_commands.db_helper, "prepare_participant_sync", return_value={}), \
+                mock.patch.object(event_commands.db_helper, "set_event_attributes"), \
+                mock.patch.object(event_commands.db_helper, "apply_participant_diff", side_effect=apply_diff):
+            tracemalloc.start()
+            try:
+                stream = startgg_api.stream_startgg_event("https://www.start.gg/tournament/test/event/main")
+                summary = event_commands._import_startgg_registrants(
+                    "server1", "111", EventData.from_dynamodb({}), stream, table=None
+                )
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        self.assertEqual(summary.total_count, self.ENTRANTS)
+        self.assertEqual(sum(written), self.ENTRANTS)
+        self.assertLessEqual(max(written), event_commands._IMPORT_CHUNK_SIZE + startgg_api.startgg_graphql.ENTRANTS_PER_PAGE)
+        self.assertLess(peak, self.PEAK_CEILING_BYTES)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+import os
+import unittest
+from unittest import mock
+
+# Fake AWS credentials/region so moto never touches a real account.
+os.environ["AWS_ACCESS_KEY_ID"] = "test-access-key"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "test-secret-key"
+os.environ["AWS_SECURITY_TOKEN"] = "test-token"
+os.environ["AWS_SESSION_TOKEN"] = "test-token"
+os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+
+import boto3
+from moto import mock_aws
+
+import commands.event.startgg.startgg_api as startgg_api
+import commands.event.startgg.startgg_graphql as startgg_graphql
+import commands.event.startgg.startgg_set_index as startgg_set_index
+
+_SLUG = "tournament/test/event/main"
+
+
+def _set(set_id, entrant_ids, state=1, created_at=100):
+    return {"id": set_id, "state": state, "createdAt": created_at,
+            "slots": [{"entrant": {"id": entrant_id} if entrant_id else None} for entrant_id in entrant_ids]}
+
+
+def _response(payload):
+    response = mock.Mock(ok=True, status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+class TestOpenSetIndex(unittest.TestCase):
+    def setUp(self):
+        mock_dynamo = mock_aws()
+        mock_dynamo.start()
+        self.addCleanup(mock_dynamo.stop)
+        self.table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName="test-table",
+            BillingMode="PAY_PER_REQUEST",
+            KeySchema=[{"AttributeName": "PK", "KeyType": "HASH"}, {"AttributeName": "SK", "KeyType": "RANGE"}],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+        )
+        self.open_set_pages = [
+            [_set(1, [10, 11]), _set(2, [12, 13]), _set(3, [14, None])],
+            [_set(4, [12, 13], created_at=200), _set(5, [16, 17], state=3)],
+        ]
+        self.queries = []
+        for patcher in (
+            mock.patch.object(startgg_api, "_get_startgg_api_token", return_value="fake-token"),
+            mock.patch.object(startgg_api, "_post_graphql", side_effect=self._post_graphql),
+            mock.patch.object(startgg_set_index.constants, "STARTGG_CACHE_TTL_SECONDS", 120),
+            mock.patch.object(startgg_set_index, "_local", startgg_set_index.OrderedDict()),
+            mock.patch("builtins.print"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _post_graphql(self, variables, query, headers):
+        self.queries.append(query)
+        if query == startgg_graphql.OPEN_SETS_QUERY:
+            return _response({"data": {"event": {"sets": {
+                "pageInfo": {"totalPages": len(self.open_set_pages)},
+                "nodes": self.open_set_pages[variables["page"] - 1],
+            }}}})
+        return _response({"data": {"event": {"sets": {"nodes": [_set(9, [16, 17], state=3)]}}}})
+
+    def _find(self, *entrant_ids):
+        return startgg_api.find_set_between_players(_SLUG, list(entrant_ids), table=self.table)
+
+    def test_reports_on_the_same_event_share_one_listing(self):
+        self.assertEqual(self._find("11", "10"), ("1", {"11": "11", "10": "10"}, False))
+        # The pair with two open sets resolves to the newer one
+        self.assertEqual(self._find("12", "13")[0], "4")
+        self.assertEqual(self.queries, [startgg_graphql.OPEN_SETS_QUERY] * 2)
+
+    def test_another_container_reads_the_stored_index(self):
+        self._find("10", "11")
+        startgg_set_index._local.clear()
+
+        self.assertEqual(self._find("13", "12")[0], "4")
+        self.assertEqual(len(self.queries), 2)
+
+    def test_pairs_missing_from_the_index_use_the_live_search(self):
+        self.assertEqual(self._find("16", "17"), ("9", {"16": "16", "17": "17"}, True))
+        self.assertEqual(self.queries[-1], startgg_graphql.FIND_SET_QUERY)
+
+    def test_reported_set_is_dropped_from_every_copy_of_the_index(self):
+        self._find("10", "11")
+        startgg_api.forget_reported_set(_SLUG, ["10", "11"], self.table)
+        self.assertNotIn(frozenset({"10", "11"}), startgg_set_index._local[_SLUG][1])
+
+        startgg_set_index._local.clear()
+        self._find("10", "11")
+
+        self.assertEqual(self.queries[-1], startgg_graphql.FIND_SET_QUERY)
+        self.assertEqual(self.queries.count(startgg_graphql.OPEN_SETS_QUERY), 2)
+
+    def test_discarding_without_a_stored_index_is_a_no_op(self):
+        startgg_api.forget_reported_set(_SLUG, ["10", "11"], self.table)
+
+        self.assertEqual(self.table.scan()["Items"], [])
+
+    def test_disabled_cache_always_searches_live(self):
+        with mock.patch.object(startgg_set_index.constants, "STARTGG_CACHE_TTL_SECONDS", 0):
+            self._find("10", "11")
+
+        self.assertEqual(self.queries, [startgg_graphql.FIND_SET_QUERY])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,9 @@ from unittest.mock import Mock, patch
 
 import commands.register.register_commands as register_commands
 from commands.models.response_message import ResponseMessage
+from database.dynamodb_utils import AddParticipantResult
 from database.models.event_data import EventData
+from enums import ParticipantWriteOutcome
 
 
 def _make_event_data(registered=None, register_enabled=True, event_id="event_111"):
@@ -20,6 +22,10 @@ def _make_event_data(registered=None, register_enabled=True, event_id="event_111
     )
 
 
+def _write_result(outcome, existing=None):
+    return AddParticipantResult(outcome, _make_event_data(), existing)
+
+
 def _make_event(**kwargs):
     event = Mock()
     event.get_server_id.return_value = kwargs.get("server_id", "server123")
@@ -96,46 +102,46 @@ class TestToggleRegister(unittest.TestCase):
 class TestRegisterUser(unittest.TestCase):
     @patch("commands.register.register_commands.db_helper")
     def test_happy_path_self_registration_writes_participant(self, mock_db):
-        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(register_enabled=True)
-        mock_db.build_server_pk.return_value = "SERVER#server123"
+        mock_db.add_event_participant_or_fail.return_value = _write_result(ParticipantWriteOutcome.ADDED)
         aws = _make_aws()
         event = _make_event(inputs={"event_name": "event_111"}, user_id="user_abc", username="TestUser")
 
         result = register_commands.register_user(event, aws)
 
         # Outcome: the invoking user is persisted as a registered participant with the right
-        # display name/id/source — not how the update expression names the map key.
+        # display name/id/source, gated on registration being open.
         self.assertIn("You have been registered", result.content)
-        call_kwargs = aws.dynamodb_table.update_item.call_args.kwargs
-        participant_info = call_kwargs["ExpressionAttributeValues"][":participant_info"]
+        call = mock_db.add_event_participant_or_fail.call_args
+        _, event_id, kind, participant_key, participant_info, _ = call.args
+        self.assertEqual((event_id, kind, participant_key), ("event_111", "registered", "user_abc"))
         self.assertEqual(participant_info["display_name"], "TestUser")
         self.assertEqual(participant_info["user_id"], "user_abc")
         self.assertEqual(participant_info["source"], "manual")
+        self.assertEqual(call.kwargs["enabled_key"], EventData.Keys.REGISTER_ENABLED)
 
     @patch("commands.register.register_commands.db_helper")
-    def test_closed_registration_rejects_self_registration_without_db_write(self, mock_db):
-        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(register_enabled=False)
+    def test_closed_registration_rejects_self_registration(self, mock_db):
+        mock_db.add_event_participant_or_fail.return_value = _write_result(ParticipantWriteOutcome.CLOSED)
         aws = _make_aws()
         event = _make_event(inputs={"event_name": "event_111"})
 
         result = register_commands.register_user(event, aws)
 
         self.assertIn("Registration is not open", result.content)
-        aws.dynamodb_table.update_item.assert_not_called()
 
     @patch("commands.register.register_commands.db_helper")
     def test_already_registered_user_gets_friendly_notice(self, mock_db):
-        # register_user calls RegisteredParticipant.from_dynamodb on the stored record
-        # and returns the friendly "already registered (X ago)" notice without writing.
-        registered = {
-            "user_abc": {
-                "display_name": "TestUser",
-                "user_id": "user_abc",
-                "time_added": "2025-01-01T00:00:00Z",
-                "source": "manual",
-            }
+        # The rejected write hands back the stored record, which register_user turns into
+        # the friendly "already registered (X ago)" notice.
+        existing = {
+            "display_name": "TestUser",
+            "user_id": "user_abc",
+            "time_added": "2025-01-01T00:00:00Z",
+            "source": "manual",
         }
-        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(registered=registered)
+        mock_db.add_event_participant_or_fail.return_value = _write_result(
+            ParticipantWriteOutcome.ALREADY_PRESENT, existing=existing
+        )
         aws = _make_aws()
         event = _make_event(inputs={"event_name": "event_111"}, user_id="user_abc")
 
@@ -143,7 +149,16 @@ class TestRegisterUser(unittest.TestCase):
 
         self.assertIsInstance(result, ResponseMessage)
         self.assertIn("already registered", result.content)
-        aws.dynamodb_table.update_item.assert_not_called()
+
+    @patch("commands.register.register_commands.db_helper")
+    def test_missing_event_message_is_propagated(self, mock_db):
+        mock_db.add_event_participant_or_fail.return_value = ResponseMessage(content="event not found")
+        aws = _make_aws()
+        event = _make_event(inputs={"event_name": "event_111"})
+
+        result = register_commands.register_user(event, aws)
+
+        self.assertEqual(result.content, "event not found")
 
     @patch("commands.register.register_commands.permissions_helper")
     def test_registering_target_user_without_organizer_role_returns_error(self, mock_perms):
@@ -160,8 +175,7 @@ class TestRegisterUser(unittest.TestCase):
     @patch("commands.register.register_commands.db_helper")
     def test_organizer_can_register_target_even_when_registration_closed(self, mock_db, mock_perms):
         mock_perms.verify_has_organizer_role.return_value = None
-        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(register_enabled=False)
-        mock_db.build_server_pk.return_value = "SERVER#server123"
+        mock_db.add_event_participant_or_fail.return_value = _write_result(ParticipantWriteOutcome.ADDED)
         aws = _make_aws()
         event_body = {
             "data": {"resolved": {"users": {"user_target": {"global_name": "TargetUser", "username": "target"}}}}
@@ -172,10 +186,11 @@ class TestRegisterUser(unittest.TestCase):
 
         # Outcome: the targeted user is persisted as a registered participant (id + resolved name).
         self.assertIn("has been registered", result.content)
-        call_kwargs = aws.dynamodb_table.update_item.call_args.kwargs
-        participant_info = call_kwargs["ExpressionAttributeValues"][":participant_info"]
+        call = mock_db.add_event_participant_or_fail.call_args
+        participant_info = call.args[4]
         self.assertEqual(participant_info["user_id"], "user_target")
         self.assertEqual(participant_info["display_name"], "TargetUser")
+        self.assertIsNone(call.kwargs["enabled_key"])
 
 
 if __name__ == "__main__":
@@ -128,6 +128,9 @@ class TestReportScoreCommand(unittest.TestCase):
 
         # Outcome: the set is reported to start.gg and the user gets a confirmation.
         mock_api.report_set.assert_called_once()
+        mock_api.forget_reported_set.assert_called_once_with(
+            "tournament/t/event/e", ["entrant-w", "entrant-l"], aws.dynamodb_table
+        )
         self.assertIsInstance(result, ResponseMessage)
         self.assertIn("Score reported on start.gg", result.content)
 
@@ -175,5 +178,112 @@ class TestReportScoreCommand(unittest.TestCase):
         mock_db.get_server_config_or_fail.assert_not_called()
 
 
+_BULK_REGISTERED = {
+    f"10{i}": {"display_name": f"Player{i}", "user_id": f"10{i}", "external_id": f"e{i}", "source": "startgg"}
+    for i in range(1, 7)
+}
+_BULK_REGISTERED["107"] = {"display_name": "Walk-in", "user_id": "107", "source": "manual"}
+
+
+@patch("commands.startgg.startgg_commands.permissions_helper")
+@patch("commands.startgg.startgg_commands.startgg_api")
+@patch("commands.startgg.startgg_commands.db_helper")
+class TestReportScoresCommand(unittest.TestCase):
+    def _run(self, mock_db, mock_api, mock_permissions, results, open_sets=None, outcomes=None):
+        mock_permissions.require_organizer_role.return_value = None
+        mock_db.get_server_config_or_fail.return_value = _make_config()
+        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(registered=_BULK_REGISTERED)
+        mock_api.extract_startgg_slug.return_value = "tournament/t/event/e"
+        mock_api.list_open_sets.return_value = open_sets if open_sets is not None else {
+            frozenset({"e1", "e2"}): "s12", frozenset({"e3", "e4"}): "s34",
+        }
+        mock_api.report_sets.side_effect = lambda reports, token: outcomes or [None] * len(reports)
+        self.aws = Mock()
+        return startgg_commands.report_scores(_make_event(event_name="evt1", results=results), self.aws)
+
+    def test_every_line_is_resolved_locally_and_reported_in_one_batch(self, mock_db, mock_api, mock_permissions):
+        result = self._run(mock_db, mock_api, mock_permissions, "<@101> <@!102> 2-1; player4 Player3 dq\n")
+
+        mock_api.list_open_sets.assert_called_once_with("tournament/t/event/e")
+        reports = mock_api.report_sets.call_args.args[0]
+        self.assertEqual([report["setId"] for report in reports], ["s12", "s34"])
+        self.assertEqual(reports[0]["gameData"], startgg_commands.build_set_game_data(2, 1, "e1", "e2"))
+        self.assertEqual((reports[1]["winnerId"], reports[1]["isDQ"], reports[1]["gameData"]), ("e4", True, []))
+        self.assertEqual(mock_api.forget_reported_set.call_count, 2)
+        self.assertIn("Reported 2/2 set(s)", result.content)
+        self.assertEqual(result.content.count("✅ reported"), 2)
+
+    def test_unresolvable_lines_get_their_own_status_and_are_not_sent(self, mock_db, mock_api, mock_permissions):
+        result = self._run(
+            mock_db, mock_api, mock_permissions,
+            "<@101> <@102> 2-1; <@102> <@101> 2-0; <@105> <@106> 2-0; <@101> <@109> 2-0; <@101> <@107> 2-0; <@101> <@103> 2:0; just two",
+        )
+
+        self.assertEqual([report["setId"] for report in mock_api.report_sets.call_args.args[0]], ["s12"])
+        for status in ("❌ duplicate", "❌ no open set", "❌ not registered", "❌ no start.gg ID", "❌ bad score",
+                       "❌ expected <winner> <loser> <score>"):
+            self.assertIn(status, result.content)
+        self.assertIn("Reported 1/7 set(s)", result.content)
+        self.assertLess(len(result.content), 2000)
+
+    def test_start_gg_errors_are_listed_under_the_table(self, mock_db, mock_api, mock_permissions):
+        result = self._run(
+            mock_db, mock_api, mock_permissions, "<@101> <@102> 2-1; <@103> <@104> 2-0",
+            outcomes=[None, "Set is already completed"],
+        )
+
+        self.assertIn("Reported 1/2 set(s)", result.content)
+        self.assertIn("2. Set is already completed", result.content)
+        mock_api.forget_reported_set.assert_called_once()
+
+    def test_expired_token_stops_with_the_reconnect_message(self, mock_db, mock_api, mock_permissions):
+        mock_api.StartggAuthError = startgg_commands.StartggAuthError
+        mock_api.report_sets.side_effect = startgg_commands.StartggAuthError("expired")
+        mock_permissions.require_organizer_role.return_value = None
+        mock_db.get_server_config_or_fail.return_value = _make_config()
+        mock_db.get_server_event_data_or_fail.return_value = _make_event_data(registered=_BULK_REGISTERED)
+        mock_api.list_open_sets.return_value = {frozenset({"e1", "e2"}): "s12"}
+
+        result = startgg_commands.report_scores(_make_event(event_name="evt1", results="<@101> <@102> 2-1"), Mock())
+
+        self.assertEqual(result.content, startgg_commands._AUTH_EXPIRED_MSG)
+
+    def test_too_many_results_are_rejected_before_any_lookup(self, mock_db, mock_api, mock_permissions):
+        lines = "; ".join("<@101> <@102> 2-1" for _ in range(startgg_commands._BULK_MAX_RESULTS + 1))
+
+        result = self._run(mock_db, mock_api, mock_permissions, lines)
+
+        self.assertIn("Too many results", result.content)
+        mock_db.get_server_event_data_or_fail.assert_not_called()
+
+
+class TestReportSets(unittest.TestCase):
+    @patch("commands.event.startgg.startgg_api._post_graphql")
+    def test_reports_are_aliased_into_batches_and_errors_matched_by_path(self, mock_post):
+        import commands.event.startgg.startgg_api as startgg_api
+
+        def post(variables, query, headers):
+            response = Mock(ok=True, status_code=200)
+            count = len(variables) // 4
+            response.json.return_value = {
+                "data": {f"r{i}": (None if i == 1 else [{"id": variables[f"s{i}"]}]) for i in range(count)},
+                "errors": [{"message": "Set is already completed", "path": ["r1"]}],
+            }
+            return response
+
+        mock_post.side_effect = post
+        reports = [{"setId": f"s{i}", "winnerId": "w", "isDQ": False, "gameData": []} for i in range(12)]
+
+        with patch("builtins.print"):
+            outcomes = startgg_api.report_sets(reports, "token")
+
+        self.assertEqual(mock_post.call_count, 2)
+        first_query = mock_post.call_args_list[0].args[1]
+        self.assertIn("r9: reportBracketSet(setId: $s9, winnerId: $w9, isDQ: $q9, gameData: $g9)", first_query)
+        self.assertEqual(outcomes[1], "Set is already completed")
+        self.assertEqual(outcomes[11], "Set is already completed")
+        self.assertEqual(sum(outcome is None for outcome in outcomes), 10)
+
+
 if __name__ == "__main__":
     unittest.main()
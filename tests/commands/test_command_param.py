@@ -1,6 +1,6 @@
 import unittest
 
-from discord import AppCommandOptionType
+from enums import AppCommandOptionType
 
 from commands.models.command_param import CommandParam, ParamChoice
 
@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import commands.command_map as command_map
+from commands.models.lazy_function import LazyFunction, LazyModule
+
+
+class TestLazyFunction(unittest.TestCase):
+    def test_module_is_not_imported_until_called(self):
+        sys.modules.pop("json.tool", None)
+        fn = LazyFunction("json.tool", "main")
+        self.assertNotIn("json.tool", sys.modules)
+
+        fn.resolve()
+        self.assertIn("json.tool", sys.modules)
+
+    def test_call_forwards_arguments_to_target(self):
+        fn = LazyFunction("os.path", "join")
+        self.assertEqual(fn("a", "b"), os.path.join("a", "b"))
+
+    def test_call_honours_patches_on_target_module(self):
+        fn = LazyFunction("os.path", "basename")
+        with patch("os.path.basename", return_value="patched"):
+            self.assertEqual(fn("/tmp/x"), "patched")
+
+    def test_lazy_module_attribute_yields_lazy_function(self):
+        fn = LazyModule("os.path").join
+        self.assertIsInstance(fn, LazyFunction)
+        self.assertEqual((fn.module_path, fn.function_name), ("os.path", "join"))
+
+    def test_lazy_module_rejects_private_attributes(self):
+        with self.assertRaises(AttributeError):
+            LazyModule("os.path")._private
+
+
+class TestCommandMapResolves(unittest.TestCase):
+    """Lazy references are only checked when invoked; resolve them all here so a typo in a
+    mapping fails the suite rather than a user's command."""
+
+    def test_every_command_function_resolves(self):
+        for name, entry in command_map.command_map.items():
+            with self.subTest(command=name):
+                self.assertTrue(callable(entry["function"].resolve()))
+
+    def test_every_autocomplete_handler_resolves(self):
+        for name, entry in command_map.command_map.items():
+            for param in entry["params"]:
+                if param.autocomplete_handler is None:
+                    continue
+                with self.subTest(command=name, param=param.name):
+                    self.assertTrue(callable(param.autocomplete_handler.resolve()))
+
+
+if __name__ == "__main__":
+    unittest.main()
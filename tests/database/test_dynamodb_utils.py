@@ -1,7 +1,7 @@
 import os
 import unittest
 from datetime import datetime, timezone as dt_timezone
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 # Fake AWS credentials/region so moto never touches a real account.
 os.environ["AWS_ACCESS_KEY_ID"] = "test-access-key"
@@ -11,12 +11,14 @@ os.environ["AWS_SESSION_TOKEN"] = "test-token"
 os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
 
 import boto3
+from boto3.dynamodb.conditions import Key
 from moto import mock_aws
 
 import database.dynamodb_utils as dynamodb_utils
 from commands.models.response_message import ResponseMessage
 from database.models.event_data import EventData
 from database.models.server_config import ServerConfig
+from enums import ParticipantWriteOutcome
 
 _SERVER_ID = "123456789012345678"
 _NOW = datetime(2026, 4, 10, 12, 0, 0, tzinfo=dt_timezone.utc)
@@ -113,6 +115,185 @@ class TestGetServerConfigOrFail(DynamoDbTableTestCase):
         self.assertIsInstance(result, ResponseMessage)
 
 
+
+class TestRequestReadCache(DynamoDbTableTestCase):
+    def setUp(self):
+        super().setUp()
+        self.get_item_spy = patch.object(self.table, "get_item", wraps=self.table.get_item).start()
+        self.query_spy = patch.object(self.table, "query", wraps=self.table.query).start()
+        self.addCleanup(patch.stopall)
+        self.cache = dynamodb_utils.RequestReadCache(self.table)
+
+    def test_repeated_config_reads_hit_dynamodb_once(self):
+        self._put_config()
+        first = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        second = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        self.assertEqual(first.server_name, second.server_name)
+        self.assertEqual(self.get_item_spy.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_missing_item_is_cached_as_missing(self):
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        self.assertIsInstance(result, ResponseMessage)
+        self.assertEqual(self.get_item_spy.call_count, 1)
+
+    def test_update_through_cache_is_visible_to_next_read(self):
+        self._put_event("111222333", "Weekly Bracket")
+        dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        self.cache.update_item(
+            Key=dynamodb_utils.build_event_key(_SERVER_ID, "111222333"),
+            UpdateExpression="SET registered = :r",
+            ExpressionAttributeValues={":r": {"u1": {"display_name": "One"}}},
+        )
+        result = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        self.assertIn("u1", result.registered)
+        self.assertEqual(self.get_item_spy.call_count, 2)
+
+    def test_put_through_cache_serves_written_item(self):
+        self.cache.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": "CONFIG", "server_id": _SERVER_ID,
+                                  "server_name": "Fresh", "organizer_role": "1"})
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        self.assertEqual(result.server_name, "Fresh")
+        self.get_item_spy.assert_not_called()
+
+    def test_mutating_a_returned_item_does_not_leak_into_cache(self):
+        self._put_event("111222333", "Weekly Bracket")
+        first = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        first.registered["intruder"] = {}
+        second = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        self.assertNotIn("intruder", second.registered)
+
+    def test_nested_participant_and_query_results_are_copied_per_caller(self):
+        self._put_event("111222333", "Weekly Bracket", registered={"u1": {"display_name": "Ann", "user_id": "u1"}})
+        first = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        first.registered["u1"]["display_name"] = "Changed"
+        second = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111222333", self.cache)
+        self.assertEqual(second.registered["u1"]["display_name"], "Ann")
+
+        query = {"KeyConditionExpression": Key("PK").eq(f"SERVER#{_SERVER_ID}") & Key("SK").begins_with("EVENT#")}
+        self.cache.query(**query)["Items"][0]["event_name"] = "Changed"
+        self.assertEqual(self.cache.query(**query)["Items"][0]["event_name"], "Weekly Bracket")
+        self.assertEqual(self.query_spy.call_count, 1)
+
+    def test_name_index_query_is_deduped_and_invalidated_by_writes(self):
+        self._put_event("111222333", "Weekly Bracket")
+        dynamodb_utils.get_events_for_server(_SERVER_ID, self.cache)
+        dynamodb_utils.get_events_for_server(_SERVER_ID, self.cache)
+        self.assertEqual(self.query_spy.call_count, 1)
+
+        self.cache.delete_item(Key=dynamodb_utils.build_event_key(_SERVER_ID, "111222333"))
+        self.assertEqual(dynamodb_utils.get_events_for_server(_SERVER_ID, self.cache), [])
+        self.assertEqual(self.query_spy.call_count, 2)
+
+    def test_unwrapped_attributes_are_forwarded_to_table(self):
+        self.assertEqual(self.cache.name, "test-table")
+
+    def test_log_lines_report_hit_and_miss_counts(self):
+        self._put_config()
+        with patch("builtins.print") as mock_print:
+            dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+            dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.cache)
+        lines = [call.args[0] for call in mock_print.call_args_list]
+        self.assertIn("(cache miss, hits=0 misses=1)", lines[1])
+        self.assertIn("(cache hit, hits=1 misses=1)", lines[3])
+
+
+class TestServerConfigWarmCache(DynamoDbTableTestCase):
+    def setUp(self):
+        super().setUp()
+        self.get_item_spy = patch.object(self.table, "get_item", wraps=self.table.get_item).start()
+        self.addCleanup(patch.stopall)
+
+    def _projected_reads(self):
+        return [c for c in self.get_item_spy.call_args_list if "ProjectionExpression" in c.kwargs]
+
+    def test_later_invocation_revalidates_with_projected_read_only(self):
+        self._put_config(config_version=3)
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+
+        self.assertEqual(result.server_name, "Test Server")
+        self.assertEqual(self.get_item_spy.call_count, 2)
+        self.assertEqual(len(self._projected_reads()), 1)
+
+    def test_version_bump_from_another_writer_triggers_refetch(self):
+        self._put_config()
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        # e.g. the OAuth callback Lambda, which has no access to this container's cache
+        self.table.update_item(
+            Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "CONFIG"},
+            UpdateExpression="SET organizer_role = :r ADD config_version :one",
+            ExpressionAttributeValues={":r": "999", ":one": 1},
+        )
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertEqual(result.organizer_role, "999")
+        self.assertEqual(result.config_version, 1)
+
+    def test_update_server_config_bumps_version_and_drops_cached_copy(self):
+        self._put_config()
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        dynamodb_utils.update_server_config(_SERVER_ID, {"organizer_role": "777"}, self.table)
+
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertEqual(result.organizer_role, "777")
+        self.assertEqual(result.config_version, 1)
+
+    def test_config_set_up_again_after_deletion_fails_revalidation(self):
+        self._put_config(config_version=1)
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.table.delete_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "CONFIG"})
+
+        dynamodb_utils.create_server_config(_SERVER_ID, {"server_id": _SERVER_ID, "organizer_role": "new"}, self.table)
+
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertEqual(result.organizer_role, "new")
+        self.assertGreater(result.config_version, 1)
+
+    def test_deleted_config_is_not_served_from_cache(self):
+        self._put_config()
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.table.delete_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "CONFIG"})
+        result = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertIsInstance(result, ResponseMessage)
+
+    def test_entry_older_than_ttl_is_refetched_in_full(self):
+        self._put_config()
+        with patch.object(dynamodb_utils.time, "monotonic", return_value=1000.0):
+            dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        expired = 1000.0 + dynamodb_utils.CONFIG_CACHE_TTL_SECONDS + 1
+        with patch.object(dynamodb_utils.time, "monotonic", return_value=expired):
+            dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertEqual(self._projected_reads(), [])
+        self.assertEqual(self.get_item_spy.call_count, 2)
+
+    def test_mutating_returned_config_does_not_change_cached_copy(self):
+        self._put_config()
+        first = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        first.organizer_role = "tampered"
+        second = dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        self.assertEqual(second.organizer_role, "333000111")
+
+    def test_projected_revalidation_is_deduped_within_one_interaction(self):
+        self._put_config()
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, self.table)
+        request_cache = dynamodb_utils.RequestReadCache(self.table)
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, request_cache)
+        dynamodb_utils.get_server_config_or_fail(_SERVER_ID, request_cache)
+        self.assertEqual(len(self._projected_reads()), 1)
+
+
+class TestServerConfigCacheBounds(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted_past_capacity(self):
+        cache = dynamodb_utils.ServerConfigCache(max_entries=2)
+        for server_id in ("a", "b"):
+            cache.put(server_id, ServerConfig(server_id, server_id, None, None))
+        cache.get("a")
+        cache.put("c", ServerConfig("c", "c", None, None))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
 class TestGetServerEventDataOrFail(DynamoDbTableTestCase):
     def test_fetch_by_numeric_event_id_returns_event_data(self):
         self._put_event("111222333", "Weekly Bracket")
@@ -138,6 +319,431 @@ class TestGetServerEventDataOrFail(DynamoDbTableTestCase):
         result = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "No Such Event", self.table)
         self.assertIsInstance(result, ResponseMessage)
 
+    def test_duplicate_event_names_resolve_to_oldest_event(self):
+        self._put_event("900000000000000002", "Weekly Bracket")
+        self._put_event("90000000000000001", "Weekly Bracket")
+        self._put_event("900000000000000003", "Weekly Bracket")
+        result = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "Weekly Bracket", self.table)
+        self.assertEqual(result.event_id, "90000000000000001")
+
+    def test_name_resolution_reads_are_independent_of_event_count(self):
+        real_query = self.table.query
+
+        def resolve_with_event_count(count):
+            with self.table.batch_writer() as batch:
+                for i in range(count):
+                    batch.put_item(Item={
+                        "PK": f"SERVER#{_SERVER_ID}", "SK": f"EVENT#{100000 + i}", "server_id": _SERVER_ID,
+                        "event_id": str(100000 + i), "event_name": f"Filler {i:04}",
+                    })
+            responses = []
+
+            def recording_query(**kwargs):
+                responses.append(real_query(**kwargs))
+                return responses[-1]
+
+            with patch.object(self.table, "query", side_effect=recording_query):
+                resolved = dynamodb_utils._resolve_event_id(_SERVER_ID, "Target", self.table)
+            return resolved, len(responses), sum(response["ScannedCount"] for response in responses)
+
+        self._put_event("777", "Target")
+        self.assertEqual(resolve_with_event_count(5), ("777", 1, 1))
+        self.assertEqual(resolve_with_event_count(300), ("777", 1, 1))
+
+
+class TestIterQuery(unittest.TestCase):
+    def _paged_table(self, *pages):
+        table = Mock()
+        table.query.side_effect = list(pages)
+        return table
+
+    def test_yields_items_across_pages(self):
+        table = self._paged_table(
+            {"Items": [{"id": 1}, {"id": 2}], "LastEvaluatedKey": {"k": 2}},
+            {"Items": [{"id": 3}]},
+        )
+        self.assertEqual([item["id"] for item in dynamodb_utils.iter_query(table, IndexName="X")], [1, 2, 3])
+        self.assertEqual(table.query.call_args_list[1].kwargs["ExclusiveStartKey"], {"k": 2})
+
+    def test_is_lazy(self):
+        table = self._paged_table(
+            {"Items": [{"id": 1}], "LastEvaluatedKey": {"k": 1}},
+            {"Items": [{"id": 2}]},
+        )
+        items = dynamodb_utils.iter_query(table)
+        self.assertEqual(next(items), {"id": 1})
+        self.assertEqual(table.query.call_count, 1)
+
+    def test_projection_uses_placeholders_and_keeps_existing_names(self):
+        table = self._paged_table({"Items": []})
+        list(dynamodb_utils.iter_query(table, projection=["name", "SK"], ExpressionAttributeNames={"#x": "x"}))
+        kwargs = table.query.call_args.kwargs
+        self.assertEqual(kwargs["ProjectionExpression"], "#p0, #p1")
+        self.assertEqual(kwargs["ExpressionAttributeNames"], {"#x": "x", "#p0": "name", "#p1": "SK"})
+
+    def test_limit_caps_total_items_and_page_reads(self):
+        table = self._paged_table(
+            {"Items": [{"id": 1}, {"id": 2}], "LastEvaluatedKey": {"k": 2}},
+            {"Items": [{"id": 3}], "LastEvaluatedKey": {"k": 3}},
+        )
+        items = list(dynamodb_utils.iter_query(table, limit=3))
+        self.assertEqual(len(items), 3)
+        self.assertEqual([call.kwargs["Limit"] for call in table.query.call_args_list], [3, 1])
+
+
+class TestPaginatedServerReads(DynamoDbTableTestCase):
+    def test_full_events_and_plans_include_every_page(self):
+        with self.table.batch_writer() as batch:
+            for i in range(30):
+                batch.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": f"EVENT#{i}", "event_name": f"E{i}"})
+                batch.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": f"SCHEDULE_PLAN#p{i}",
+                                     "plan_name": f"P{i}", "start_time": "2026-04-11T12:00:00Z"})
+        real_query = self.table.query
+        with patch.object(self.table, "query", side_effect=lambda **kw: real_query(**{**kw, "Limit": 7})) as spy:
+            events = dynamodb_utils.get_full_events_for_server(_SERVER_ID, self.table)
+            plans = dynamodb_utils.get_schedule_plans_for_server(_SERVER_ID, self.table)
+        self.assertEqual(len(events), 30)
+        self.assertEqual(len(plans), 30)
+        self.assertGreater(spy.call_count, 2)
+
+    def test_projected_events_keep_event_id(self):
+        self._put_event("111", "Weekly", registered={"u1": {"display_name": "x"}})
+        (event,) = dynamodb_utils.iter_full_events_for_server(_SERVER_ID, self.table, projection=["event_name"])
+        self.assertEqual(event.event_id, "111")
+        self.assertEqual(event.event_name, "Weekly")
+        self.assertFalse(event.registered)
+
+
+class TestGetEventView(DynamoDbTableTestCase):
+    def test_view_returns_only_projected_fields(self):
+        self._put_event("111", "Weekly", start_time="2026-04-11T12:00:00Z",
+                        registered={"u1": {"display_name": "x"}}, checked_in={"u1": {}})
+        event = dynamodb_utils.get_event_view(_SERVER_ID, "111", dynamodb_utils.EVENT_REMINDER_VIEW, self.table)
+        self.assertEqual(event.event_id, "111")
+        self.assertEqual(event.event_name, "Weekly")
+        self.assertEqual(event.start_time, "2026-04-11T12:00:00Z")
+        self.assertIsNone(event.registered)
+        self.assertIsNone(event.checked_in)
+
+    def test_cleanup_view_includes_checked_in(self):
+        self._put_event("111", "Weekly", checked_in={"u1": {}}, registered={"u2": {}})
+        event = dynamodb_utils.get_event_view(_SERVER_ID, "111", dynamodb_utils.EVENT_CLEANUP_VIEW, self.table)
+        self.assertEqual(event.checked_in, {"u1": {}})
+        self.assertIsNone(event.registered)
+
+    def test_missing_event_returns_none(self):
+        self.assertIsNone(dynamodb_utils.get_event_view(_SERVER_ID, "404", dynamodb_utils.EVENT_SCHEDULE_VIEW, self.table))
+
+
+class TestParticipantItemLayout(DynamoDbTableTestCase):
+    def _participant(self, user_id):
+        return {"display_name": f"name-{user_id}", "user_id": user_id, "time_added": "2026-04-10T12:00:00Z"}
+
+    def _items_event(self):
+        self._put_event("111", "Weekly", participant_layout="items")
+        return dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+
+    def _event_item(self):
+        return self.table.get_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111"})["Item"]
+
+    def test_items_layout_writes_one_item_per_participant_and_reads_back_as_maps(self):
+        event_data = self._items_event()
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "checked_in", "u1", self._participant("u1"), self.table)
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "registered", "u2", self._participant("u2"), self.table)
+
+        stored = self.table.get_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "PART#111#CHK#u1"})["Item"]
+        self.assertEqual(stored["display_name"], "name-u1")
+        self.assertEqual(self._event_item()["checked_in"], {})  # EVENT item untouched
+
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(reloaded.checked_in, {"u1": self._participant("u1")})
+        self.assertEqual(reloaded.registered, {"u2": self._participant("u2")})
+
+    def test_items_layout_participants_are_only_queried_when_read(self):
+        self._put_event("111", "Weekly", participant_layout="items")
+        self.table.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": "PART#111#REG#u1", **self._participant("u1")})
+
+        with patch.object(self.table, "query", wraps=self.table.query) as query:
+            event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+            self.assertEqual(event_data.event_name, "Weekly")
+            query.assert_not_called()
+
+            self.assertEqual(list(event_data.registered), ["u1"])
+            self.assertEqual(query.call_count, 1)
+
+    def test_items_layout_remove_and_clear(self):
+        event_data = self._items_event()
+        for uid in ("u1", "u2", "u3"):
+            dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "checked_in", uid, self._participant(uid), self.table)
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "registered", "u1", self._participant("u1"), self.table)
+
+        dynamodb_utils.remove_event_participant(_SERVER_ID, "111", event_data, "checked_in", "u2", self.table)
+        self.assertEqual(set(dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table).checked_in), {"u1", "u3"})
+
+        dynamodb_utils.clear_event_participants(_SERVER_ID, "111", event_data, "checked_in", self.table)
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(reloaded.checked_in, {})
+        self.assertEqual(set(reloaded.registered), {"u1"})
+
+    def test_embedded_layout_keeps_writing_maps(self):
+        self._put_event("111", "Weekly")
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "checked_in", "u1", self._participant("u1"), self.table)
+        self.assertEqual(self._event_item()["checked_in"], {"u1": self._participant("u1")})
+
+    def test_event_listings_skip_participant_items(self):
+        event_data = self._items_event()
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "registered", "u1", self._participant("u1"), self.table)
+        events = dynamodb_utils.get_full_events_for_server(_SERVER_ID, self.table)
+        self.assertEqual([e.event_id for e in events], ["111"])
+
+        # Participant items live under PART#, so the EVENT# listing doesn't even read them
+        listed = self.table.query(
+            KeyConditionExpression=Key("PK").eq(f"SERVER#{_SERVER_ID}") & Key("SK").begins_with("EVENT#"),
+        )
+        self.assertEqual(listed["Count"], 1)
+
+    def test_legacy_participant_items_are_moved_under_part_prefix(self):
+        self._put_event("111", "Weekly", participant_layout="items")
+        self.table.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111#REG#u1", **self._participant("u1")})
+        self.table.put_item(Item={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111#CHK#u1", **self._participant("u1")})
+
+        self.assertEqual(dynamodb_utils.move_legacy_participant_items(_SERVER_ID, "111", self.table), 2)
+        self.assertEqual(dynamodb_utils.move_legacy_participant_items(_SERVER_ID, "111", self.table), 0)
+
+        self.assertNotIn("Item", self.table.get_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111#REG#u1"}))
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(reloaded.registered, {"u1": self._participant("u1")})
+        self.assertEqual(reloaded.checked_in, {"u1": self._participant("u1")})
+
+    def test_migration_moves_maps_to_items_and_is_idempotent(self):
+        self._put_event("111", "Weekly",
+                        registered={"u1": self._participant("u1"), "u2": self._participant("u2")},
+                        checked_in={"u1": self._participant("u1")})
+        self.assertEqual(dynamodb_utils.migrate_event_participants(_SERVER_ID, "111", self.table), 3)
+        self.assertEqual(dynamodb_utils.migrate_event_participants(_SERVER_ID, "111", self.table), 0)
+
+        item = self._event_item()
+        self.assertEqual(item["participant_layout"], "items")
+        self.assertEqual(item["registered"], {})
+        self.assertEqual(item["checked_in"], {})
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(set(reloaded.registered), {"u1", "u2"})
+        self.assertEqual(set(reloaded.checked_in), {"u1"})
+
+    def test_migration_retries_when_participants_change_mid_flight(self):
+        self._put_event("111", "Weekly", checked_in={"u1": self._participant("u1")})
+        real_get_item = self.table.get_item
+        calls = []
+
+        def get_item_then_concurrent_check_in(**kwargs):
+            response = real_get_item(**kwargs)
+            if not calls:
+                # A check-in lands after the migration read the maps
+                self.table.update_item(
+                    Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111"},
+                    UpdateExpression="SET checked_in.#uid = :p",
+                    ExpressionAttributeNames={"#uid": "u2"},
+                    ExpressionAttributeValues={":p": self._participant("u2")},
+                )
+            calls.append(kwargs)
+            return response
+
+        with patch.object(self.table, "get_item", side_effect=get_item_then_concurrent_check_in):
+            written = dynamodb_utils.migrate_event_participants(_SERVER_ID, "111", self.table)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(len(calls), 2)
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(set(reloaded.checked_in), {"u1", "u2"})
+
+    def test_sync_migrates_embedded_event_that_would_outgrow_the_limit(self):
+        manual = {**self._participant("m1"), "source": "manual"}
+        self._put_event("111", "Weekly", registered={"m1": manual}, checked_in={"u1": self._participant("u1")})
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        with patch.object(dynamodb_utils, "EMBEDDED_PARTICIPANT_LIMIT", 3):
+            stored = dynamodb_utils.prepare_participant_sync(_SERVER_ID, "111", event_data, "registered", 3, self.table)
+        dynamodb_utils.apply_participant_diff(
+            _SERVER_ID, "111", event_data, "registered", {f"u{i}": self._participant(f"u{i}") for i in range(3)}, [], self.table
+        )
+
+        self.assertEqual(set(stored), {"m1"})
+        self.assertEqual(self._event_item()["participant_layout"], "items")
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(set(reloaded.registered), {"m1", "u0", "u1", "u2"})
+        self.assertEqual(set(reloaded.checked_in), {"u1"})
+
+    def test_embedded_diff_touches_only_the_given_keys_in_bounded_updates(self):
+        self._put_event("111", "Weekly", registered={f"u{i}": self._participant(f"u{i}") for i in range(5)})
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        upserts = {f"n{i}": self._participant(f"n{i}") for i in range(3)}
+        real_update_item = self.table.update_item
+        with patch.object(dynamodb_utils, "PARTICIPANT_SYNC_ACTIONS_PER_UPDATE", 2), \
+                patch.object(self.table, "update_item", side_effect=real_update_item) as update_item:
+            dynamodb_utils.apply_participant_diff(_SERVER_ID, "111", event_data, "registered", upserts, ["u0", "u1"], self.table)
+
+        self.assertEqual(update_item.call_count, 3)
+        self.assertTrue(all(len(call.kwargs["ExpressionAttributeNames"]) <= 3 for call in update_item.call_args_list))
+        self.assertEqual(set(self._event_item()["registered"]), {"u2", "u3", "u4", "n0", "n1", "n2"})
+
+    def test_sync_gives_an_embedded_event_without_the_map_an_empty_one(self):
+        self._put_event("111", "Weekly")
+        self.table.update_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111"}, UpdateExpression="REMOVE registered")
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+
+        stored = dynamodb_utils.prepare_participant_sync(_SERVER_ID, "111", event_data, "registered", 1, self.table)
+        dynamodb_utils.apply_participant_diff(
+            _SERVER_ID, "111", event_data, "registered", {"u1": self._participant("u1")}, [], self.table
+        )
+
+        self.assertEqual(stored, {})
+        self.assertEqual(set(self._event_item()["registered"]), {"u1"})
+
+    def test_items_diff_deletes_removed_participants_only(self):
+        event_data = self._items_event()
+        for user_id in ("u1", "u2", "u3"):
+            dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "registered", user_id, self._participant(user_id), self.table)
+
+        dynamodb_utils.apply_participant_diff(
+            _SERVER_ID, "111", event_data, "registered", {"u4": self._participant("u4")}, ["u1"], self.table
+        )
+
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(set(reloaded.registered), {"u2", "u3", "u4"})
+
+    def test_delete_past_events_removes_participant_items(self):
+        self._put_event("111", "Past", start_time="2026-04-09T12:00:00Z", participant_layout="items")
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        dynamodb_utils.put_event_participant(_SERVER_ID, "111", event_data, "checked_in", "u1", self._participant("u1"), self.table)
+        with patch.object(dynamodb_utils, "datetime") as mock_dt:
+            mock_dt.now.return_value = _NOW
+            mock_dt.fromisoformat.side_effect = datetime.fromisoformat
+            deleted = dynamodb_utils.delete_past_real_events(_SERVER_ID, self.table)
+        self.assertEqual(deleted, ["Past"])
+        remaining = self.table.scan()["Items"]
+        self.assertEqual(remaining, [])
+
+
+class TestAddEventParticipantOrFail(DynamoDbTableTestCase):
+    def _participant(self, user_id):
+        return {"display_name": f"name-{user_id}", "user_id": user_id, "time_added": "2026-04-10T12:00:00Z"}
+
+    def _add(self, user_id, event_id="111", kind="checked_in", enabled_key="check_in_enabled"):
+        return dynamodb_utils.add_event_participant_or_fail(
+            _SERVER_ID, event_id, kind, user_id, self._participant(user_id), self.table, enabled_key=enabled_key
+        )
+
+    def _event_item(self):
+        return self.table.get_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111"})["Item"]
+
+    def test_open_event_adds_participant_in_one_write_without_returning_the_maps(self):
+        self._put_event("111", "Weekly", check_in_enabled=True, registered={f"r{i}": {"user_id": f"r{i}"} for i in range(50)})
+        responses = []
+        real_update_item = self.table.update_item
+
+        def update_item(**kwargs):
+            responses.append(real_update_item(**kwargs))
+            return responses[-1]
+
+        with patch.object(self.table, "get_item", wraps=self.table.get_item) as get_item, \
+                patch.object(self.table, "update_item", side_effect=update_item):
+            result = self._add("u1")
+
+        get_item.assert_not_called()
+        self.assertEqual(list(responses[0]["Attributes"]), ["checked_in"])
+        self.assertEqual(responses[0]["Attributes"]["checked_in"], {"u1": self._participant("u1")})
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.ADDED)
+        self.assertEqual(self._event_item()["checked_in"], {"u1": self._participant("u1")})
+        self.assertEqual(self._event_item()["participant_role"], "555000111")
+
+    def test_added_result_carries_the_participant_role_from_the_write(self):
+        # DynamoDB returns every attribute named in a SET under UPDATED_NEW, including the
+        # if_not_exists no-op on participant_role (moto omits unchanged values, so stub the table)
+        table = Mock()
+        table.update_item.return_value = {"Attributes": {"participant_role": "555000111", "checked_in": {}}}
+
+        result = dynamodb_utils.add_event_participant_or_fail(
+            _SERVER_ID, "111", "checked_in", "u1", self._participant("u1"), table, enabled_key="check_in_enabled"
+        )
+
+        self.assertIn("#role = if_not_exists(#role, :none)", table.update_item.call_args.kwargs["UpdateExpression"])
+        self.assertEqual(result.event_data.participant_role, "555000111")
+
+    def test_second_add_reports_existing_participant_without_overwriting(self):
+        self._put_event("111", "Weekly", check_in_enabled=True)
+        self._add("u1")
+        result = dynamodb_utils.add_event_participant_or_fail(
+            _SERVER_ID, "111", "checked_in", "u1", {**self._participant("u1"), "display_name": "late"},
+            self.table, enabled_key="check_in_enabled",
+        )
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.ALREADY_PRESENT)
+        self.assertEqual(result.existing, self._participant("u1"))
+        self.assertEqual(self._event_item()["checked_in"]["u1"]["display_name"], "name-u1")
+
+    def test_closed_event_is_rejected_with_event_name(self):
+        self._put_event("111", "Weekly", check_in_enabled=False)
+        result = self._add("u1")
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.CLOSED)
+        self.assertEqual(result.event_data.event_name, "Weekly")
+        self.assertEqual(self._event_item()["checked_in"], {})
+
+    def test_without_enabled_key_closed_event_still_accepts(self):
+        self._put_event("111", "Weekly", register_enabled=False)
+        result = self._add("u1", kind="registered", enabled_key=None)
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.ADDED)
+        self.assertIn("u1", self._event_item()["registered"])
+
+    def test_missing_event_returns_message_and_creates_nothing(self):
+        result = self._add("u1", event_id="999")
+
+        self.assertIsInstance(result, ResponseMessage)
+        self.assertNotIn("Item", self.table.get_item(Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#999"}))
+
+    def test_resolves_display_name_to_event_id(self):
+        self._put_event("111", "Weekly", check_in_enabled=True)
+        result = self._add("u1", event_id="Weekly")
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.ADDED)
+        self.assertIn("u1", self._event_item()["checked_in"])
+
+    def test_items_layout_adds_participant_item_once(self):
+        self._put_event("111", "Weekly", check_in_enabled=True, participant_layout="items")
+        first = self._add("u1")
+        second = self._add("u1")
+
+        self.assertEqual(first.outcome, ParticipantWriteOutcome.ADDED)
+        self.assertEqual(first.event_data.participant_role, "555000111")
+        self.assertEqual(second.outcome, ParticipantWriteOutcome.ALREADY_PRESENT)
+        self.assertEqual(second.existing, self._participant("u1"))
+        self.assertEqual(self._event_item()["checked_in"], {})
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(reloaded.checked_in, {"u1": self._participant("u1")})
+
+    def test_items_layout_closed_event_is_rejected(self):
+        self._put_event("111", "Weekly", check_in_enabled=False, participant_layout="items")
+        result = self._add("u1")
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.CLOSED)
+        reloaded = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.assertEqual(reloaded.checked_in, {})
+
+    def test_items_layout_rechecks_flag_inside_transaction(self):
+        # Check-ins close between the rejected first write and the transaction
+        self._put_event("111", "Weekly", check_in_enabled=True, participant_layout="items")
+        event_data = dynamodb_utils.get_server_event_data_or_fail(_SERVER_ID, "111", self.table)
+        self.table.update_item(
+            Key={"PK": f"SERVER#{_SERVER_ID}", "SK": "EVENT#111"},
+            UpdateExpression="SET check_in_enabled = :off", ExpressionAttributeValues={":off": False},
+        )
+        result = dynamodb_utils._add_participant_item(
+            _SERVER_ID, "111", event_data, "checked_in", "u1", self._participant("u1"), self.table, "check_in_enabled"
+        )
+
+        self.assertEqual(result.outcome, ParticipantWriteOutcome.CLOSED)
+
 
 class TestGetEventsForServer(DynamoDbTableTestCase):
     def test_returns_name_id_tuples_for_all_server_events(self):
@@ -154,6 +760,17 @@ class TestGetEventsForServer(DynamoDbTableTestCase):
         events = dynamodb_utils.get_events_for_server(_SERVER_ID, self.table)
         self.assertEqual(events, [])
 
+    def test_follows_last_evaluated_key_across_pages(self):
+        table = Mock()
+        table.query.side_effect = [
+            {"Items": [{"event_name": "A", "event_id": "1"}], "LastEvaluatedKey": {"k": "1"}},
+            {"Items": [{"event_name": "B", "event_id": "2"}]},
+        ]
+        events = dynamodb_utils.get_events_for_server(_SERVER_ID, table)
+        self.assertEqual(events, [("A", "1"), ("B", "2")])
+        self.assertNotIn("ExclusiveStartKey", table.query.call_args_list[0].kwargs)
+        self.assertEqual(table.query.call_args_list[1].kwargs["ExclusiveStartKey"], {"k": "1"})
+
 
 class TestDeletePastRealEvents(DynamoDbTableTestCase):
     def _run_with_fixed_now(self):
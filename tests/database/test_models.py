@@ -0,0 +1,165 @@
+import sys
+import time
+import unittest
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+from unittest.mock import Mock
+
+from database.models.event_data import EventData, LazyParticipantMap
+from database.models.league_data import LeagueData
+from database.models.participant import Participant
+from database.models.registered_participant import RegisteredParticipant
+from database.models.schedule_plan import SchedulePlan
+from database.models.server_config import ServerConfig
+
+_ENTRANTS = 1500
+
+
+def _large_event_record(entrants: int = _ENTRANTS) -> dict:
+    registered = {
+        f"user_{i}": {
+            "display_name": f"Player {i}",
+            "user_id": f"user_{i}",
+            "time_added": "2026-04-10T12:00:00Z",
+            "source": "startgg",
+            "external_id": str(100000 + i),
+        }
+        for i in range(entrants)
+    }
+    return {
+        "SK": "EVENT#111",
+        "event_name": "Weekly",
+        "registered": registered,
+        "checked_in": {key: registered[key] for key in list(registered)[: entrants // 2]},
+        "queue": {},
+        "participant_role": "555",
+        "check_in_enabled": True,
+        "register_enabled": True,
+        "start_message": "",
+        "end_message": "",
+    }
+
+
+# The pre-slots model shape: a plain dataclass whose subscript converted the whole model with asdict()
+class _AsdictSubscriptable:
+    def __getitem__(self, key):
+        try:
+            return asdict(self)[key]
+        except KeyError as e:
+            raise KeyError(f"Key '{key}' not found in model.") from e
+
+
+@dataclass
+class _LegacyEventData(_AsdictSubscriptable):
+    checked_in: dict
+    registered: dict
+    queue: dict
+    participant_role: str
+    check_in_enabled: bool
+    register_enabled: bool
+    start_message: str
+    end_message: str
+    event_name: Optional[str] = None
+    event_id: Optional[str] = field(default=None)
+
+    @classmethod
+    def from_dynamodb(cls, record: dict) -> "_LegacyEventData":
+        return cls(
+            checked_in=record.get("checked_in"),
+            registered=record.get("registered"),
+            queue=record.get("queue"),
+            participant_role=record.get("participant_role"),
+            check_in_enabled=record.get("check_in_enabled"),
+            register_enabled=record.get("register_enabled"),
+            start_message=record.get("start_message"),
+            end_message=record.get("end_message"),
+            event_name=record.get("event_name"),
+            event_id=record.get("SK", "").removeprefix("EVENT#") or None,
+        )
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestSlottedModels(unittest.TestCase):
+    def test_models_have_no_instance_dict(self):
+        models = [
+            EventData.from_dynamodb({"SK": "EVENT#1"}),
+            ServerConfig.from_dynamodb({"server_id": "1"}),
+            LeagueData.from_dynamodb({"SK": "LEAGUE#ABC"}),
+            Participant("name", "1"),
+            RegisteredParticipant("name", "1", source="manual"),
+            SchedulePlan(plan_name="weekly", start_time="2026-04-10T12:00:00Z"),
+        ]
+        for model in models:
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, "__dict__"))
+
+    def test_subscript_reads_field_without_copying(self):
+        record = _large_event_record(entrants=3)
+        event_data = EventData.from_dynamodb(record)
+
+        self.assertIs(event_data["registered"], record["registered"])
+        self.assertEqual(event_data["event_name"], "Weekly")
+        with self.assertRaises(KeyError):
+            event_data["not_a_field"]
+
+    def test_registered_participant_keeps_base_fields(self):
+        participant = RegisteredParticipant("name", "1", source="startgg", external_id="9", time_added="2026-04-10T12:00:00Z")
+        self.assertEqual(participant.to_dict(), {
+            "display_name": "name", "user_id": "1", "time_added": "2026-04-10T12:00:00Z",
+            "source": "startgg", "external_id": "9",
+        })
+
+
+class TestLazyParticipantMap(unittest.TestCase):
+    def test_loads_once_on_first_access(self):
+        load = Mock(return_value={"u1": {"user_id": "u1"}})
+        participants = LazyParticipantMap(load)
+        load.assert_not_called()
+
+        self.assertIn("u1", participants)
+        self.assertEqual(len(participants), 1)
+        self.assertEqual(participants, {"u1": {"user_id": "u1"}})
+        load.assert_called_once()
+
+
+class TestModelBenchmark(unittest.TestCase):
+    """Micro-benchmark: asdict()-based subscript vs. slotted direct access on a 1500-entrant event."""
+
+    LOOKUPS = 5
+
+    def test_subscript_on_large_event_is_much_faster_than_asdict(self):
+        record = _large_event_record()
+        legacy = _LegacyEventData.from_dynamodb(record)
+        slotted = EventData.from_dynamodb(record)
+
+        def lookup(model):
+            return lambda: [model["event_name"] for _ in range(self.LOOKUPS)]
+
+        legacy_seconds = _best_of(lookup(legacy))
+        slotted_seconds = _best_of(lookup(slotted))
+        print(f"\n[benchmark] {self.LOOKUPS} subscripts on {_ENTRANTS} entrants: "
+              f"asdict {legacy_seconds * 1000:.2f} ms, slotted {slotted_seconds * 1000:.4f} ms")
+
+        # asdict() deep-copies every participant on each lookup; direct access doesn't grow with the event
+        self.assertLess(slotted_seconds * 100, legacy_seconds)
+
+    def test_slotted_instances_are_smaller(self):
+        record = _large_event_record(entrants=1)
+        legacy = _LegacyEventData.from_dynamodb(record)
+        slotted = EventData.from_dynamodb(record)
+
+        legacy_size = sys.getsizeof(legacy) + sys.getsizeof(legacy.__dict__)
+        print(f"\n[benchmark] instance size: dataclass {legacy_size} B, slotted {sys.getsizeof(slotted)} B")
+        self.assertLess(sys.getsizeof(slotted), legacy_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
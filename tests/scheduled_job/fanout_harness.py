@@ -0,0 +1,87 @@
+"""
+Local harness for the scheduled job's fan-out: runs the coordinator (handler.py) and drains
+the server queue through the worker (worker.py), with an in-memory stand-in for the FIFO
+queue in between. DynamoDB is whatever `db.dynamodb` points at (moto in the tests).
+"""
+from collections import deque
+from unittest.mock import patch
+
+import handler
+import worker
+
+
+class InMemoryFifoQueue:
+    """The parts of an SQS FIFO queue the fan-out relies on: SendMessageBatch with content
+    dedup on MessageDeduplicationId, one in-flight message per MessageGroupId, and
+    redelivery of the messages a worker reports in batchItemFailures.
+
+    `dedup=False` behaves as if SQS's 5-minute dedup window had already passed."""
+
+    def __init__(self, dedup=True, max_receives=3):
+        self.dedup = dedup
+        self.max_receives = max_receives
+        self.dead_letters = []
+        self._messages = deque()
+        self._dedup_ids = set()
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._messages)
+
+    def send_message_batch(self, QueueUrl, Entries):
+        successful = []
+        for entry in Entries:
+            dedup_id = entry["MessageDeduplicationId"]
+            if not (self.dedup and dedup_id in self._dedup_ids):
+                self._dedup_ids.add(dedup_id)
+                self._next_id += 1
+                self._messages.append({
+                    "messageId": f"msg-{self._next_id}",
+                    "body": entry["MessageBody"],
+                    "attributes": {"MessageGroupId": entry["MessageGroupId"], "ApproximateReceiveCount": "0"},
+                })
+            successful.append({"Id": entry["Id"]})
+        return {"Successful": successful, "Failed": []}
+
+    def receive(self, max_messages=10):
+        """Pop up to max_messages as a Lambda SQS event, taking one message per group."""
+        batch, held, groups = [], deque(), set()
+        while self._messages and len(batch) < max_messages:
+            message = self._messages.popleft()
+            group = message["attributes"]["MessageGroupId"]
+            if group in groups:
+                held.append(message)
+                continue
+            groups.add(group)
+            attributes = message["attributes"]
+            attributes["ApproximateReceiveCount"] = str(int(attributes["ApproximateReceiveCount"]) + 1)
+            batch.append(message)
+        self._messages.extendleft(reversed(held))
+        return {"Records": batch}
+
+    def settle(self, event, result):
+        """Delete the batch's successes; put failures back at the front of the queue (or in
+        dead_letters once they've been received max_receives times)."""
+        failed_ids = {failure["itemIdentifier"] for failure in (result or {}).get("batchItemFailures", [])}
+        retry = [record for record in event["Records"] if record["messageId"] in failed_ids]
+        for record in reversed(retry):
+            if int(record["attributes"]["ApproximateReceiveCount"]) >= self.max_receives:
+                self.dead_letters.append(record)
+            else:
+                self._messages.appendleft(record)
+
+
+def run_coordinator(queue, context=None):
+    with patch.object(handler, "_sqs", queue):
+        handler.handler({}, context)
+
+
+def drain(queue, context=None, batch_size=10):
+    """Feed the queue to the worker until it is empty. Returns the worker's results."""
+    results = []
+    while len(queue):
+        event = queue.receive(batch_size)
+        result = worker.handler(event, context)
+        queue.settle(event, result)
+        results.append(result)
+    return results
@@ -0,0 +1,163 @@
+import os
+import sys
+
+# Scheduled job modules read env vars at import time (via scheduled_job_constants).
+# Assign deterministic test values directly so real host env vars never leak through.
+os.environ["REGION"] = "us-east-1"
+os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
+os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
+os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
+os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import db
+
+
+class TestIterQuery(unittest.TestCase):
+    def test_follows_last_evaluated_key(self):
+        table = Mock()
+        table.query.side_effect = [
+            {"Items": [{"SK": "EVENT#1"}], "LastEvaluatedKey": {"k": 1}},
+            {"Items": [{"SK": "EVENT#2"}]},
+        ]
+        events = db.get_full_events_for_server(table, "server1")
+        self.assertEqual([e["SK"] for e in events], ["EVENT#1", "EVENT#2"])
+        self.assertEqual(table.query.call_args_list[1].kwargs["ExclusiveStartKey"], {"k": 1})
+
+    def test_projection_and_limit(self):
+        table = Mock()
+        table.query.return_value = {"Items": [{"a": 1}, {"a": 2}], "LastEvaluatedKey": {"k": 2}}
+        items = list(db.iter_server_items(table, "server1", "EVENT#", projection=["a"], limit=2))
+        self.assertEqual(len(items), 2)
+        kwargs = table.query.call_args.kwargs
+        self.assertEqual(kwargs["ProjectionExpression"], "#p0")
+        self.assertEqual(kwargs["Limit"], 2)
+        table.query.assert_called_once()
+
+
+class TestEventViews(unittest.TestCase):
+    def test_reminder_view_projects_only_scalar_attributes(self):
+        table = Mock()
+        table.get_item.return_value = {"Item": {"SK": "EVENT#e1", "should_post_reminder": True}}
+        item = db.get_event_reminder_view(table, "server1", "e1")
+        self.assertEqual(item["should_post_reminder"], True)
+        kwargs = table.get_item.call_args.kwargs
+        self.assertEqual(kwargs["Key"], {"PK": "SERVER#server1", "SK": "EVENT#e1"})
+        projected = set(kwargs["ExpressionAttributeNames"].values())
+        self.assertEqual(projected, set(db.EVENT_REMINDER_VIEW))
+        self.assertNotIn("registered", projected)
+        self.assertNotIn("checked_in", projected)
+
+    def test_cleanup_view_keeps_checked_in_for_role_removals(self):
+        self.assertIn("checked_in", db.EVENT_CLEANUP_VIEW)
+        self.assertNotIn("registered", db.EVENT_CLEANUP_VIEW)
+
+    def test_missing_record_returns_none(self):
+        table = Mock()
+        table.get_item.return_value = {}
+        self.assertIsNone(db.get_event_reschedule_view(table, "server1", "e1"))
+
+
+class TestParticipantItemLayout(unittest.TestCase):
+    def test_full_events_skip_participant_items(self):
+        table = Mock()
+        table.query.return_value = {"Items": [{"SK": "EVENT#1"}, {"SK": "EVENT#1#CHK#u1"}, {"SK": "EVENT#2"}]}
+        self.assertEqual([e["SK"] for e in db.get_full_events_for_server(table, "server1")], ["EVENT#1", "EVENT#2"])
+
+    def test_checked_in_read_from_items_for_items_layout(self):
+        table = Mock()
+        table.query.return_value = {"Items": [{"PK": "SERVER#server1", "SK": "PART#1#CHK#u1", "user_id": "u1"}]}
+        checked_in = db.get_checked_in(table, "server1", "1", {"participant_layout": "items"})
+        self.assertEqual(checked_in, {"u1": {"user_id": "u1"}})
+
+    def test_checked_in_read_from_map_for_embedded_layout(self):
+        table = Mock()
+        self.assertEqual(db.get_checked_in(table, "server1", "1", {"checked_in": {"u1": {}}}), {"u1": {}})
+        table.query.assert_not_called()
+
+
+class TestBatchPrefetch(unittest.TestCase):
+    def _table(self, responses):
+        table = Mock()
+        table.name = "test-table"
+        table.meta.client.batch_get_item.side_effect = responses
+        return table
+
+    def test_configs_fetched_100_keys_per_call(self):
+        server_ids = [str(i) for i in range(250)]
+
+        def respond(RequestItems):
+            keys = RequestItems["test-table"]["Keys"]
+            return {"Responses": {"test-table": [{**key, "server_id": key["PK"][7:]} for key in keys]}}
+
+        table = self._table(respond)
+        configs = db.batch_get_server_configs(table, server_ids)
+
+        self.assertEqual(len(configs), 250)
+        self.assertEqual(configs["42"]["server_id"], "42")
+        batch_sizes = [len(c.kwargs["RequestItems"]["test-table"]["Keys"]) for c in table.meta.client.batch_get_item.call_args_list]
+        self.assertEqual(batch_sizes, [100, 100, 50])
+
+    def test_unprocessed_keys_are_retried(self):
+        first_key = {"PK": "SERVER#s1", "SK": "EVENT#e1"}
+        second_key = {"PK": "SERVER#s1", "SK": "EVENT#e2"}
+        table = self._table([
+            {"Responses": {"test-table": [first_key]}, "UnprocessedKeys": {"test-table": {"Keys": [second_key]}}},
+            {"Responses": {"test-table": [second_key]}},
+        ])
+        with patch("db.time.sleep") as sleep:
+            records = db.batch_get_event_records(table, {"s1": ["e1", "e2"]})
+
+        self.assertEqual(set(records["s1"]), {"e1", "e2"})
+        retry_keys = table.meta.client.batch_get_item.call_args_list[1].kwargs["RequestItems"]["test-table"]["Keys"]
+        self.assertEqual(retry_keys, [second_key])
+        sleep.assert_called_once()
+
+    def test_event_records_projected_to_run_view_and_missing_events_left_out(self):
+        table = self._table([{"Responses": {"test-table": [{"PK": "SERVER#s1", "SK": "EVENT#e1", "event_name": "Weekly"}]}}])
+        records = db.batch_get_event_records(table, {"s1": ["e1", "gone"]})
+
+        self.assertEqual(records, {"s1": {"e1": {"PK": "SERVER#s1", "SK": "EVENT#e1", "event_name": "Weekly"}}})
+        request = table.meta.client.batch_get_item.call_args.kwargs["RequestItems"]["test-table"]
+        projected = set(request["ExpressionAttributeNames"].values())
+        self.assertTrue(set(db.EVENT_REMINDER_VIEW + db.EVENT_RESCHEDULE_VIEW + db.EVENT_CLEANUP_VIEW) <= projected)
+        self.assertNotIn("registered", projected)
+
+
+class TestMeteredTable(unittest.TestCase):
+    def test_counts_table_and_batch_calls(self):
+        raw_table = Mock()
+        raw_table.name = "test-table"
+        raw_table.get_item.return_value = {}
+        raw_table.meta.client.batch_get_item.return_value = {"Responses": {"test-table": []}}
+        table = db.MeteredTable(raw_table)
+
+        db.get_server_config(table, "s1")
+        db.get_server_config(table, "s2")
+        db.batch_get_server_configs(table, ["s1"])
+
+        self.assertEqual(table.calls, {"get_item": 2, "batch_get_item": 1})
+        self.assertEqual(table.summary(), "total=3 batch_get_item=1 get_item=2")
+
+
+class TestThreadTable(unittest.TestCase):
+    def test_each_thread_gets_its_own_table(self):
+        first = db.get_thread_table("test-table")
+        self.assertIs(db.get_thread_table("test-table"), first)
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(db.get_thread_table("test-table")))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], first)
+        self.assertEqual(other[0].name, "test-table")
+
+
+if __name__ == "__main__":
+    unittest.main()
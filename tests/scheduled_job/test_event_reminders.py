@@ -8,6 +8,7 @@ os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
 os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
 os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
 os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
 
@@ -52,7 +53,7 @@ class TestCheckAndSendReminder(unittest.TestCase):
              patch("event_reminders.datetime") as mock_dt:
             mock_dt.now.return_value = _NOW
             mock_dt.fromisoformat.side_effect = datetime.fromisoformat
-            mock_db.get_event_record.return_value = event_record
+            mock_db.get_event_reminder_view.return_value = event_record
             mock_db.get_server_config.return_value = server_config
             mock_discord.send_channel_message.return_value = discord_sent
             result = check_and_send_reminder(Mock(), "server1", "event1", server_config)
@@ -62,7 +63,7 @@ class TestCheckAndSendReminder(unittest.TestCase):
 
     def test_returns_unchanged_config_when_event_record_not_found(self):
         with patch("event_reminders.db") as mock_db, patch("event_reminders.discord_api") as mock_discord:
-            mock_db.get_event_record.return_value = None
+            mock_db.get_event_reminder_view.return_value = None
             result = check_and_send_reminder(Mock(), "server1", "event1", None)
         self.assertIsNone(result)
         mock_discord.send_channel_message.assert_not_called()
@@ -159,7 +160,7 @@ class TestCheckAndSendReminder(unittest.TestCase):
              patch("event_reminders.datetime") as mock_dt:
             mock_dt.now.return_value = _NOW
             mock_dt.fromisoformat.side_effect = datetime.fromisoformat
-            mock_db.get_event_record.return_value = record
+            mock_db.get_event_reminder_view.return_value = record
             mock_db.get_server_config.return_value = fetched_config
             result = check_and_send_reminder(Mock(), "server1", "event1", None)
         mock_db.get_server_config.assert_called_once()
@@ -173,7 +174,7 @@ class TestCheckAndSendReminder(unittest.TestCase):
              patch("event_reminders.datetime") as mock_dt:
             mock_dt.now.return_value = _NOW
             mock_dt.fromisoformat.side_effect = datetime.fromisoformat
-            mock_db.get_event_record.return_value = record
+            mock_db.get_event_reminder_view.return_value = record
             check_and_send_reminder(Mock(), "server1", "event1", cached_config)
         mock_db.get_server_config.assert_not_called()
 
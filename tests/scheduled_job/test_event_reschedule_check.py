@@ -8,6 +8,7 @@ os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
 os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
 os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
 os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
 
@@ -47,7 +48,7 @@ class TestCheckForReschedule(unittest.TestCase):
         with patch("event_reschedule_check.db") as mock_db, \
              patch("event_reschedule_check.discord_api") as mock_discord, \
              patch("event_reschedule_check.startgg_api") as mock_startgg:
-            mock_db.get_event_record.return_value = event_record
+            mock_db.get_event_reschedule_view.return_value = event_record
             mock_startgg.get_event_start_time_utc.return_value = startgg_start
             check_for_reschedule(Mock(), "server1", "event1", server_config)
         return mock_db, mock_discord, mock_startgg
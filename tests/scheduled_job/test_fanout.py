@@ -0,0 +1,267 @@
+import os
+import sys
+
+# Scheduled job modules read env vars at import time (via scheduled_job_constants).
+# Assign deterministic test values directly so real host env vars never leak through.
+os.environ["REGION"] = "us-east-1"
+os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
+os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
+os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
+os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
+
+import threading
+import unittest
+from unittest.mock import patch
+
+import boto3
+from moto import mock_aws
+
+import database.dynamodb_utils as dynamodb_utils
+import db
+import scheduled_job_constants as constants
+from tests.scheduled_job import fanout_harness
+from tests.scheduled_job.fanout_harness import InMemoryFifoQueue
+
+_SERVERS = {"s1": ["e1", "e2"], "s2": ["e3"], "s3": ["e4"]}
+
+
+class _FanOutTestCase(unittest.TestCase):
+    def setUp(self):
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+        resource = boto3.resource("dynamodb", region_name="us-east-1")
+        table = resource.create_table(
+            TableName="test-table",
+            KeySchema=[{"AttributeName": "PK", "KeyType": "HASH"}, {"AttributeName": "SK", "KeyType": "RANGE"}],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+                {"AttributeName": "server_id", "AttributeType": "S"},
+                {"AttributeName": "event_name", "AttributeType": "S"},
+                {"AttributeName": "poll_partition", "AttributeType": "S"},
+                {"AttributeName": "next_action_at", "AttributeType": "N"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "EventNameIndex",
+                    "KeySchema": [
+                        {"AttributeName": "server_id", "KeyType": "HASH"},
+                        {"AttributeName": "event_name", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["event_id"]},
+                },
+                {
+                    "IndexName": "NextActionIndex",
+                    "KeySchema": [
+                        {"AttributeName": "poll_partition", "KeyType": "HASH"},
+                        {"AttributeName": "next_action_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "KEYS_ONLY"},
+                },
+            ],
+        )
+        self.table = table
+        for server_id, event_ids in _SERVERS.items():
+            table.put_item(Item={"PK": f"SERVER#{server_id}", "SK": "CONFIG", "server_id": server_id})
+            for event_id in event_ids:
+                self._put_event(server_id, event_id)
+            # Due since long ago, as if each server's events had just been written
+            table.put_item(Item={
+                "PK": f"SERVER#{server_id}", "SK": "POLL_STATE", "poll_partition": "POLL_STATE", "next_action_at": 0,
+            })
+
+        self.processed = []
+        self._lock = threading.Lock()
+        self.failures_left = {}
+
+        def process(table, server_id, db_event_ids, server_config, server_event_records):
+            with self._lock:
+                if self.failures_left.get(server_id):
+                    self.failures_left[server_id] -= 1
+                    raise RuntimeError("Discord is down")
+                self.processed.append((server_id, sorted(db_event_ids), sorted(server_event_records)))
+                return []
+
+        for patcher in (
+            patch.object(db, "dynamodb", resource),
+            patch("handler.startgg_token_check"),
+            patch("worker._process_server", side_effect=process),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _put_event(self, server_id, event_id, **attributes):
+        self.table.put_item(Item={
+            "PK": f"SERVER#{server_id}", "SK": f"EVENT#{event_id}",
+            "server_id": server_id, "event_id": event_id, "event_name": f"Event {event_id}", **attributes,
+        })
+
+    def _poll_state(self, server_id):
+        return self.table.get_item(Key={"PK": f"SERVER#{server_id}", "SK": "POLL_STATE"})["Item"]
+
+    def _processed_servers(self):
+        return sorted(server_id for server_id, _, _ in self.processed)
+
+
+class TestFanOut(_FanOutTestCase):
+    def test_every_server_is_processed_once_with_its_events(self):
+        queue = InMemoryFifoQueue()
+
+        fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+
+        self.assertEqual(sorted(self.processed), [
+            ("s1", ["e1", "e2"], ["e1", "e2"]),
+            ("s2", ["e3"], ["e3"]),
+            ("s3", ["e4"], ["e4"]),
+        ])
+
+    def test_overlapping_runs_in_one_slot_are_deduplicated_by_the_queue(self):
+        queue = InMemoryFifoQueue()
+
+        fanout_harness.run_coordinator(queue)
+        fanout_harness.run_coordinator(queue)
+        self.assertEqual(len(queue), len(_SERVERS))
+        fanout_harness.drain(queue)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2", "s3"])
+
+    def test_claim_stops_a_repeat_run_after_the_dedup_window(self):
+        queue = InMemoryFifoQueue(dedup=False)
+
+        fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+        fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2", "s3"])
+
+    def test_next_slot_processes_servers_again(self):
+        queue = InMemoryFifoQueue()
+
+        with patch("handler.current_run_slot", return_value=1):
+            fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+        with patch("handler.current_run_slot", return_value=2):
+            fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s1", "s2", "s2", "s3", "s3"])
+
+    def test_failed_server_is_redelivered_alone(self):
+        queue = InMemoryFifoQueue()
+        self.failures_left["s2"] = 1
+
+        fanout_harness.run_coordinator(queue)
+        results = fanout_harness.drain(queue)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2", "s3"])
+        self.assertEqual([len(result["batchItemFailures"]) for result in results], [1, 0])
+        self.assertEqual(queue.dead_letters, [])
+
+    def test_server_failing_every_delivery_ends_in_dead_letters(self):
+        queue = InMemoryFifoQueue(max_receives=2)
+        self.failures_left["s3"] = 5
+
+        fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2"])
+        self.assertEqual(len(queue.dead_letters), 1)
+
+
+_NOW = 1_800_000_000
+_FAR_START = "2027-06-01T00:00:00Z"  # months after _NOW
+_FAR_END = "2027-06-01T03:00:00Z"
+
+
+class TestNextActionWatermark(_FanOutTestCase):
+    """The coordinator only enqueues servers whose next_action_at has passed, and each run
+    moves the watermark to the server's next due moment."""
+
+    def setUp(self):
+        super().setUp()
+        for server_id, event_ids in _SERVERS.items():
+            for event_id in event_ids:
+                self._put_event(server_id, event_id, start_time=_FAR_START, end_time=_FAR_END)
+        for patcher in (patch("handler.time.time", return_value=_NOW), patch("worker.time.time", return_value=_NOW)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run_slot(self, run_slot):
+        queue = InMemoryFifoQueue()
+        with patch("handler.current_run_slot", return_value=run_slot):
+            fanout_harness.run_coordinator(queue)
+        fanout_harness.drain(queue)
+
+    def test_run_moves_the_watermark_to_the_next_event_start(self):
+        self._run_slot(1)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2", "s3"])
+        self.assertEqual(int(self._poll_state("s1")["next_action_at"]), 1811808000)
+
+    def test_servers_with_nothing_due_are_not_polled(self):
+        self._run_slot(1)
+        self.processed.clear()
+
+        self._run_slot(2)
+
+        self.assertEqual(self.processed, [])
+
+    def test_event_written_by_the_bot_makes_its_server_due(self):
+        self._run_slot(1)
+        self.processed.clear()
+
+        dynamodb_utils.lower_server_next_action_at("s2", _NOW - 60, ["e5"], self.table)
+        self._put_event("s2", "e5", start_time=_FAR_START, end_time=_FAR_END)
+        self._run_slot(2)
+
+        self.assertEqual(self._processed_servers(), ["s2"])
+        self.assertNotIn("pending_event_ids", self._poll_state("s2"))
+
+    def test_later_event_write_does_not_delay_an_earlier_watermark(self):
+        dynamodb_utils.lower_server_next_action_at("s1", _NOW + 3600, ["e1"], self.table)
+
+        self.assertEqual(int(self._poll_state("s1")["next_action_at"]), 0)
+        self.assertEqual(self._poll_state("s1")["pending_event_ids"], {"e1"})
+
+    def test_event_written_during_a_run_is_not_lost(self):
+        def process(table, server_id, db_event_ids, server_config, server_event_records):
+            if server_id == "s3":
+                # The bot creates an event due sooner while the worker is mid-server
+                dynamodb_utils.lower_server_next_action_at("s3", _NOW + 60, ["e6"], self.table)
+            return []
+
+        with patch("worker._process_server", side_effect=process):
+            self._run_slot(1)
+
+        # The run saw only e4 (months out); it must not push the watermark past e6
+        self.assertLessEqual(int(self._poll_state("s3")["next_action_at"]), _NOW + 60)
+        self.assertEqual(self._poll_state("s3")["pending_event_ids"], {"e6"})
+        self.assertEqual(int(self._poll_state("s1")["next_action_at"]), 1811808000)
+
+    def test_server_without_events_leaves_the_index(self):
+        self.table.delete_item(Key={"PK": "SERVER#s2", "SK": "EVENT#e3"})
+
+        self._run_slot(1)
+
+        self.assertNotIn("next_action_at", self._poll_state("s2"))
+        self.assertNotIn("s2", db.get_due_server_ids(self.table, _NOW + 10 ** 9))
+
+    def test_full_sweep_polls_servers_that_are_not_due(self):
+        slots_per_sweep = constants.FULL_SWEEP_INTERVAL_SECONDS // constants.RUN_INTERVAL_SECONDS
+        self._run_slot(slots_per_sweep - 1)
+        self.processed.clear()
+
+        self._run_slot(slots_per_sweep)
+
+        self.assertEqual(self._processed_servers(), ["s1", "s2", "s3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import sys
+
+# Scheduled job modules read env vars at import time (via scheduled_job_constants).
+# Assign deterministic test values directly so real host env vars never leak through.
+os.environ["REGION"] = "us-east-1"
+os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
+os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
+os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
+os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import handler
+
+
+class TestCoordinator(unittest.TestCase):
+    def _run(self, server_events, sqs=None, run_slot=42, all_server_events=None):
+        sqs = sqs or Mock(**{"send_message_batch.return_value": {"Successful": [], "Failed": []}})
+        with patch("handler.db") as mock_db, \
+             patch("handler.startgg_token_check"), \
+             patch("handler._sqs", sqs), \
+             patch("handler.current_run_slot", return_value=run_slot), \
+             patch("handler.logger") as mock_logger:
+            mock_db.get_due_server_ids.return_value = list(server_events)
+            mock_db.get_event_ids_for_servers.side_effect = lambda table, ids: {i: server_events[i] for i in ids}
+            mock_db.get_all_events_by_server.return_value = all_server_events or {}
+            handler.handler({}, None)
+            self.mock_db = mock_db
+        return sqs, mock_logger
+
+    def _enqueued(self, sqs):
+        return {
+            json.loads(entry["MessageBody"])["server_id"]: json.loads(entry["MessageBody"])["event_ids"]
+            for call in sqs.send_message_batch.call_args_list
+            for entry in call.kwargs["Entries"]
+        }
+
+    def test_enqueues_one_message_per_server_with_dedup_keys(self):
+        sqs, _ = self._run({"s1": ["e1", "e2"], "s2": ["e3"]})
+
+        entries = sqs.send_message_batch.call_args.kwargs["Entries"]
+        self.assertEqual(sqs.send_message_batch.call_args.kwargs["QueueUrl"], handler.constants.SERVER_WORK_QUEUE_URL)
+        self.assertEqual([entry["MessageGroupId"] for entry in entries], ["s1", "s2"])
+        self.assertEqual([entry["MessageDeduplicationId"] for entry in entries], ["s1-42", "s2-42"])
+        self.assertEqual(
+            json.loads(entries[0]["MessageBody"]), {"server_id": "s1", "event_ids": ["e1", "e2"], "run_slot": 42}
+        )
+
+    def test_sends_in_batches_of_ten(self):
+        sqs, _ = self._run({f"s{i}": ["e"] for i in range(23)})
+
+        self.assertEqual([len(call.kwargs["Entries"]) for call in sqs.send_message_batch.call_args_list], [10, 10, 3])
+
+    def test_failed_entries_are_logged(self):
+        sqs = Mock(**{"send_message_batch.return_value": {"Failed": [{"Id": "1", "Message": "throttled"}]}})
+        _, mock_logger = self._run({"s1": ["e1"], "s2": ["e2"]}, sqs=sqs)
+
+        errors = " ".join(str(call.args[0]) for call in mock_logger.error.call_args_list)
+        self.assertIn("Failed to enqueue 1 server(s): s2", errors)
+
+    def test_no_due_servers_enqueues_nothing(self):
+        sqs, _ = self._run({})
+
+        sqs.send_message_batch.assert_not_called()
+
+    def test_only_due_servers_are_listed_and_enqueued(self):
+        sqs, _ = self._run({"s1": ["e1"], "s3": []}, all_server_events={"s2": ["e2"]})
+
+        # s3's events are gone; it's still enqueued so the worker clears its watermark
+        self.assertEqual(self._enqueued(sqs), {"s1": ["e1"], "s3": []})
+        self.mock_db.get_all_events_by_server.assert_not_called()
+
+    def test_full_sweep_slot_adds_every_server_with_events(self):
+        slots_per_sweep = handler.constants.FULL_SWEEP_INTERVAL_SECONDS // handler.constants.RUN_INTERVAL_SECONDS
+        sqs, _ = self._run({"s1": ["e1"]}, run_slot=3 * slots_per_sweep, all_server_events={"s2": ["e2"]})
+
+        self.assertEqual(self._enqueued(sqs), {"s1": ["e1"], "s2": ["e2"]})
+
+
+class TestRunSlot(unittest.TestCase):
+    def test_runs_within_one_interval_share_a_slot(self):
+        interval = handler.constants.RUN_INTERVAL_SECONDS
+        self.assertEqual(handler.current_run_slot(10 * interval), handler.current_run_slot(10 * interval + interval - 1))
+        self.assertEqual(handler.current_run_slot(11 * interval), 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
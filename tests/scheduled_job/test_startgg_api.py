@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 
@@ -7,6 +8,7 @@ os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
 os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
 os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
 os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
 
@@ -16,6 +18,16 @@ from unittest.mock import Mock, patch
 import requests
 
 import startgg_api
+import startgg_client
+
+
+def _patch_client(test):
+    """A fresh shared client per test: no budget carried over between tests, no backoff sleeps."""
+    patcher = patch.object(startgg_client, "client", startgg_client.StartggClient(
+        startgg_client.TokenBucket(1000, 60), sleep=lambda seconds: None,
+    ))
+    patcher.start()
+    test.addCleanup(patcher.stop)
 
 _VALID_URL = "https://www.start.gg/tournament/midweek/event/singles"
 # 2026-04-10T21:00:00Z as a unix timestamp.
@@ -27,9 +39,12 @@ def _mock_response(ok=True, status_code=200, json_data=None, raises_json=False):
     resp = Mock()
     resp.ok = ok
     resp.status_code = status_code
+    resp.headers = {}
     if raises_json:
+        resp.content = b"<html>"
         resp.json.side_effect = ValueError("no json")
     else:
+        resp.content = json.dumps(json_data or {}).encode()
         resp.json.return_value = json_data or {}
     return resp
 
@@ -46,23 +61,27 @@ class TestExtractSlug(unittest.TestCase):
 
 
 class TestGetEventStartTimeUtc(unittest.TestCase):
+    def setUp(self):
+        _patch_client(self)
+        startgg_api.clear_start_time_cache()
+        self.addCleanup(startgg_api.clear_start_time_cache)
+
     def _run(self, response=None, request_exc=None):
-        with patch("startgg_api.requests") as mock_requests, \
+        with patch("startgg_client.http_sessions") as mock_sessions, \
              patch("startgg_api.constants") as mock_constants:
             mock_constants.get_startgg_api_token.return_value = "token"
-            mock_requests.RequestException = requests.RequestException
             if request_exc is not None:
-                mock_requests.post.side_effect = request_exc
+                mock_sessions.post.side_effect = request_exc
             else:
-                mock_requests.post.return_value = response
+                mock_sessions.post.return_value = response
             result = startgg_api.get_event_start_time_utc(_VALID_URL)
         return result
 
     def test_invalid_url_skips_request(self):
-        with patch("startgg_api.requests") as mock_requests:
+        with patch("startgg_client.http_sessions") as mock_sessions:
             result = startgg_api.get_event_start_time_utc("https://example.com/nope")
         self.assertIsNone(result)
-        mock_requests.post.assert_not_called()
+        mock_sessions.post.assert_not_called()
 
     def test_successful_response_returns_iso(self):
         resp = _mock_response(json_data={"data": {"event": {"id": "1", "startAt": _START_AT_UNIX}}})
@@ -77,8 +96,13 @@ class TestGetEventStartTimeUtc(unittest.TestCase):
         self.assertIsNone(self._run(response=resp))
 
     def test_non_ok_response_returns_none(self):
+        resp = _mock_response(ok=False, status_code=400)
+        self.assertIsNone(self._run(response=resp))
+
+    def test_server_errors_are_retried_before_giving_up(self):
         resp = _mock_response(ok=False, status_code=500)
         self.assertIsNone(self._run(response=resp))
+        self.assertEqual(startgg_client.client.stats.retries, startgg_client.MAX_RETRIES)
 
     def test_request_exception_returns_none(self):
         self.assertIsNone(self._run(request_exc=requests.RequestException("boom")))
@@ -88,5 +112,78 @@ class TestGetEventStartTimeUtc(unittest.TestCase):
         self.assertIsNone(self._run(response=resp))
 
 
+def _slug_url(i):
+    return f"https://www.start.gg/tournament/t{i}/event/singles"
+
+
+class TestPrefetchEventStartTimes(unittest.TestCase):
+    """A fake start.gg that answers aliased documents from the variables it was sent."""
+
+    def setUp(self):
+        _patch_client(self)
+        startgg_api.clear_start_time_cache()
+        self.addCleanup(startgg_api.clear_start_time_cache)
+        self.posts = []
+
+        def post(url, json, **kwargs):
+            self.posts.append(json)
+            data = {
+                alias.replace("s", "e", 1): {"id": alias, "startAt": _START_AT_UNIX + int(slug.split("/")[1][1:])}
+                for alias, slug in json["variables"].items()
+                if "missing" not in slug
+            }
+            return _mock_response(json_data={"data": data})
+
+        for patcher in (
+            patch("startgg_client.http_sessions.post", side_effect=post),
+            patch("startgg_api.constants.get_startgg_api_token", return_value="token"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_events_are_resolved_in_aliased_chunks(self):
+        urls = [_slug_url(i) for i in range(startgg_api.START_TIME_BATCH_SIZE + 5)]
+
+        requests_made = startgg_api.prefetch_event_start_times(urls)
+
+        self.assertEqual(requests_made, 2)
+        self.assertEqual([len(body["variables"]) for body in self.posts], [startgg_api.START_TIME_BATCH_SIZE, 5])
+        self.assertIn("e99: event(slug: $s99)", self.posts[0]["query"])
+        self.assertEqual(startgg_api.get_event_start_time_utc(_slug_url(1)), "2026-04-10T21:00:01Z")
+        self.assertEqual(len(self.posts), 2)
+
+    def test_duplicate_and_cached_slugs_are_fetched_once(self):
+        startgg_api.prefetch_event_start_times([_slug_url(1), _slug_url(1) + "/overview", "https://example.com"])
+        startgg_api.prefetch_event_start_times([_slug_url(1), _slug_url(2)])
+
+        self.assertEqual(
+            [sorted(body["variables"].values()) for body in self.posts],
+            [["tournament/t1/event/singles"], ["tournament/t2/event/singles"]],
+        )
+
+    def test_missing_event_is_cached_as_none(self):
+        url = "https://www.start.gg/tournament/missing/event/singles"
+        startgg_api.prefetch_event_start_times([url])
+
+        self.assertIsNone(startgg_api.get_event_start_time_utc(url))
+        self.assertEqual(len(self.posts), 1)
+
+    def test_failed_chunk_is_not_retried_per_event(self):
+        with patch("startgg_client.http_sessions.post", side_effect=requests.RequestException("down")) as mock_post:
+            startgg_api.prefetch_event_start_times([_slug_url(1), _slug_url(2)])
+            self.assertIsNone(startgg_api.get_event_start_time_utc(_slug_url(1)))
+            self.assertIsNone(startgg_api.get_event_start_time_utc(_slug_url(2)))
+
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_uncached_event_falls_back_to_a_single_query_and_is_cached(self):
+        with patch("startgg_client.http_sessions.post") as mock_post:
+            mock_post.return_value = _mock_response(json_data={"data": {"event": {"id": "1", "startAt": _START_AT_UNIX}}})
+            self.assertEqual(startgg_api.get_event_start_time_utc(_VALID_URL), _START_AT_ISO)
+            self.assertEqual(startgg_api.get_event_start_time_utc(_VALID_URL), _START_AT_ISO)
+
+        self.assertEqual(mock_post.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,214 @@
+import os
+import sys
+
+# Scheduled job modules read env vars at import time (via scheduled_job_constants).
+# Assign deterministic test values directly so real host env vars never leak through.
+os.environ["REGION"] = "us-east-1"
+os.environ["DISCORD_BOT_TOKEN_SECRET_NAME"] = "test-secret-name"
+os.environ["DYNAMODB_TABLE_NAME"] = "test-table"
+os.environ["REMOVE_ROLE_QUEUE_URL"] = "https://sqs.test"
+os.environ["STARTGG_SECRET_NAME"] = "test-startgg-secret"
+os.environ["SERVER_WORK_QUEUE_URL"] = "https://sqs.test/servers.fifo"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "jobs", "scheduled_job"))
+
+import json
+import unittest
+from unittest.mock import ANY, Mock, patch
+
+import worker
+
+_ACTIVE = 2
+_COMPLETED = 3
+
+
+def _sqs_event(server_events, run_slot=100):
+    return {"Records": [
+        {
+            "messageId": f"msg-{server_id}",
+            "body": json.dumps({"server_id": server_id, "event_ids": event_ids, "run_slot": run_slot}),
+        }
+        for server_id, event_ids in server_events.items()
+    ]}
+
+
+class TestWorkerPrefetch(unittest.TestCase):
+    def _run(self, server_events, configs, records, discord_events):
+        with patch("worker.db") as mock_db, \
+             patch("worker.discord_api") as mock_discord, \
+             patch("worker.event_cleanup") as mock_cleanup, \
+             patch("worker.event_reminders") as mock_reminders, \
+             patch("worker.event_reschedule_check") as mock_reschedule, \
+             patch("worker.schedule_sync"):
+            mock_db.claim_server_run.return_value = {}
+            mock_db.batch_get_server_configs.return_value = configs
+            mock_db.batch_get_event_records.return_value = records
+            mock_discord.get_guild_events.return_value = discord_events
+            mock_cleanup.cleanup_ended_event.return_value = None
+            worker.handler(_sqs_event(server_events), None)
+        return mock_db, mock_cleanup, mock_reminders, mock_reschedule
+
+    def test_passes_prefetched_snapshots_to_each_pass(self):
+        config = {"server_id": "s1"}
+        active_record = {"SK": "EVENT#e1"}
+        ended_record = {"SK": "EVENT#e2"}
+        mock_db, mock_cleanup, mock_reminders, mock_reschedule = self._run(
+            server_events={"s1": ["e1", "e2"]},
+            configs={"s1": config},
+            records={"s1": {"e1": active_record, "e2": ended_record}},
+            discord_events=[{"id": "e1", "status": _ACTIVE}, {"id": "e2", "status": _COMPLETED}],
+        )
+
+        mock_db.batch_get_server_configs.assert_called_once_with(ANY, ["s1"])
+        mock_db.batch_get_event_records.assert_called_once_with(ANY, {"s1": ["e1", "e2"]})
+        mock_db.get_server_config.assert_not_called()
+        mock_reminders.check_and_send_reminder.assert_called_once_with(ANY, "s1", "e1", config, event_record=active_record)
+        mock_reschedule.check_for_reschedule.assert_called_once_with(ANY, "s1", "e1", config, event_record=active_record)
+        mock_cleanup.cleanup_ended_event.assert_called_once_with(ANY, "s1", "e2", config, event_record=ended_record)
+
+    def test_startgg_start_times_are_prefetched_once_for_the_batch(self):
+        url = "https://www.start.gg/tournament/t/event/e"
+        with patch("worker.startgg_api") as mock_startgg:
+            self._run(
+                server_events={"s1": ["e1"], "s2": ["e2", "e3"]},
+                configs={},
+                records={
+                    "s1": {"e1": {"SK": "EVENT#e1", "startgg_url": url}},
+                    "s2": {"e2": {"SK": "EVENT#e2", "startgg_url": url}, "e3": {"SK": "EVENT#e3"}},
+                },
+                discord_events=[],
+            )
+
+        mock_startgg.clear_start_time_cache.assert_called_once_with()
+        mock_startgg.prefetch_event_start_times.assert_called_once_with([url, url])
+
+    def test_event_deleted_since_index_scan_is_skipped(self):
+        _, mock_cleanup, mock_reminders, _ = self._run(
+            server_events={"s1": ["gone"]},
+            configs={},
+            records={},
+            discord_events=[],
+        )
+
+        mock_cleanup.cleanup_ended_event.assert_not_called()
+        mock_reminders.check_and_send_reminder.assert_not_called()
+
+
+class TestWorkerWatermark(unittest.TestCase):
+    def _run(self, event_ids, records, discord_events, claim=None, now=1_000_000):
+        with patch("worker.db") as mock_db, \
+             patch("worker.discord_api") as mock_discord, \
+             patch("worker.event_cleanup") as mock_cleanup, \
+             patch("worker.event_reminders"), \
+             patch("worker.event_reschedule_check"), \
+             patch("worker.schedule_sync"), \
+             patch("worker.time.time", return_value=now):
+            mock_db.claim_server_run.return_value = claim or {}
+            mock_db.batch_get_server_configs.return_value = {}
+            mock_db.batch_get_event_records.return_value = {"s1": records}
+            mock_discord.get_guild_events.return_value = discord_events
+            mock_cleanup.cleanup_ended_event.side_effect = lambda table, server_id, event_id, *args, **kwargs: event_id
+            worker.handler(_sqs_event({"s1": event_ids}), None)
+        return mock_db, mock_discord
+
+    def _stored_next_action_at(self, mock_db):
+        mock_db.set_server_next_action_at.assert_called_once()
+        return mock_db.set_server_next_action_at.call_args.args[2]
+
+    def test_watermark_moves_to_the_remaining_events_next_action(self):
+        upcoming = {"SK": "EVENT#e1", "start_time": "2026-01-01T00:00:00Z", "end_time": "2026-01-01T02:00:00Z"}
+        mock_db, _ = self._run(
+            ["e1", "e2"], {"e1": upcoming, "e2": {"SK": "EVENT#e2"}},
+            discord_events=[{"id": "e1", "status": 1}],
+        )
+
+        # e2 was cleaned up, so only e1's start counts
+        self.assertEqual(self._stored_next_action_at(mock_db), 1767225600)
+
+    def test_watermark_removed_once_the_server_has_no_events(self):
+        mock_db, mock_discord = self._run([], {}, discord_events=[])
+
+        self.assertIsNone(self._stored_next_action_at(mock_db))
+        mock_discord.get_guild_events.assert_not_called()
+
+    def test_discord_failure_leaves_the_server_due_next_run(self):
+        mock_db, _ = self._run(["e1"], {"e1": {"SK": "EVENT#e1"}}, discord_events=None, now=1234)
+
+        self.assertEqual(self._stored_next_action_at(mock_db), 1234)
+
+    def test_pending_event_ids_from_the_claim_are_processed(self):
+        claim = {"last_run_slot": 100, "pending_event_ids": {"e9"}}
+        mock_db, _ = self._run(["e1"], {}, discord_events=[], claim=claim)
+
+        mock_db.batch_get_event_records.assert_called_once_with(ANY, {"s1": ["e1", "e9"]})
+        mock_db.set_server_next_action_at.assert_called_once_with(ANY, "s1", ANY, claim)
+
+
+class TestWorkerConcurrency(unittest.TestCase):
+    def _run(self, server_ids, context=None, failing_server=None, claimed=None):
+        processed = []
+
+        def process(table, server_id, *args):
+            if server_id == failing_server:
+                raise RuntimeError("boom")
+            processed.append(server_id)
+            return []
+
+        with patch("worker.db") as mock_db, \
+             patch("worker._process_server", side_effect=process), \
+             patch("worker.logger") as mock_logger:
+            mock_db.claim_server_run.side_effect = lambda table, server_id, slot: (
+                None if server_id in (claimed or []) else {}
+            )
+            mock_db.batch_get_server_configs.return_value = {}
+            mock_db.batch_get_event_records.return_value = {}
+            self.result = worker.handler(_sqs_event({server_id: ["e1"] for server_id in server_ids}), context)
+            self.mock_db = mock_db
+        return processed, mock_logger
+
+    def test_failing_server_does_not_stop_the_others(self):
+        processed, mock_logger = self._run(["s1", "s2", "s3"], failing_server="s2")
+
+        self.assertEqual(sorted(processed), ["s1", "s3"])
+        errors = " ".join(str(call.args[0]) for call in mock_logger.error.call_args_list)
+        self.assertIn("Server s2 failed: boom", errors)
+        # Only the failed server's message goes back to SQS, with its claim released
+        self.assertEqual(self.result, {"batchItemFailures": [{"itemIdentifier": "msg-s2"}]})
+        self.mock_db.release_server_run.assert_called_once_with(ANY, "s2", 100)
+
+    def test_servers_deferred_once_time_budget_is_spent(self):
+        context = Mock()
+        context.get_remaining_time_in_millis.return_value = worker.constants.RUN_TIME_RESERVE_MS - 1
+
+        processed, mock_logger = self._run(["s1", "s2"], context=context)
+
+        self.assertEqual(processed, [])
+        warnings = " ".join(str(call.args[0]) for call in mock_logger.warning.call_args_list)
+        self.assertIn("deferred 2 server(s)", warnings)
+        self.assertEqual(
+            sorted(failure["itemIdentifier"] for failure in self.result["batchItemFailures"]),
+            ["msg-s1", "msg-s2"],
+        )
+
+    def test_server_already_claimed_for_the_slot_is_skipped(self):
+        processed, _ = self._run(["s1", "s2"], claimed=["s1"])
+
+        self.assertEqual(processed, ["s2"])
+        self.assertEqual(self.result, {"batchItemFailures": []})
+        self.mock_db.batch_get_server_configs.assert_called_once_with(ANY, ["s2"])
+
+    def test_claims_are_released_when_the_prefetch_fails(self):
+        with patch("worker.db") as mock_db, patch("worker._process_server") as mock_process:
+            mock_db.claim_server_run.return_value = {}
+            mock_db.batch_get_event_records.side_effect = RuntimeError("throttled")
+
+            with self.assertRaises(RuntimeError):
+                worker.handler(_sqs_event({"s1": ["e1"], "s2": ["e2"]}), None)
+
+        mock_process.assert_not_called()
+        released = sorted(call.args[1:] for call in mock_db.release_server_run.call_args_list)
+        self.assertEqual(released, [("s1", 100), ("s2", 100)])
+
+
+if __name__ == "__main__":
+    unittest.main()
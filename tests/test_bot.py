@@ -1,8 +1,12 @@
+import time
 import unittest
 from unittest.mock import Mock, patch
 
 import bot
+import database.dynamodb_utils as db_helper
+from aws_services import AWSServices
 import commands.command_map as command_map
+import constants
 from commands.models.discord_event import DiscordEvent
 from commands.models.response_message import ResponseMessage
 
@@ -26,17 +30,33 @@ class TestProcessBotCommand(unittest.TestCase):
     def test_dispatches_to_mapped_command_and_returns_response_dict(self):
         fake_command = Mock(return_value=ResponseMessage(content="fake command ran"))
         self._patch_command_map({"fake-command": {"function": fake_command, "params": []}})
-        aws_services = Mock()
+        aws_services = AWSServices(Mock(), Mock(), Mock(), Mock())
 
         response = bot.process_bot_command(_make_command_body("fake-command"), aws_services)
 
         fake_command.assert_called_once()
         called_event, called_services = fake_command.call_args.args
         self.assertIsInstance(called_event, DiscordEvent)
-        self.assertIs(called_services, aws_services)
+        self.assertIs(called_services.remove_role_sqs_queue, aws_services.remove_role_sqs_queue)
         self.assertEqual(response["data"]["content"], "fake command ran")
         self.assertEqual(response["type"], 4)
 
+    def test_command_receives_request_scoped_read_cache_over_shared_table(self):
+        fake_command = Mock(return_value=ResponseMessage(content="ok"))
+        self._patch_command_map({"fake-command": {"function": fake_command, "params": []}})
+        table = Mock()
+        aws_services = AWSServices(table, Mock(), Mock(), Mock())
+
+        bot.process_bot_command(_make_command_body("fake-command"), aws_services)
+        bot.process_bot_command(_make_command_body("fake-command"), aws_services)
+
+        first_table = fake_command.call_args_list[0].args[1].dynamodb_table
+        second_table = fake_command.call_args_list[1].args[1].dynamodb_table
+        self.assertIsInstance(first_table, db_helper.RequestReadCache)
+        self.assertIsNot(first_table, second_table)
+        # The shared, container-lifetime services are never mutated
+        self.assertIs(aws_services.dynamodb_table, table)
+
     def test_unknown_command_name_raises_value_error(self):
         self._patch_command_map({})
         with self.assertRaises(ValueError) as ctx:
@@ -74,5 +94,97 @@ class TestProcessBotCommand(unittest.TestCase):
         self.assertIn("did not return a message", str(ctx.exception))
 
 
+class TestDeferredCommands(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(command_map.command_map, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        edit_patcher = patch.object(bot.discord_helper, "edit_original_interaction_response", return_value=True)
+        self.mock_edit = edit_patcher.start()
+        self.addCleanup(edit_patcher.stop)
+
+        followup_patcher = patch.object(bot.discord_helper, "send_interaction_followup", return_value=True)
+        self.mock_followup = followup_patcher.start()
+        self.addCleanup(followup_patcher.stop)
+
+    def _register(self, function):
+        command_map.command_map["slow-command"] = {"function": function, "params": [], "deferred": True}
+
+    def _make_payload(self, enqueued_at=None):
+        body = _make_command_body("slow-command")
+        body["application_id"] = "app1"
+        body["token"] = "interaction-token"
+        return {
+            "command_name": "slow-command",
+            "event_body": body,
+            "enqueued_at": time.time() if enqueued_at is None else enqueued_at,
+        }
+
+    def test_deferred_command_is_enqueued_and_acked_without_running(self):
+        slow_command = Mock()
+        self._register(slow_command)
+        aws_services = Mock()
+
+        response = bot.process_bot_command(_make_command_body("slow-command"), aws_services)
+
+        self.assertEqual(response, {"type": 5})
+        slow_command.assert_not_called()
+        aws_services.deferred_command_sqs_queue.send_message.assert_called_once()
+
+    def test_process_deferred_command_edits_original_response_with_result(self):
+        self._register(Mock(return_value=ResponseMessage(content="imported 42 entrants")))
+
+        bot.process_deferred_command(self._make_payload(), Mock())
+
+        app_id, token, message_data = self.mock_edit.call_args.args
+        self.assertEqual((app_id, token), ("app1", "interaction-token"))
+        self.assertEqual(message_data["content"], "imported 42 entrants")
+
+    def test_process_deferred_command_posts_generic_error_on_unexpected_exception(self):
+        self._register(Mock(side_effect=RuntimeError("internal kaboom")))
+
+        bot.process_deferred_command(self._make_payload(), Mock())
+
+        message_data = self.mock_edit.call_args.args[2]
+        self.assertTrue(message_data["content"])
+        self.assertNotIn("internal kaboom", message_data["content"])
+
+    def test_result_that_pings_is_sent_as_a_followup(self):
+        self._register(Mock(return_value=ResponseMessage(content="Not checked in: <@123>")))
+
+        bot.process_deferred_command(self._make_payload(), Mock())
+
+        self.mock_edit.assert_not_called()
+        self.assertEqual(self.mock_followup.call_args.args[2]["content"], "Not checked in: <@123>")
+
+    def test_silenced_mentions_are_edited_in_place(self):
+        self._register(Mock(return_value=ResponseMessage(content="Not checked in: <@123>").with_silent_pings()))
+
+        bot.process_deferred_command(self._make_payload(), Mock())
+
+        self.mock_followup.assert_not_called()
+        self.mock_edit.assert_called_once()
+
+    def test_delivery_failure_does_not_raise_after_the_command_ran(self):
+        slow_command = Mock(return_value=ResponseMessage(content="done"))
+        self._register(slow_command)
+        self.mock_edit.side_effect = RuntimeError("unexpected")
+
+        bot.process_deferred_command(self._make_payload(), Mock())
+
+        slow_command.assert_called_once()
+
+    def test_process_deferred_command_drops_message_past_token_lifetime(self):
+        slow_command = Mock()
+        self._register(slow_command)
+        stale = time.time() - constants.INTERACTION_TOKEN_TTL_SECONDS - 1
+
+        bot.process_deferred_command(self._make_payload(enqueued_at=stale), Mock())
+
+        slow_command.assert_not_called()
+        self.mock_edit.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
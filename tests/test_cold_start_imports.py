@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Cumulative cold-import budget for the interaction Lambda, in milliseconds. Dominated by
+# boto3; override on slow machines with IMPORT_TIME_BUDGET_MS.
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", "600"))
+
+# Modules only the commands that need them should load
+HEAVY_MODULES = [
+    "discord",
+    "commands.event.event_commands",
+    "commands.event.startgg.startgg_api",
+    "commands.league.league_commands",
+    "commands.schedule.schedule_commands",
+    "commands.startgg.startgg_commands",
+    "mypy_boto3_dynamodb",
+    "mypy_boto3_sqs",
+]
+
+
+def _cold_import(code: str) -> dict[str, int]:
+    """Run `code` in a fresh interpreter under -X importtime and return the cumulative
+    import time in microseconds for every module it loaded."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": SRC_DIR,
+        "PUBLIC_KEY": "00" * 32,
+        "AWS_DEFAULT_REGION": "us-east-1",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        timings[module.strip()] = int(cumulative.strip())
+    return timings
+
+
+class TestColdStartImports(unittest.TestCase):
+    def _assert_within_budget(self, timings: dict[str, int], top_level_modules: list[str]):
+        total_ms = sum(timings[m] for m in top_level_modules) / 1000
+        self.assertLess(total_ms, IMPORT_TIME_BUDGET_MS,
+                        f"cold import took {total_ms:.0f}ms (budget {IMPORT_TIME_BUDGET_MS}ms)")
+
+    def _assert_heavy_modules_not_loaded(self, timings: dict[str, int]):
+        loaded = [m for m in HEAVY_MODULES if m in timings]
+        self.assertEqual(loaded, [])
+
+    def test_ping_path_stays_within_budget(self):
+        timings = _cold_import("import lambda_handler")
+        self._assert_heavy_modules_not_loaded(timings)
+        self._assert_within_budget(timings, ["lambda_handler"])
+
+    def test_check_in_path_stays_within_budget(self):
+        # What bot.py loads when /check-in is invoked (LazyFunction's importlib call is
+        # invisible to -X importtime, so import the module directly)
+        timings = _cold_import("import lambda_handler; import commands.check_in.check_in_commands")
+        self._assert_heavy_modules_not_loaded(timings)
+        self.assertIn("commands.check_in.check_in_commands", timings)
+        self._assert_within_budget(timings, ["lambda_handler", "commands.check_in.check_in_commands"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+import datetime
+import ipaddress
+import os
+import ssl
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+import http_sessions
+
+_ROOT = os.path.join(os.path.dirname(__file__), "..")
+_MIRRORS = [
+    "jobs/scheduled_job/http_sessions.py",
+    "jobs/remove_role/http_sessions.py",
+    "jobs/sheets_agent/http_sessions.py",
+    "jobs/startgg_oauth/http_sessions.py",
+]
+
+
+def _write_self_signed_cert(directory: str) -> tuple[str, str]:
+    """Writes a localhost certificate + key and returns (cert_path, key_path)."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ))
+    return cert_path, key_path
+
+
+class _LocalHttpsServer:
+    """HTTPS stand-in for Discord/start.gg that counts the TLS connections it accepts.
+    Paths listed in `failures` answer 503 that many times before succeeding."""
+
+    def __init__(self, cert_path, key_path):
+        self.connections = 0
+        self.hits = 0
+        self.failures = {}
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                with fake._lock:
+                    fake.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.hits += 1
+                    remaining = fake.failures.get(self.path, 0)
+                    if remaining:
+                        fake.failures[self.path] = remaining - 1
+                status = 503 if remaining else 200
+                body = b'{"ok": true}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_PUT = do_DELETE = do_GET
+
+            def do_POST(self):
+                # Drain the body so the kept-alive connection stays usable
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.do_GET()
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+        self.base_url = f"https://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _HttpsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.cert_path, cls.key_path = _write_self_signed_cert(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        http_sessions.close_all()
+        self.addCleanup(http_sessions.close_all)
+        self.server = _LocalHttpsServer(self.cert_path, self.key_path)
+        self.addCleanup(self.server.close)
+
+
+class TestSessions(_HttpsTestCase):
+    def test_one_session_per_host_reused_across_calls(self):
+        first = http_sessions.get_session(f"{self.server.base_url}/a")
+        second = http_sessions.get_session(f"{self.server.base_url}/b?x=1")
+        other_host = http_sessions.get_session("https://discord.com/api/v10/users/@me")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_host)
+
+    def test_sequential_calls_share_one_connection(self):
+        for _ in range(5):
+            response = http_sessions.request("GET", f"{self.server.base_url}/guilds/1", verify=self.cert_path)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.server.connections, 1)
+
+    def test_idempotent_request_is_retried_on_5xx(self):
+        self.server.failures["/guilds/1/members/2/roles/3"] = 1
+
+        response = http_sessions.request(
+            "PUT", f"{self.server.base_url}/guilds/1/members/2/roles/3", verify=self.cert_path
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 2)
+
+    def test_post_is_not_retried(self):
+        self.server.failures["/gql/alpha"] = 1
+
+        response = http_sessions.post(f"{self.server.base_url}/gql/alpha", json={"query": "{}"}, verify=self.cert_path)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_pool_size_applies_to_new_sessions(self):
+        self.addCleanup(http_sessions.configure_pool, http_sessions.DEFAULT_POOL_MAXSIZE)
+        http_sessions.configure_pool(16)
+
+        adapter = http_sessions.get_session(self.server.base_url).get_adapter(self.server.base_url)
+
+        self.assertEqual(adapter._pool_maxsize, 16)
+
+    def test_host_pool_size_leaves_other_hosts_alone(self):
+        self.addCleanup(http_sessions._host_pool_maxsize.clear)
+        other_url = "https://discord.example"
+        http_sessions.get_session(self.server.base_url)
+
+        http_sessions.configure_host_pool(self.server.base_url, 24)
+
+        adapter = http_sessions.get_session(self.server.base_url).get_adapter(self.server.base_url)
+        other = http_sessions.get_session(other_url).get_adapter(other_url)
+        self.assertEqual(adapter._pool_maxsize, 24)
+        self.assertEqual(other._pool_maxsize, http_sessions._pool_maxsize)
+
+    def test_default_timeout_is_applied(self):
+        session = http_sessions.get_session(self.server.base_url)
+        with patch.object(session, "request") as mock_request:
+            http_sessions.request("GET", self.server.base_url)
+            http_sessions.request("GET", self.server.base_url, timeout=2)
+
+        self.assertEqual(mock_request.call_args_list[0].kwargs["timeout"], http_sessions.DEFAULT_TIMEOUT)
+        self.assertEqual(mock_request.call_args_list[1].kwargs["timeout"], 2)
+
+
+class TestPooledLatencyBenchmark(_HttpsTestCase):
+    CALLS = 30
+
+    def _time_calls(self, send) -> float:
+        started = time.perf_counter()
+        for _ in range(self.CALLS):
+            self.assertEqual(send().status_code, 200)
+        return (time.perf_counter() - started) / self.CALLS
+
+    def test_pooled_session_skips_the_per_call_handshake(self):
+        url = f"{self.server.base_url}/channels/1/messages"
+
+        fresh = self._time_calls(lambda: requests.request("GET", url, verify=self.cert_path, timeout=5))
+        fresh_connections = self.server.connections
+        self.server.connections = 0
+        pooled = self._time_calls(lambda: http_sessions.request("GET", url, verify=self.cert_path, timeout=5))
+
+        print(
+            f"\n[benchmark] {self.CALLS} GETs over local HTTPS: "
+            f"fresh connection {fresh * 1000:.2f} ms/call, pooled {pooled * 1000:.2f} ms/call, "
+            f"saved {(fresh - pooled) * 1000:.2f} ms/call"
+        )
+        self.assertEqual(fresh_connections, self.CALLS)
+        self.assertEqual(self.server.connections, 1)
+        self.assertLess(pooled, fresh)
+
+
+class TestMirrors(unittest.TestCase):
+    def test_job_copies_match_src(self):
+        def body(rel_path):
+            with open(os.path.join(_ROOT, rel_path), encoding="utf-8") as f:
+                return f.read().split("\n", 1)[1]  # skip the MIRROR header line
+
+        canonical = body("src/http_sessions.py")
+        for mirror in _MIRRORS:
+            self.assertEqual(body(mirror), canonical, f"{mirror} is out of sync")
+
+
+if __name__ == "__main__":
+    unittest.main()
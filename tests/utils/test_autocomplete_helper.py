@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import utils.autocomplete_helper as autocomplete_helper
+from commands.models.discord_event import DiscordEvent
+from utils.autocomplete_helper import NameIndex
+
+
+def _names(choices):
+    return [choice.name for choice in choices]
+
+
+class TestNameIndexSearch(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex([
+            ("Weekly Bracket", "1"),
+            ("weekly", "2"),
+            ("Monthly Major", "3"),
+            ("Major League Weekly", "4"),
+            ("Summer Showdown", "5"),
+        ])
+
+    def test_empty_query_lists_alphabetically(self):
+        self.assertEqual(
+            _names(self.index.search("")),
+            ["Major League Weekly", "Monthly Major", "Summer Showdown", "weekly", "Weekly Bracket"],
+        )
+
+    def test_ranks_exact_then_prefix_then_word_prefix_then_substring(self):
+        self.assertEqual(
+            _names(self.index.search("WEEKLY")),
+            ["weekly", "Weekly Bracket", "Major League Weekly"],
+        )
+        self.assertEqual(_names(self.index.search("jor")), ["Major League Weekly", "Monthly Major"])
+
+    def test_word_prefix_ranks_above_substring(self):
+        index = NameIndex([("Gamers Night", "1"), ("Friday Games", "2")])
+        self.assertEqual(_names(index.search("game")), ["Gamers Night", "Friday Games"])
+        index = NameIndex([("Endgame", "1"), ("Friday Games", "2")])
+        self.assertEqual(_names(index.search("game")), ["Friday Games", "Endgame"])
+
+    def test_values_are_carried_through(self):
+        self.assertEqual([c.value for c in self.index.search("summer")], ["5"])
+
+    def test_no_match_returns_empty(self):
+        self.assertEqual(self.index.search("zzz"), [])
+
+    def test_limit_caps_results(self):
+        index = NameIndex([(f"Event {i:03}", str(i)) for i in range(300)])
+        choices = index.search("event")
+        self.assertEqual(len(choices), autocomplete_helper.MAX_CHOICES)
+        self.assertEqual(choices[0].name, "Event 000")
+
+    def test_preserve_order_keeps_given_order_for_empty_query(self):
+        index = NameIndex([("UTC", "UTC"), ("Eastern", "America/New_York")], preserve_order=True)
+        self.assertEqual(_names(index.search("")), ["UTC", "Eastern"])
+        self.assertEqual(_names(index.search("e")), ["Eastern"])
+
+
+class TestGetNameIndex(unittest.TestCase):
+    def test_reuses_index_within_ttl(self):
+        loader = Mock(return_value=[("Weekly", "1")])
+        first = autocomplete_helper.get_name_index("event", "srv", loader)
+        second = autocomplete_helper.get_name_index("event", "srv", loader)
+        self.assertIs(first, second)
+        loader.assert_called_once()
+
+    def test_rebuilds_after_ttl(self):
+        loader = Mock(return_value=[("Weekly", "1")])
+        with patch.object(autocomplete_helper.time, "monotonic", side_effect=[0, 1000, 1000]):
+            autocomplete_helper.get_name_index("event", "srv", loader)
+            autocomplete_helper.get_name_index("event", "srv", loader)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_kinds_and_servers_are_cached_separately(self):
+        loader = Mock(return_value=[])
+        autocomplete_helper.get_name_index("event", "srv", loader)
+        autocomplete_helper.get_name_index("league", "srv", loader)
+        autocomplete_helper.get_name_index("event", "other", loader)
+        self.assertEqual(loader.call_count, 3)
+
+    def test_invalidate_forces_rebuild(self):
+        loader = Mock(return_value=[])
+        autocomplete_helper.get_name_index("plan", "srv", loader)
+        autocomplete_helper.invalidate_name_index("plan", "srv")
+        autocomplete_helper.get_name_index("plan", "srv", loader)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_evicts_least_recently_used_server(self):
+        loader = Mock(return_value=[])
+        with patch.object(autocomplete_helper, "NAME_INDEX_MAX_ENTRIES", 2):
+            autocomplete_helper.get_name_index("event", "a", loader)
+            autocomplete_helper.get_name_index("event", "b", loader)
+            autocomplete_helper.get_name_index("event", "a", loader)
+            autocomplete_helper.get_name_index("event", "c", loader)
+            autocomplete_helper.get_name_index("event", "a", loader)
+            autocomplete_helper.get_name_index("event", "b", loader)
+        # a is hit twice; b is rebuilt after eviction
+        self.assertEqual(loader.call_count, 4)
+
+
+class TestFocusedOptionValue(unittest.TestCase):
+    def test_returns_focused_option_value(self):
+        event = DiscordEvent({"data": {"options": [
+            {"name": "event_name", "value": "wee", "focused": True},
+            {"name": "other", "value": "x"},
+        ]}})
+        self.assertEqual(event.get_focused_option_value(), "wee")
+
+    def test_returns_empty_string_without_focused_option(self):
+        self.assertEqual(DiscordEvent({"data": {}}).get_focused_option_value(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
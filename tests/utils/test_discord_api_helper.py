@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from utils import discord_api_helper
+
+
+class TestInteractionWebhooks(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(discord_api_helper.discord_rate_limit, "request")
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_edit_drops_flags_the_edit_endpoint_rejects(self):
+        self.mock_request.return_value = Mock(status_code=200)
+        flags = discord_api_helper.SUPPRESS_EMBEDS | 1 << 12
+
+        self.assertTrue(discord_api_helper.edit_original_interaction_response("app1", "tok", {"content": "x", "flags": flags}))
+
+        method, url = self.mock_request.call_args.args
+        self.assertEqual((method, url.rsplit("/", 2)[-2:]), ("PATCH", ["messages", "@original"]))
+        self.assertEqual(self.mock_request.call_args.kwargs["json"]["flags"], discord_api_helper.SUPPRESS_EMBEDS)
+
+    def test_followup_is_posted_and_keeps_silent_flag(self):
+        self.mock_request.return_value = Mock(status_code=200)
+
+        self.assertTrue(discord_api_helper.send_interaction_followup("app1", "tok", {"content": "x", "flags": 1 << 12}))
+
+        method, url = self.mock_request.call_args.args
+        self.assertEqual(method, "POST")
+        self.assertTrue(url.endswith("/webhooks/app1/tok"))
+        self.assertEqual(self.mock_request.call_args.kwargs["json"]["flags"], 1 << 12)
+
+    def test_connection_errors_are_reported_not_raised(self):
+        self.mock_request.side_effect = requests.ConnectionError("reset")
+
+        self.assertFalse(discord_api_helper.edit_original_interaction_response("app1", "tok", {"content": "x"}))
+        self.assertFalse(discord_api_helper.send_interaction_followup("app1", "tok", {"content": "x"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
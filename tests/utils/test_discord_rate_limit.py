@@ -0,0 +1,247 @@
+import json
+import os
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from utils import discord_rate_limit
+from utils.discord_rate_limit import DiscordRateLimiter, route_key
+
+_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+_MIRRORS = [
+    "jobs/scheduled_job/discord_rate_limit.py",
+    "jobs/remove_role/discord_rate_limit.py",
+    "jobs/sheets_agent/discord_rate_limit.py",
+    "jobs/startgg_oauth/discord_rate_limit.py",
+]
+
+
+class _FakeDiscord:
+    """Local HTTP server that enforces fixed-window buckets the way Discord reports them.
+
+    Every route shares one bucket ("bucket-a") scoped per major id, allowing `limit`
+    requests per `window` seconds. Requests past the limit get a 429 with retry_after.
+    Paths listed in `global_429` answer with a single global 429 before behaving normally,
+    and paths in `always_429` never succeed.
+    """
+
+    def __init__(self, limit=2, window=0.2):
+        self.limit = limit
+        self.window = window
+        self.global_429 = set()
+        self.always_429 = set()
+        self.hits = []
+        self.too_many = 0
+        self._windows = {}
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake._handle(self)
+
+            do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v10"
+        self._thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handle(self, handler):
+        path = handler.path.split("?", 1)[0]
+        with self._lock:
+            self.hits.append((handler.command, path, time.monotonic()))
+            if path in self.always_429:
+                self.too_many += 1
+                return self._reply(handler, 429, {"retry_after": 0.01, "global": False}, {})
+            if path in self.global_429:
+                self.global_429.discard(path)
+                self.too_many += 1
+                return self._reply(handler, 429, {"retry_after": 0.2, "global": True}, {"X-RateLimit-Global": "true"})
+            major = path.split("/")[4] if path.count("/") >= 4 else ""
+            now = time.monotonic()
+            start, used = self._windows.get(major, (now, 0))
+            if now - start >= self.window:
+                start, used = now, 0
+            reset_after = max(self.window - (now - start), 0.0)
+            headers = {"X-RateLimit-Bucket": "bucket-a", "X-RateLimit-Limit": str(self.limit)}
+            if used >= self.limit:
+                self.too_many += 1
+                headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": f"{reset_after:.3f}"})
+                return self._reply(handler, 429, {"retry_after": reset_after, "global": False}, headers)
+            used += 1
+            self._windows[major] = (start, used)
+            headers.update({
+                "X-RateLimit-Remaining": str(self.limit - used),
+                "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            })
+            return self._reply(handler, 200, {"ok": True}, headers)
+
+    @staticmethod
+    def _reply(handler, status, body, headers):
+        payload = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+class TestRouteKey(unittest.TestCase):
+    def test_minor_ids_are_templated_and_major_id_is_split_out(self):
+        route, major = route_key("put", "https://discord.com/api/v10/guilds/123/members/456/roles/789")
+        self.assertEqual(route, "PUT /guilds/{id}/members/{id}/roles/{id}")
+        self.assertEqual(major, "123")
+
+    def test_webhook_token_scopes_the_limit_but_stays_out_of_the_route(self):
+        route, major = route_key("PATCH", "https://discord.com/api/v10/webhooks/111/secret-token/messages/@original")
+        self.assertEqual(route, "PATCH /webhooks/{id}/{token}/messages/@original")
+        self.assertNotIn("secret-token", route)
+        self.assertEqual(major, "111/secret-token")
+
+    def test_query_string_is_ignored(self):
+        route, major = route_key("GET", "https://discord.com/api/v10/guilds/1/members/search?query=x")
+        self.assertEqual((route, major), ("GET /guilds/{id}/members/search", "1"))
+
+
+class TestDiscordRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.fake = _FakeDiscord()
+        self.addCleanup(self.fake.close)
+        self.limiter = DiscordRateLimiter(max_retries=3)
+
+    def _send(self, method, path, limiter=None):
+        url = f"{self.fake.base_url}{path}"
+        return (limiter or self.limiter).execute(method, url, lambda: requests.request(method, url, timeout=5))
+
+    def test_drained_bucket_is_waited_out_instead_of_hitting_429(self):
+        started = time.monotonic()
+        statuses = [self._send("POST", "/channels/10/messages").status_code for _ in range(5)]
+
+        self.assertEqual(statuses, [200] * 5)
+        self.assertEqual(self.fake.too_many, 0)
+        # 5 requests at 2 per 0.2s window span at least two resets
+        self.assertGreaterEqual(time.monotonic() - started, 0.35)
+
+    def test_bucket_learned_on_one_route_throttles_another_route_in_it(self):
+        self._send("POST", "/channels/10/messages")
+        self._send("GET", "/channels/10/messages/555")
+        # Both routes report bucket-a, which is now drained for channel 10
+        response = self._send("DELETE", "/channels/10/messages/556")
+        self.assertEqual(response.status_code, 200)
+        # Third route was never seen, so its first call may 429 once, but no more than that
+        self.assertLessEqual(self.fake.too_many, 1)
+
+    def test_major_ids_are_limited_independently(self):
+        for channel in ("10", "20", "30"):
+            self._send("POST", f"/channels/{channel}/messages")
+            self._send("POST", f"/channels/{channel}/messages")
+
+        started = time.monotonic()
+        self._send("POST", "/channels/40/messages")
+        self.assertLess(time.monotonic() - started, 0.15)
+        self.assertEqual(self.fake.too_many, 0)
+
+    def test_429_is_retried_after_retry_after(self):
+        # A fresh limiter knows nothing about the bucket another client drained
+        self._send("POST", "/channels/10/messages")
+        self._send("POST", "/channels/10/messages")
+        response = self._send("POST", "/channels/10/messages", limiter=DiscordRateLimiter())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fake.too_many, 1)
+
+    def test_retries_are_capped(self):
+        self.fake.always_429.add("/api/v10/guilds/1/members/2/roles/3")
+        response = self._send("DELETE", "/guilds/1/members/2/roles/3")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(self.fake.hits), self.limiter.max_retries + 1)
+
+    def test_wait_longer_than_cap_returns_the_429_without_sleeping(self):
+        self.fake.always_429.add("/api/v10/guilds/1/members/2/roles/3")
+        sleeps = []
+        limiter = DiscordRateLimiter(max_wait_seconds=0.001, sleep=sleeps.append)
+
+        response = self._send("DELETE", "/guilds/1/members/2/roles/3", limiter=limiter)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(self.fake.hits), 1)
+        self.assertEqual(sleeps, [])
+
+    def test_global_429_holds_back_every_route(self):
+        self.fake.global_429.add("/api/v10/channels/10/messages")
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            time.sleep(seconds)
+
+        limiter = DiscordRateLimiter(sleep=sleep)
+        statuses = [
+            self._send("POST", "/channels/10/messages", limiter=limiter).status_code,
+            self._send("GET", "/guilds/99", limiter=limiter).status_code,
+        ]
+
+        self.assertEqual(statuses, [200, 200])
+        self.assertEqual(self.fake.too_many, 1)
+        # The retry waited out the global limit; the other route did not need to wait again
+        self.assertEqual(len(sleeps), 1)
+        self.assertGreater(sleeps[0], 0.1)
+
+    def test_concurrent_callers_share_the_bucket_without_429s(self):
+        statuses = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(3):
+                status = self._send("PUT", "/guilds/7/members/1/roles/2").status_code
+                with lock:
+                    statuses.append(status)
+
+        # Prime the bucket so the limiter knows the route before the threads race
+        self._send("PUT", "/guilds/7/members/1/roles/2")
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(statuses, [200] * 12)
+        self.assertEqual(self.fake.too_many, 0)
+
+    def test_module_request_passes_kwargs_through(self):
+        discord_rate_limit.limiter.clear()
+        self.addCleanup(discord_rate_limit.limiter.clear)
+        response = discord_rate_limit.request(
+            "GET", f"{self.fake.base_url}/guilds/5", params={"with_counts": "true"}, timeout=5
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"ok": True})
+
+
+class TestMirrors(unittest.TestCase):
+    def test_job_copies_match_src(self):
+        def body(rel_path):
+            with open(os.path.join(_ROOT, rel_path), encoding="utf-8") as f:
+                return f.read().split("\n", 1)[1]  # skip the MIRROR header line
+
+        canonical = body("src/utils/discord_rate_limit.py")
+        for mirror in _MIRRORS:
+            self.assertEqual(body(mirror), canonical, f"{mirror} is out of sync")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+
+from utils.poll_watermark import REMINDER_LEAD_SECONDS, event_next_action_at, server_next_action_at
+
+_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+
+_NOW = 1_800_000_000            # 2027-01-15T08:00:00Z
+_START = "2027-01-20T08:00:00Z"  # five days out
+_START_EPOCH = _NOW + 5 * 86400
+_END = "2027-01-20T11:00:00Z"
+
+
+class TestEventNextActionAt(unittest.TestCase):
+    def test_upcoming_event_is_next_due_at_its_start(self):
+        self.assertEqual(event_next_action_at({"start_time": _START, "end_time": _END}, _NOW), _START_EPOCH)
+
+    def test_pending_reminder_is_due_when_its_window_opens(self):
+        record = {"start_time": _START, "end_time": _END, "should_post_reminder": True, "did_post_reminder": False}
+        self.assertEqual(event_next_action_at(record, _NOW), _START_EPOCH - REMINDER_LEAD_SECONDS)
+
+    def test_sent_reminder_no_longer_counts(self):
+        record = {"start_time": _START, "end_time": _END, "should_post_reminder": True, "did_post_reminder": True}
+        self.assertEqual(event_next_action_at(record, _NOW), _START_EPOCH)
+
+    def test_reminder_window_already_open_is_due_now(self):
+        record = {"start_time": _START, "end_time": _END, "should_post_reminder": True}
+        self.assertEqual(event_next_action_at(record, _START_EPOCH - 3600), _START_EPOCH - 3600)
+
+    def test_upcoming_startgg_event_is_due_every_run(self):
+        record = {"start_time": _START, "end_time": _END, "startgg_url": "https://www.start.gg/tournament/t/event/e"}
+        self.assertEqual(event_next_action_at(record, _NOW), _NOW)
+
+    def test_started_event_is_next_due_at_its_expected_end(self):
+        now = _START_EPOCH + 600
+        record = {"start_time": _START, "end_time": _END, "startgg_url": "https://www.start.gg/tournament/t/event/e"}
+        self.assertEqual(event_next_action_at(record, now), _START_EPOCH + 3 * 3600)
+
+    def test_event_past_its_end_stays_due_until_cleaned_up(self):
+        now = _START_EPOCH + 86400
+        self.assertEqual(event_next_action_at({"start_time": _START, "end_time": _END}, now), now)
+
+    def test_unreadable_times_are_due_now(self):
+        self.assertEqual(event_next_action_at({"start_time": "not a time"}, _NOW), _NOW)
+
+
+class TestServerNextActionAt(unittest.TestCase):
+    def test_earliest_event_wins(self):
+        records = [
+            {"start_time": _START, "end_time": _END},
+            {"start_time": "2027-01-16T08:00:00Z", "end_time": "2027-01-16T10:00:00Z"},
+        ]
+        self.assertEqual(server_next_action_at(records, _NOW), _NOW + 86400)
+
+    def test_no_events_has_no_watermark(self):
+        self.assertIsNone(server_next_action_at([], _NOW))
+
+
+class TestMirrors(unittest.TestCase):
+    def test_job_copy_matches_src(self):
+        def body(rel_path):
+            with open(os.path.join(_ROOT, rel_path), encoding="utf-8") as f:
+                return f.read().split("\n", 1)[1]  # skip the MIRROR header line
+
+        self.assertEqual(body("jobs/scheduled_job/poll_watermark.py"), body("src/utils/poll_watermark.py"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+from utils.queue_deferred_command import enqueue_deferred_command
+
+
+class TestEnqueueDeferredCommand(unittest.TestCase):
+    def test_message_body_contains_command_and_interaction(self):
+        queue = Mock()
+        event_body = {"token": "abc", "data": {"name": "event-refresh-startgg"}}
+
+        enqueue_deferred_command("event-refresh-startgg", event_body, queue)
+
+        queue.send_message.assert_called_once()
+        body = json.loads(queue.send_message.call_args.kwargs["MessageBody"])
+        self.assertEqual(body["command_name"], "event-refresh-startgg")
+        self.assertEqual(body["event_body"], event_body)
+        self.assertIsInstance(body["enqueued_at"], float)
+
+
+if __name__ == "__main__":
+    unittest.main()
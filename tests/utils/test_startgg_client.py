@@ -0,0 +1,164 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from utils import startgg_client
+from utils.startgg_client import StartggClient, TokenBucket
+
+_ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+_MIRRORS = ["jobs/scheduled_job/startgg_client.py"]
+
+_QUERY = "query EventEntrants($slug: String, $page: Int!, $perPage: Int!) { event(slug: $slug) { id } }"
+_MUTATION = "mutation ReportBracketSet($setId: ID!) { reportBracketSet(setId: $setId) { id } }"
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body if body is not None else {"data": {}}).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def _errors(message):
+    return {"errors": [{"message": message}], "data": None}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_up_to_capacity_then_paced_at_the_refill_rate(self):
+        clock = _Clock()
+        bucket = TokenBucket(capacity=2, window_seconds=60, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 30.0)
+
+    def test_drain_makes_the_next_caller_wait_for_a_refill(self):
+        clock = _Clock()
+        bucket = TokenBucket(capacity=80, window_seconds=60, clock=clock, sleep=clock.sleep)
+
+        bucket.drain()
+
+        self.assertAlmostEqual(bucket.acquire(), 0.75)
+
+
+class TestStartggClient(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.client = StartggClient(
+            TokenBucket(1000, 60, clock=self.clock, sleep=self.clock.sleep),
+            sleep=self.clock.sleep, jitter=lambda low, high: high,
+        )
+        self.sent = []
+        patcher = patch.object(startgg_client.http_sessions, "post", side_effect=self._post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.responses = []
+
+    def _post(self, url, json, headers, timeout):
+        self.sent.append(dict(json["variables"]))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def test_429_is_retried_after_retry_after_and_slows_every_caller(self):
+        self.responses = [_response(429, {"success": False, "message": "Rate limit exceeded - api-token"},
+                                    headers={"Retry-After": "5"}), _response()]
+
+        with patch.object(self.client.bucket, "drain", wraps=self.client.bucket.drain) as drain:
+            response = self.client.post(_QUERY, {"slug": "s"}, {})
+
+        self.assertEqual(response.status_code, 200)
+        drain.assert_called_once()
+        self.assertEqual(self.clock.sleeps, [5.0])
+        self.assertEqual((self.client.stats.requests, self.client.stats.retries), (2, 1))
+        self.assertEqual(self.client.stats.throttled_seconds, 5.0)
+
+    def test_rate_limit_error_in_a_200_is_retried_with_growing_backoff(self):
+        self.responses = [_response(body=_errors("Rate limit exceeded")), _response(503), _response()]
+
+        self.client.post(_QUERY, {"slug": "s"}, {})
+
+        backoffs = [seconds for seconds in self.clock.sleeps if seconds >= startgg_client.BACKOFF_BASE_SECONDS]
+        self.assertEqual(backoffs, [1.0, 2.0])
+        self.assertEqual(self.client.stats.retries, 2)
+
+    def test_gives_up_after_max_retries_and_returns_the_last_response(self):
+        self.responses = [_response(502) for _ in range(startgg_client.MAX_RETRIES + 1)]
+
+        response = self.client.post(_QUERY, {"slug": "s"}, {})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(len(self.sent), startgg_client.MAX_RETRIES + 1)
+
+    def test_mutations_are_not_resent_after_a_server_error_or_lost_connection(self):
+        self.responses = [_response(500)]
+        self.assertEqual(self.client.post(_MUTATION, {"setId": "1"}, {}).status_code, 500)
+
+        self.responses = [requests.ConnectionError("reset")]
+        with self.assertRaises(requests.ConnectionError):
+            self.client.post(_MUTATION, {"setId": "1"}, {})
+        self.assertEqual(len(self.sent), 2)
+
+    def test_mutations_are_retried_when_rate_limited(self):
+        self.responses = [_response(429, {"message": "Rate limit exceeded"}), _response()]
+
+        self.assertEqual(self.client.post(_MUTATION, {"setId": "1"}, {}).status_code, 200)
+
+    def test_queries_are_retried_after_a_lost_connection(self):
+        self.responses = [requests.ConnectionError("reset"), _response()]
+
+        self.assertEqual(self.client.post(_QUERY, {"slug": "s"}, {}).status_code, 200)
+
+    def test_complexity_error_on_page_one_halves_per_page_in_place(self):
+        self.responses = [_response(body=_errors("Your query complexity is too high.")) for _ in range(2)] + [_response()]
+        variables = {"slug": "s", "page": 1, "perPage": 75}
+
+        self.client.post(_QUERY, variables, {})
+
+        self.assertEqual([sent["perPage"] for sent in self.sent], [75, 37, 18])
+        self.assertEqual(variables["perPage"], 18)
+        self.assertEqual(self.client.stats.per_page_shrinks, 2)
+
+    def test_complexity_error_on_a_later_page_is_returned_unchanged(self):
+        self.responses = [_response(body=_errors("Your query complexity is too high."))]
+        variables = {"slug": "s", "page": 3, "perPage": 75}
+
+        response = self.client.post(_QUERY, variables, {})
+
+        self.assertIn("errors", response.json())
+        self.assertEqual(variables["perPage"], 75)
+        self.assertEqual(len(self.sent), 1)
+
+
+class TestMirrors(unittest.TestCase):
+    def test_job_copies_match_src(self):
+        def body(rel_path):
+            with open(os.path.join(_ROOT, rel_path), encoding="utf-8") as f:
+                return f.read().split("\n", 1)[1]  # skip the MIRROR header line
+
+        canonical = body("src/utils/startgg_client.py")
+        for mirror in _MIRRORS:
+            self.assertEqual(body(mirror), canonical, f"{mirror} is out of sync")
+
+
+if __name__ == "__main__":
+    unittest.main()